@@ -47,6 +47,7 @@ from . import conversation_level, hat_directions, story, types, utils
 from .action import Action
 from .action_map import ActionMap
 from .ambiance import Ambiance
+from .codec import BinaryCodec, CodecError
 from .config import Config, ConfigValue
 from .configuration import EarwaxConfig
 from .credit import Credit
@@ -54,28 +55,44 @@ from .dialogue_tree import DialogueLine, DialogueTree
 from .die import Die
 from .editor import Editor, TextValidator
 from .event_matcher import EventMatcher
+from .executors import MeteredExecutor
 from .game import Game, GameNotRunning
 from .game_board import GameBoard, NoSuchTile
+from .headless import HeadlessRunner, NullSpeech, VirtualClock
 from .input_modes import InputModes
+from .leaks import LeakDetector, LeakReport, TrackedResource
 from .level import IntroLevel, Level
 from .mapping import (Box, BoxBounds, BoxLevel, BoxTypes, CurrentBox, Door,
                       MapEditor, MapEditorContext, NearestBox, NotADoor,
-                      Portal)
+                      Portal, ReplicatedDoor, ReplicatedEntity,
+                      ReplicatedPerspective, Replicator)
 from .menus import (ActionMenu, ConfigMenu, FileMenu, Menu, MenuItem,
                     ReverbEditor, TypeHandler, UnknownTypeError)
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry
+from .metrics_level import MetricsLevel
 from .mixins import DismissibleMixin, DumpLoadMixin, TitleMixin
-from .networking import (
-    AlreadyConnected, AlreadyConnecting, ConnectionStates, NetworkConnection,
-    NetworkingConnectionError, NotConnectedYet)
+from .networking import (AlreadyConnected, AlreadyConnecting,
+                         ConnectionStates, Framing, MessageTooLarge,
+                         NetworkConnection, NetworkingConnectionError,
+                         NetworkServer, NotConnectedYet, SendStats)
 from .point import Point, PointDirections
-from .promises import (Promise, PromiseStates, StaggeredPromise,
-                       ThreadedPromise, staggered_promise)
-from .reverb import Reverb
+from .profiler import CallbackStats, Profiler
+from .promises import (ChainedPromise, CombinedPromise, GatheredPromise,
+                       MappedPromise, Promise, PromiseStates, RacedPromise,
+                       Sequencer, StaggeredPromise, ThreadedPromise,
+                       staggered_promise)
+from .recording import (InputPlayer, InputRecorder, InputRecording,
+                        RecordedEvent)
+from .reverb import Reverb, ReverbPool
 from .rumble_effects import RumbleEffect, RumbleSequence, RumbleSequenceLine
+from .serializers import (BinarySerializer, DataCache, Serializer,
+                          UnknownSerializer, YamlSerializer)
 from .sound import (AlreadyDestroyed, BufferCache, BufferDirectory, NoCache,
-                    Sound, SoundError, SoundManager)
+                    NullSound, NullSoundManager, Sound, SoundError,
+                    SoundManager)
 from .speech import tts
 from .task import IntervalFunction, Task, TaskFunction
+from .tracing import Tracer
 from .track import Track, TrackTypes
 from .vault_file import IncorrectVaultKey, VaultFile
 from .walking_directions import walking_directions
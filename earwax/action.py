@@ -5,6 +5,8 @@ from typing import Optional
 
 from attr import Factory, attrib, attrs
 
+from .profiler import profiled
+from .tracing import traced
 from .types import ActionFunctionType, HatDirection, OptionalGenerator
 
 
@@ -93,6 +95,8 @@ class Action:
     interval: Optional[float] = None
     last_run: float = attrib(default=Factory(float), init=False)
 
+    @profiled(get_name=lambda a: "Action: %s" % a.title)
+    @traced(category="action", get_args=lambda a, dt: dict(title=a.title))
     def run(self, dt: Optional[float]) -> OptionalGenerator:
         """Run this action.
 
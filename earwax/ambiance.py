@@ -52,20 +52,33 @@ class Ambiance:
         path = random_file(path)
         return cls("file", str(path), coordinates=coordinates)
 
-    def play(self, sound_manager: SoundManager, **kwargs) -> None:
+    def play(
+        self, sound_manager: SoundManager, use_cache: bool = False, **kwargs
+    ) -> None:
         """Load and position the sound.
 
         :param sound_manager: The sound manager which will be used to play this
             ambiance.
 
+        :param use_cache: Whether or not to play a cached buffer, if the
+            sound manager's cache has one.
+
+            If this value is ``True``, the sound is played with
+            :meth:`~earwax.SoundManager.play_cached`.
+
         :param kwargs: The additional keyword arguments to pass to
             :meth:`~earwax.SoundManager.play_path`.
         """
         kwargs.setdefault("position", self.coordinates)
         kwargs.setdefault("looping", True)
-        self.sound = sound_manager.play_stream(
-            self.protocol, self.path, **kwargs
-        )
+        if use_cache:
+            self.sound = sound_manager.play_cached(
+                self.protocol, self.path, **kwargs
+            )
+        else:
+            self.sound = sound_manager.play_stream(
+                self.protocol, self.path, **kwargs
+            )
 
     def stop(self) -> None:
         """Stop this ambiance from playing."""
@@ -0,0 +1,332 @@
+"""Provides the AssetStore class."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from shutil import copyfile, rmtree
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from attr import Factory, attrib, attrs
+
+from ..serializers import write_atomic
+
+# The number of bytes to read at once when hashing files.
+chunk_size: int = 1024 * 1024
+
+
+@attrs(auto_attribs=True)
+class AssetStore:
+    """A directory of sounds, stored by their contents.
+
+    Every file is stored once, named after the SHA-256 hash of its contents,
+    no matter how many times, or under how many names, it is used. Folders of
+    sounds, which are played at random, are stored as folders named after the
+    hashes of everything inside them.
+
+    Files are hashed, and copied, with a pool of worker threads::
+
+        store: AssetStore = AssetStore(Path('sounds'))
+        paths: Dict[str, str] = store.gather(['music/main.wav'])
+        store.claim('world.yaml')
+        store.prune()
+        store.save_manifest()
+
+    The size and modification time of every source file are saved in
+    :attr:`~earwax.cmd.asset_store.AssetStore.manifest_path`, so files which
+    have not changed since the last build are not hashed again, and files
+    which are already in the store are not copied again.
+
+    Many worlds can share one store. The manifest also records the assets
+    each world used the last time it was built, and only assets which no
+    world uses are ever pruned.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.directory: The directory to store
+        files in.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.link: Whether or not to make hard
+        links instead of copies.
+
+        If a link cannot be made, for example because the source is on
+        another drive, the file is copied instead.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.jobs: The number of worker
+        threads to use.
+
+        If this value is ``None``, the default for ``ThreadPoolExecutor`` is
+        used.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.manifest_path: The file to save
+        hashes and stored assets to.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.hashes: The size, modification
+        time, and hash of every source file which has been hashed, keyed by
+        path.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.assets: The names of every asset
+        this store has made.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.worlds: The names of the assets
+        used by every world which has been built into this store, keyed by
+        the path of the world file.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.used: The names of the assets
+        which have been gathered since this store was created.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.copied: The number of files which
+        have been copied or linked.
+
+    :ivar ~earwax.cmd.asset_store.AssetStore.skipped: The number of assets
+        which were already stored.
+    """
+
+    directory: Path
+    link: bool = False
+    jobs: Optional[int] = None
+    manifest_path: Path = attrib()
+
+    @manifest_path.default
+    def get_default_manifest_path(instance: "AssetStore") -> Path:
+        """Return ``assets.json`` in the store directory."""
+        return instance.directory / "assets.json"
+
+    hashes: Dict[str, Dict[str, Any]] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    assets: Set[str] = attrib(default=Factory(set), init=False, repr=False)
+    worlds: Dict[str, Set[str]] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    used: Set[str] = attrib(default=Factory(set), init=False, repr=False)
+    copied: int = attrib(default=0, init=False)
+    skipped: int = attrib(default=0, init=False)
+    lock: Lock = attrib(default=Factory(Lock), init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Load the manifest from the last build."""
+        self.load_manifest()
+
+    def load_manifest(self) -> None:
+        """Load :attr:`~earwax.cmd.asset_store.AssetStore.manifest_path`.
+
+        If the manifest is missing or broken, every file will be hashed again.
+        """
+        try:
+            data: Dict[str, Any] = loads(self.manifest_path.read_text())
+            self.hashes = dict(data["hashes"])
+            self.assets = set(data["assets"])
+            self.worlds = {
+                world: set(names) for world, names in data["worlds"].items()
+            }
+        except (
+            AttributeError,
+            OSError,
+            JSONDecodeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ):
+            self.hashes = {}
+            self.assets = set()
+            self.worlds = {}
+
+    def save_manifest(self) -> None:
+        """Save the hashes and assets, so the next build can use them."""
+        data: Dict[str, Any] = {
+            "hashes": self.hashes,
+            "assets": sorted(self.assets),
+            "worlds": {
+                world: sorted(names)
+                for world, names in sorted(self.worlds.items())
+            },
+        }
+        write_atomic(self.manifest_path, dumps(data, indent=2).encode())
+
+    def hash_file(self, path: Path) -> str:
+        """Return the hash of a file.
+
+        If the file has the same size and modification time as when it was
+        last hashed, the saved hash is returned without reading it.
+
+        :param path: The file to hash.
+        """
+        key: str = str(path.resolve())
+        stat: os.stat_result = path.stat()
+        with self.lock:
+            entry: Optional[Dict[str, Any]] = self.hashes.get(key)
+        if (
+            entry is not None
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime") == stat.st_mtime_ns
+        ):
+            return entry["sha256"]
+        h = sha256()
+        with path.open("rb") as f:
+            chunk: bytes
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+        digest: str = h.hexdigest()
+        with self.lock:
+            self.hashes[key] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": digest,
+            }
+        return digest
+
+    def get_files(self, path: Path) -> List[Path]:
+        """Return every file in a folder, sorted by their relative paths.
+
+        :param path: The folder to look in.
+        """
+        return sorted(
+            (p for p in path.rglob("*") if p.is_file()),
+            key=lambda p: p.relative_to(path).as_posix(),
+        )
+
+    def get_name(self, source: Path) -> str:
+        """Return the name ``source`` will be stored under.
+
+        Files are named after their hash, and keep their extension. Folders
+        are named after a hash of the names and hashes of their files.
+
+        :param source: The file or folder to name.
+        """
+        if source.is_dir():
+            h = sha256()
+            p: Path
+            for p in self.get_files(source):
+                h.update(p.relative_to(source).as_posix().encode() + b"\0")
+                h.update(self.hash_file(p).encode() + b"\0")
+            return h.hexdigest()
+        return self.hash_file(source) + source.suffix.lower()
+
+    def store_file(self, source: Path, destination: Path) -> None:
+        """Link or copy a file.
+
+        The file is written under a temporary name, then renamed, so an
+        interrupted build never leaves a partial file behind.
+
+        :param source: The file to store.
+
+        :param destination: Where to store it.
+        """
+        temporary: Path = destination.with_name(destination.name + ".tmp")
+        if temporary.exists():
+            temporary.unlink()
+        if self.link:
+            try:
+                os.link(source, temporary)
+            except OSError:
+                copyfile(source, temporary)
+        else:
+            copyfile(source, temporary)
+        os.replace(temporary, destination)
+
+    def store(self, source: Path, name: str) -> None:
+        """Put a file or folder in the store, unless it is already there.
+
+        :param source: The file or folder to store.
+
+        :param name: The name to store it under, as returned by
+            :meth:`~earwax.cmd.asset_store.AssetStore.get_name`.
+        """
+        destination: Path = self.directory / name
+        if destination.exists():
+            with self.lock:
+                self.skipped += 1
+            return
+        copied: int = 1
+        if source.is_dir():
+            temporary: Path = self.directory / (name + ".tmp")
+            if temporary.exists():
+                rmtree(temporary)
+            files: List[Path] = self.get_files(source)
+            p: Path
+            for p in files:
+                target: Path = temporary / p.relative_to(source)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self.store_file(p, target)
+            temporary.mkdir(exist_ok=True)
+            os.replace(temporary, destination)
+            copied = len(files)
+        else:
+            self.store_file(source, destination)
+        print(f"{source} -> {destination}")
+        with self.lock:
+            self.copied += copied
+
+    def gather(self, sources: Iterable[str]) -> Dict[str, str]:
+        """Store every given file or folder.
+
+        Returns a dictionary mapping every source to the path it has been
+        stored at. Sources with the same contents map to the same path.
+
+        Sources are hashed first, then every unique asset is stored once.
+        Both steps are shared between
+        :attr:`~earwax.cmd.asset_store.AssetStore.jobs` threads.
+
+        :param sources: The paths of the files and folders to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        unique: List[str] = list(dict.fromkeys(sources))
+        names: List[str]
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            names = list(
+                executor.map(lambda s: self.get_name(Path(s)), unique)
+            )
+            first: Dict[str, str] = {}
+            source: str
+            name: str
+            for source, name in zip(unique, names):
+                first.setdefault(name, source)
+            list(
+                executor.map(
+                    lambda item: self.store(Path(item[1]), item[0]),
+                    first.items(),
+                )
+            )
+        self.used.update(names)
+        self.assets.update(names)
+        return {
+            source: str(self.directory / name)
+            for source, name in zip(unique, names)
+        }
+
+    def claim(self, world: str) -> None:
+        """Record that a world uses the assets gathered by this store.
+
+        Whatever the world used before is forgotten, so assets it no longer
+        uses can be pruned, unless another world still uses them.
+
+        :param world: The path of the world file.
+        """
+        self.worlds[world] = set(self.used)
+
+    def prune(self) -> List[str]:
+        """Delete assets which no world uses.
+
+        Only assets which were made by this store, according to
+        :attr:`~earwax.cmd.asset_store.AssetStore.assets`, and which are not
+        used by any world in
+        :attr:`~earwax.cmd.asset_store.AssetStore.worlds`, or gathered since
+        this store was created, are ever deleted.
+
+        Returns the names of the deleted assets.
+        """
+        wanted: Set[str] = set(self.used)
+        names: Set[str]
+        for names in self.worlds.values():
+            wanted.update(names)
+        removed: List[str] = sorted(self.assets - wanted)
+        name: str
+        for name in removed:
+            path: Path = self.directory / name
+            if path.is_dir():
+                rmtree(path)
+            elif path.exists():
+                path.unlink()
+            self.assets.discard(name)
+        return removed
@@ -23,8 +23,10 @@ from logging import _nameToLevel, basicConfig
 from pathlib import Path
 from typing import Callable, Type
 
+from ..serializers import serializers
 from .subcommands.configure_earwax import configure_earwax
 from .subcommands.conversation_tree import edit_convo, new_convo
+from .subcommands.convert import convert
 from .subcommands.game import new_game
 from .subcommands.game_map import edit_map, new_map
 from .subcommands.init_project import init_project
@@ -182,6 +184,21 @@ build_story_parser.add_argument(
     help="The directory to copy sounds to",
 )
 
+build_story_parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    metavar="<number>",
+    default=None,
+    help="The number of threads to hash and copy sounds with",
+)
+
+build_story_parser.add_argument(
+    "--link",
+    action="store_true",
+    help="Hard link sounds instead of copying them, where possible",
+)
+
 game_parser: ArgumentParser = subcommand(
     "game", new_game, commands, description="Create a blank game to work from."
 )
@@ -273,6 +290,30 @@ edit_convo_parser.add_argument(
     "filename", type=Path, help="The conversation tree file to edit"
 )
 
+convert_parser: ArgumentParser = subcommand(
+    "convert",
+    convert,
+    commands,
+    description="Convert a world, map, or other saved file between YAML and "
+    "binary formats.",
+)
+
+convert_parser.add_argument("source", help="The file to convert")
+
+convert_parser.add_argument(
+    "destination",
+    help="The file to write. Unless a format is given, the format is chosen "
+    "by extension",
+)
+
+convert_parser.add_argument(
+    "-f",
+    "--format",
+    choices=list(serializers),
+    default=None,
+    help="The format to convert to",
+)
+
 
 def cmd_main() -> None:
     """Run the earwax client."""
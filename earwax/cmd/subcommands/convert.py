@@ -0,0 +1,22 @@
+"""Provides a command for converting files between formats."""
+
+from argparse import Namespace
+from pathlib import Path
+from typing import Any
+
+from ...serializers import Serializer, get_serializer, load_data, save_data
+
+
+def convert(args: Namespace) -> None:
+    """Convert a saved file to another format."""
+    source: Path = Path(args.source)
+    destination: Path = Path(args.destination)
+    if not source.is_file():
+        print("Error:")
+        print()
+        print(f"File does not exist: {source}.")
+        raise SystemExit
+    serializer: Serializer = get_serializer(args.format, destination)
+    data: Any = load_data(source)
+    save_data(data, destination, serializer=serializer.name)
+    print(f"Converted {source} to {destination} ({serializer.name}).")
@@ -4,8 +4,8 @@ import os.path
 from argparse import Namespace
 from logging import Logger, getLogger
 from pathlib import Path
-from shutil import copy
-from typing import List, Optional, Union
+from time import time
+from typing import Callable, Dict, List, Optional
 
 from jinja2 import Environment, Template
 from pyglet.window import Window
@@ -14,6 +14,7 @@ from yaml.error import YAMLError
 from ...game import Game
 from ...story import (EditLevel, RoomExit, RoomObject, StoryContext,
                       StoryWorld, WorldAction, WorldAmbiance, WorldRoom)
+from ..asset_store import AssetStore
 
 code: str = '''"""{{ world.name }}.
 
@@ -38,97 +39,90 @@ if __name__ == '__main__':
 '''
 
 
-def make_directory(directory: Path) -> None:
-    """Make the given directory, if necessary.
+def replace_sounds(world: StoryWorld, func: Callable[[str], str]) -> None:
+    """Replace the path of every sound in the given world.
 
-    if the given directory already exists, print a message to that effect.
+    This covers the main menu music, the menu sounds, and the sounds of
+    every ambiance and action in the world.
 
-    Otherwise, create the directory, and print a message about it.
+    :param world: The world whose sounds will be replaced.
 
-    :param directory: The directory to create.
+    :param func: A function which will be called with every sound path, and
+        should return the path to replace it with.
     """
-    if directory.is_dir():
-        print(f"The directory {directory} already exists.")
-    else:
-        print(f"Creating directory {directory}.")
-        directory.mkdir()
-
-
-def copy_path(source: Union[str, Path], destination: Path) -> str:
-    """Copy the given file or folder to the given destination.
-
-    :param source: Where to copy from.
-
-    :param destination: The destination for the new file.
-    """
-    if destination.is_file():
-        print(f"Not copying {source}: Destination already exists.")
-        return str(destination)
-    else:
-        print(f"{source} -> {destination}")
-        return str(copy(source, destination))
-
-
-def get_filename(filename: str, index: int) -> str:
-    """Return a unique filename.
-
-    Given a filename of ``'music/track.wav'``, and an index of ``5``,
-    ``'5.wav'`` would be returned.
-
-    :param filename: The original filename (can include path).
-
-    :param index: The index of this filename in whatever list is being iterated
-        over.
-    """
-    return f"{index}{os.path.splitext(filename)[1]}"
-
-
-def copy_ambiances(ambiances: List[WorldAmbiance], destination: Path) -> None:
-    """Copy all ambiance files.
-
-    :param ambiances: The ambiances whose sounds will be copied.
+    world.main_menu_musics = [func(music) for music in world.main_menu_musics]
+    if world.cursor_sound is not None:
+        world.cursor_sound = func(world.cursor_sound)
+    if world.empty_category_sound is not None:
+        world.empty_category_sound = func(world.empty_category_sound)
+    if world.end_of_category_sound is not None:
+        world.end_of_category_sound = func(world.end_of_category_sound)
+    ambiances: List[WorldAmbiance] = []
+    actions: List[Optional[WorldAction]] = [
+        world.take_action,
+        world.drop_action,
+    ]
+    room: WorldRoom
+    for room in world.rooms.values():
+        ambiances.extend(room.ambiances)
+        x: RoomExit
+        actions.extend(x.action for x in room.exits)
+        obj: RoomObject
+        for obj in room.objects.values():
+            ambiances.extend(obj.ambiances)
+            actions.extend(obj.actions)
+            actions.extend(
+                [
+                    obj.take_action,
+                    obj.drop_action,
+                    obj.use_action,
+                    obj.actions_action,
+                ]
+            )
+    ambiance: WorldAmbiance
+    for ambiance in ambiances:
+        ambiance.path = func(ambiance.path)
+    action: Optional[WorldAction]
+    for action in actions:
+        if action is not None and action.sound is not None:
+            action.sound = func(action.sound)
 
-    :param destination: The ambiances directory to copy into.
 
-        If this directory does not exist, it will be created before copying
-        begins.
-    """
-    make_directory(destination)
-    for index, ambiance in enumerate(ambiances):
-        filename = get_filename(ambiance.path, index)
-        filename = copy_path(ambiance.path, destination / filename)
-        ambiance.path = filename
+def gather_assets(
+    world: StoryWorld, store: AssetStore, world_filename: str
+) -> None:
+    """Copy every sound in the given world into an asset store.
 
+    The paths in the world are changed to point at the stored copies. Assets
+    from earlier builds which are no longer used by this world, or any other
+    world built into the same store, are deleted.
 
-def copy_actions(actions: List[WorldAction], destination: Path) -> None:
-    """Copy the sounds from a list of action objects.
+    :param world: The world whose sounds will be gathered.
 
-    :param actions: The list of actions whose sounds will be copied.
+    :param store: The store to gather sounds into.
 
-    :param destination: The destination for the copied sounds.
+    :param world_filename: The file the world was loaded from.
 
-        If this directory does not exist, it will be created before the copy.
+        The store records which assets each world file uses.
     """
-    action: WorldAction
-    for index, action in enumerate(actions):
-        copy_action(action, destination, index)
-
-
-def copy_action(action: WorldAction, destination: Path, index: int) -> None:
-    """Copy the sound for the given action.
-
-    :param action: The action whose sound will be copied.
-
-    :param destination: The destination the sound will be copied to.
-
-        If this directory does not exist, it will be created before the copy.
-
-    :param index: The number to base the resulting file name on.
-    """
-    make_directory(destination)
-    if action.sound is not None:
-        filename = get_filename(action.sound, index)
-        action.sound = copy_path(action.sound, destination / filename)
+    sources: List[str] = []
+
+    def collect(path: str) -> str:
+        sources.append(path)
+        return path
+
+    replace_sounds(world, collect)
+    started: float = time()
+    paths: Dict[str, str] = store.gather(sources)
+    replace_sounds(world, paths.__getitem__)
+    store.claim(str(Path(world_filename).resolve()))
+    removed: List[str] = store.prune()
+    store.save_manifest()
+    print(
+        f"Gathered {len(sources)} sounds as {len(set(paths.values()))} "
+        f"assets in {time() - started:.2f} seconds: {store.copied} files "
+        f"copied, {store.skipped} assets unchanged, {len(removed)} removed."
+    )
 
 
 def build_story(args: Namespace) -> None:
@@ -147,79 +141,16 @@ def build_story(args: Namespace) -> None:
     except YAMLError as exc:
         print(f"Failed to load world from {world_filename}: {exc}.")
         raise SystemExit
-    sounds_directory: Optional[Path] = None
     if args.sounds_directory:
-        sounds_directory = Path(args.sounds_directory)
-        make_directory(sounds_directory)
         print("Gathering assets:")
-        music_directory = sounds_directory / "music"
-        make_directory(music_directory)
-        musics: List[str] = world.main_menu_musics
-        world.main_menu_musics = []
-        index: int
-        music: str
-        for index, music in enumerate(musics):
-            filename: str = get_filename(music, index)
-            filename = copy_path(music, music_directory / filename)
-            world.main_menu_musics.append(filename)
-        if world.cursor_sound is None:
-            print("Skipping empty cursor sound.")
-        else:
-            world.cursor_sound = copy_path(
-                world.cursor_sound, sounds_directory
-            )
-        if world.empty_category_sound is None:
-            print("Skipping empty category sound.")
-        else:
-            world.empty_category_sound = copy_path(
-                world.empty_category_sound, sounds_directory
-            )
-        if world.end_of_category_sound is None:
-            print("Skipping end of category sound.")
-        else:
-            world.end_of_category_sound = copy_path(
-                world.end_of_category_sound, sounds_directory
-            )
-        actions_directory: Path = sounds_directory / "actions"
-        if world.take_action is not None:
-            copy_action(world.take_action, actions_directory, 0)
-        if world.drop_action is not None:
-            copy_action(world.drop_action, actions_directory, 1)
-        rooms_directory: Path = sounds_directory / "rooms"
-        make_directory(rooms_directory)
-        room: WorldRoom
-        action: WorldAction
-        for room in world.rooms.values():
-            room_directory: Path = rooms_directory / room.id
-            make_directory(room_directory)
-            ambiances_directory: Path = room_directory / "ambiances"
-            copy_ambiances(room.ambiances, ambiances_directory)
-            exits_directory: Path = room_directory / "exits"
-            x: RoomExit
-            actions: List[WorldAction] = [x.action for x in room.exits]
-            copy_actions(actions, exits_directory)
-            obj: RoomObject
-            objects_directory: Path = room_directory / "objects"
-            make_directory(objects_directory)
-            for obj in room.objects.values():
-                object_directory: Path = objects_directory / obj.id
-                make_directory(object_directory)
-                ambiances_directory = object_directory / "ambiances"
-                copy_ambiances(obj.ambiances, ambiances_directory)
-                actions_directory = object_directory / "actions"
-                make_directory(actions_directory)
-                copy_actions(obj.actions, actions_directory)
-                system_actions_directory: Path = actions_directory / "system"
-                if obj.take_action is not None:
-                    copy_action(obj.take_action, system_actions_directory, 0)
-                if obj.drop_action is not None:
-                    copy_action(obj.drop_action, system_actions_directory, 1)
-                if obj.use_action is not None:
-                    copy_action(obj.use_action, system_actions_directory, 2)
-                if obj.actions_action is not None:
-                    copy_action(
-                        obj.actions_action, system_actions_directory, 3
-                    )
+        store: AssetStore = AssetStore(
+            Path(args.sounds_directory), link=args.link, jobs=args.jobs
+        )
+        try:
+            gather_assets(world, store, world_filename)
+        except OSError as exc:
+            print(f"Failed to gather assets: {exc}.")
+            raise SystemExit
     else:
         print("Not copying sounds.")
     yaml_file: Path = Path(python_filename + ".yaml")
@@ -256,7 +187,10 @@ def play_story(args: Namespace, edit: bool = False) -> None:
         raise SystemExit
     game: Game = Game()
     try:
-        world: StoryWorld = StoryWorld.from_filename(filename, game)
+        # Rooms are only loaded as they are needed when playing.
+        world: StoryWorld = StoryWorld.from_filename(
+            filename, game, lazy=not edit
+        )
     except YAMLError as e:
         print(f"Failed to load world from {filename}: {e}.")
         raise SystemExit
@@ -0,0 +1,468 @@
+"""Provides a compact binary codec for game messages."""
+
+from datetime import datetime
+from enum import Enum
+from importlib import import_module
+from struct import Struct
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
+
+from attr import Factory, attrib, attrs, fields
+
+# The tags which precede every encoded value.
+TAG_NONE: int = 0
+TAG_FALSE: int = 1
+TAG_TRUE: int = 2
+TAG_INT: int = 3
+TAG_FLOAT: int = 4
+TAG_STR: int = 5
+TAG_BYTES: int = 6
+TAG_LIST: int = 7
+TAG_DICT: int = 8
+TAG_OBJECT: int = 9
+TAG_DATETIME: int = 10
+TAG_ENUM: int = 11
+
+float_struct: Struct = Struct("!d")
+
+# The types of data which can be decoded.
+DataType = Union[bytes, bytearray, memoryview]
+
+
+class CodecError(Exception):
+    """There was a problem encoding or decoding a value."""
+
+
+@attrs(auto_attribs=True)
+class BinaryCodec:
+    """Encode and decode values in a compact binary form.
+
+    Supported values are ``None``, booleans, integers, floats, strings,
+    bytes, lists, tuples (which decode as lists), dictionaries, datetimes,
+    enumeration members, and instances of registered ``attrs`` classes::
+
+        @attrs(auto_attribs=True)
+        class Say:
+            player: int
+            text: str
+
+        codec: BinaryCodec = BinaryCodec()
+        codec.register(Say, 1)
+        con.send_message(codec.encode(Say(5, 'Hello')))
+
+        @con.event
+        def on_message(message: memoryview) -> None:
+            msg: Any = codec.decode(message)
+
+    Integers are stored as variable length, so small numbers take a single
+    byte. Registered classes are stored as their type ID, followed by the
+    values of their ``__init__`` fields, so field names are never sent.
+
+    Enumeration members are stored as the module and name of their class,
+    followed by their value. Their classes must be registered with
+    :meth:`~earwax.BinaryCodec.register_enum` before they can be decoded,
+    unless :attr:`~earwax.BinaryCodec.import_enums` is ``True``.
+
+    Lists, dictionaries, and objects can be nested no more than
+    :attr:`~earwax.BinaryCodec.max_depth` deep, so a malicious message cannot
+    exhaust the stack.
+
+    :ivar ~earwax.BinaryCodec.import_enums: Whether or not to import the
+        modules of enumerations which have not been registered.
+
+        This should only be enabled for trusted data, like save files, as
+        decoding will import any module named in the data.
+
+    :ivar ~earwax.BinaryCodec.max_depth: The deepest values can be nested.
+
+        Values which are nested deeper cannot be encoded or decoded.
+
+    :ivar ~earwax.BinaryCodec.types: The registered classes, keyed by type
+        ID.
+
+    :ivar ~earwax.BinaryCodec.type_ids: The type IDs of registered classes,
+        and the names of the fields which are encoded.
+
+    :ivar ~earwax.BinaryCodec.enums: The known enumerations, keyed by the
+        names they are encoded with.
+    """
+
+    import_enums: bool = False
+    max_depth: int = 100
+
+    types: Dict[int, Type] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    type_ids: Dict[Type, Tuple[int, List[str]]] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    enums: Dict[str, Type[Enum]] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+
+    def register(self, cls: Type, type_id: int) -> None:
+        """Register an ``attrs`` class.
+
+        :param cls: The class to register.
+
+        :param type_id: The ID to encode instances of ``cls`` with.
+
+            Both ends of a connection must use the same IDs.
+        """
+        if type_id in self.types:
+            raise CodecError(
+                "Type ID %d is already used by %r."
+                % (type_id, self.types[type_id])
+            )
+        self.types[type_id] = cls
+        self.type_ids[cls] = (
+            type_id,
+            [f.name for f in fields(cls) if f.init],
+        )
+
+    def register_enum(self, cls: Type[Enum]) -> None:
+        """Register an enumeration, so its members can be decoded.
+
+        :param cls: The enumeration to register.
+        """
+        self.enums[enum_name(cls)] = cls
+
+    def get_enum(self, name: str) -> Type[Enum]:
+        """Return the enumeration with the given name.
+
+        If the enumeration has not been registered, and
+        :attr:`~earwax.BinaryCodec.import_enums` is ``True``, its module will
+        be imported.
+
+        :param name: The name the enumeration was encoded with.
+        """
+        cls: Any = self.enums.get(name)
+        if cls is None and self.import_enums:
+            module_name: str
+            qualname: str
+            module_name, _, qualname = name.partition(":")
+            try:
+                cls = import_module(module_name)
+                part: str
+                for part in qualname.split("."):
+                    cls = getattr(cls, part)
+            except (ImportError, AttributeError):
+                raise CodecError("Cannot find enumeration %s." % name)
+        if not isinstance(cls, type) or not issubclass(cls, Enum):
+            raise CodecError("Unknown enumeration %s." % name)
+        self.enums[name] = cls
+        return cls
+
+    def encode(self, value: Any) -> bytes:
+        """Return ``value`` encoded as bytes.
+
+        :param value: The value to encode.
+        """
+        buffer: bytearray = bytearray()
+        self.write(buffer, value)
+        return bytes(buffer)
+
+    def decode(self, data: DataType) -> Any:
+        """Return the value encoded in ``data``.
+
+        :param data: The bytes (or memoryview) to decode.
+        """
+        value: Any
+        offset: int
+        value, offset = self.read(data, 0)
+        if offset != len(data):
+            raise CodecError(
+                "%d bytes left over after decoding." % (len(data) - offset)
+            )
+        return value
+
+    def write(self, buffer: bytearray, value: Any, depth: int = 0) -> None:
+        """Append ``value`` to ``buffer``.
+
+        :param buffer: The buffer to write to.
+
+        :param value: The value to write.
+
+        :param depth: How deeply ``value`` is nested in the value being
+            encoded.
+        """
+        if depth > self.max_depth:
+            raise CodecError("Values are nested too deeply.")
+        if value is None:
+            buffer.append(TAG_NONE)
+        elif value is True:
+            buffer.append(TAG_TRUE)
+        elif value is False:
+            buffer.append(TAG_FALSE)
+        elif isinstance(value, Enum):
+            buffer.append(TAG_ENUM)
+            self.write(buffer, enum_name(type(value)))
+            self.write(buffer, value.value)
+        elif isinstance(value, int):
+            buffer.append(TAG_INT)
+            # Zigzag encoding keeps small negative numbers small.
+            write_varint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            buffer.append(TAG_FLOAT)
+            buffer += float_struct.pack(value)
+        elif isinstance(value, str):
+            data: bytes = value.encode()
+            buffer.append(TAG_STR)
+            write_varint(buffer, len(data))
+            buffer += data
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            buffer.append(TAG_BYTES)
+            write_varint(buffer, len(value))
+            buffer += value
+        elif isinstance(value, (list, tuple)):
+            buffer.append(TAG_LIST)
+            write_varint(buffer, len(value))
+            for item in value:
+                self.write(buffer, item, depth + 1)
+        elif isinstance(value, dict):
+            buffer.append(TAG_DICT)
+            write_varint(buffer, len(value))
+            for key, item in value.items():
+                self.write(buffer, key, depth + 1)
+                self.write(buffer, item, depth + 1)
+        elif isinstance(value, datetime):
+            buffer.append(TAG_DATETIME)
+            self.write(buffer, value.isoformat())
+        elif type(value) in self.type_ids:
+            type_id: int
+            names: List[str]
+            type_id, names = self.type_ids[type(value)]
+            buffer.append(TAG_OBJECT)
+            write_varint(buffer, type_id)
+            name: str
+            for name in names:
+                self.write(buffer, getattr(value, name), depth + 1)
+        else:
+            raise CodecError("Cannot encode %r." % value)
+
+    def read(
+        self, data: DataType, offset: int, depth: int = 0
+    ) -> Tuple[Any, int]:
+        """Read one value from ``data``.
+
+        Returns the value, and the offset of the byte after it.
+
+        :param data: The data to read from.
+
+        :param offset: The offset to start reading at.
+
+        :param depth: How deeply the value is nested in the value being
+            decoded.
+        """
+        if depth > self.max_depth:
+            raise CodecError("Values are nested too deeply.")
+        try:
+            tag: int = data[offset]
+        except IndexError:
+            raise CodecError("Unexpected end of data.")
+        offset += 1
+        reader: ReaderType = readers.get(tag, read_unknown)
+        return reader(self, data, offset, depth)
+
+
+# The type of the functions which read each tag.
+ReaderType = Callable[[BinaryCodec, DataType, int, int], Tuple[Any, int]]
+
+
+def enum_name(cls: Type[Enum]) -> str:
+    """Return the name an enumeration is encoded with.
+
+    :param cls: The enumeration to name.
+    """
+    return "%s:%s" % (cls.__module__, cls.__qualname__)
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Append a non-negative integer, 7 bits at a time.
+
+    :param buffer: The buffer to write to.
+
+    :param value: The integer to write.
+    """
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: DataType, offset: int) -> Tuple[int, int]:
+    """Read an integer written by :func:`write_varint`.
+
+    Returns the integer, and the offset of the byte after it.
+
+    :param data: The data to read from.
+
+    :param offset: The offset to start reading at.
+    """
+    value: int = 0
+    shift: int = 0
+    while True:
+        try:
+            byte: int = data[offset]
+        except IndexError:
+            raise CodecError("Unexpected end of data.")
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def read_sized(data: DataType, offset: int) -> Tuple[bytes, int]:
+    """Read a length, followed by that many bytes.
+
+    :param data: The data to read from.
+
+    :param offset: The offset to start reading at.
+    """
+    size: int
+    size, offset = read_varint(data, offset)
+    end: int = offset + size
+    if end > len(data):
+        raise CodecError("Unexpected end of data.")
+    return bytes(data[offset:end]), end
+
+
+def read_int(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[int, int]:
+    """Read a zigzag encoded integer."""
+    value: int
+    value, offset = read_varint(data, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+def read_float(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[float, int]:
+    """Read a float."""
+    if offset + float_struct.size > len(data):
+        raise CodecError("Unexpected end of data.")
+    return (
+        float_struct.unpack_from(data, offset)[0],
+        offset + float_struct.size,
+    )
+
+
+def read_str(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[str, int]:
+    """Read a string."""
+    value: bytes
+    value, offset = read_sized(data, offset)
+    return value.decode(), offset
+
+
+def read_bytes(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[bytes, int]:
+    """Read some bytes."""
+    return read_sized(data, offset)
+
+
+def read_list(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[List[Any], int]:
+    """Read a list."""
+    count: int
+    count, offset = read_varint(data, offset)
+    items: List[Any] = []
+    for _ in range(count):
+        item: Any
+        item, offset = codec.read(data, offset, depth + 1)
+        items.append(item)
+    return items, offset
+
+
+def read_dict(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[Dict[Any, Any], int]:
+    """Read a dictionary."""
+    count: int
+    count, offset = read_varint(data, offset)
+    value: Dict[Any, Any] = {}
+    for _ in range(count):
+        key: Any
+        item: Any
+        key, offset = codec.read(data, offset, depth + 1)
+        item, offset = codec.read(data, offset, depth + 1)
+        try:
+            value[key] = item
+        except TypeError:
+            raise CodecError("Invalid dictionary key %r." % key)
+    return value, offset
+
+
+def read_object(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[Any, int]:
+    """Read an instance of a registered class."""
+    type_id: int
+    type_id, offset = read_varint(data, offset)
+    cls: Type
+    try:
+        cls = codec.types[type_id]
+    except KeyError:
+        raise CodecError("Unknown type ID %d." % type_id)
+    kwargs: Dict[str, Any] = {}
+    name: str
+    for name in codec.type_ids[cls][1]:
+        # Attrs strips leading underscores from argument names.
+        kwargs[name.lstrip("_")], offset = codec.read(data, offset, depth + 1)
+    return cls(**kwargs), offset
+
+
+def read_datetime(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[datetime, int]:
+    """Read a datetime."""
+    value: Any
+    value, offset = codec.read(data, offset, depth + 1)
+    try:
+        return datetime.fromisoformat(value), offset
+    except (TypeError, ValueError):
+        raise CodecError("Invalid datetime %r." % value)
+
+
+def read_enum(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[Enum, int]:
+    """Read an enumeration member."""
+    name: Any
+    value: Any
+    name, offset = codec.read(data, offset, depth + 1)
+    value, offset = codec.read(data, offset, depth + 1)
+    if not isinstance(name, str):
+        raise CodecError("Invalid enumeration name %r." % name)
+    cls: Type[Enum] = codec.get_enum(name)
+    try:
+        return cls(value), offset
+    except ValueError:
+        raise CodecError("%r is not a valid %s." % (value, name))
+
+
+def read_unknown(
+    codec: BinaryCodec, data: DataType, offset: int, depth: int
+) -> Tuple[Any, int]:
+    """Raise an error for an unknown tag."""
+    raise CodecError("Unknown tag %d." % data[offset - 1])
+
+
+readers: Dict[int, ReaderType] = {
+    TAG_NONE: lambda codec, data, offset, depth: (None, offset),
+    TAG_FALSE: lambda codec, data, offset, depth: (False, offset),
+    TAG_TRUE: lambda codec, data, offset, depth: (True, offset),
+    TAG_INT: read_int,
+    TAG_FLOAT: read_float,
+    TAG_STR: read_str,
+    TAG_BYTES: read_bytes,
+    TAG_LIST: read_list,
+    TAG_DICT: read_dict,
+    TAG_OBJECT: read_object,
+    TAG_DATETIME: read_datetime,
+    TAG_ENUM: read_enum,
+}
@@ -1,5 +1,6 @@
 """Provides the Config class."""
 
+from multiprocessing import cpu_count
 from pathlib import Path
 from typing import Optional
 
@@ -106,6 +107,10 @@ class SoundConfig(Config):
 
     :ivar ~earwax.configuration.default_cache_size: The default size (in bytes)
         for the default :attr:`~earwax.Game.buffer_cache` object.
+
+    :ivar ~earwax.configuration.prefetch_size: The most sound data (in bytes)
+        which will be loaded ahead of time, for rooms the player is likely to
+        visit next.
     """
 
     __section_name__ = "Sound"
@@ -119,6 +124,9 @@ class SoundConfig(Config):
     default_cache_size: ConfigValue[int] = ConfigValue(
         1024 ** 2 * 500, name="The size of the default sound cache in bytes"
     )
+    prefetch_size: ConfigValue[int] = ConfigValue(
+        1024 ** 2 * 100, name="The most sound data to load ahead in bytes"
+    )
 
 
 class EditorConfig(Config):
@@ -136,6 +144,32 @@ class EditorConfig(Config):
     )
 
 
+class ExecutorsConfig(Config):
+    """Configure the thread pools returned by :meth:`earwax.Game.get_executor`.
+
+    :ivar ~earwax.configuration.io_workers: The number of threads used for
+        reading and writing files, and other work that spends most of its time
+        waiting.
+
+    :ivar ~earwax.configuration.cpu_workers: The number of threads used for
+        work that keeps the processor busy.
+
+    :ivar ~earwax.configuration.audio_decode_workers: The number of threads
+        used to decode sound files into buffers.
+    """
+
+    __section_name__ = "Thread Pools"
+    io_workers: ConfigValue[int] = ConfigValue(
+        min(32, cpu_count() + 4), name="Threads for input and output"
+    )
+    cpu_workers: ConfigValue[int] = ConfigValue(
+        cpu_count(), name="Threads for processing"
+    )
+    audio_decode_workers: ConfigValue[int] = ConfigValue(
+        cpu_count(), name="Threads for decoding audio"
+    )
+
+
 class EarwaxConfig(Config):
     """The main earwax configuration.
 
@@ -149,3 +183,4 @@ class EarwaxConfig(Config):
     speech: SpeechConfig = SpeechConfig()
     sound: SoundConfig = SoundConfig()
     editors: EditorConfig = EditorConfig()
+    executors: ExecutorsConfig = ExecutorsConfig()
@@ -1,10 +1,9 @@
 """Provides the Die class."""
 
-from random import randint
-
 from attr import attrs
 
 from .mixins import RegisterEventMixin
+from .utils import get_random
 
 
 @attrs(auto_attribs=True)
@@ -35,6 +34,6 @@ class Die(RegisterEventMixin):
         Returns a number between 1, and :attr:`self.size
         <earwax.Die.size>`.
         """
-        value: int = randint(1, self.sides)
+        value: int = get_random("die").randint(1, self.sides)
         self.dispatch_event("on_roll", value)
         return value
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 
 from attr import attrs
 
+from .profiler import profiled
+
 if TYPE_CHECKING:
     from .game import Game
 
@@ -25,6 +27,7 @@ class EventMatcher:
     game: "Game"
     name: str
 
+    @profiled(get_name=lambda m: "Event: %s" % m.name)
     def dispatch(self, *args, **kwargs) -> None:
         """Dispatch this event.
 
@@ -35,12 +38,17 @@ class EventMatcher:
         the proper name, search instead on :attr:`self.game
         <earwax.EventMatcher.game>`.
 
+        If the game has an :attr:`~earwax.Game.input_recorder`, the event is
+        recorded first.
+
         :param args: The positional arguments to pass to any event that is
             found.
 
         :param kwargs: The keyword arguments to pass to any event that is
             found.
         """
+        if self.game.input_recorder is not None:
+            self.game.input_recorder.record(self.name, args)
         if (
             self.game.level is not None
             and self.name in self.game.level.event_types
@@ -0,0 +1,193 @@
+"""Provides the MeteredExecutor class."""
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from attr import Factory, attrib, attrs
+
+
+@attrs(auto_attribs=True)
+class MeteredExecutor(Executor):
+    """A thread pool which keeps statistics about the work it does.
+
+    Instances of this class are created by :meth:`earwax.Game.get_executor`,
+    so that slow work of one kind (like reading from disk) cannot starve work
+    of another kind (like decoding audio)::
+
+        executor: MeteredExecutor = game.get_executor('io')
+        future: Future = executor.submit(path.read_bytes)
+        print(executor.queue_depth)
+
+    The underlying ``ThreadPoolExecutor`` is only created when work is first
+    submitted. When :meth:`~earwax.MeteredExecutor.shutdown` is called, that
+    thread pool is shut down, and a new one will be created if more work is
+    submitted.
+
+    :ivar ~earwax.MeteredExecutor.name: The name of this executor.
+
+        This name is used as the prefix for worker thread names.
+
+    :ivar ~earwax.MeteredExecutor.max_workers: The maximum number of worker
+        threads.
+
+    :ivar ~earwax.MeteredExecutor.submitted: The number of work items that
+        have been submitted.
+
+    :ivar ~earwax.MeteredExecutor.started: The number of work items that have
+        been started by a worker.
+
+    :ivar ~earwax.MeteredExecutor.completed: The number of work items that
+        have finished, whether or not they raised an error.
+
+    :ivar ~earwax.MeteredExecutor.failed: The number of work items that raised
+        an error.
+
+    :ivar ~earwax.MeteredExecutor.cancelled: The number of work items that
+        were cancelled before they started.
+
+        Cancelled work items are not counted in
+        :attr:`~earwax.MeteredExecutor.submitted`.
+
+    :ivar ~earwax.MeteredExecutor.total_latency: The total number of seconds
+        work items spent waiting for a worker.
+
+    :ivar ~earwax.MeteredExecutor.max_latency: The longest time a single work
+        item spent waiting for a worker.
+
+    :ivar ~earwax.MeteredExecutor.total_duration: The total number of seconds
+        spent doing work.
+
+    :ivar ~earwax.MeteredExecutor.max_duration: The longest time a single work
+        item took to complete.
+    """
+
+    name: str
+    max_workers: int
+
+    submitted: int = attrib(default=0, init=False)
+    started: int = attrib(default=0, init=False)
+    completed: int = attrib(default=0, init=False)
+    failed: int = attrib(default=0, init=False)
+    cancelled: int = attrib(default=0, init=False)
+    total_latency: float = attrib(default=0.0, init=False, repr=False)
+    max_latency: float = attrib(default=0.0, init=False, repr=False)
+    total_duration: float = attrib(default=0.0, init=False, repr=False)
+    max_duration: float = attrib(default=0.0, init=False, repr=False)
+
+    _executor: Optional[ThreadPoolExecutor] = attrib(
+        default=None, init=False, repr=False
+    )
+    _lock: Lock = attrib(default=Factory(Lock), init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Check the number of workers."""
+        if self.max_workers < 1:
+            raise ValueError(
+                "Executor %r must have at least 1 worker, not %r."
+                % (self.name, self.max_workers)
+            )
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of work items waiting for a worker."""
+        return self.submitted - self.started
+
+    @property
+    def running(self) -> int:
+        """Return the number of work items currently being worked on."""
+        return self.started - self.completed
+
+    @property
+    def average_latency(self) -> float:
+        """Return the average time work items waited for a worker."""
+        if not self.started:
+            return 0.0
+        return self.total_latency / self.started
+
+    @property
+    def average_duration(self) -> float:
+        """Return the average time work items took to complete."""
+        if not self.completed:
+            return 0.0
+        return self.total_duration / self.completed
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Return the underlying thread pool, creating it if necessary."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix=self.name
+                )
+            return self._executor
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], *args, **kwargs
+    ) -> Future:
+        """Submit work, recording how long it waits and runs.
+
+        :param fn: The function to call.
+
+        :param args: The positional arguments to pass to ``fn``.
+
+        :param kwargs: The keyword arguments to pass to ``fn``.
+        """
+        submitted_at: float = perf_counter()
+
+        def inner() -> Any:
+            started_at: float = perf_counter()
+            latency: float = started_at - submitted_at
+            with self._lock:
+                self.started += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+            ok: bool = False
+            try:
+                result: Any = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                duration: float = perf_counter() - started_at
+                with self._lock:
+                    self.completed += 1
+                    if not ok:
+                        self.failed += 1
+                    self.total_duration += duration
+                    self.max_duration = max(self.max_duration, duration)
+
+        executor: ThreadPoolExecutor = self.get_executor()
+        with self._lock:
+            self.submitted += 1
+        try:
+            future: Future = executor.submit(inner)
+        except Exception:
+            with self._lock:
+                self.submitted -= 1
+            raise
+        future.add_done_callback(self.on_future_done)
+        return future
+
+    def on_future_done(self, future: Future) -> None:
+        """Stop counting work which was cancelled before it started.
+
+        :param future: The future which has finished.
+        """
+        if future.cancelled():
+            with self._lock:
+                self.submitted -= 1
+                self.cancelled += 1
+
+    def shutdown(self, wait: bool = True, **kwargs) -> None:
+        """Shut down the underlying thread pool.
+
+        :param wait: Whether or not to wait for outstanding work to finish.
+
+        :param kwargs: Extra keyword arguments to pass to the ``shutdown``
+            method of the underlying thread pool.
+        """
+        with self._lock:
+            executor: Optional[ThreadPoolExecutor] = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait, **kwargs)
@@ -1,6 +1,6 @@
 """Provides the Game class."""
 
-from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import Executor
 from inspect import isgenerator
 from logging import Logger, getLogger
 from multiprocessing import cpu_count
@@ -41,20 +41,41 @@ except ModuleNotFoundError:
         None,
     )
 
+from . import leaks
 from .action import Action, HatDirection, OptionalGenerator
+from .config import ConfigValue
 from .configuration import EarwaxConfig
 from .event_matcher import EventMatcher
+from .executors import MeteredExecutor
 from .hat_directions import DEFAULT
+from .leaks import LeakDetector
 from .level import Level
+from .metrics import MetricsRegistry
 from .mixins import RegisterEventMixin
+from .profiler import Profiler, profiled
+from .promises.base import Promise
+from .promises.sequencer import Sequencer
+from .recording import InputRecorder
+from .reverb import ReverbPool
 from .sound import SoundManager
 from .speech import tts
+from .tracing import Tracer, traced
 from .types import (ActionListType, JoyButtonReleaseGeneratorDictType,
                     ReleaseGeneratorDictType)
 
 NoneType: Type[None] = type(None)
 
 
+def get_level_args(game: "Game", level: Level) -> Dict[str, str]:
+    """Return the information traced when a level is pushed or replaced.
+
+    :param game: The game the level is being pushed onto.
+
+    :param level: The level being pushed.
+    """
+    return dict(level=type(level).__name__)
+
+
 class GameNotRunning(Exception):
     """This game is not running."""
 
@@ -94,6 +115,9 @@ class Game(RegisterEventMixin):
     :ivar ~earwax.Game.ambiance_sound_manager: A sound manager for playing
         ambiances.
 
+    :ivar ~earwax.Game.reverb_pool: The pool to get reverbs from, so presets
+        with the same settings share a reverb.
+
     :ivar ~earwax.Game.levels: All the pushed :class:`earwax.Level` instances.
 
     :ivar ~earwax.Game.triggered_actions: The currently triggered
@@ -122,14 +146,63 @@ class Game(RegisterEventMixin):
     :ivar ~earwax.Game.joysticks: The list of joysticks that have been opened
         by this instance.
 
-    :ivar ~earwax.Game.thread_pool: An instance of ``ThreadPoolExecutor`` to
-        use for threaded operations.
+    :ivar ~earwax.Game.executors: The :class:`earwax.MeteredExecutor`
+        instances which have been created by :meth:`~earwax.Game.get_executor`.
+
+    :ivar ~earwax.Game.thread_pool: An executor to use for threaded
+        operations.
+
+        By default, this is the ``'io'`` executor from
+        :meth:`~earwax.Game.get_executor`.
 
     :ivar ~earwax.Game.tasks: A list of :class:`earwax.Task` instances.
 
         You can add tasks with the :meth:`~earwax.Game.register_task`
         decorator, and remove them again with the
         :meth:`~earwax.Game.remove_task` method.
+
+    :ivar ~earwax.Game.sequencer: The :class:`earwax.Sequencer` used by
+        :class:`earwax.StaggeredPromise` instances created by earwax itself,
+        such as rumble effects.
+
+        Use this sequencer for your own promises if you plan to run lots of
+        them at once.
+
+    :ivar ~earwax.Game.tts: The object used by :meth:`~earwax.Game.output` to
+        speak and braille text.
+
+        By default, this is the :attr:`earwax.tts` object. Any object with
+        ``speak``, ``braille``, and ``silence`` methods can be used.
+
+    :ivar ~earwax.Game.input_recorder: The :class:`earwax.InputRecorder`
+        which is recording the input this game receives, if any.
+
+        This attribute is set by :meth:`earwax.InputRecorder.start`.
+
+    :ivar ~earwax.Game.profiler: The :class:`earwax.Profiler` which was last
+        started for this game, if any.
+
+        This attribute is set by :meth:`earwax.Profiler.start`. The profiler
+        is stopped (and its results saved, if it has a
+        :attr:`~earwax.Profiler.path`) by :meth:`~earwax.Game.finalise_run`.
+
+    :ivar ~earwax.Game.tracer: The :class:`earwax.Tracer` which was last
+        started for this game, if any.
+
+        Like :attr:`~earwax.Game.profiler`, this attribute is set when the
+        tracer is started, and the tracer is stopped by
+        :meth:`~earwax.Game.finalise_run`.
+
+    :ivar ~earwax.Game.leak_detector: The :class:`earwax.LeakDetector` which
+        was last started for this game, if any.
+
+        While it is running, it is told about every level that is pushed and
+        popped. It is stopped by :meth:`~earwax.Game.finalise_run`.
+
+    :ivar ~earwax.Game.metrics: The metrics registry for this game.
+
+        The gauges added by :meth:`~earwax.Game.register_metrics` are always
+        present.
     """
 
     window: Optional[Window] = attrib(
@@ -172,6 +245,9 @@ class Game(RegisterEventMixin):
         default=Factory(list), init=False, repr=False
     )
     tasks: List[Task] = attrib(default=Factory(list), init=False, repr=False)
+    sequencer: Sequencer = attrib(
+        default=Factory(Sequencer), init=False, repr=False
+    )
 
     name: str = __name__
 
@@ -197,13 +273,22 @@ class Game(RegisterEventMixin):
     ambiance_sound_manager: Optional[SoundManager] = attrib(
         default=Factory(NoneType), repr=False
     )
+    reverb_pool: Optional[ReverbPool] = attrib(
+        default=Factory(NoneType), repr=False
+    )
 
-    thread_pool: Executor = attrib(
-        default=Factory(
-            lambda: ThreadPoolExecutor(max(1, int(cpu_count() / 4)))
-        ),
-        repr=False,
+    executors: Dict[str, MeteredExecutor] = attrib(
+        default=Factory(dict), init=False, repr=False
     )
+    thread_pool: Executor = attrib(repr=False)
+
+    @thread_pool.default
+    def get_default_thread_pool(instance: "Game") -> Executor:
+        """Return the default thread pool.
+
+        :param instance: The game to return the thread pool for.
+        """
+        return instance.get_executor("io")
 
     credits: List[Credit] = attrib(default=Factory(list), repr=False)
     logger: Logger = attrib(repr=False)
@@ -216,6 +301,22 @@ class Game(RegisterEventMixin):
     input_mode: InputModes = attrib(
         default=Factory(lambda: InputModes.keyboard), init=False, repr=False
     )
+    tts: Any = attrib(default=Factory(lambda: tts), repr=False)
+    input_recorder: Optional[InputRecorder] = attrib(
+        default=Factory(NoneType), init=False, repr=False
+    )
+    profiler: Optional[Profiler] = attrib(
+        default=Factory(NoneType), init=False, repr=False
+    )
+    tracer: Optional[Tracer] = attrib(
+        default=Factory(NoneType), init=False, repr=False
+    )
+    leak_detector: Optional[LeakDetector] = attrib(
+        default=Factory(NoneType), init=False, repr=False
+    )
+    metrics: MetricsRegistry = attrib(
+        default=Factory(MetricsRegistry), init=False, repr=False
+    )
 
     def __attrs_post_init__(self) -> None:
         """Register default events."""
@@ -233,6 +334,117 @@ class Game(RegisterEventMixin):
             self.setup,
         ):
             self.register_event(cast(EventType, func))
+        self.register_metrics()
+
+    def register_metrics(self) -> None:
+        """Add the engine's gauges to :attr:`~earwax.Game.metrics`.
+
+        * ``levels.depth``: The number of levels on the stack.
+
+        * ``sounds.active``: The number of sounds in each of this game's sound
+            managers, by name.
+
+        * ``buffers.size``: The :attr:`~earwax.BufferCache.current_size` of
+            the buffer cache.
+
+        * ``buffers.count``: The number of cached buffers.
+
+        * ``buffers.hit_rate``: The :attr:`~earwax.BufferCache.hit_rate` of
+            the buffer cache.
+
+        * ``reverbs.count``: The number of reverbs in
+            :attr:`~earwax.Game.reverb_pool`, including idle ones.
+
+        * ``promises.pending``: The value of
+            :attr:`earwax.Promise.pending_count`.
+
+        * ``executors.queue_depth``: The
+            :attr:`~earwax.MeteredExecutor.queue_depth` of each executor, by
+            name.
+        """
+        m: MetricsRegistry = self.metrics
+        m.gauge("levels.depth", lambda: len(self.levels))
+        m.gauge("sounds.active", self.get_sound_counts)
+        m.gauge("buffers.size", lambda: self.buffer_cache.current_size)
+        m.gauge("buffers.count", lambda: len(self.buffer_cache.buffers))
+        m.gauge("buffers.hit_rate", lambda: self.buffer_cache.hit_rate)
+        m.gauge(
+            "reverbs.count",
+            lambda: 0
+            if self.reverb_pool is None
+            else len(self.reverb_pool.reverbs),
+        )
+        m.gauge("promises.pending", lambda: Promise.pending_count)
+        name: str
+        executor: MeteredExecutor
+        m.gauge(
+            "executors.queue_depth",
+            lambda: {
+                name: executor.queue_depth
+                for name, executor in self.executors.items()
+            },
+        )
+
+    def get_sound_counts(self) -> Dict[str, float]:
+        """Return the number of sounds in each of this game's sound managers.
+
+        This method is used by the ``sounds.active`` gauge.
+        """
+        manager: Optional[SoundManager]
+        return {
+            manager.name: len(manager.sounds)
+            for manager in (
+                self.interface_sound_manager,
+                self.music_sound_manager,
+                self.ambiance_sound_manager,
+            )
+            if manager is not None
+        }
+
+    def get_executor(self, name: str) -> MeteredExecutor:
+        """Return the executor with the given name, creating it if necessary.
+
+        Earwax uses three executors, each of which is sized by the
+        :attr:`executors <earwax.configuration.EarwaxConfig.executors>`
+        configuration section:
+
+        * ``'io'``: For reading and writing files.
+
+        * ``'cpu'``: For work that keeps the processor busy, like rebuilding
+            the caches made by :meth:`earwax.story.StoryWorld.from_filename`.
+
+        * ``'audio-decode'``: For decoding sound files.
+
+        Executors with any other name will have one thread per processor.
+
+        All executors will be shut down by the
+        :meth:`~earwax.Game.shutdown_executors` method.
+
+        :param name: The name of the executor.
+        """
+        if name not in self.executors:
+            workers: Optional[ConfigValue] = getattr(
+                self.config.executors,
+                name.replace("-", "_") + "_workers",
+                None,
+            )
+            self.executors[name] = MeteredExecutor(
+                name, cpu_count() if workers is None else workers.value
+            )
+        return self.executors[name]
+
+    def shutdown_executors(self, wait: bool = True) -> None:
+        """Shut down every executor created by :meth:`get_executor`.
+
+        This method is called after the :meth:`~earwax.Game.after_run` event
+        has been dispatched. Executors will start new threads if they are
+        used again.
+
+        :param wait: Whether or not to wait for outstanding work to finish.
+        """
+        executor: MeteredExecutor
+        for executor in self.executors.values():
+            executor.shutdown(wait=wait)
 
     def start_action(self, a: Action) -> OptionalGenerator:
         """Start an action.
@@ -584,7 +796,7 @@ class Game(RegisterEventMixin):
         """Get ready to run the game.
 
         This method dispatches the :meth:`~earwax.Game.setup` event, and sets
-        up sound managers.
+        up sound managers, and :attr:`~earwax.Game.reverb_pool`.
 
         Finally, it pushes the initial level, if necessary.
 
@@ -616,6 +828,8 @@ class Game(RegisterEventMixin):
                     default_gain=self.config.sound.ambiance_volume.value,
                     default_looping=True,
                 )
+            if self.reverb_pool is None:
+                self.reverb_pool = ReverbPool(self.audio_context)
         if initial_level is not None:
             self.push_level(initial_level)
 
@@ -629,11 +843,27 @@ class Game(RegisterEventMixin):
         * Unload Cytolk.
 
         * Dispatch the :meth:`~earwax.Game.after_run` event.
+
+        * Call :meth:`~earwax.Game.shutdown_executors`.
+
+        * Destroy every reverb in :attr:`~earwax.Game.reverb_pool`.
+
+        * Stop :attr:`~earwax.Game.profiler`, :attr:`~earwax.Game.tracer`,
+            and :attr:`~earwax.Game.leak_detector` if they are running.
         """
         self.dispatch_event("before_run")
         app.run()
         unload()
         self.dispatch_event("after_run")
+        self.shutdown_executors()
+        if self.reverb_pool is not None:
+            self.reverb_pool.destroy_all()
+        if self.profiler is not None and self.profiler.running:
+            self.profiler.stop()
+        if self.tracer is not None and self.tracer.running:
+            self.tracer.stop()
+        if self.leak_detector is not None and self.leak_detector.running:
+            self.leak_detector.stop()
 
     def run(
         self,
@@ -714,6 +944,7 @@ class Game(RegisterEventMixin):
                 )
                 j.event(name)(m.dispatch)
 
+    @traced(category="level", get_args=get_level_args)
     def push_level(self, level: Level) -> None:
         """Push a level onto :attr:`self.levels <earwax.Game.levels>`.
 
@@ -732,8 +963,12 @@ class Game(RegisterEventMixin):
         if self.level is not None:
             self.level.dispatch_event("on_cover", level)
         self.levels.append(level)
+        detector: Optional[LeakDetector] = leaks.active_leak_detector
+        if detector is not None:
+            detector.level_pushed(level)
         level.dispatch_event("on_push")
 
+    @traced(category="level", get_args=get_level_args)
     def replace_level(self, level: Level) -> None:
         """Pop the current level, then push the new one.
 
@@ -747,6 +982,10 @@ class Game(RegisterEventMixin):
         self.pop_level()
         self.push_level(level)
 
+    @traced(
+        category="level",
+        get_args=lambda game: dict(level=type(game.level).__name__),
+    )
     def pop_level(self) -> None:
         """Pop the most recent :class:`earwax.Level` instance from the stack.
 
@@ -756,9 +995,15 @@ class Game(RegisterEventMixin):
 
         This method calls :meth:`~earwax.Level.on_pop` on the popped level, and
         :meth:`~earwax.Level.on_reveal` on the one below it.
+
+        If a :class:`earwax.LeakDetector` is running, any resources the popped
+        level left alive will be reported.
         """
         level: Level = self.levels.pop()
         level.dispatch_event("on_pop")
+        detector: Optional[LeakDetector] = leaks.active_leak_detector
+        if detector is not None:
+            detector.level_popped(level)
         if self.level is not None:
             self.level.dispatch_event("on_reveal")
 
@@ -820,17 +1065,24 @@ class Game(RegisterEventMixin):
             anything else.
         """
         if interrupt:
-            tts.silence()
+            self.tts.silence()
         if self.config.speech.speak.value:
-            tts.speak(text)
+            self.tts.speak(text)
         if self.config.speech.braille.value:
-            tts.braille(text)
+            self.tts.braille(text)
 
     def stop(self) -> None:
         """Close :attr:`self.window <earwax.Game.window>`.
 
         If ``self.window`` is ``None``, then :class:earwax.GameNotRunning` will
         be raised.
+
+        This method does not shut down :attr:`~earwax.Game.executors` itself.
+        Closing the window ends the main loop, and
+        :meth:`~earwax.Game.finalise_run` then calls
+        :meth:`~earwax.Game.shutdown_executors`, after the
+        :meth:`~earwax.Game.after_run` event, so work submitted by
+        ``after_run`` handlers (like saving the game) still finishes.
         """
         if self.window is None:
             raise GameNotRunning()
@@ -1013,6 +1265,7 @@ class Game(RegisterEventMixin):
         else:
             self.reveal_level(level)
 
+    @profiled()
     def poll_synthizer_events(self, dt: float) -> None:
         """Poll the audio context for new synthizer events.
 
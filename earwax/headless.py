@@ -0,0 +1,440 @@
+"""Provides classes for running games without a window or audio."""
+
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional
+
+from attr import Factory, attrib, attrs
+from pyglet.clock import Clock, get_default, set_default
+from pyglet.window import Window
+
+from .event_matcher import EventMatcher
+from .game import Game
+from .leaks import LeakDetector
+from .level import Level
+from .recording import InputRecording, RecordedEvent
+from .sound import NullSoundManager
+from .utils import seed_random
+
+HeadlessPredicate = Callable[[], bool]
+
+joystick_event_types: List[str] = [
+    "on_joyaxis_motion",
+    "on_joybutton_press",
+    "on_joybutton_release",
+    "on_joyhat_motion",
+]
+
+
+@attrs(auto_attribs=True)
+class VirtualClock:
+    """A clock whose time only moves when it is told to.
+
+    Instances of this class can be passed as the ``time_function`` argument to
+    ``pyglet.clock.Clock``.
+
+    :ivar ~earwax.VirtualClock.time: The current time in seconds.
+    """
+
+    time: float = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.time
+
+    def advance(self, dt: float) -> None:
+        """Move time forward.
+
+        :param dt: The number of seconds to advance by.
+        """
+        if dt < 0:
+            raise ValueError("Time cannot go backwards (%r)." % dt)
+        self.time += dt
+
+
+@attrs(auto_attribs=True)
+class NullSpeech:
+    """A replacement for :attr:`earwax.tts` which records what it is given.
+
+    :ivar ~earwax.NullSpeech.spoken: Every string that has been spoken.
+
+    :ivar ~earwax.NullSpeech.brailled: Every string that has been sent to the
+        braille display.
+    """
+
+    spoken: List[str] = Factory(list)
+    brailled: List[str] = Factory(list)
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        """Record spoken text.
+
+        :param text: The text to record.
+
+        :param interrupt: Ignored.
+        """
+        self.spoken.append(text)
+
+    def braille(self, text: str) -> None:
+        """Record brailled text.
+
+        :param text: The text to record.
+        """
+        self.brailled.append(text)
+
+    def output(self, text: str, interrupt: bool = False) -> None:
+        """Record both spoken and brailled text.
+
+        :param text: The text to record.
+
+        :param interrupt: Ignored.
+        """
+        self.speak(text)
+        self.braille(text)
+
+    def silence(self) -> None:
+        """Do nothing."""
+        pass
+
+
+@attrs(auto_attribs=True)
+class HeadlessRunner:
+    """Run a game with no window, no audio, and no screen reader.
+
+    Instead of ``pyglet.app.run``, time is driven by a
+    :class:`~earwax.VirtualClock`. While the runner is started, that clock is
+    installed as pyglet's default clock, so :class:`earwax.Task`,
+    :class:`earwax.Action`, and promise scheduling all follow virtual time::
+
+        runner: HeadlessRunner = HeadlessRunner(game)
+        with runner.started(initial_level=level):
+            runner.press_key(key.RETURN)
+            runner.run_for(60.0)
+        print(runner.speech.spoken)
+
+    Simulated time can pass as quickly as the computer allows, so minutes of
+    play can be simulated in a fraction of a second.
+
+    :ivar ~earwax.HeadlessRunner.game: The game to run.
+
+    :ivar ~earwax.HeadlessRunner.fps: The number of frames in one second of
+        virtual time.
+
+    :ivar ~earwax.HeadlessRunner.virtual_clock: The virtual time source.
+
+    :ivar ~earwax.HeadlessRunner.clock: The pyglet clock which is driven by
+        :attr:`~earwax.HeadlessRunner.virtual_clock`.
+
+    :ivar ~earwax.HeadlessRunner.speech: The speech object which replaces
+        :attr:`earwax.Game.tts` while running.
+
+    :ivar ~earwax.HeadlessRunner.joystick: The object passed as the joystick
+        argument of joystick events.
+
+    :ivar ~earwax.HeadlessRunner.running: Whether or not this runner has been
+        started.
+
+    :ivar ~earwax.HeadlessRunner.frames: The number of frames which have been
+        run.
+    """
+
+    game: Game
+    fps: float = 60.0
+    virtual_clock: VirtualClock = Factory(VirtualClock)
+    clock: Clock = attrib(repr=False)
+
+    @clock.default
+    def get_default_clock(instance: "HeadlessRunner") -> Clock:
+        """Return a clock driven by the virtual clock.
+
+        :param instance: The runner to create the clock for.
+        """
+        return Clock(time_function=instance.virtual_clock)
+
+    speech: NullSpeech = Factory(NullSpeech)
+    joystick: Any = attrib(
+        default=Factory(
+            lambda: SimpleNamespace(device=SimpleNamespace(name="Headless"))
+        ),
+        repr=False,
+    )
+
+    running: bool = attrib(default=False, init=False)
+    frames: int = attrib(default=0, init=False)
+    _old_clock: Optional[Clock] = attrib(default=None, init=False, repr=False)
+    _old_tts: Any = attrib(default=None, init=False, repr=False)
+
+    def start(self, initial_level: Optional[Level] = None) -> None:
+        """Start running the game.
+
+        This method performs the same steps as :meth:`earwax.Game.run`, except
+        that:
+
+        * No window is opened, but event matchers are still created for every
+            window and joystick event, so input can be simulated with
+            :meth:`~earwax.HeadlessRunner.dispatch`.
+
+        * :attr:`~earwax.HeadlessRunner.clock` is installed as pyglet's
+            default clock.
+
+        * If the game has no audio context, its sound managers are replaced
+            with :class:`earwax.NullSoundManager` instances.
+
+        * The game's :attr:`~earwax.Game.tts` is replaced with
+            :attr:`~earwax.HeadlessRunner.speech`.
+
+        :param initial_level: A level to push onto the stack.
+        """
+        if self.running:
+            raise RuntimeError("%r is already running." % self)
+        self._old_clock = get_default()
+        set_default(self.clock)
+        self._old_tts = self.game.tts
+        self.game.tts = self.speech
+        name: str
+        for name in Window.event_types + joystick_event_types:
+            self.game.event_matchers.setdefault(
+                name, EventMatcher(self.game, name)
+            )
+        if self.game.audio_context is None:
+            if self.game.interface_sound_manager is None:
+                self.game.interface_sound_manager = NullSoundManager(
+                    None,
+                    name="Interface sound manager",
+                    default_gain=self.game.config.sound.sound_volume.value,
+                )
+            if self.game.music_sound_manager is None:
+                self.game.music_sound_manager = NullSoundManager(
+                    None,
+                    name="Music sound manager",
+                    default_gain=self.game.config.sound.music_volume.value,
+                    default_looping=True,
+                )
+            if self.game.ambiance_sound_manager is None:
+                self.game.ambiance_sound_manager = NullSoundManager(
+                    None,
+                    name="Ambiance sound manager",
+                    default_gain=self.game.config.sound.ambiance_volume.value,
+                    default_looping=True,
+                )
+        self.running = True
+        self.game.setup_run(initial_level)
+        self.game.dispatch_event("before_run")
+
+    def stop(self) -> None:
+        """Stop running the game.
+
+        The :meth:`~earwax.Game.on_close` and :meth:`~earwax.Game.after_run`
+        events are dispatched, executors are shut down, pooled reverbs are
+        destroyed, any running :attr:`~earwax.Game.profiler`,
+        :attr:`~earwax.Game.tracer`, and :attr:`~earwax.Game.leak_detector`
+        are stopped, and pyglet's default clock is restored.
+        """
+        if not self.running:
+            raise RuntimeError("%r is not running." % self)
+        try:
+            self.game.dispatch_event("on_close")
+            self.game.dispatch_event("after_run")
+            self.game.shutdown_executors()
+            if self.game.reverb_pool is not None:
+                self.game.reverb_pool.destroy_all()
+            if self.game.profiler is not None and self.game.profiler.running:
+                self.game.profiler.stop()
+            if self.game.tracer is not None and self.game.tracer.running:
+                self.game.tracer.stop()
+            detector: Optional[LeakDetector] = self.game.leak_detector
+            if detector is not None and detector.running:
+                detector.stop()
+        finally:
+            self.game.tts = self._old_tts
+            if self._old_clock is not None:
+                set_default(self._old_clock)
+            self._old_clock = None
+            self.running = False
+
+    def __enter__(self) -> "HeadlessRunner":
+        """Start running with no initial level."""
+        if not self.running:
+            self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop running."""
+        self.stop()
+
+    def started(
+        self, initial_level: Optional[Level] = None
+    ) -> "HeadlessRunner":
+        """Start this runner, and return it for use as a context manager.
+
+        :param initial_level: The level to push onto the stack.
+        """
+        self.start(initial_level=initial_level)
+        return self
+
+    def step(self, dt: Optional[float] = None) -> float:
+        """Advance virtual time, and run everything that is due.
+
+        Returns the amount of time that passed.
+
+        :param dt: The number of seconds to advance.
+
+            If this value is ``None``, one frame will pass, as determined by
+            :attr:`~earwax.HeadlessRunner.fps`.
+        """
+        if dt is None:
+            dt = 1 / self.fps
+        self.virtual_clock.advance(dt)
+        self.frames += 1
+        return self.clock.tick()
+
+    def run_for(self, seconds: float) -> int:
+        """Run for the given number of virtual seconds.
+
+        Returns the number of frames that were run.
+
+        :param seconds: The number of seconds to run for.
+        """
+        frames: int = 0
+        end: float = self.virtual_clock.time + seconds
+        frame_length: float = 1 / self.fps
+        while self.virtual_clock.time < end:
+            self.step(min(frame_length, end - self.virtual_clock.time))
+            frames += 1
+        return frames
+
+    def run_until(
+        self, predicate: HeadlessPredicate, timeout: float = 60.0
+    ) -> bool:
+        """Run until ``predicate`` returns ``True``.
+
+        Returns whether or not ``predicate`` returned ``True`` before
+        ``timeout`` virtual seconds had passed.
+
+        :param predicate: The function to check after every frame.
+
+        :param timeout: The maximum number of virtual seconds to run for.
+        """
+        end: float = self.virtual_clock.time + timeout
+        while not predicate():
+            if self.virtual_clock.time >= end:
+                return False
+            self.step()
+        return True
+
+    def dispatch(self, name: str, *args) -> Any:
+        """Dispatch an event as if a window had received it.
+
+        :param name: The name of the event, such as ``'on_key_press'``.
+
+        :param args: The arguments to pass to the event.
+        """
+        return self.game.event_matchers[name].dispatch(*args)
+
+    def press_key(self, symbol: int, modifiers: int = 0) -> None:
+        """Simulate pressing a key.
+
+        :param symbol: The key to press.
+
+        :param modifiers: The modifiers that are held.
+        """
+        self.dispatch("on_key_press", symbol, modifiers)
+
+    def release_key(self, symbol: int, modifiers: int = 0) -> None:
+        """Simulate releasing a key.
+
+        :param symbol: The key to release.
+
+        :param modifiers: The modifiers that are held.
+        """
+        self.dispatch("on_key_release", symbol, modifiers)
+
+    def tap_key(
+        self, symbol: int, modifiers: int = 0, hold: float = 0.0
+    ) -> None:
+        """Press a key, run for ``hold`` seconds, then release it.
+
+        :param symbol: The key to press.
+
+        :param modifiers: The modifiers that are held.
+
+        :param hold: The number of virtual seconds to hold the key for.
+        """
+        self.press_key(symbol, modifiers)
+        if hold:
+            self.run_for(hold)
+        self.release_key(symbol, modifiers)
+
+    def type_text(self, text: str) -> None:
+        """Simulate typing text.
+
+        :param text: The text to type.
+        """
+        self.dispatch("on_text", text)
+
+    def text_motion(self, motion: int) -> None:
+        """Simulate a text motion.
+
+        :param motion: One of the motion constants from
+            ``pyglet.window.key``.
+        """
+        self.dispatch("on_text_motion", motion)
+
+    def click_mouse(self, button: int, modifiers: int = 0) -> None:
+        """Simulate clicking a mouse button.
+
+        :param button: The button to click.
+
+        :param modifiers: The modifiers that are held.
+        """
+        self.dispatch("on_mouse_press", 0, 0, button, modifiers)
+        self.dispatch("on_mouse_release", 0, 0, button, modifiers)
+
+    def press_joybutton(self, button: int) -> None:
+        """Simulate pressing a joystick button.
+
+        :param button: The button to press.
+        """
+        self.dispatch("on_joybutton_press", self.joystick, button)
+
+    def release_joybutton(self, button: int) -> None:
+        """Simulate releasing a joystick button.
+
+        :param button: The button to release.
+        """
+        self.dispatch("on_joybutton_release", self.joystick, button)
+
+    def move_hat(self, x: int, y: int) -> None:
+        """Simulate moving a joystick hat.
+
+        :param x: The left / right position of the hat.
+
+        :param y: The up / down position of the hat.
+        """
+        self.dispatch("on_joyhat_motion", self.joystick, x, y)
+
+    def replay(self, recording: InputRecording, extra: float = 0.0) -> int:
+        """Replay a recording as fast as possible.
+
+        The random number generators are seeded from the recording, then
+        virtual time is advanced to each event in turn before it is
+        dispatched, so the game sees exactly the same timings as it did when
+        the recording was made.
+
+        Returns the number of frames that were run.
+
+        :param recording: The recording to replay.
+
+        :param extra: The number of virtual seconds to keep running for after
+            the last event has been dispatched.
+        """
+        seed_random(recording.seeds)
+        frames: int = 0
+        start: float = self.virtual_clock.time
+        event: RecordedEvent
+        for event in recording.events:
+            delay: float = start + event.time - self.virtual_clock.time
+            if delay > 0:
+                frames += self.run_for(delay)
+            self.dispatch(event.name, *event.get_args())
+        if extra:
+            frames += self.run_for(extra)
+        return frames
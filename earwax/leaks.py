@@ -0,0 +1,356 @@
+"""Provides classes for finding sounds and other resources which are leaked."""
+
+import tracemalloc
+from traceback import extract_stack, format_list
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from attr import Factory, attrib, attrs
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .level import Level
+
+AliveFunction = Callable[[], bool]
+
+# The leak detector which is currently running, if any.
+#
+# This variable is set by ``LeakDetector.start``, and cleared by
+# ``LeakDetector.stop``. When it is ``None``, tracked objects only pay for
+# one global lookup.
+active_leak_detector: Optional["LeakDetector"] = None
+
+
+def native_alive(obj: Any) -> bool:
+    """Return whether or not a synthizer object has not been destroyed.
+
+    Synthizer raises an error when destroyed objects are used, so this
+    function reads ``gain``. Buffers have no properties, so their number of
+    channels is read instead.
+
+    :param obj: The object to check.
+    """
+    try:
+        if hasattr(obj, "get_channels"):
+            obj.get_channels()
+        else:
+            obj.gain
+        return True
+    except Exception:
+        return False
+
+
+def track_resource(resource: Any, kind: str, is_alive: AliveFunction) -> None:
+    """Tell the active :class:`earwax.LeakDetector` about a new resource.
+
+    If no leak detector is running, nothing happens.
+
+    :param resource: The resource to track.
+
+    :param kind: The kind of resource, like ``'sound'``.
+
+    :param is_alive: A function which returns whether or not the resource is
+        still alive.
+    """
+    detector: Optional[LeakDetector] = active_leak_detector
+    if detector is not None:
+        detector.track(resource, kind, is_alive)
+
+
+def share_resource(resource: Any) -> None:
+    """Tell the active :class:`earwax.LeakDetector` a resource is shared.
+
+    If no leak detector is running, nothing happens.
+
+    :param resource: The resource which is shared.
+    """
+    detector: Optional[LeakDetector] = active_leak_detector
+    if detector is not None:
+        detector.share(resource)
+
+
+@attrs(auto_attribs=True)
+class TrackedResource:
+    """A resource which was created while a :class:`earwax.LeakDetector` ran.
+
+    :ivar ~earwax.TrackedResource.resource: The resource itself.
+
+    :ivar ~earwax.TrackedResource.kind: The kind of resource, like
+        ``'sound'``, ``'reverb'``, or ``'buffer'``.
+
+    :ivar ~earwax.TrackedResource.is_alive: A function which returns whether
+        or not the resource is still alive.
+
+    :ivar ~earwax.TrackedResource.level: The level that was at the top of the
+        stack when the resource was created.
+
+    :ivar ~earwax.TrackedResource.stack: The stack trace of the code that
+        created the resource.
+    """
+
+    resource: Any = attrib(repr=False)
+    kind: str
+    is_alive: AliveFunction = attrib(repr=False)
+    level: Optional["Level"] = attrib(repr=False)
+    stack: List[str] = attrib(default=Factory(list), repr=False)
+
+    @property
+    def level_name(self) -> str:
+        """Return the class name of :attr:`~earwax.TrackedResource.level`."""
+        return type(self.level).__name__
+
+    def get_stack(self) -> List[str]:
+        """Return the stack trace of the code that created the resource.
+
+        If no stack was captured, ``tracemalloc`` will be asked for the
+        resource's traceback, which only works if ``tracemalloc`` was tracing
+        when the resource was created.
+        """
+        if self.stack:
+            return self.stack
+        traceback: Optional[
+            tracemalloc.Traceback
+        ] = tracemalloc.get_object_traceback(self.resource)
+        if traceback is None:
+            return []
+        return traceback.format()
+
+    def format(self) -> str:
+        """Return a description of this resource, and where it came from."""
+        lines: List[str] = [f"{self.kind} {self.resource!r}:"]
+        lines.extend(self.get_stack())
+        return "\n".join(lines)
+
+
+@attrs(auto_attribs=True)
+class LeakReport:
+    """The resources left alive when a level was popped.
+
+    :ivar ~earwax.LeakReport.level: The level which was popped.
+
+    :ivar ~earwax.LeakReport.resources: The resources which were still alive.
+
+    :ivar ~earwax.LeakReport.memory: The lines of the ``tracemalloc``
+        snapshot comparison between when the level was pushed and when it
+        was popped, biggest growth first.
+
+        This list is empty unless
+        :attr:`~earwax.LeakDetector.use_tracemalloc` was ``True``.
+    """
+
+    level: "Level" = attrib(repr=False)
+    resources: List[TrackedResource] = Factory(list)
+    memory: List[str] = Factory(list)
+
+    def format(self) -> str:
+        """Return this report as text."""
+        lines: List[str] = [
+            "%d resources leaked by %s."
+            % (len(self.resources), type(self.level).__name__)
+        ]
+        resource: TrackedResource
+        for resource in self.resources:
+            lines.append(resource.format())
+        if self.memory:
+            lines.append("Memory growth:")
+            lines.extend(self.memory)
+        return "\n".join(lines)
+
+
+@attrs(auto_attribs=True)
+class LeakDetector:
+    """Find sounds, reverbs, and buffers which outlive their levels.
+
+    While a leak detector is running, every :class:`earwax.Sound`, every
+    reverb made by :meth:`earwax.Reverb.make_reverb`, and every buffer loaded
+    by :class:`earwax.BufferCache` is tagged with the level at the top of the
+    stack. When a level is popped, anything it created which is still alive
+    is logged as a warning, along with the stack trace of the code that
+    created it::
+
+        detector: LeakDetector = LeakDetector(game, use_tracemalloc=True)
+        detector.start()
+
+    This is a debugging tool, and capturing stacks makes creating sounds
+    noticeably slower.
+
+    Buffers which are kept by the cache outlive the levels which loaded them,
+    so they are shared. Only buffers which never made it into the cache, and
+    were not destroyed, are blamed.
+
+    :ivar ~earwax.LeakDetector.game: The game whose levels will be watched.
+
+    :ivar ~earwax.LeakDetector.capture_stacks: Whether or not to capture a
+        stack trace every time a resource is created.
+
+        If this value is ``False``, stack traces will come from
+        ``tracemalloc`` instead, if it is tracing.
+
+    :ivar ~earwax.LeakDetector.stack_limit: The number of frames to capture.
+
+    :ivar ~earwax.LeakDetector.use_tracemalloc: Whether or not to start
+        ``tracemalloc``, and compare snapshots taken when each level is pushed
+        and popped.
+
+    :ivar ~earwax.LeakDetector.top: The number of lines of ``tracemalloc``
+        statistics to include in each report.
+
+    :ivar ~earwax.LeakDetector.resources: The resources which are being
+        tracked.
+
+    :ivar ~earwax.LeakDetector.snapshots: The ``tracemalloc`` snapshots taken
+        when levels were pushed, keyed by level ID.
+
+    :ivar ~earwax.LeakDetector.reports: Every report which found leaks.
+    """
+
+    game: "Game"
+    capture_stacks: bool = True
+    stack_limit: int = 16
+    use_tracemalloc: bool = False
+    top: int = 10
+
+    resources: List[TrackedResource] = attrib(
+        default=Factory(list), init=False, repr=False
+    )
+    snapshots: Dict[int, tracemalloc.Snapshot] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    reports: List[LeakReport] = attrib(
+        default=Factory(list), init=False, repr=False
+    )
+    _started_tracemalloc: bool = attrib(default=False, init=False, repr=False)
+
+    @property
+    def running(self) -> bool:
+        """Return whether or not this detector is running."""
+        return active_leak_detector is self
+
+    def start(self) -> None:
+        """Start tracking resources.
+
+        This detector is also stored as the game's
+        :attr:`~earwax.Game.leak_detector`.
+        """
+        global active_leak_detector
+        if active_leak_detector is not None:
+            raise RuntimeError("%r is already running." % active_leak_detector)
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start(self.stack_limit)
+            self._started_tracemalloc = True
+        active_leak_detector = self
+        self.game.leak_detector = self
+        if self.use_tracemalloc and self.game.level is not None:
+            self.level_pushed(self.game.level)
+
+    def stop(self) -> None:
+        """Stop tracking resources.
+
+        If this detector started ``tracemalloc``, it will be stopped too.
+        """
+        global active_leak_detector
+        if active_leak_detector is self:
+            active_leak_detector = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.snapshots.clear()
+
+    def track(self, resource: Any, kind: str, is_alive: AliveFunction) -> None:
+        """Start tracking a resource.
+
+        Resources which are already dead are forgotten every time the number
+        of tracked resources doubles.
+
+        :param resource: The resource to track.
+
+        :param kind: The kind of resource.
+
+        :param is_alive: A function which returns whether or not the resource
+            is still alive.
+        """
+        stack: List[str] = []
+        if self.capture_stacks:
+            # Drop the frames for this method, and ``track_resource``.
+            stack = format_list(extract_stack(limit=self.stack_limit + 2)[:-2])
+        self.resources.append(
+            TrackedResource(resource, kind, is_alive, self.game.level, stack)
+        )
+        n: int = len(self.resources)
+        if n >= 64 and not n & (n - 1):
+            self.prune()
+
+    def share(self, resource: Any) -> None:
+        """Stop blaming any level for a resource.
+
+        Shared resources, like the reverbs in a :class:`earwax.ReverbPool`,
+        are meant to outlive the level which created them, so they are never
+        reported when a level is popped. They are still returned by
+        :meth:`~earwax.LeakDetector.alive`.
+
+        :param resource: The resource which is shared.
+        """
+        r: TrackedResource
+        for r in self.resources:
+            if r.resource is resource:
+                r.level = None
+
+    def prune(self) -> None:
+        """Forget every resource which is no longer alive."""
+        r: TrackedResource
+        self.resources = [r for r in self.resources if r.is_alive()]
+
+    def alive(self, level: Optional["Level"] = None) -> List[TrackedResource]:
+        """Return the tracked resources which are still alive.
+
+        :param level: If this value is not ``None``, only resources created by
+            this level will be returned.
+        """
+        r: TrackedResource
+        return [
+            r
+            for r in self.resources
+            if (level is None or r.level is level) and r.is_alive()
+        ]
+
+    def level_pushed(self, level: "Level") -> None:
+        """Take a ``tracemalloc`` snapshot, if necessary.
+
+        This method is called by :meth:`earwax.Game.push_level`.
+
+        :param level: The level which was pushed.
+        """
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            self.snapshots[id(level)] = tracemalloc.take_snapshot()
+
+    def level_popped(self, level: "Level") -> Optional[LeakReport]:
+        """Report the resources left alive by ``level``.
+
+        This method is called by :meth:`earwax.Game.pop_level`, after the
+        level's :meth:`~earwax.Level.on_pop` event has been dispatched.
+
+        Returns a :class:`earwax.LeakReport` if anything was leaked. All the
+        resources created by ``level`` are then forgotten.
+
+        :param level: The level which was popped.
+        """
+        leaked: List[TrackedResource] = self.alive(level)
+        r: TrackedResource
+        self.resources = [r for r in self.resources if r.level is not level]
+        before: Optional[tracemalloc.Snapshot] = self.snapshots.pop(
+            id(level), None
+        )
+        if not leaked:
+            return None
+        memory: List[str] = []
+        if before is not None and tracemalloc.is_tracing():
+            stat: tracemalloc.StatisticDiff
+            memory = [
+                str(stat)
+                for stat in tracemalloc.take_snapshot().compare_to(
+                    before, "lineno"
+                )[: self.top]
+            ]
+        report: LeakReport = LeakReport(level, leaked, memory)
+        self.reports.append(report)
+        self.game.logger.warning(report.format())
+        return report
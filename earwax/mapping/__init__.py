@@ -11,6 +11,8 @@ from .box_level import BoxLevel, CurrentBox, NearestBox
 from .door import Door
 from .map_editor import MapEditor, MapEditorContext
 from .portal import Portal
+from .replication import (ReplicatedDoor, ReplicatedEntity,
+                          ReplicatedPerspective, Replicator)
 
 __all__ = [
     # box.py:
@@ -30,4 +32,9 @@ __all__ = [
     "MapEditorContext",
     # portal.py:
     "Portal",
+    # replication.py:
+    "ReplicatedDoor",
+    "ReplicatedEntity",
+    "ReplicatedPerspective",
+    "Replicator",
 ]
@@ -2,7 +2,6 @@
 
 from enum import Enum
 from pathlib import Path
-from random import uniform
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -30,6 +29,7 @@ from ..mixins import RegisterEventMixin
 from ..point import Point
 from ..sound import SoundManager
 from ..types import EventType
+from ..utils import get_random
 from .door import Door
 from .portal import Portal
 
@@ -601,7 +601,7 @@ class Box(Generic[T], RegisterEventMixin):
                 a: float
                 b: float
                 a, b = d.close_after
-                when = uniform(a, b)
+                when = get_random("box").uniform(a, b)
             elif isinstance(d.close_after, float):
                 when = d.close_after
             else:
@@ -226,10 +226,47 @@ class BoxLevel(Level):
             self.add_box(box)
 
     def on_push(self) -> None:
-        """Set listener orientation, and start ambiances and tracks."""
+        """Set listener orientation, and start ambiances and tracks.
+
+        The gauges from :meth:`~earwax.BoxLevel.register_metrics` are also
+        added to the game's :attr:`~earwax.Game.metrics`.
+        """
         self.set_coordinates(self.coordinates)
+        self.register_metrics()
         return super().on_push()
 
+    def on_reveal(self) -> None:
+        """Register metrics again."""
+        self.register_metrics()
+        return super().on_reveal()
+
+    def on_pop(self) -> None:
+        """Remove the gauges added by :meth:`register_metrics`."""
+        self.game.metrics.remove("boxes.count")
+        self.game.metrics.remove("boxes.sounds")
+        return super().on_pop()
+
+    def register_metrics(self) -> None:
+        """Add gauges for this level to the game's metrics registry.
+
+        * ``boxes.count``: The number of boxes on this level.
+
+        * ``boxes.sounds``: The number of sounds playing from boxes.
+
+        Spatial queries are timed by the ``boxes.query`` histogram.
+        """
+        self.game.metrics.gauge("boxes.count", lambda: len(self.boxes))
+        self.game.metrics.gauge("boxes.sounds", self.get_sounds_count)
+
+    def get_sounds_count(self) -> int:
+        """Return the number of sounds playing from boxes on this level."""
+        box: Box
+        return sum(
+            len(box._sound_manager.sounds)
+            for box in self.boxes
+            if box._sound_manager is not None
+        )
+
     def on_turn(self) -> None:
         """Handle turning.
 
@@ -615,12 +652,13 @@ class BoxLevel(Level):
         """
         nearest: Optional[NearestBox] = None
         box: Box
-        for box in self.get_boxes(data_type):
-            point: Point = box.get_nearest_point(start)
-            if not same_z or box.start.z == start.z:
-                distance: float = start.distance_between(point)
-                if nearest is None or distance < nearest.distance:
-                    nearest = NearestBox(box, point, distance)
+        with self.game.metrics.histogram("boxes.query").time():
+            for box in self.get_boxes(data_type):
+                point: Point = box.get_nearest_point(start)
+                if not same_z or box.start.z == start.z:
+                    distance: float = start.distance_between(point)
+                    if nearest is None or distance < nearest.distance:
+                        nearest = NearestBox(box, point, distance)
         return nearest
 
     def nearest_door(
@@ -664,11 +702,12 @@ class BoxLevel(Level):
         :param coordinates: The coordinates the box should span.
         """
         box: Box
-        for box in self.sort_boxes():
-            if box.contains_point(coordinates):
-                return box
-        else:
-            return None
+        with self.game.metrics.histogram("boxes.query").time():
+            for box in self.sort_boxes():
+                if box.contains_point(coordinates):
+                    return box
+            else:
+                return None
 
     def get_boxes(self, t: Any) -> List[Box]:
         """Return a list of boxes of the current type.
@@ -0,0 +1,408 @@
+"""Provides classes for replicating box level state over a network."""
+
+from collections import deque
+from struct import Struct
+from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Deque, Dict, List,
+                    Optional, Set, Tuple)
+
+from attr import Factory, attrib, attrs
+
+from ..point import Point
+from .door import Door
+
+if TYPE_CHECKING:
+    from .box import Box
+    from .box_level import BoxLevel
+
+EntityState = Tuple[int, ...]
+
+# The tick number, whether or not this is a full snapshot, and the number of
+# entities which follow.
+header_struct: Struct = Struct("!IBI")
+
+# The ID of an entity, and the size of its state, which is 0 for an entity
+# that has been removed.
+entry_struct: Struct = Struct("!IB")
+
+
+@attrs(auto_attribs=True)
+class ReplicatedEntity:
+    """Something whose state can be replicated by :class:`earwax.Replicator`.
+
+    Subclasses should set :attr:`~earwax.ReplicatedEntity.state_struct`, and
+    override :meth:`~earwax.ReplicatedEntity.get_state` and
+    :meth:`~earwax.ReplicatedEntity.apply_state`.
+
+    State is always a tuple of integers, so that states can be compared
+    cheaply, and packed with :attr:`~earwax.ReplicatedEntity.state_struct`.
+    """
+
+    state_struct: ClassVar[Struct] = Struct("!")
+
+    def get_state(self) -> EntityState:
+        """Return the current state of this entity."""
+        raise NotImplementedError
+
+    def apply_state(self, state: EntityState) -> None:
+        """Change this entity to match ``state``.
+
+        :param state: A state returned by the
+            :meth:`~earwax.ReplicatedEntity.get_state` method of the same
+            entity on another machine.
+        """
+        raise NotImplementedError
+
+    def watch(self, func: Callable[[], None]) -> None:
+        """Arrange for ``func`` to be called when this entity changes.
+
+        The default implementation does nothing, in which case changes must
+        be reported with :meth:`earwax.Replicator.mark_dirty`.
+
+        :param func: The function to call.
+        """
+        pass
+
+
+@attrs(auto_attribs=True)
+class ReplicatedPerspective(ReplicatedEntity):
+    """Replicate the coordinates and bearing of a :class:`earwax.BoxLevel`.
+
+    Coordinates are quantised to multiples of
+    :attr:`~earwax.ReplicatedPerspective.resolution`, so movements smaller
+    than that are not replicated.
+
+    :ivar ~earwax.ReplicatedPerspective.level: The level to replicate.
+
+    :ivar ~earwax.ReplicatedPerspective.resolution: The size of the smallest
+        movement which will be replicated.
+    """
+
+    state_struct: ClassVar[Struct] = Struct("!iiiH")
+
+    level: "BoxLevel"
+    resolution: float = 0.01
+
+    def get_state(self) -> EntityState:
+        """Return the quantised coordinates and bearing."""
+        p: Point = self.level.coordinates
+        r: float = self.resolution
+        return (
+            round(p.x / r),
+            round(p.y / r),
+            round(p.z / r),
+            self.level.bearing % 360,
+        )
+
+    def apply_state(self, state: EntityState) -> None:
+        """Move and turn the level.
+
+        Uses :meth:`earwax.BoxLevel.set_coordinates` and
+        :meth:`earwax.BoxLevel.set_bearing`, so the listener is moved too.
+
+        :param state: The new state.
+        """
+        x: int
+        y: int
+        z: int
+        bearing: int
+        x, y, z, bearing = state
+        if self.get_state()[:3] != (x, y, z):
+            r: float = self.resolution
+            self.level.set_coordinates(Point(x * r, y * r, z * r))
+        if self.level.bearing != bearing:
+            self.level.set_bearing(bearing)
+
+    def watch(self, func: Callable[[], None]) -> None:
+        """Call ``func`` when the perspective moves or turns.
+
+        Coordinates set directly with :meth:`earwax.BoxLevel.set_coordinates`
+        (by a portal, for example) must be reported with
+        :meth:`earwax.Replicator.mark_dirty`.
+
+        :param func: The function to call.
+        """
+        self.level.push_handlers(on_move_success=func, on_turn=func)
+
+
+@attrs(auto_attribs=True)
+class ReplicatedDoor(ReplicatedEntity):
+    """Replicate whether or not a door is open.
+
+    :ivar ~earwax.ReplicatedDoor.box: The box whose :attr:`~earwax.Box.data`
+        is a :class:`earwax.Door`.
+    """
+
+    state_struct: ClassVar[Struct] = Struct("!B")
+
+    box: "Box[Door]"
+
+    @property
+    def door(self) -> Door:
+        """Return the door attached to :attr:`~earwax.ReplicatedDoor.box`."""
+        assert isinstance(self.box.data, Door)
+        return self.box.data
+
+    def get_state(self) -> EntityState:
+        """Return ``(1,)`` if the door is open, and ``(0,)`` otherwise."""
+        return (int(self.door.open),)
+
+    def apply_state(self, state: EntityState) -> None:
+        """Open or close the door.
+
+        Uses :meth:`earwax.Box.open` and :meth:`earwax.Box.close`, so the
+        usual sounds are played.
+
+        :param state: The new state.
+        """
+        if state[0] and not self.door.open:
+            self.box.open()
+        elif not state[0] and self.door.open:
+            self.box.close()
+
+    def watch(self, func: Callable[[], None]) -> None:
+        """Call ``func`` when the door opens or closes.
+
+        :param func: The function to call.
+        """
+        self.box.push_handlers(on_open=func, on_close=func)
+
+
+@attrs(auto_attribs=True)
+class Replicator:
+    """Send the changes to entities, rather than their whole state.
+
+    On the server, register entities, call
+    :meth:`~earwax.Replicator.tick` regularly, and send each client the
+    result of :meth:`~earwax.Replicator.encode_for`::
+
+        replicator: Replicator = Replicator()
+        replicator.add(1, ReplicatedPerspective(player_level))
+        replicator.add(2, ReplicatedDoor(front_door))
+
+        def send_state(dt: float) -> None:
+            replicator.tick()
+            for client in server.clients:
+                client.send_message(replicator.encode_for(client))
+
+    Clients register the same entities with the same IDs, pass every
+    message to :meth:`~earwax.Replicator.apply`, and send back the tick
+    number it returns, which the server passes to
+    :meth:`~earwax.Replicator.acknowledge`.
+
+    Each client is only sent the entities which have changed since the last
+    tick it acknowledged. Only entities which have been marked dirty are
+    checked on each tick, so the cost of a tick depends on how much has
+    changed, not on how many entities there are.
+
+    :ivar ~earwax.Replicator.history_size: The number of ticks with changes
+        to remember.
+
+        Clients which have not acknowledged any of these ticks will be sent
+        a full snapshot.
+
+    :ivar ~earwax.Replicator.tick_number: The number of the most recent tick.
+
+    :ivar ~earwax.Replicator.entities: The registered entities, keyed by ID.
+
+    :ivar ~earwax.Replicator.states: The most recently replicated state of
+        every entity.
+
+    :ivar ~earwax.Replicator.dirty: The IDs of entities which may have
+        changed since the last tick.
+
+    :ivar ~earwax.Replicator.history: The tick numbers which had changes,
+        and the IDs of the entities which changed, oldest first.
+
+    :ivar ~earwax.Replicator.acks: The last tick acknowledged by each client.
+    """
+
+    history_size: int = 256
+
+    tick_number: int = attrib(default=0, init=False)
+    entities: Dict[int, ReplicatedEntity] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    states: Dict[int, EntityState] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    dirty: Set[int] = attrib(default=Factory(set), init=False, repr=False)
+    history: Deque[Tuple[int, Set[int]]] = attrib(
+        default=Factory(deque), init=False, repr=False
+    )
+    acks: Dict[Any, int] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    _forgotten: int = attrib(default=0, init=False, repr=False)
+    _encoded: Dict[int, bytes] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+
+    def add(self, entity_id: int, entity: ReplicatedEntity) -> None:
+        """Register an entity.
+
+        :param entity_id: The ID of the entity, which must be the same on the
+            server and every client.
+
+        :param entity: The entity to add.
+        """
+        self.entities[entity_id] = entity
+        entity.watch(lambda: self.mark_dirty(entity_id))
+        self.dirty.add(entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        """Unregister an entity.
+
+        Clients will be told to remove it on the next tick.
+
+        :param entity_id: The ID of the entity to remove.
+        """
+        del self.entities[entity_id]
+        self.dirty.add(entity_id)
+
+    def mark_dirty(self, entity_id: int) -> None:
+        """Check the given entity for changes on the next tick.
+
+        :param entity_id: The ID of the entity which may have changed.
+        """
+        self.dirty.add(entity_id)
+
+    def mark_all_dirty(self) -> None:
+        """Check every entity for changes on the next tick."""
+        self.dirty.update(self.entities)
+
+    def tick(self) -> int:
+        """Record the changes to every dirty entity.
+
+        Returns the new tick number.
+        """
+        self.tick_number += 1
+        self._encoded.clear()
+        changed: Set[int] = set()
+        entity_id: int
+        for entity_id in self.dirty:
+            entity: Optional[ReplicatedEntity] = self.entities.get(entity_id)
+            if entity is None:
+                if self.states.pop(entity_id, None) is not None:
+                    changed.add(entity_id)
+                continue
+            state: EntityState = entity.get_state()
+            if self.states.get(entity_id) != state:
+                self.states[entity_id] = state
+                changed.add(entity_id)
+        self.dirty.clear()
+        if changed:
+            if len(self.history) == self.history_size:
+                self._forgotten = self.history.popleft()[0]
+            self.history.append((self.tick_number, changed))
+        return self.tick_number
+
+    def encode(self, since: int = 0) -> bytes:
+        """Return the changes since the given tick.
+
+        If ``since`` is ``0``, or older than
+        :attr:`~earwax.Replicator.history`, a full snapshot is returned
+        instead.
+
+        Clients which have acknowledged the same tick share the same bytes.
+
+        :param since: The last tick the client acknowledged.
+        """
+        data: Optional[bytes] = self._encoded.get(since)
+        if data is not None:
+            return data
+        full: bool = since <= 0 or since < self._forgotten
+        ids: Set[int]
+        if full:
+            ids = set(self.states)
+        else:
+            ids = set()
+            tick: int
+            changed: Set[int]
+            for tick, changed in reversed(self.history):
+                if tick <= since:
+                    break
+                ids.update(changed)
+        chunks: List[bytes] = [
+            header_struct.pack(self.tick_number, int(full), len(ids))
+        ]
+        entity_id: int
+        for entity_id in sorted(ids):
+            state: Optional[EntityState] = self.states.get(entity_id)
+            if state is None:
+                chunks.append(entry_struct.pack(entity_id, 0))
+            else:
+                s: Struct = self.entities[entity_id].state_struct
+                chunks.append(entry_struct.pack(entity_id, s.size))
+                chunks.append(s.pack(*state))
+        data = b"".join(chunks)
+        self._encoded[since] = data
+        return data
+
+    def encode_for(self, client: Any) -> bytes:
+        """Return the changes a client has not acknowledged.
+
+        :param client: Any hashable object which identifies the client.
+        """
+        return self.encode(self.acks.get(client, 0))
+
+    def acknowledge(self, client: Any, tick: int) -> None:
+        """Record that a client has applied the given tick.
+
+        :param client: The client which sent the acknowledgement.
+
+        :param tick: The tick number returned by
+            :meth:`~earwax.Replicator.apply` on the client.
+        """
+        if tick > self.acks.get(client, 0):
+            self.acks[client] = tick
+
+    def forget(self, client: Any) -> None:
+        """Forget a client, which has probably disconnected.
+
+        :param client: The client to forget.
+        """
+        self.acks.pop(client, None)
+
+    def apply(self, data: bytes) -> int:
+        """Apply changes sent by another replicator.
+
+        Entities which are unknown to this replicator are skipped. If
+        ``data`` is a full snapshot, entities which are not included are
+        removed.
+
+        Returns the tick number which should be acknowledged.
+
+        :param data: The data returned by :meth:`~earwax.Replicator.encode`.
+        """
+        tick: int
+        full: int
+        count: int
+        tick, full, count = header_struct.unpack_from(data)
+        offset: int = header_struct.size
+        seen: Set[int] = set()
+        for _ in range(count):
+            entity_id: int
+            size: int
+            entity_id, size = entry_struct.unpack_from(data, offset)
+            offset += entry_struct.size
+            seen.add(entity_id)
+            entity: Optional[ReplicatedEntity] = self.entities.get(entity_id)
+            if entity is not None:
+                if size:
+                    state: EntityState = entity.state_struct.unpack_from(
+                        data, offset
+                    )
+                    entity.apply_state(state)
+                    self.states[entity_id] = state
+                else:
+                    self.remove(entity_id)
+                    self.states.pop(entity_id, None)
+            offset += size
+        if full:
+            for entity_id in set(self.entities) - seen:
+                self.remove(entity_id)
+                self.states.pop(entity_id, None)
+                seen.add(entity_id)
+        # Changes made by this method should not be sent back.
+        self.dirty.difference_update(seen)
+        return tick
@@ -0,0 +1,240 @@
+"""Provides a registry of counters, gauges, and histograms."""
+
+from contextlib import contextmanager
+from json import dumps
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from attr import Factory, attrib, attrs
+from pyglet.clock import schedule_interval, unschedule
+
+from .profiler import CallbackStats
+
+GaugeValue = Union[float, Dict[str, float]]
+GaugeFunction = Callable[[], GaugeValue]
+
+
+@attrs(auto_attribs=True)
+class Counter:
+    """A number which only goes up.
+
+    :ivar ~earwax.Counter.name: The name of this counter.
+
+    :ivar ~earwax.Counter.value: The current value.
+    """
+
+    name: str
+    value: int = 0
+
+    def increment(self, n: int = 1) -> None:
+        """Add to :attr:`~earwax.Counter.value`.
+
+        :param n: The amount to add.
+        """
+        self.value += n
+
+
+@attrs(auto_attribs=True)
+class Gauge:
+    """A number which can go up and down.
+
+    If :attr:`~earwax.Gauge.func` is not ``None``, it will be called every
+    time the value is read, so gauges which watch engine state cost nothing
+    until they are looked at.
+
+    :ivar ~earwax.Gauge.name: The name of this gauge.
+
+    :ivar ~earwax.Gauge.func: The function which returns the current value.
+
+        This function can also return a dictionary of ``{label: value}``
+        pairs, which will be reported as separate values.
+
+    :ivar ~earwax.Gauge.value: The value to use if there is no
+        :attr:`~earwax.Gauge.func`.
+    """
+
+    name: str
+    func: Optional[GaugeFunction] = attrib(default=None, repr=False)
+    value: GaugeValue = 0.0
+
+    def set(self, value: GaugeValue) -> None:
+        """Set :attr:`~earwax.Gauge.value`.
+
+        :param value: The new value.
+        """
+        self.value = value
+
+    def get(self) -> GaugeValue:
+        """Return the current value."""
+        if self.func is not None:
+            return self.func()
+        return self.value
+
+
+@attrs(auto_attribs=True)
+class Histogram(CallbackStats):
+    """A record of how long something takes.
+
+    Like :class:`earwax.CallbackStats`, values are recorded in seconds.
+    """
+
+    def observe(self, value: float) -> None:
+        """Record a value.
+
+        :param value: The number of seconds to record.
+        """
+        self.add(value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the time taken by the body of a ``with`` statement."""
+        started: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(perf_counter() - started)
+
+
+@attrs(auto_attribs=True)
+class MetricsRegistry:
+    """A collection of named metrics.
+
+    Every :class:`earwax.Game` has a registry as its
+    :attr:`~earwax.Game.metrics` attribute, which the engine fills in itself.
+    You can add your own metrics too::
+
+        game.metrics.counter('monsters.killed').increment()
+        game.metrics.gauge('player.health').set(player.health)
+        with game.metrics.histogram('pathfinding').time():
+            find_path()
+
+    :ivar ~earwax.MetricsRegistry.counters: The counters in this registry.
+
+    :ivar ~earwax.MetricsRegistry.gauges: The gauges in this registry.
+
+    :ivar ~earwax.MetricsRegistry.histograms: The histograms in this registry.
+
+    :ivar ~earwax.MetricsRegistry.export_path: The path that metrics are
+        periodically written to.
+
+        This value is set by :meth:`~earwax.MetricsRegistry.start_export`.
+    """
+
+    counters: Dict[str, Counter] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    gauges: Dict[str, Gauge] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    histograms: Dict[str, Histogram] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    export_path: Optional[Path] = attrib(default=None, init=False)
+
+    def counter(self, name: str) -> Counter:
+        """Return the counter with the given name, creating it if necessary.
+
+        :param name: The name of the counter.
+        """
+        if name not in self.counters:
+            self.counters[name] = Counter(name)
+        return self.counters[name]
+
+    def gauge(self, name: str, func: Optional[GaugeFunction] = None) -> Gauge:
+        """Return the gauge with the given name, creating it if necessary.
+
+        :param name: The name of the gauge.
+
+        :param func: The function to read the value from.
+
+            If this value is not ``None``, it replaces the function of any
+            existing gauge with the same name.
+        """
+        if name not in self.gauges:
+            self.gauges[name] = Gauge(name)
+        gauge: Gauge = self.gauges[name]
+        if func is not None:
+            gauge.func = func
+        return gauge
+
+    def histogram(self, name: str) -> Histogram:
+        """Return the histogram with the given name, creating it if necessary.
+
+        :param name: The name of the histogram.
+        """
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name)
+        return self.histograms[name]
+
+    def remove(self, name: str) -> None:
+        """Remove any metric with the given name.
+
+        :param name: The name of the metric to remove.
+        """
+        self.counters.pop(name, None)
+        self.gauges.pop(name, None)
+        self.histograms.pop(name, None)
+
+    def collect(self) -> Dict[str, float]:
+        """Return the current value of every metric.
+
+        Gauges which return dictionaries are reported as ``name.label``.
+        Histograms are reported as ``name.count``, ``name.mean``,
+        ``name.p99``, and ``name.max``.
+        """
+        values: Dict[str, float] = {}
+        name: str
+        counter: Counter
+        for name, counter in self.counters.items():
+            values[name] = counter.value
+        gauge: Gauge
+        for name, gauge in self.gauges.items():
+            value: GaugeValue = gauge.get()
+            if isinstance(value, dict):
+                label: str
+                for label, v in value.items():
+                    values[f"{name}.{label}"] = v
+            else:
+                values[name] = value
+        histogram: Histogram
+        for name, histogram in self.histograms.items():
+            values[f"{name}.count"] = histogram.count
+            values[f"{name}.mean"] = histogram.mean
+            values[f"{name}.p99"] = histogram.percentile(99)
+            values[f"{name}.max"] = histogram.max
+        return dict(sorted(values.items()))
+
+    def save(self, path: Path) -> None:
+        """Write the current values of all metrics to a JSON file.
+
+        :param path: The path to write to.
+        """
+        path.write_text(dumps(self.collect(), indent=2))
+
+    def start_export(self, path: Path, interval: float = 5.0) -> None:
+        """Start saving metrics periodically.
+
+        :param path: The path to write to.
+
+        :param interval: The number of seconds between writes.
+        """
+        self.stop_export()
+        self.export_path = path
+        schedule_interval(self.export, interval)
+
+    def stop_export(self) -> None:
+        """Stop saving metrics periodically."""
+        unschedule(self.export)
+        self.export_path = None
+
+    def export(self, dt: Any) -> None:
+        """Save metrics to :attr:`~earwax.MetricsRegistry.export_path`.
+
+        This method is scheduled by
+        :meth:`~earwax.MetricsRegistry.start_export`.
+
+        :param dt: The time since the last export.
+        """
+        if self.export_path is not None:
+            self.save(self.export_path)
@@ -0,0 +1,106 @@
+"""Provides the MetricsLevel class."""
+
+from typing import Dict, List
+
+from attr import Factory, attrib, attrs
+from pyglet.window import key
+
+from .hat_directions import DOWN, LEFT, UP
+from .level import Level
+from .mixins import DismissibleMixin
+
+
+@attrs(auto_attribs=True)
+class MetricsLevel(Level, DismissibleMixin):
+    """A level for reading a game's :attr:`~earwax.Game.metrics`.
+
+    Push an instance of this class over any other level to hear live engine
+    numbers::
+
+        @level.action('Show metrics', symbol=key.F12)
+        def show_metrics() -> None:
+            game.push_level(MetricsLevel(game))
+
+    Metrics are collected when the level is pushed, and again whenever the
+    user moves to the first metric, so values are always fresh.
+
+    :ivar ~earwax.MetricsLevel.values: The most recently collected values.
+
+    :ivar ~earwax.MetricsLevel.position: The index of the selected metric.
+    """
+
+    values: Dict[str, float] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    position: int = attrib(default=-1, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Add actions."""
+        super().__attrs_post_init__()
+        self.action("Next metric", symbol=key.DOWN, hat_direction=DOWN)(
+            self.move_down
+        )
+        self.action("Previous metric", symbol=key.UP, hat_direction=UP)(
+            self.move_up
+        )
+        self.action("Read all metrics", symbol=key.R, joystick_button=0)(
+            self.read_all
+        )
+        self.action("Dismiss", symbol=key.ESCAPE, hat_direction=LEFT)(
+            self.dismiss
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """Return the names of the collected metrics."""
+        return list(self.values)
+
+    def refresh(self) -> None:
+        """Collect fresh values from the game's metrics registry."""
+        self.values = self.game.metrics.collect()
+
+    def format_value(self, name: str) -> str:
+        """Return a line of text describing one metric.
+
+        :param name: The name of the metric to describe.
+        """
+        value: float = self.values[name]
+        if isinstance(value, float):
+            return f"{name}: {value:.4g}"
+        return f"{name}: {value}"
+
+    def show_selection(self) -> None:
+        """Output the selected metric."""
+        if not self.values:
+            self.game.output("No metrics.")
+        else:
+            self.game.output(self.format_value(self.names[self.position]))
+
+    def on_push(self) -> None:
+        """Collect metrics, and say how many there are."""
+        super().on_push()
+        self.refresh()
+        self.position = -1
+        self.game.output(f"Metrics: {len(self.values)}.")
+
+    def move_down(self) -> None:
+        """Select the next metric."""
+        if self.position == -1:
+            self.refresh()
+        self.position = min(self.position + 1, len(self.values) - 1)
+        self.show_selection()
+
+    def move_up(self) -> None:
+        """Select the previous metric."""
+        self.position = max(0, self.position - 1)
+        if self.position == 0:
+            self.refresh()
+        self.show_selection()
+
+    def read_all(self) -> None:
+        """Collect and output every metric at once."""
+        self.refresh()
+        name: str
+        self.game.output(
+            ", ".join(self.format_value(name) for name in self.values) + "."
+        )
@@ -4,14 +4,15 @@ from datetime import datetime
 from enum import Enum
 from inspect import isclass
 from pathlib import Path
-from typing import (
-    TYPE_CHECKING, Any, Dict, Iterable, List, Optional, TextIO, Type, Union)
+from typing import (TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable,
+                    List, Optional, TextIO, Tuple, Type, Union)
 
 from attr import Attribute, attrs
 from pyglet.event import EventDispatcher
 from typing_inspect import get_args, get_origin, is_union_type
 
-from .yaml import CDumper, CLoader, dump, load
+from .serializers import load_data, save_data
+from .yaml import CLoader, load
 
 if TYPE_CHECKING:
     from .game import Game
@@ -100,6 +101,304 @@ class RegisterEventMixin(EventDispatcher):
         return self.event(func)
 
 
+# Functions which dump a value for a particular type annotation. They take the
+# object being dumped, and the value to dump.
+Dumper = Callable[["DumpLoadMixin", Any], Any]
+
+# Functions which load a value for a particular type annotation.
+Loader = Callable[[Any], Any]
+
+
+@attrs(auto_attribs=True)
+class DumpLoadPlan:
+    """The fields of a :class:`~earwax.mixins.DumpLoadMixin` subclass.
+
+    Plans are built by :func:`get_plan` the first time a class is dumped or
+    loaded, so the attributes and type annotations of a class are only
+    examined once. Each field gets a converter which was chosen for its type
+    annotation, and which falls back to
+    :meth:`~earwax.mixins.DumpLoadMixin.get_dump_value` or
+    :meth:`~earwax.mixins.DumpLoadMixin.get_load_value` for any value it does
+    not expect, so the results are always the same.
+
+    :ivar ~earwax.mixins.DumpLoadPlan.cls: The class this plan is for.
+
+    :ivar ~earwax.mixins.DumpLoadPlan.fields: The names and type annotations
+        of every field which is dumped and loaded.
+
+    :ivar ~earwax.mixins.DumpLoadPlan.dumpers: The names of every field, and
+        the functions which dump them.
+
+    :ivar ~earwax.mixins.DumpLoadPlan.loaders: The names of every field, and
+        the functions which load them.
+    """
+
+    cls: Type["DumpLoadMixin"]
+    fields: List[Tuple[str, Type]]
+    dumpers: List[Tuple[str, Dumper]]
+    loaders: List[Tuple[str, Loader]]
+
+
+# The plans which have already been built.
+plans: Dict[Type["DumpLoadMixin"], DumpLoadPlan] = {}
+
+
+def get_fields(cls: Type["DumpLoadMixin"]) -> List[Tuple[str, Type]]:
+    """Return the names and types of every field which should be dumped.
+
+    Fields whose names start with an underscore, or which appear in the
+    ``__excluded_attribute_names__`` list, are left out.
+
+    :param cls: The class to examine.
+    """
+    fields: List[Tuple[str, Type]] = []
+    name: Union[Attribute, str]
+    items: Iterable[Union[Attribute, str]] = getattr(
+        cls, "__attrs_attrs__", cls.__annotations__.keys()
+    )
+    for name in items:
+        type_: Type
+        if isinstance(name, Attribute):
+            if name.type is not None:
+                type_ = name.type
+            else:
+                type_ = cls.__annotations__[name.name]
+            name = name.name
+        else:
+            type_ = cls.__annotations__[name]
+        if name.startswith("_"):
+            continue
+        if (
+            cls.__excluded_attribute_names__ is not None
+            and name in cls.__excluded_attribute_names__
+        ):
+            continue
+        fields.append((name, type_))
+    return fields
+
+
+def make_dumper(cls: Type["DumpLoadMixin"], type_: Type) -> Dumper:
+    """Return a function which dumps values of the given type.
+
+    :param cls: The class whose ``__allowed_basic_types__`` should be used.
+
+    :param type_: The type annotation to dump values for.
+    """
+    basic: FrozenSet[Type] = frozenset(cls.__allowed_basic_types__)
+
+    def slow(obj: DumpLoadMixin, value: Any) -> Any:
+        return obj.get_dump_value(type_, value)
+
+    origin: Optional[Type] = get_origin(type_)
+    args: Tuple[Type, ...] = get_args(type_)
+    if list in basic or dict in basic:
+        # Collections are returned as they are.
+        origin = None
+    if origin is list and len(args) == 1:
+        entry_type: Type = args[0]
+        if entry_type in basic:
+
+            def dump_basic_list(obj: DumpLoadMixin, value: Any) -> Any:
+                if type(value) is list:
+                    return value
+                return slow(obj, value)
+
+            return dump_basic_list
+        if isclass(entry_type) and issubclass(entry_type, DumpLoadMixin):
+
+            def dump_list(obj: DumpLoadMixin, value: Any) -> Any:
+                if type(value) is list:
+                    return [entry.dump() for entry in value]
+                return slow(obj, value)
+
+            return dump_list
+        return slow
+    if (
+        origin is dict
+        and len(args) == 2
+        and isclass(args[0])
+        and isclass(args[1])
+        and not issubclass(args[0], DumpLoadMixin)
+    ):
+        dump_key: Dumper = make_dumper(cls, args[0])
+        dump_value: Dumper = make_dumper(cls, args[1])
+
+        def dump_dict(obj: DumpLoadMixin, value: Any) -> Any:
+            if type(value) is dict:
+                return {
+                    dump_key(obj, k): dump_value(obj, v)
+                    for k, v in value.items()
+                }
+            return slow(obj, value)
+
+        return dump_dict
+
+    def dump_any(obj: DumpLoadMixin, value: Any) -> Any:
+        if type(value) in basic or isinstance(value, Enum):
+            return value
+        if isinstance(value, DumpLoadMixin):
+            return value.dump()
+        return slow(obj, value)
+
+    return dump_any
+
+
+def make_loader(cls: Type["DumpLoadMixin"], type_: Type) -> Loader:
+    """Return a function which loads values of the given type.
+
+    :param cls: The class whose
+        :meth:`~earwax.mixins.DumpLoadMixin.get_load_value` method should be
+        used for unexpected values.
+
+    :param type_: The type annotation to load values for.
+    """
+    basic: FrozenSet[Type] = frozenset(cls.__allowed_basic_types__)
+
+    def slow(value: Any) -> Any:
+        return cls.get_load_value(type_, value)
+
+    origin: Optional[Type] = get_origin(type_)
+    args: Tuple[Type, ...] = get_args(type_)
+    if list in basic or dict in basic:
+        # Collections are returned as they are.
+        return slow
+    if origin is list and len(args) == 1:
+        entry_type: Type = args[0]
+        if entry_type in basic:
+
+            def load_basic_list(value: Any) -> Any:
+                if type(value) is list:
+                    return value
+                return slow(value)
+
+            return load_basic_list
+        if isclass(entry_type) and issubclass(entry_type, DumpLoadMixin):
+            load_entry: Callable[[Any], Any] = entry_type.load
+
+            def load_list(value: Any) -> Any:
+                if type(value) is list:
+                    return [load_entry(entry) for entry in value]
+                return slow(value)
+
+            return load_list
+        return slow
+    if isclass(type_) and issubclass(type_, DumpLoadMixin):
+        load_object: Callable[[Any], Any] = type_.load
+
+        def load_dumped(value: Any) -> Any:
+            if type(value) is dict:
+                return load_object(value)
+            if type(value) in basic:
+                return value
+            return slow(value)
+
+        return load_dumped
+    if origin is dict and len(args) == 2:
+        load_key: Loader = make_loader(cls, args[0])
+        load_value: Loader = make_loader(cls, args[1])
+
+        def load_dict(value: Any) -> Any:
+            if type(value) is dict:
+                return {load_key(k): load_value(v) for k, v in value.items()}
+            if type(value) in basic:
+                return value
+            return slow(value)
+
+        return load_dict
+    if is_union_type(type_):
+        types: Dict[str, Type[DumpLoadMixin]] = {}
+        t: Type
+        for t in args:
+            if not isclass(t):
+                # ``get_load_value`` would fail on reaching this type.
+                break
+            if issubclass(t, DumpLoadMixin):
+                types.setdefault(t.__name__, t)
+        type_key: str = cls.__type_key__
+
+        def load_union(value: Any) -> Any:
+            if type(value) in basic:
+                return value
+            if type(value) is dict:
+                t: Optional[Type[DumpLoadMixin]] = types.get(
+                    value.get(type_key, "")
+                )
+                if t is not None:
+                    return t.get_load_value(t, value)
+            return slow(value)
+
+        return load_union
+
+    def load_any(value: Any) -> Any:
+        if type(value) in basic:
+            return value
+        return slow(value)
+
+    return load_any
+
+
+def make_method_dumper(type_: Type) -> Dumper:
+    """Return a function which always calls ``get_dump_value``.
+
+    :param type_: The type annotation to dump values for.
+    """
+
+    def dump_value(obj: DumpLoadMixin, value: Any) -> Any:
+        return obj.get_dump_value(type_, value)
+
+    return dump_value
+
+
+def make_method_loader(cls: Type["DumpLoadMixin"], type_: Type) -> Loader:
+    """Return a function which always calls ``get_load_value``.
+
+    :param cls: The class whose method should be called.
+
+    :param type_: The type annotation to load values for.
+    """
+
+    def load_value(value: Any) -> Any:
+        return cls.get_load_value(type_, value)
+
+    return load_value
+
+
+def get_plan(cls: Type["DumpLoadMixin"]) -> DumpLoadPlan:
+    """Return the plan for the given class, building it if necessary.
+
+    If a class overrides :meth:`~earwax.mixins.DumpLoadMixin.get_dump_value`
+    or :meth:`~earwax.mixins.DumpLoadMixin.get_load_value`, every field uses
+    the overridden method.
+
+    :param cls: The class to return the plan for.
+    """
+    plan: Optional[DumpLoadPlan] = plans.get(cls)
+    if plan is not None:
+        return plan
+    fields: List[Tuple[str, Type]] = get_fields(cls)
+    dumpers: List[Tuple[str, Dumper]] = []
+    loaders: List[Tuple[str, Loader]] = []
+    custom_dump: bool = cls.get_dump_value is not DumpLoadMixin.get_dump_value
+    # ``get_load_value`` is a class method, so compare the functions.
+    load_method: Any = cls.get_load_value
+    default_method: Any = DumpLoadMixin.get_load_value
+    custom_load: bool = load_method.__func__ is not default_method.__func__
+    name: str
+    type_: Type
+    for name, type_ in fields:
+        if custom_dump:
+            dumpers.append((name, make_method_dumper(type_)))
+        else:
+            dumpers.append((name, make_dumper(cls, type_)))
+        if custom_load:
+            loaders.append((name, make_method_loader(cls, type_)))
+        else:
+            loaders.append((name, make_loader(cls, type_)))
+    plan = DumpLoadPlan(cls, fields, dumpers, loaders)
+    plans[cls] = plan
+    return plan
+
+
 class DumpLoadMixin:
     """A mixin that allows any object to be dumped to and loaded from a dictionary.
 
@@ -189,31 +488,17 @@ class DumpLoadMixin:
             )
 
     def dump(self) -> Dict[str, Any]:
-        """Dump this instance as a dictionary."""
+        """Dump this instance as a dictionary.
+
+        The fields to dump, and how to dump them, are worked out the first
+        time an instance of each class is dumped. See
+        :class:`~earwax.mixins.DumpLoadPlan`.
+        """
         cls: Type[DumpLoadMixin] = type(self)
-        dump_value: Dict[str, Any] = {}
-        name: Union[Attribute, str]
-        items: Iterable[Union[Attribute, str]] = getattr(
-            self, "__attrs_attrs__", self.__annotations__.keys()
-        )
-        for name in items:
-            type_: Type
-            if isinstance(name, Attribute):
-                if name.type is not None:
-                    type_ = name.type
-                else:
-                    type_ = self.__annotations__[name.name]
-                name = name.name
-            else:
-                type_ = self.__annotations__[name]
-            if name.startswith("_"):
-                continue
-            if (
-                cls.__excluded_attribute_names__ is not None
-                and name in cls.__excluded_attribute_names__
-            ):
-                continue
-            dump_value[name] = self.get_dump_value(type_, getattr(self, name))
+        dump_value: Dict[str, Any] = {
+            name: dumper(self, getattr(self, name))
+            for name, dumper in get_plan(cls).dumpers
+        }
         return {cls.__type_key__: cls.__name__, cls.__value_key__: dump_value}
 
     @classmethod
@@ -313,29 +598,11 @@ class DumpLoadMixin:
             )
         data = data.get(cls.__value_key__, {})
         kwargs: Dict[str, Any] = {}
-        name: Union[Attribute, str]
-        items: Iterable[Union[Attribute, str]] = getattr(
-            cls, "__attrs_attrs__", cls.__annotations__.keys()
-        )
-        for name in items:
-            type_: Type
-            if isinstance(name, Attribute):
-                if name.type is not None:
-                    type_ = name.type
-                else:
-                    type_ = cls.__annotations__[name.name]
-                name = name.name
-            else:
-                type_ = cls.__annotations__[name]
+        name: str
+        loader: Loader
+        for name, loader in get_plan(cls).loaders:
             if name in data:
-                if (
-                    cls.__excluded_attribute_names__ is not None
-                    and name in cls.__excluded_attribute_names__
-                ):
-                    continue
-                if name.startswith("_"):
-                    continue
-                kwargs[name] = cls.get_load_value(type_, data[name])
+                kwargs[name] = loader(data[name])
         return cls(*args, **kwargs)  # type: ignore[call-arg]
 
     @classmethod
@@ -351,18 +618,33 @@ class DumpLoadMixin:
         return cls.load(data, *args)
 
     @classmethod
-    def from_filename(cls, filename: Path, *args) -> Any:
+    def from_filename(
+        cls, filename: Path, *args, serializer: Optional[str] = None
+    ) -> Any:
         """Load an instance from a filename.
 
         :param filename: The path to load from.
+
+        :param args: Extra positional arguments to pass to the ``load``
+            constructor.
+
+        :param serializer: The name of the serializer to load with.
+
+            If this value is ``None``, the format will be worked out from the
+            contents of the file. See :mod:`earwax.serializers`.
         """
-        with filename.open("r") as f:
-            return cls.from_file(f, *args)
+        data: Dict[str, Any] = load_data(filename, serializer=serializer)
+        return cls.load(data, *args)
 
-    def save(self, filename: Path) -> None:
+    def save(self, filename: Path, serializer: Optional[str] = None) -> None:
         """Write this object to the provided filename.
 
         :param filename: The path to the file to dump to.
+
+        :param serializer: The name of the serializer to save with.
+
+            If this value is ``None``, the serializer will be chosen by the
+            extension of ``filename``, so ``.ewb`` files will be binary, and
+            everything else will be YAML. See :mod:`earwax.serializers`.
         """
-        with filename.open("w") as f:
-            dump(self.dump(), f, Dumper=CDumper)
+        save_data(self.dump(), filename, serializer=serializer)
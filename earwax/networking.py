@@ -1,14 +1,26 @@
 """Provides classes for networking."""
 
+from collections import deque
 from enum import Enum
-from socket import AF_INET, SOCK_STREAM, error
+from os import strerror
+from selectors import (EVENT_READ, EVENT_WRITE, BaseSelector, DefaultSelector,
+                       SelectorKey)
+from socket import (AF_INET, SO_ERROR, SO_REUSEADDR, SOCK_STREAM, SOL_SOCKET,
+                    error)
 from socket import socket as _socket
-from typing import List, Optional
+from struct import Struct
+from time import perf_counter
+from typing import Any, Deque, List, Optional, Tuple, Union
+from zlib import Z_FINISH, Z_SYNC_FLUSH, compressobj, decompressobj
 
 from attr import Factory, attrib, attrs
 from pyglet.clock import schedule, unschedule
+from pyglet.event import EVENT_HANDLED
 
+from . import tracing
+from .metrics import Histogram
 from .mixins import RegisterEventMixin
+from .profiler import profiled
 
 
 class NetworkingConnectionError(Exception):
@@ -36,6 +48,38 @@ class NotConnectedYet(NetworkingConnectionError):
     """Tried to send data on a connection which is not yet connected."""
 
 
+class MessageTooLarge(NetworkingConnectionError):
+    """A line or message was longer than the maximum allowed size.
+
+    This exception is passed to :meth:`~earwax.NetworkConnection.on_error`
+    when more than :attr:`~earwax.NetworkConnection.max_message_size` bytes
+    are received without a complete frame.
+
+    The rest of a length-prefixed message which is too large is skipped, so
+    the messages after it are still received.
+    """
+
+
+class Framing(Enum):
+    """The ways that :class:`~earwax.NetworkConnection` can split up data.
+
+    :ivar ~earwax.Framing.raw: Data is passed to
+        :meth:`~earwax.NetworkConnection.on_data` as it is received.
+
+    :ivar ~earwax.Framing.lines: Data is split on
+        :attr:`~earwax.NetworkConnection.delimiter`, and each line is passed
+        to :meth:`~earwax.NetworkConnection.on_line`.
+
+    :ivar ~earwax.Framing.length_prefixed: Each message is preceded by its
+        length, packed with :attr:`~earwax.NetworkConnection.length_format`,
+        and passed to :meth:`~earwax.NetworkConnection.on_message`.
+    """
+
+    raw = 0
+    lines = 1
+    length_prefixed = 2
+
+
 class ConnectionStates(Enum):
     """Various states that :class:`~earwax.NetworkConnection` classes can be in.
 
@@ -63,6 +107,42 @@ class ConnectionStates(Enum):
     error = 4
 
 
+@attrs(auto_attribs=True)
+class SendStats:
+    """Statistics about the data sent by a :class:`~earwax.NetworkConnection`.
+
+    :ivar ~earwax.SendStats.bytes_sent: The number of bytes which have been
+        sent.
+
+    :ivar ~earwax.SendStats.writes: The number of times data was written to
+        the socket.
+
+        When small writes are coalesced, this number will be smaller than
+        :attr:`~earwax.SendStats.messages`.
+
+    :ivar ~earwax.SendStats.messages: The number of calls to
+        :meth:`~earwax.NetworkConnection.send` whose data has been completely
+        sent.
+
+    :ivar ~earwax.SendStats.max_queued: The largest number of bytes that
+        have been waiting to be sent at once.
+
+    :ivar ~earwax.SendStats.latency: The time between data being passed to
+        :meth:`~earwax.NetworkConnection.send`, and the last of it being
+        written to the socket.
+    """
+
+    bytes_sent: int = 0
+    writes: int = 0
+    messages: int = 0
+    max_queued: int = 0
+    latency: Histogram = Factory(lambda: Histogram("send.latency"))
+
+
+# The data waiting to be sent, and the times it was queued.
+QueuedData = Tuple[memoryview, List[float]]
+
+
 @attrs(auto_attribs=True)
 class NetworkConnection(RegisterEventMixin):
     """Represents a single outbound connection.
@@ -71,12 +151,108 @@ class NetworkConnection(RegisterEventMixin):
     :meth:`~earwax.NetworkConnection.on_data`, and write data with the
     :meth:`~earwax.NetworkConnection.send` method.
 
+    If you would rather receive whole lines or messages, set
+    :attr:`~earwax.NetworkConnection.framing`::
+
+        con: NetworkConnection = NetworkConnection(framing=Framing.lines)
+
+        @con.event
+        def on_line(line: memoryview) -> None:
+            game.output(str(line, 'utf-8'))
+
+    Data is read into one reusable buffer, and lines and messages are
+    dispatched as slices of that buffer, without copying. Those slices are
+    released as soon as the event has been dispatched, so if you need to keep
+    the data around, convert it with ``bytes(line)`` first.
+
+    :ivar ~earwax.NetworkConnection.framing: How received data should be
+        split up.
+
+    :ivar ~earwax.NetworkConnection.buffer_size: The initial size of the
+        receive buffer.
+
+        The buffer will grow if a single line or message is bigger than this.
+
+    :ivar ~earwax.NetworkConnection.delimiter: The bytes which end every line,
+        when :attr:`~earwax.NetworkConnection.framing` is
+        :attr:`earwax.Framing.lines`.
+
+    :ivar ~earwax.NetworkConnection.length_format: The ``struct`` format of
+        the length which precedes every message, when
+        :attr:`~earwax.NetworkConnection.framing` is
+        :attr:`earwax.Framing.length_prefixed`.
+
+    :ivar ~earwax.NetworkConnection.max_message_size: The biggest line or
+        message that can be received.
+
+        If this size is exceeded, :class:`earwax.MessageTooLarge` will be
+        passed to :meth:`~earwax.NetworkConnection.on_error`, and the
+        buffered data will be discarded. The rest of a length-prefixed
+        message which is too large will be skipped as it arrives.
+
+    :ivar ~earwax.NetworkConnection.high_water_mark: The number of queued
+        bytes above which :meth:`~earwax.NetworkConnection.send` will return
+        ``False``.
+
+        Once the queue has emptied again,
+        :meth:`~earwax.NetworkConnection.on_drain` will be dispatched.
+
+    :ivar ~earwax.NetworkConnection.coalesce: Whether or not to join small
+        writes together.
+
+        If this value is ``True``, data is only sent when
+        :meth:`~earwax.NetworkConnection.poll` runs, so everything sent in
+        one frame will be written to the socket at once.
+
+    :ivar ~earwax.NetworkConnection.coalesce_size: The largest number of
+        bytes to join together when coalescing writes.
+
     :ivar ~earwax.NetworkConnection.socket: The raw socket this instance uses
         for communication.
 
     :ivar ~earwax.NetworkConnection.state: The state this connection is in.
+
+    :ivar ~earwax.NetworkConnection.selector: The selector which is used to
+        check whether :attr:`~earwax.NetworkConnection.socket` is readable.
+
+    :ivar ~earwax.NetworkConnection.buffer: The receive buffer.
+
+    :ivar ~earwax.NetworkConnection.received: The number of bytes at the
+        start of :attr:`~earwax.NetworkConnection.buffer` which have been
+        received, but not yet dispatched.
+
+    :ivar ~earwax.NetworkConnection.send_queue: The data which is waiting to
+        be sent.
+
+    :ivar ~earwax.NetworkConnection.queued: The number of bytes in
+        :attr:`~earwax.NetworkConnection.send_queue`.
+
+    :ivar ~earwax.NetworkConnection.send_stats: Statistics about the data
+        this connection has sent.
+
+    :ivar ~earwax.NetworkConnection.compressor: The zlib stream which
+        outgoing data is compressed with, if any.
+
+        This value is set by
+        :meth:`~earwax.NetworkConnection.start_compression`.
+
+    :ivar ~earwax.NetworkConnection.decompressor: The zlib stream which
+        incoming data is decompressed with, if any.
+
+        This value is set by
+        :meth:`~earwax.NetworkConnection.start_decompression`, and cleared
+        when the other end finishes its stream.
     """
 
+    framing: Framing = Framing.raw
+    buffer_size: int = 65536
+    delimiter: bytes = b"\r\n"
+    length_format: str = "!I"
+    max_message_size: int = 1 << 24
+    high_water_mark: int = 1 << 20
+    coalesce: bool = False
+    coalesce_size: int = 65536
+
     socket: Optional[_socket] = attrib(
         default=Factory(lambda: None), init=False
     )
@@ -85,12 +261,44 @@ class NetworkConnection(RegisterEventMixin):
         default=Factory(lambda: ConnectionStates.not_connected), init=False
     )
 
+    selector: Optional[BaseSelector] = attrib(
+        default=Factory(lambda: None), init=False, repr=False
+    )
+    buffer: bytearray = attrib(init=False, repr=False)
+    received: int = attrib(default=0, init=False, repr=False)
+    _view: memoryview = attrib(init=False, repr=False)
+    _searched: int = attrib(default=0, init=False, repr=False)
+    _skipping: int = attrib(default=0, init=False, repr=False)
+    _length: Struct = attrib(init=False, repr=False)
+    send_queue: Deque[QueuedData] = attrib(
+        default=Factory(deque), init=False, repr=False
+    )
+    queued: int = attrib(default=0, init=False, repr=False)
+    send_stats: SendStats = attrib(
+        default=Factory(SendStats), init=False, repr=False
+    )
+    _events: int = attrib(default=0, init=False, repr=False)
+    _owns_selector: bool = attrib(default=True, init=False, repr=False)
+    compressor: Optional[Any] = attrib(default=None, init=False, repr=False)
+    decompressor: Optional[Any] = attrib(
+        default=None, init=False, repr=False
+    )
+    _raw: Optional[memoryview] = attrib(default=None, init=False, repr=False)
+    _switching: bool = attrib(default=False, init=False, repr=False)
+    _blocked: bool = attrib(default=False, init=False, repr=False)
+
     def __attrs_post_init__(self) -> None:
         """Register default events."""
+        self.buffer = bytearray(self.buffer_size)
+        self._view = memoryview(self.buffer)
+        self._length = Struct(self.length_format)
         for func in (
             self.on_connect,
             self.on_disconnect,
             self.on_data,
+            self.on_line,
+            self.on_message,
+            self.on_drain,
             self.on_error,
         ):
             self.register_event(func)  # type: ignore[arg-type]
@@ -98,9 +306,9 @@ class NetworkConnection(RegisterEventMixin):
     def on_connect(self) -> None:
         """Deal with the connection being opened.
 
-        This event is dispatched when text is first received from
-        :attr:`self.socket <earwax.NetworkConnection.socket>`, since I've not
-        found a better way to know when the socket is properly open.
+        This event is dispatched when
+        :attr:`self.socket <earwax.NetworkConnection.socket>` first becomes
+        writable, and no error occurred while connecting.
         """
         pass
 
@@ -119,7 +327,46 @@ class NetworkConnection(RegisterEventMixin):
         """Handle incoming data.
 
         An event which is dispatched whenever data is received from
-        :attr:`self.socket <earwax.NetworkConnection.socket>`.
+        :attr:`self.socket <earwax.NetworkConnection.socket>`, and
+        :attr:`~earwax.NetworkConnection.framing` is
+        :attr:`earwax.Framing.raw`.
+        """
+        pass
+
+    def on_line(self, line: memoryview) -> None:
+        """Handle an incoming line.
+
+        An event which is dispatched for every complete line, when
+        :attr:`~earwax.NetworkConnection.framing` is
+        :attr:`earwax.Framing.lines`.
+
+        :param line: The line, without
+            :attr:`~earwax.NetworkConnection.delimiter`.
+
+            This view is released after the event has been dispatched.
+        """
+        pass
+
+    def on_message(self, message: memoryview) -> None:
+        """Handle an incoming message.
+
+        An event which is dispatched for every complete message, when
+        :attr:`~earwax.NetworkConnection.framing` is
+        :attr:`earwax.Framing.length_prefixed`.
+
+        :param message: The message, without its length.
+
+            This view is released after the event has been dispatched.
+        """
+        pass
+
+    def on_drain(self) -> None:
+        """Handle the send queue emptying.
+
+        This event is dispatched when everything in
+        :attr:`~earwax.NetworkConnection.send_queue` has been sent, if
+        :meth:`~earwax.NetworkConnection.send` has returned ``False`` since
+        the last time it was dispatched.
         """
         pass
 
@@ -127,7 +374,7 @@ class NetworkConnection(RegisterEventMixin):
         """Handle a connection error.
 
         This event is dispatched when there is an error establishing a
-        connection.
+        connection, or when a message is too large.
 
         :param e: The exception that was raised.
         """
@@ -148,16 +395,25 @@ class NetworkConnection(RegisterEventMixin):
         if self.state is ConnectionStates.connected:
             raise AlreadyConnected(self)
         self.socket = _socket(AF_INET, SOCK_STREAM)
+        self._owns_selector = True
         self.state = ConnectionStates.connecting
         self.socket.setblocking(False)
+        self.received = 0
+        self._searched = 0
+        self._skipping = 0
         try:
             self.socket.connect((hostname, port))
         except BlockingIOError:
-            schedule(self.poll)
+            pass
         except error as e:
             self.state = ConnectionStates.error
             self.dispatch_event("on_error", e)
             self.socket = None
+            return
+        self.selector = DefaultSelector()
+        self.selector.register(self.socket, EVENT_WRITE, self)
+        self._events = EVENT_WRITE
+        schedule(self.poll)
 
     def close(self) -> None:
         """Close this connection.
@@ -171,6 +427,60 @@ class NetworkConnection(RegisterEventMixin):
         self.dispatch_event("on_disconnect")
         self.shutdown()
 
+    def use_socket(self, sock: _socket, selector: BaseSelector) -> None:
+        """Use a socket which is already connected.
+
+        This method is used by :class:`earwax.NetworkServer`, to wrap the
+        sockets it accepts.
+
+        The socket will be registered with ``selector``, which this connection
+        will not poll itself. Instead, whoever owns the selector should call
+        :meth:`~earwax.NetworkConnection.handle`. When this connection is
+        shut down, the socket will be unregistered and closed.
+
+        :param sock: The connected socket.
+
+        :param selector: The selector to register ``sock`` with.
+        """
+        if self.socket is not None:
+            raise AlreadyConnected(self)
+        sock.setblocking(False)
+        self.socket = sock
+        self.selector = selector
+        self._owns_selector = False
+        self.state = ConnectionStates.connected
+        self.received = 0
+        self._searched = 0
+        self._skipping = 0
+        self._events = EVENT_READ
+        selector.register(sock, EVENT_READ, self)
+
+    def finish_connecting(self) -> None:
+        """Finish connecting.
+
+        This method is called by :meth:`~earwax.NetworkConnection.poll` when
+        :attr:`self.socket <earwax.NetworkConnection.socket>` first becomes
+        writable.
+
+        If connecting failed, :meth:`~earwax.NetworkConnection.on_error` will
+        be dispatched. Otherwise,
+        :meth:`~earwax.NetworkConnection.on_connect` will be dispatched, and
+        the socket will be watched for incoming data instead.
+        """
+        assert self.socket is not None
+        assert self.selector is not None
+        code: int = self.socket.getsockopt(SOL_SOCKET, SO_ERROR)
+        if code:
+            self.shutdown()
+            self.state = ConnectionStates.error
+            self.dispatch_event("on_error", OSError(code, strerror(code)))
+        else:
+            self.state = ConnectionStates.connected
+            self._events = EVENT_WRITE
+            self.watch_writes(bool(self.send_queue))
+            self.dispatch_event("on_connect")
+
+    @profiled()
     def poll(self, dt: float) -> None:
         """Check if any data has been received.
 
@@ -182,28 +492,209 @@ class NetworkConnection(RegisterEventMixin):
         :meth:`~earwax.NetworkConnection.shutdown`, when no more data is
         received from the socket.
 
+        If there is a :attr:`~earwax.NetworkConnection.selector`, the socket
+        will only be read from when it is readable, so idle connections cost
+        one system call per frame.
+
         If this connection is not connected yet (I.E.: you called this function
         yourself), then :class:`earwax.NotConnectedYet` will be raised.
         """
         if self.socket is None:
             raise NotConnectedYet(self)
-        chunks: List[bytes] = []
+        mask: int = EVENT_READ
+        if self.selector is not None:
+            events: List[Tuple[SelectorKey, int]] = self.selector.select(0)
+            if not events:
+                return  # Nothing has happened.
+            if self.state is ConnectionStates.connecting:
+                return self.finish_connecting()
+            mask = events[0][1]
+        elif self.send_queue:
+            mask |= EVENT_WRITE
+        self.handle(mask)
+
+    def handle(self, mask: int) -> None:
+        """Handle the socket becoming readable or writable.
+
+        This method is called by :meth:`~earwax.NetworkConnection.poll`, or by
+        the :class:`earwax.NetworkServer` which accepted this connection.
+
+        :param mask: The selector events which occurred.
+        """
+        if mask & EVENT_WRITE:
+            self.flush()
+        if mask & EVENT_READ and self.socket is not None:
+            self.read()
+
+    def read(self) -> None:
+        """Read and dispatch everything which has been received.
+
+        This method reads until the socket would block, and is called by
+        :meth:`~earwax.NetworkConnection.handle`.
+        """
+        if self.socket is None:
+            raise NotConnectedYet(self)
+        total: int = 0
         while True:
+            if self.received == len(self.buffer):
+                self.make_room()
+                if self.socket is None:
+                    return  # An event handler closed this connection.
             try:
-                data: bytes = self.socket.recv(1024)
-                if not data:
-                    self.dispatch_event("on_disconnect")
-                    return self.shutdown()
-                chunks.append(data)
+                if self._raw is None:
+                    size: int = self.socket.recv_into(
+                        self._view[self.received :]
+                    )
+                else:
+                    size = self.socket.recv_into(self._raw)
             except BlockingIOError:
-                if self.state is ConnectionStates.connecting:
-                    self.state = ConnectionStates.connected
-                    self.dispatch_event("on_connect")
                 break  # There is no data to read.
+            except ConnectionError:
+                size = 0  # Treat a reset like a disconnect.
             except error:
                 return  # Still connecting.
-        if chunks:
-            self.dispatch_event("on_data", b"".join(chunks))
+            if not size:
+                self.dispatch_frames()
+                self.dispatch_event("on_disconnect")
+                return self.shutdown()
+            if self._raw is None:
+                self.received += size
+            else:
+                self.inflate(self._raw[:size])
+                if self.socket is None:
+                    return  # An event handler closed this connection.
+            total += size
+            if self.framing is not Framing.raw:
+                self.dispatch_frames()
+                if self.socket is None:
+                    return  # An event handler closed this connection.
+        if total:
+            tracer: Optional[tracing.Tracer] = tracing.active_tracer
+            if tracer is not None:
+                tracer.instant("receive", "network", size=total)
+            self.dispatch_frames()
+
+    def grow_buffer(self, size: int) -> None:
+        """Make :attr:`~earwax.NetworkConnection.buffer` bigger.
+
+        If ``size`` is bigger than
+        :attr:`~earwax.NetworkConnection.max_message_size`,
+        :class:`earwax.MessageTooLarge` will be passed to
+        :meth:`~earwax.NetworkConnection.on_error`, and any received data will
+        be discarded instead.
+
+        :param size: The new size of the buffer.
+        """
+        if size > self.max_message_size:
+            self.received = 0
+            self._searched = 0
+            self.dispatch_event(
+                "on_error",
+                MessageTooLarge(
+                    "No complete frame in %d bytes." % self.max_message_size
+                ),
+            )
+        else:
+            self._view.release()
+            self.buffer.extend(bytes(size - len(self.buffer)))
+            self._view = memoryview(self.buffer)
+
+    def dispatch_frames(self) -> None:
+        """Dispatch every complete frame which has been received.
+
+        Which events are dispatched depends on
+        :attr:`~earwax.NetworkConnection.framing`. Any incomplete frame is
+        moved to the start of :attr:`~earwax.NetworkConnection.buffer`.
+        """
+        if not self.received:
+            return
+        if self.framing is Framing.raw:
+            data: bytes = bytes(self._view[: self.received])
+            self.received = 0
+            self.dispatch_event("on_data", data)
+            return
+        start: int = 0
+        if self.framing is Framing.lines:
+            start = self.dispatch_lines()
+        else:
+            start = self.dispatch_messages()
+        if self.received >= start > 0:
+            # The received count is reset if an event handler shuts this
+            # connection down.
+            remaining: int = self.received - start
+            self._view[:remaining] = self._view[start : self.received]
+            self.received = remaining
+            self._searched = max(0, self._searched - start)
+        if self._switching:
+            # An event handler started decompression, so everything after
+            # the frame it was handling is compressed.
+            self._switching = False
+            compressed: bytes = bytes(self._view[: self.received])
+            self.received = 0
+            self._searched = 0
+            self.inflate(compressed)
+            self.dispatch_frames()
+
+    def dispatch_view(self, name: str, start: int, end: int) -> None:
+        """Dispatch a slice of :attr:`~earwax.NetworkConnection.buffer`.
+
+        :param name: The name of the event to dispatch.
+
+        :param start: The index of the first byte to dispatch.
+
+        :param end: The index after the last byte to dispatch.
+        """
+        view: memoryview = self._view[start:end]
+        try:
+            self.dispatch_event(name, view)
+        finally:
+            view.release()
+
+    def dispatch_lines(self) -> int:
+        """Dispatch :meth:`~earwax.NetworkConnection.on_line` for every line.
+
+        Returns the index of the first byte which was not dispatched.
+        """
+        start: int = 0
+        delimiter: bytes = self.delimiter
+        search: int = max(0, self._searched - len(delimiter) + 1)
+        while True:
+            end: int = self.buffer.find(delimiter, search, self.received)
+            if end == -1:
+                self._searched = self.received
+                return start
+            self.dispatch_view("on_line", start, end)
+            start = search = end + len(delimiter)
+            if self._switching:
+                return start
+
+    def dispatch_messages(self) -> int:
+        """Dispatch :meth:`~earwax.NetworkConnection.on_message` for messages.
+
+        Returns the index of the first byte which was not dispatched.
+        """
+        start: int = min(self._skipping, self.received)
+        self._skipping -= start
+        header: int = self._length.size
+        while self.received - start >= header:
+            length: int = self._length.unpack_from(self.buffer, start)[0]
+            end: int = start + header + length
+            if end > self.received:
+                if header + length > len(self.buffer):
+                    if start:
+                        break  # Make room first.
+                    if header + length > self.max_message_size:
+                        # The received data is about to be discarded, so
+                        # skip the rest of this message as it arrives.
+                        # Otherwise its body would be read as lengths.
+                        self._skipping = end - self.received
+                    self.grow_buffer(header + length)
+                break
+            self.dispatch_view("on_message", start + header, end)
+            start = end
+            if self._switching:
+                break
+        return start
 
     def shutdown(self) -> None:
         """Shutdown this server.
@@ -212,24 +703,644 @@ class NetworkConnection(RegisterEventMixin):
         :attr:`self.socket <earwax.NetworkConnection.socket>` to ``None``, and
         reset :attr:`self.state <earwax.NetworkConnection.state>` to
         :attr:`earwax.ConnectionStates.not_connected`.
+
+        Sockets passed to :meth:`~earwax.NetworkConnection.use_socket` are
+        unregistered from their selector, and closed.
         """
         unschedule(self.poll)
+        if self.selector is not None:
+            if self._owns_selector:
+                self.selector.close()
+            elif self.socket is not None:
+                self.selector.unregister(self.socket)
+                self.socket.close()
+            self.selector = None
         self.socket = None
         self.state = ConnectionStates.not_connected
+        self.received = 0
+        self._searched = 0
+        self._skipping = 0
+        self.send_queue.clear()
+        self.queued = 0
+        self._events = 0
+        self._blocked = False
+        self.compressor = None
+        self.decompressor = None
+        self._raw = None
+        self._switching = False
+
+    def append_received(self, data: bytes) -> None:
+        """Add data to :attr:`~earwax.NetworkConnection.buffer`.
 
-    def send(self, data: bytes) -> None:
-        r"""Send some data over this connection.
+        This method is used for data which was not read straight into the
+        buffer, and makes room as necessary.
+
+        :param data: The data to add.
+        """
+        view: memoryview = memoryview(data)
+        while view:
+            if self.received == len(self.buffer):
+                self.make_room()
+                if self.socket is None:
+                    return  # An event handler closed this connection.
+                if self.decompressor is not None:
+                    # An event handler started decompression again.
+                    return self.inflate(view)
+            size: int = min(len(view), len(self.buffer) - self.received)
+            self._view[self.received : self.received + size] = view[:size]
+            self.received += size
+            view = view[size:]
+
+    def make_room(self) -> None:
+        """Make room in a full :attr:`~earwax.NetworkConnection.buffer`.
+
+        Every complete frame is dispatched first. The buffer is only grown if
+        that freed no space, because a single line or message fills it.
+        """
+        self.dispatch_frames()
+        if self.received == len(self.buffer):
+            self.grow_buffer(len(self.buffer) * 2)
+
+    def inflate(self, data: Union[bytes, memoryview]) -> None:
+        """Decompress data into :attr:`~earwax.NetworkConnection.buffer`.
+
+        Data is decompressed in chunks which fit in the space left in the
+        buffer, and complete frames are dispatched whenever it fills up. If
+        the compressed stream ends, decompression stops, and
+        anything after the end of the stream is added as it is.
+
+        :param data: The compressed data.
+        """
+        d: Any = self.decompressor
+        assert d is not None
+        while data:
+            if self.received == len(self.buffer):
+                self.make_room()
+                if self.socket is None:
+                    return  # An event handler closed this connection.
+            out: bytes = d.decompress(data, len(self.buffer) - self.received)
+            self._view[self.received : self.received + len(out)] = out
+            self.received += len(out)
+            data = d.unconsumed_tail
+            if d.eof:
+                self.decompressor = None
+                self._raw = None
+                self.append_received(d.unused_data)
+                break
+
+    def start_compression(self, level: int = 6) -> None:
+        """Compress everything sent from now on.
+
+        Like MCCP, compression covers the whole stream, rather than
+        individual messages, so repeated text compresses very well. Each call
+        to :meth:`~earwax.NetworkConnection.send` is flushed, so the other end
+        can decompress it straight away.
+
+        You should tell the other end to call
+        :meth:`~earwax.NetworkConnection.start_decompression` first::
+
+            client.send_message(b'compress')
+            client.start_compression()
+
+        :param level: The zlib compression level, from ``1`` to ``9``.
+        """
+        if self.compressor is None:
+            self.compressor = compressobj(level)
+
+    def stop_compression(self) -> None:
+        """Finish the compressed stream.
+
+        The other end will stop decompressing automatically.
+        """
+        if self.compressor is not None:
+            data: bytes = self.compressor.flush(Z_FINISH)
+            self.compressor = None
+            self.send(data)
+
+    def start_decompression(self, data: bytes = b"") -> None:
+        """Decompress everything received from now on.
+
+        If this method is called from an
+        :meth:`~earwax.NetworkConnection.on_line` or
+        :meth:`~earwax.NetworkConnection.on_message` event, everything after
+        that line or message will be decompressed.
+
+        :param data: Compressed data which has already been received.
+
+            This is useful with :attr:`earwax.Framing.raw`, where compressed
+            data may arrive in the same
+            :meth:`~earwax.NetworkConnection.on_data` event as the request to
+            start decompressing. It will be dispatched straight away.
+        """
+        if self.decompressor is not None:
+            return
+        self.decompressor = decompressobj()
+        self._raw = memoryview(bytearray(self.buffer_size))
+        if self.framing is not Framing.raw:
+            self._switching = True
+        if data:
+            self.inflate(data)
+            if self.framing is Framing.raw:
+                self.dispatch_frames()
+
+    def frame(self, data: bytes) -> bytes:
+        """Return ``data`` framed for sending.
+
+        Lines are followed by :attr:`~earwax.NetworkConnection.delimiter`,
+        and messages are preceded by their length. Raw data is returned as it
+        is.
+
+        :param data: The data to frame.
+        """
+        if self.framing is Framing.lines:
+            return b"".join((data, self.delimiter))
+        if self.framing is Framing.length_prefixed:
+            return self._length.pack(len(data)) + data
+        return data
+
+    def send(self, data: bytes) -> bool:
+        """Send some data over this connection.
 
         Sends some data to :attr:`self.socket
         <earwax.NetworkConnection.socket>`.
 
+        This method never blocks. As much of ``data`` as the socket will
+        accept is sent straight away, and the rest is added to
+        :attr:`~earwax.NetworkConnection.send_queue`, to be sent by
+        :meth:`~earwax.NetworkConnection.poll` when the socket is writable. If
+        :attr:`~earwax.NetworkConnection.coalesce` is ``True``, all the data
+        is queued.
+
+        Returns ``False`` if more than
+        :attr:`~earwax.NetworkConnection.high_water_mark` bytes are waiting to
+        be sent. In that case, you should stop sending until
+        :meth:`~earwax.NetworkConnection.on_drain` is dispatched.
+
         If this object is not connected yet, then
-        :class:`~earwax.NotConnectedYet` will be raised.
+        :class:`~earwax.NotConnectedYet` will be raised. Data sent while still
+        connecting is queued.
 
         :param data: The data to send to the socket.
 
-            Must end with ``'\r\n'``.
+            The data is sent as it is, whatever
+            :attr:`~earwax.NetworkConnection.framing` is. To add a delimiter
+            or length, use :meth:`~earwax.NetworkConnection.send_message`
+            instead.
         """
         if self.socket is None:
             raise NotConnectedYet(self)
-        self.socket.sendall(data)
+        if not data:
+            return not self._blocked
+        if self.compressor is not None:
+            data = self.compressor.compress(data) + self.compressor.flush(
+                Z_SYNC_FLUSH
+            )
+        # Copy mutable buffers, so they can be changed once this method
+        # returns.
+        self.send_queue.append((memoryview(bytes(data)), [perf_counter()]))
+        self.queued += len(data)
+        if self.queued > self.send_stats.max_queued:
+            self.send_stats.max_queued = self.queued
+        if self.coalesce or self.state is not ConnectionStates.connected:
+            self.watch_writes(True)
+        elif len(self.send_queue) == 1:
+            self.flush()
+        if self.queued > self.high_water_mark:
+            self._blocked = True
+        return not self._blocked
+
+    def flush(self) -> None:
+        """Send as much queued data as possible, without blocking.
+
+        This method is called by :meth:`~earwax.NetworkConnection.poll` when
+        :attr:`self.socket <earwax.NetworkConnection.socket>` is writable.
+
+        If :attr:`~earwax.NetworkConnection.coalesce` is ``True``, small
+        chunks of data will be joined together before being sent.
+        """
+        if self.socket is None:
+            raise NotConnectedYet(self)
+        queue: Deque[QueuedData] = self.send_queue
+        stats: SendStats = self.send_stats
+        while queue:
+            if (
+                self.coalesce
+                and len(queue) > 1
+                and len(queue[0][0]) < self.coalesce_size
+            ):
+                self.join_queued()
+            data: memoryview
+            times: List[float]
+            data, times = queue[0]
+            try:
+                size: int = self.socket.send(data)
+            except BlockingIOError:
+                break
+            except ConnectionError:
+                self.dispatch_event("on_disconnect")
+                return self.shutdown()
+            stats.writes += 1
+            stats.bytes_sent += size
+            self.queued -= size
+            if size < len(data):
+                queue[0] = (data[size:], times)
+                break
+            queue.popleft()
+            now: float = perf_counter()
+            started: float
+            for started in times:
+                stats.latency.add(now - started)
+            stats.messages += len(times)
+        self.watch_writes(bool(queue))
+        if not queue and self._blocked:
+            self._blocked = False
+            self.dispatch_event("on_drain")
+
+    def join_queued(self) -> None:
+        """Join small chunks at the start of the send queue into one chunk.
+
+        No more than :attr:`~earwax.NetworkConnection.coalesce_size` bytes
+        are joined, unless the first chunk is already bigger than that.
+        """
+        queue: Deque[QueuedData] = self.send_queue
+        data: memoryview
+        times: List[float]
+        data, times = queue.popleft()
+        chunks: List[memoryview] = [data]
+        all_times: List[float] = list(times)
+        size: int = len(data)
+        while queue and size + len(queue[0][0]) <= self.coalesce_size:
+            data, times = queue.popleft()
+            chunks.append(data)
+            all_times.extend(times)
+            size += len(data)
+        queue.appendleft((memoryview(b"".join(chunks)), all_times))
+
+    def watch_writes(self, value: bool) -> None:
+        """Set whether or not the selector should wait for writability.
+
+        :param value: ``True`` if there is data waiting to be sent.
+        """
+        if (
+            self.selector is None
+            or self.socket is None
+            or self.state is not ConnectionStates.connected
+        ):
+            return
+        events: int = EVENT_READ | (EVENT_WRITE if value else 0)
+        if events != self._events:
+            self.selector.modify(self.socket, events, self)
+            self._events = events
+
+    def send_message(self, data: bytes) -> bool:
+        """Frame and send some data.
+
+        Uses :meth:`~earwax.NetworkConnection.frame` to add a delimiter or
+        length to ``data``, then sends it with
+        :meth:`~earwax.NetworkConnection.send`, whose return value is
+        returned.
+
+        :param data: The line or message to send.
+        """
+        return self.send(self.frame(data))
+
+
+@attrs(auto_attribs=True)
+class NetworkServer(RegisterEventMixin):
+    """Accepts many inbound connections, and polls them all at once.
+
+    Every accepted client is wrapped in a :class:`earwax.NetworkConnection`,
+    whose events are passed on to this server, with the client as the first
+    argument::
+
+        server: NetworkServer = NetworkServer(framing=Framing.lines)
+
+        @server.event
+        def on_line(client: NetworkConnection, line: memoryview) -> None:
+            server.broadcast_message(bytes(line), exclude=client)
+
+        server.listen('0.0.0.0', 4000)
+
+    All the client sockets share one selector, so one system call per frame
+    is enough to find out which clients need attention, no matter how many
+    are connected.
+
+    :ivar ~earwax.NetworkServer.framing: The framing used by every client.
+
+    :ivar ~earwax.NetworkServer.buffer_size: The initial receive buffer size
+        of every client.
+
+    :ivar ~earwax.NetworkServer.delimiter: The line delimiter used by every
+        client.
+
+    :ivar ~earwax.NetworkServer.length_format: The message length format used
+        by every client.
+
+    :ivar ~earwax.NetworkServer.max_message_size: The biggest line or message
+        that any client can send.
+
+    :ivar ~earwax.NetworkServer.high_water_mark: The high water mark of every
+        client's send queue.
+
+    :ivar ~earwax.NetworkServer.coalesce: Whether or not writes to each
+        client should be coalesced.
+
+    :ivar ~earwax.NetworkServer.socket: The listening socket.
+
+    :ivar ~earwax.NetworkServer.selector: The selector shared by the
+        listening socket, and every client.
+
+    :ivar ~earwax.NetworkServer.clients: The clients which are connected.
+    """
+
+    framing: Framing = Framing.raw
+    buffer_size: int = 65536
+    delimiter: bytes = b"\r\n"
+    length_format: str = "!I"
+    max_message_size: int = 1 << 24
+    high_water_mark: int = 1 << 20
+    coalesce: bool = False
+
+    socket: Optional[_socket] = attrib(
+        default=Factory(lambda: None), init=False
+    )
+    selector: Optional[BaseSelector] = attrib(
+        default=Factory(lambda: None), init=False, repr=False
+    )
+    clients: List[NetworkConnection] = attrib(
+        default=Factory(list), init=False, repr=False
+    )
+    _length: Struct = attrib(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Register default events."""
+        self._length = Struct(self.length_format)
+        for func in (
+            self.on_connect,
+            self.on_disconnect,
+            self.on_data,
+            self.on_line,
+            self.on_message,
+            self.on_drain,
+            self.on_error,
+        ):
+            self.register_event(func)  # type: ignore[arg-type]
+
+    def on_connect(self, client: NetworkConnection) -> None:
+        """Handle a new client.
+
+        :param client: The client which has connected.
+        """
+        pass
+
+    def on_disconnect(self, client: NetworkConnection) -> None:
+        """Handle a client disconnecting.
+
+        When this event is dispatched, ``client`` has already been removed
+        from :attr:`~earwax.NetworkServer.clients`.
+
+        :param client: The client which has disconnected.
+        """
+        pass
+
+    def on_data(self, client: NetworkConnection, data: bytes) -> None:
+        """Handle data from a client.
+
+        :param client: The client which sent the data.
+
+        :param data: The data which was received.
+        """
+        pass
+
+    def on_line(self, client: NetworkConnection, line: memoryview) -> None:
+        """Handle a line from a client.
+
+        :param client: The client which sent the line.
+
+        :param line: The line which was received.
+
+            Like :meth:`earwax.NetworkConnection.on_line`, this view is
+            released after the event has been dispatched.
+        """
+        pass
+
+    def on_message(
+        self, client: NetworkConnection, message: memoryview
+    ) -> None:
+        """Handle a message from a client.
+
+        :param client: The client which sent the message.
+
+        :param message: The message which was received.
+
+            Like :meth:`earwax.NetworkConnection.on_message`, this view is
+            released after the event has been dispatched.
+        """
+        pass
+
+    def on_drain(self, client: NetworkConnection) -> None:
+        """Handle a client's send queue emptying.
+
+        :param client: The client whose send queue has emptied.
+        """
+        pass
+
+    def on_error(
+        self, client: Optional[NetworkConnection], e: Exception
+    ) -> None:
+        """Handle an error.
+
+        :param client: The client which caused the error, or ``None`` if the
+            error happened while accepting a connection.
+
+        :param e: The exception that was raised.
+        """
+        raise e
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Return the address this server is listening on.
+
+        This is useful if :meth:`~earwax.NetworkServer.listen` was called with
+        a port of ``0``.
+        """
+        if self.socket is None:
+            raise NotConnectedYet(self)
+        return self.socket.getsockname()
+
+    def listen(
+        self, hostname: str = "127.0.0.1", port: int = 0, backlog: int = 128
+    ) -> None:
+        """Start accepting connections.
+
+        :param hostname: The address to listen on.
+
+        :param port: The port to listen on.
+
+            If this value is ``0``, the operating system will pick a port.
+
+        :param backlog: The number of connections which can wait to be
+            accepted.
+        """
+        if self.socket is not None:
+            raise AlreadyConnected(self)
+        self.socket = _socket(AF_INET, SOCK_STREAM)
+        self.socket.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        self.socket.bind((hostname, port))
+        self.socket.listen(backlog)
+        self.socket.setblocking(False)
+        self.selector = DefaultSelector()
+        self.selector.register(self.socket, EVENT_READ)
+        schedule(self.poll)
+
+    def make_client(self) -> NetworkConnection:
+        """Return a connection to wrap an accepted socket with.
+
+        The connection will have the same settings as this server.
+        """
+        return NetworkConnection(
+            framing=self.framing,
+            buffer_size=self.buffer_size,
+            delimiter=self.delimiter,
+            length_format=self.length_format,
+            max_message_size=self.max_message_size,
+            high_water_mark=self.high_water_mark,
+            coalesce=self.coalesce,
+        )
+
+    def add_client(self, sock: _socket) -> NetworkConnection:
+        """Wrap an accepted socket, and start polling it.
+
+        Dispatches :meth:`~earwax.NetworkServer.on_connect`.
+
+        :param sock: The socket which was accepted.
+        """
+        assert self.selector is not None
+        client: NetworkConnection = self.make_client()
+
+        def on_disconnect() -> None:
+            self.clients.remove(client)
+            self.dispatch_event("on_disconnect", client)
+
+        def on_error(e: Exception) -> bool:
+            self.dispatch_event("on_error", client, e)
+            return EVENT_HANDLED
+
+        client.push_handlers(
+            on_disconnect=on_disconnect,
+            on_data=lambda data: self.dispatch_event("on_data", client, data),
+            on_line=lambda line: self.dispatch_event("on_line", client, line),
+            on_message=lambda message: self.dispatch_event(
+                "on_message", client, message
+            ),
+            on_drain=lambda: self.dispatch_event("on_drain", client),
+            on_error=on_error,
+        )
+        client.use_socket(sock, self.selector)
+        self.clients.append(client)
+        self.dispatch_event("on_connect", client)
+        return client
+
+    def accept(self) -> None:
+        """Accept every waiting connection.
+
+        This method is called by :meth:`~earwax.NetworkServer.poll` when the
+        listening socket is readable.
+        """
+        assert self.socket is not None
+        while True:
+            try:
+                sock: _socket = self.socket.accept()[0]
+            except BlockingIOError:
+                break
+            except error as e:
+                self.dispatch_event("on_error", None, e)
+                break
+            self.add_client(sock)
+
+    @profiled()
+    def poll(self, dt: float) -> None:
+        """Accept new connections, and handle every client which is ready.
+
+        This method is scheduled by :meth:`~earwax.NetworkServer.listen`, and
+        unscheduled by :meth:`~earwax.NetworkServer.close`.
+
+        :param dt: The time since this method last ran.
+        """
+        if self.selector is None:
+            raise NotConnectedYet(self)
+        key: SelectorKey
+        mask: int
+        for key, mask in self.selector.select(0):
+            if key.data is None:
+                self.accept()
+            elif key.data.socket is not None:
+                # An earlier client may have closed this one.
+                key.data.handle(mask)
+
+    def frame(self, data: bytes) -> bytes:
+        """Return ``data`` framed for sending to clients.
+
+        This works like :meth:`earwax.NetworkConnection.frame`.
+
+        :param data: The data to frame.
+        """
+        if self.framing is Framing.lines:
+            return b"".join((data, self.delimiter))
+        if self.framing is Framing.length_prefixed:
+            return self._length.pack(len(data)) + data
+        return data
+
+    def broadcast(
+        self, data: bytes, exclude: Optional[NetworkConnection] = None
+    ) -> int:
+        """Send the same data to every client.
+
+        The same bytes object is queued for every client, so broadcasting
+        does not copy ``data``.
+
+        Returns the number of clients whose send queues are below their high
+        water mark.
+
+        :param data: The data to send.
+
+        :param exclude: A client which should not be sent the data.
+        """
+        data = bytes(data)
+        count: int = 0
+        client: NetworkConnection
+        for client in list(self.clients):
+            if client is not exclude and client.socket is not None:
+                count += client.send(data)
+        return count
+
+    def broadcast_message(
+        self, data: bytes, exclude: Optional[NetworkConnection] = None
+    ) -> int:
+        """Frame some data once, then send it to every client.
+
+        Returns the value of :meth:`~earwax.NetworkServer.broadcast`.
+
+        :param data: The line or message to send.
+
+        :param exclude: A client which should not be sent the message.
+        """
+        return self.broadcast(self.frame(data), exclude=exclude)
+
+    def close(self) -> None:
+        """Disconnect every client, and stop listening.
+
+        :meth:`~earwax.NetworkServer.on_disconnect` is dispatched for every
+        client.
+        """
+        if self.socket is None:
+            raise NotConnectedYet(self)
+        unschedule(self.poll)
+        client: NetworkConnection
+        for client in list(self.clients):
+            client.close()
+        assert self.selector is not None
+        self.selector.close()
+        self.selector = None
+        self.socket.close()
+        self.socket = None
@@ -2,12 +2,14 @@
 
 from enum import Enum
 from math import dist, floor
-from random import randint
+from random import Random
 from typing import Any, Generic, Tuple, Type, TypeVar, Union, cast
 
 from attr import attrs
 from movement_2d import angle_between, coordinates_in_direction
 
+from .utils import get_random
+
 T = TypeVar("T", float, int)
 PointType = TypeVar("PointType", bound="Point")
 
@@ -56,10 +58,11 @@ class Point(Generic[T]):
 
         :param b: The second point.
         """
+        r: Random = get_random("point")
         return cls(
-            randint(min(a.x, b.x), max(a.x, b.x)),
-            randint(min(a.y, b.y), max(a.y, b.y)),
-            randint(min(a.z, b.z), max(a.z, b.z)),
+            r.randint(min(a.x, b.x), max(a.x, b.x)),
+            r.randint(min(a.y, b.y), max(a.y, b.y)),
+            r.randint(min(a.z, b.z), max(a.z, b.z)),
         )
 
     @property
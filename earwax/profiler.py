@@ -0,0 +1,310 @@
+"""Provides classes for profiling the callbacks run by earwax."""
+
+from functools import wraps
+from json import dumps
+from math import frexp
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
+
+from attr import Factory, attrib, attrs
+
+if TYPE_CHECKING:
+    from .game import Game
+
+CallbackType = TypeVar("CallbackType", bound=Callable[..., Any])
+NameFunction = Callable[[Any], str]
+
+# The profiler which is currently recording, if any.
+#
+# This variable is set by ``Profiler.start``, and cleared by
+# ``Profiler.stop``. When it is ``None``, profiled callbacks only pay for one
+# global lookup.
+active_profiler: Optional["Profiler"] = None
+
+# The number of histogram buckets. Bucket ``n`` holds durations of less than
+# ``2 ** n`` microseconds, so the last bucket holds anything longer than about
+# 17 minutes.
+bucket_count: int = 31
+
+
+@attrs(auto_attribs=True)
+class CallbackStats:
+    """Timings for a single callback, or for a single level class.
+
+    Durations are recorded in a histogram whose buckets double in size, so
+    percentiles are accurate to within a factor of 2, whatever the number of
+    calls.
+
+    :ivar ~earwax.CallbackStats.name: The name of the callback, or level
+        class.
+
+    :ivar ~earwax.CallbackStats.count: The number of calls which have been
+        recorded.
+
+    :ivar ~earwax.CallbackStats.total: The total number of seconds spent in
+        this callback.
+
+    :ivar ~earwax.CallbackStats.max: The longest a single call has taken.
+
+    :ivar ~earwax.CallbackStats.buckets: The histogram of call durations.
+    """
+
+    name: str
+    count: int = attrib(default=0, init=False)
+    total: float = attrib(default=0.0, init=False)
+    max: float = attrib(default=0.0, init=False)
+    buckets: List[int] = attrib(
+        default=Factory(lambda: [0] * bucket_count), init=False, repr=False
+    )
+
+    @property
+    def mean(self) -> float:
+        """Return the average duration of a call."""
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def add(self, duration: float) -> None:
+        """Record a call.
+
+        :param duration: The number of seconds the call took.
+        """
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        bucket: int = frexp(duration * 1000000)[1]
+        self.buckets[max(0, min(bucket, bucket_count - 1))] += 1
+
+    def percentile(self, p: float) -> float:
+        """Return the duration which ``p`` percent of calls took less than.
+
+        The returned value is the upper bound of the histogram bucket in which
+        the percentile falls, but is never more than
+        :attr:`~earwax.CallbackStats.max`.
+
+        :param p: The percentile to return, between 0 and 100.
+        """
+        if not self.count:
+            return 0.0
+        target: float = self.count * p / 100
+        seen: int = 0
+        bucket: int
+        count: int
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(self.max, (2 ** bucket) / 1000000)
+        return self.max
+
+    def dump(self) -> Dict[str, Any]:
+        """Return these stats as a dictionary."""
+        return dict(
+            count=self.count,
+            total=self.total,
+            mean=self.mean,
+            max=self.max,
+            p50=self.percentile(50),
+            p90=self.percentile(90),
+            p99=self.percentile(99),
+        )
+
+
+@attrs(auto_attribs=True)
+class Profiler:
+    """Time the callbacks which earwax runs from the pyglet loop.
+
+    While a profiler is started, every action, task, promise check, network
+    poll, synthizer event poll, and :meth:`earwax.EventMatcher.dispatch`
+    call is timed::
+
+        profiler: Profiler = Profiler(game, path=Path('profile.json'))
+        profiler.start()
+        game.run(window)
+        # The results have now been written to profile.json.
+
+    Results can be read from :attr:`~earwax.Profiler.callbacks`, and
+    :attr:`~earwax.Profiler.levels`, or written with
+    :meth:`~earwax.Profiler.save`.
+
+    :ivar ~earwax.Profiler.game: The game to profile.
+
+        The class of the game's current :attr:`~earwax.Game.level` is used to
+        fill :attr:`~earwax.Profiler.levels`.
+
+    :ivar ~earwax.Profiler.path: The path to save results to when
+        :meth:`~earwax.Profiler.stop` is called.
+
+        If this value is ``None``, results will not be saved automatically.
+
+    :ivar ~earwax.Profiler.callbacks: The stats for each callback.
+
+    :ivar ~earwax.Profiler.levels: The stats for each level class.
+
+        Only the outermost callback is counted here, so calls which are made
+        by other callbacks are not counted twice.
+
+    :ivar ~earwax.Profiler.depth: How many profiled callbacks are currently
+        running.
+    """
+
+    game: "Game"
+    path: Optional[Path] = None
+    callbacks: Dict[str, CallbackStats] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    levels: Dict[str, CallbackStats] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    depth: int = attrib(default=0, init=False, repr=False)
+
+    @property
+    def running(self) -> bool:
+        """Return whether or not this profiler is recording."""
+        return active_profiler is self
+
+    def start(self) -> None:
+        """Start recording.
+
+        This profiler is also stored as the game's
+        :attr:`~earwax.Game.profiler`.
+        """
+        global active_profiler
+        if active_profiler is not None:
+            raise RuntimeError("%r is already running." % active_profiler)
+        active_profiler = self
+        self.game.profiler = self
+
+    def stop(self) -> None:
+        """Stop recording.
+
+        If :attr:`~earwax.Profiler.path` is not ``None``, results will be
+        saved there.
+        """
+        global active_profiler
+        if active_profiler is self:
+            active_profiler = None
+        if self.path is not None:
+            self.save(self.path)
+
+    def clear(self) -> None:
+        """Forget all results."""
+        self.callbacks.clear()
+        self.levels.clear()
+
+    def get_stats(
+        self, stats: Dict[str, CallbackStats], name: str
+    ) -> CallbackStats:
+        """Return stats from ``stats``, creating them if necessary.
+
+        :param stats: Either :attr:`~earwax.Profiler.callbacks`, or
+            :attr:`~earwax.Profiler.levels`.
+
+        :param name: The name of the callback or level class.
+        """
+        if name not in stats:
+            stats[name] = CallbackStats(name)
+        return stats[name]
+
+    def call(
+        self, name: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Call ``func``, recording how long it takes.
+
+        :param name: The name to record the call under.
+
+        :param func: The function to call.
+
+        :param args: The positional arguments to pass to ``func``.
+
+        :param kwargs: The keyword arguments to pass to ``func``.
+        """
+        level_name: Optional[str] = None
+        if not self.depth:
+            level_name = type(self.game.level).__name__
+        self.depth += 1
+        started: float = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration: float = perf_counter() - started
+            self.depth -= 1
+            self.get_stats(self.callbacks, name).add(duration)
+            if level_name is not None:
+                self.get_stats(self.levels, level_name).add(duration)
+
+    def slowest(self, n: int = 10) -> List[CallbackStats]:
+        """Return the callbacks with the longest maximum durations.
+
+        :param n: The number of callbacks to return.
+        """
+        return sorted(
+            self.callbacks.values(), key=lambda s: s.max, reverse=True
+        )[:n]
+
+    def dump(self) -> Dict[str, Any]:
+        """Return all results as a dictionary."""
+        name: str
+        stats: CallbackStats
+        return dict(
+            callbacks={
+                name: stats.dump() for name, stats in self.callbacks.items()
+            },
+            levels={name: stats.dump() for name, stats in self.levels.items()},
+        )
+
+    def save(self, path: Path) -> None:
+        """Save results as JSON.
+
+        :param path: The path to write to.
+        """
+        path.write_text(dumps(self.dump(), indent=2))
+
+
+def callable_name(func: Callable[..., Any]) -> str:
+    """Return a readable name for ``func``.
+
+    :param func: The function to name.
+    """
+    return getattr(func, "__qualname__", repr(func))
+
+
+def profiled(
+    name: Optional[str] = None, get_name: Optional[NameFunction] = None
+) -> Callable[[CallbackType], CallbackType]:
+    """Decorate a method, so it can be timed by :class:`earwax.Profiler`.
+
+    The decorated function is still the same attribute on the class, so it
+    can be scheduled and unscheduled with pyglet's clock as normal.
+
+    :param name: The name to record calls under.
+
+        If this value is ``None``, the function's qualified name will be used.
+
+    :param get_name: A function which will be called with the instance the
+        method is bound to, and should return a name to record calls under.
+
+        This allows different instances to be told apart, like actions with
+        different titles.
+    """
+
+    def inner(func: CallbackType) -> CallbackType:
+        default_name: str = func.__qualname__ if name is None else name
+
+        @wraps(func)
+        def wrapper(self: Any, *args, **kwargs) -> Any:
+            profiler: Optional[Profiler] = active_profiler
+            if profiler is None:
+                return func(self, *args, **kwargs)
+            return profiler.call(
+                default_name if get_name is None else get_name(self),
+                func,
+                self,
+                *args,
+                **kwargs,
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return inner
@@ -1,6 +1,10 @@
 """Provides the various promise classes."""
 
 from .base import Promise, PromiseStates
+from .combined_promise import (ChainedPromise, CombinedPromise,
+                               GatheredPromise, RacedPromise)
+from .mapped_promise import MappedPromise
+from .sequencer import Sequencer
 from .staggered_promise import StaggeredPromise
 from .threaded_promise import ThreadedPromise
 
@@ -9,5 +13,11 @@ __all__ = [
     "ThreadedPromise",
     "StaggeredPromise",
     "Promise",
+    "CombinedPromise",
+    "GatheredPromise",
+    "RacedPromise",
+    "ChainedPromise",
+    "MappedPromise",
+    "Sequencer",
     "staggered_promise",
 ]
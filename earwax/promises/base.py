@@ -1,14 +1,19 @@
 """Provides the base Promise class, and the PromisesStates enumeration."""
 
+from concurrent.futures import Executor
 from enum import Enum
-from typing import TYPE_CHECKING, Generic, TypeVar, cast
+from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Generic, Iterable,
+                    Optional, TypeVar, cast)
 
-from attr import attrib, attrs
+from attr import Attribute, attrib, attrs
 
+from .. import tracing
 from ..mixins import RegisterEventMixin
 
 if TYPE_CHECKING:
     from ..types import EventType
+    from .combined_promise import ChainedPromise, GatheredPromise, RacedPromise
+    from .mapped_promise import MappedPromise
 
 T = TypeVar("T")
 
@@ -52,6 +57,30 @@ class PromiseStates(Enum):
     cancelled = 5
 
 
+def count_pending(
+    instance: "Promise", attribute: Attribute, value: PromiseStates
+) -> PromiseStates:
+    """Update :attr:`earwax.Promise.pending_count` when a state changes.
+
+    This function is used as the ``on_setattr`` hook of
+    :attr:`earwax.Promise.state`, so promises are counted once when they start
+    running, and once when they stop, no matter how their state is changed.
+
+    :param instance: The promise whose state is changing.
+
+    :param attribute: The attribute being set.
+
+    :param value: The new state.
+    """
+    running: PromiseStates = PromiseStates.running
+    old: PromiseStates = instance.state
+    if old is not running and value is running:
+        Promise.pending_count += 1
+    elif old is running and value is not running:
+        Promise.pending_count -= 1
+    return value
+
+
 @attrs(auto_attribs=True)
 class Promise(Generic[T], RegisterEventMixin):
     """The base class for promises.
@@ -61,9 +90,19 @@ class Promise(Generic[T], RegisterEventMixin):
 
     :ivar ~earwax.Promise.state: The state this promise is in (see
         above).
+
+    :ivar ~earwax.Promise.pending_count: The number of promises of any class
+        which have been run, but are not yet done, errored, or cancelled.
+
+        This value is updated whenever :attr:`~earwax.Promise.state` changes
+        to or from :attr:`earwax.PromiseStates.running`.
     """
 
-    state: PromiseStates = attrib(default=PromiseStates.ready, init=False)
+    pending_count: ClassVar[int] = 0
+
+    state: PromiseStates = attrib(
+        default=PromiseStates.ready, init=False, on_setattr=count_pending
+    )
 
     def __attrs_post_init__(self) -> None:
         """Register default events."""
@@ -109,13 +148,30 @@ class Promise(Generic[T], RegisterEventMixin):
         """
         pass
 
+    def trace(self, phase: str, **args) -> None:
+        """Record the start or end of this promise with the active tracer.
+
+        If there is no active :class:`earwax.Tracer`, nothing happens.
+
+        :param phase: Either ``'b'`` to start a span, or ``'e'`` to end it.
+
+        :param args: Extra information to store with the event.
+        """
+        tracer: Optional["tracing.Tracer"] = tracing.active_tracer
+        if tracer is not None:
+            tracer.add_event(
+                phase, type(self).__name__, "promise", id=id(self), args=args
+            )
+
     def run(self, *args, **kwargs) -> None:
         """Start this promise running."""
         self.state = PromiseStates.running
+        self.trace("b")
 
     def cancel(self) -> None:
         """Override to provide cancel functionality."""
         self.state = PromiseStates.cancelled
+        self.trace("e", state="cancelled")
         self.dispatch_event("on_cancel")
 
     def done(self, value: T) -> None:
@@ -128,6 +184,7 @@ class Promise(Generic[T], RegisterEventMixin):
         :param value: The value that was returned from whatever function this
             promise had.
         """
+        self.trace("e", state="done")
         self.dispatch_event("on_done", value)
         self.dispatch_event("on_finally")
         self.state = PromiseStates.done
@@ -140,6 +197,75 @@ class Promise(Generic[T], RegisterEventMixin):
 
         :param e: The exception that was raised.
         """
+        self.trace("e", state="error", error=repr(e))
         self.dispatch_event("on_error", e)
         self.dispatch_event("on_finally")
         self.state = PromiseStates.error
+
+    def then(self, func: Callable[[T], Any]) -> "ChainedPromise":
+        """Return a promise which calls ``func`` when this one is done.
+
+        The resulting :class:`~earwax.ChainedPromise` will be done with the
+        return value of ``func``. If ``func`` returns a promise, that promise
+        will be run, and its value used instead::
+
+            promise.then(lambda value: value * 2).then(print).run()
+
+        Running the returned promise will run this one, if it has not already
+        been started.
+
+        :param func: The function to call with the value of this promise.
+        """
+        from .combined_promise import ChainedPromise
+
+        return ChainedPromise(self, func)
+
+    @classmethod
+    def all(cls, *promises: "Promise") -> "GatheredPromise":
+        """Return a promise which is done when all ``promises`` are done.
+
+        The resulting :class:`~earwax.GatheredPromise` will be done with a
+        list of values, in the same order as ``promises``.
+
+        :param promises: The promises to wait on.
+        """
+        from .combined_promise import GatheredPromise
+
+        return GatheredPromise(list(promises))
+
+    @classmethod
+    def race(cls, *promises: "Promise") -> "RacedPromise":
+        """Return a promise which is done when the first of ``promises`` is.
+
+        The remaining promises will be cancelled.
+
+        :param promises: The promises to race.
+        """
+        from .combined_promise import RacedPromise
+
+        return RacedPromise(list(promises))
+
+    @classmethod
+    def map(
+        cls,
+        thread_pool: Executor,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int = 1,
+    ) -> "MappedPromise":
+        """Return a promise which calls ``func`` with every item in ``items``.
+
+        The resulting :class:`~earwax.MappedPromise` will be done with a list
+        of results, in the same order as ``items``.
+
+        :param thread_pool: The executor to submit work to.
+
+        :param func: The function to call with each item.
+
+        :param items: The items to process.
+
+        :param concurrency: The maximum number of items to process at once.
+        """
+        from .mapped_promise import MappedPromise
+
+        return MappedPromise(thread_pool, func, items, concurrency=concurrency)
@@ -0,0 +1,343 @@
+"""Provides promises which combine other promises."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from attr import Factory, attrib, attrs
+from pyglet.event import EVENT_HANDLED
+
+from .base import Promise, PromiseStates
+
+ThenFunctionType = Callable[[Any], Any]
+
+
+@attrs(auto_attribs=True)
+class CombinedPromise(Promise, ABC):
+    """The base class for promises which wait on other promises.
+
+    Instances of this class keep a list of
+    :attr:`~earwax.CombinedPromise.children`. When a combined promise is
+    cancelled, any children which are still running will be cancelled too.
+
+    Children may complete before this promise is run. Their results are kept,
+    and handled as soon as :meth:`~earwax.CombinedPromise.run` is called.
+    Children which have already completed when this promise is created cannot
+    be waited on, because their results are gone.
+
+    Subclasses must override :meth:`~earwax.CombinedPromise.child_done`.
+
+    :ivar ~earwax.CombinedPromise.children: The promises to wait on.
+
+    :ivar ~earwax.CombinedPromise.early_events: The events from children which
+        completed before this promise was run, as tuples of ``(index, name,
+        value)``.
+    """
+
+    children: List[Promise] = Factory(list)
+    early_events: List[Tuple[int, str, Any]] = attrib(
+        default=Factory(list), init=False, repr=False
+    )
+
+    def __attrs_post_init__(self) -> None:
+        """Attach event handlers to all children."""
+        super().__attrs_post_init__()
+        index: int
+        child: Promise
+        for index, child in enumerate(self.children):
+            self.attach(index, child)
+
+    def attach(self, index: int, child: Promise) -> None:
+        """Listen for events on the given child.
+
+        The handlers which are pushed are plain functions, so a child will keep
+        its parent alive until it completes.
+
+        If ``child`` has already completed, ``RuntimeError`` is raised.
+
+        :param index: The index of ``child`` in
+            :attr:`~earwax.CombinedPromise.children`.
+
+        :param child: The promise to attach handlers to.
+        """
+        if child.state not in (
+            PromiseStates.not_ready,
+            PromiseStates.ready,
+            PromiseStates.running,
+        ):
+            raise RuntimeError(
+                "Cannot wait on %r, because it has already completed." % child
+            )
+
+        def on_done(value: Any) -> None:
+            self.child_event(index, "done", value)
+
+        def on_error(e: Exception) -> bool:
+            self.child_event(index, "error", e)
+            return EVENT_HANDLED
+
+        def on_cancel() -> None:
+            self.child_event(index, "cancel", None)
+
+        child.push_handlers(
+            on_done=on_done, on_error=on_error, on_cancel=on_cancel
+        )
+
+    def child_event(self, index: int, name: str, value: Any) -> None:
+        """Handle an event from a child.
+
+        If this promise has not been run yet, the event is stored in
+        :attr:`~earwax.CombinedPromise.early_events`. If this promise has
+        already completed, the event is ignored.
+
+        :param index: The index of the child which dispatched the event.
+
+        :param name: The name of the event: ``'done'``, ``'error'``, or
+            ``'cancel'``.
+
+        :param value: The value the child completed with, or the exception it
+            raised.
+        """
+        if self.state in (PromiseStates.not_ready, PromiseStates.ready):
+            self.early_events.append((index, name, value))
+        elif self.state is PromiseStates.running:
+            if name == "done":
+                self.child_done(index, value)
+            elif name == "error":
+                # Stop the sibling ``on_cancel`` events from cancelling us.
+                self.state = PromiseStates.error
+                self.cancel_children(exclude=index)
+                self.error(value)
+            else:
+                self.cancel()
+
+    @abstractmethod
+    def child_done(self, index: int, value: Any) -> None:
+        """Handle a child completing.
+
+        :param index: The index of the child that completed.
+
+        :param value: The value the child completed with.
+        """
+        raise NotImplementedError
+
+    def cancel_children(self, exclude: Optional[int] = None) -> None:
+        """Cancel all children which are still running.
+
+        :param exclude: The index of a child which should not be cancelled.
+
+            This is the child which has just completed, and is still running
+            while its events are dispatched.
+        """
+        index: int
+        child: Promise
+        for index, child in enumerate(self.children):
+            if index != exclude and child.state is PromiseStates.running:
+                child.cancel()
+
+    def run(self, *args, **kwargs) -> None:
+        """Run all children which have not yet been started.
+
+        :param args: The positional arguments to pass to each child's ``run``
+            method.
+
+        :param kwargs: The keyword arguments to pass to each child's ``run``
+            method.
+        """
+        super().run()
+        events: List[Tuple[int, str, Any]] = self.early_events
+        self.early_events = []
+        index: int
+        name: str
+        value: Any
+        for index, name, value in events:
+            self.child_event(index, name, value)
+        child: Promise
+        for child in self.children:
+            if self.state is not PromiseStates.running:
+                break  # A child has already completed us.
+            if child.state is PromiseStates.ready:
+                child.run(*args, **kwargs)
+
+    def cancel(self) -> None:
+        """Cancel this promise, and all running children."""
+        super().cancel()
+        self.cancel_children()
+
+
+@attrs(auto_attribs=True)
+class GatheredPromise(CombinedPromise):
+    """A promise which completes when all of its children have completed.
+
+    The :meth:`~earwax.Promise.on_done` event will be dispatched with a list of
+    results, in the same order as :attr:`~earwax.CombinedPromise.children`::
+
+        promise: GatheredPromise = Promise.all(first, second)
+
+        @promise.event
+        def on_done(results: List[Any]) -> None:
+            first_result, second_result = results
+
+        promise.run()
+
+    If any child raises an error, the remaining children will be cancelled,
+    and the error will be passed to this promise's
+    :meth:`~earwax.Promise.on_error` event.
+
+    :ivar ~earwax.GatheredPromise.results: The results that have been received
+        so far.
+    """
+
+    results: Dict[int, Any] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+
+    def run(self, *args, **kwargs) -> None:
+        """Run all children.
+
+        If there are no children, this promise completes immediately.
+
+        :param args: The positional arguments to pass to each child.
+
+        :param kwargs: The keyword arguments to pass to each child.
+        """
+        self.results.clear()
+        super().run(*args, **kwargs)
+        if (
+            len(self.results) == len(self.children)
+            and self.state is PromiseStates.running
+        ):
+            # Every child completed before this promise was run.
+            self.done([self.results[i] for i in range(len(self.children))])
+
+    def child_done(self, index: int, value: Any) -> None:
+        """Store the result, and finish if all children have completed.
+
+        :param index: The index of the child that completed.
+
+        :param value: The value the child completed with.
+        """
+        self.results[index] = value
+        if len(self.results) == len(self.children):
+            self.done([self.results[i] for i in range(len(self.children))])
+
+
+@attrs(auto_attribs=True)
+class RacedPromise(CombinedPromise):
+    """A promise which completes when the first of its children completes.
+
+    The :meth:`~earwax.Promise.on_done` event will be dispatched with the value
+    of the winning child, and all other children will be cancelled.
+    """
+
+    def child_done(self, index: int, value: Any) -> None:
+        """Cancel the losers, and finish with ``value``.
+
+        :param index: The index of the child that completed first.
+
+        :param value: The value the child completed with.
+        """
+        # Stop the loser ``on_cancel`` events from cancelling us.
+        self.state = PromiseStates.done
+        self.cancel_children(exclude=index)
+        self.done(value)
+
+
+@attrs(auto_attribs=True)
+class ChainedPromise(Promise):
+    """A promise which runs a function when another promise completes.
+
+    Instances of this class are created with the :meth:`~earwax.Promise.then`
+    method::
+
+        promise: ChainedPromise = load_map.then(lambda m: build_level(m))
+        promise.run()
+
+    If :attr:`~earwax.ChainedPromise.func` returns another promise, that
+    promise will be run, and this promise will complete with its result.
+    Otherwise, this promise completes with the return value of ``func``.
+
+    Cancelling a chained promise cancels whichever of
+    :attr:`~earwax.ChainedPromise.parent` or
+    :attr:`~earwax.ChainedPromise.inner` is still running.
+
+    :ivar ~earwax.ChainedPromise.parent: The promise that must complete first.
+
+    :ivar ~earwax.ChainedPromise.func: The function to call with the value of
+        :attr:`~earwax.ChainedPromise.parent`.
+
+    :ivar ~earwax.ChainedPromise.inner: The promise returned by
+        :attr:`~earwax.ChainedPromise.func`, if any.
+    """
+
+    parent: Promise
+    func: ThenFunctionType
+    inner: Optional[Promise] = attrib(default=None, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Attach event handlers to the parent."""
+        super().__attrs_post_init__()
+        self.attach(self.parent, self.parent_done)
+
+    def attach(self, promise: Promise, func: Callable[[Any], None]) -> None:
+        """Forward events from ``promise`` to this one.
+
+        :param promise: Either :attr:`~earwax.ChainedPromise.parent`, or
+            :attr:`~earwax.ChainedPromise.inner`.
+
+        :param func: The function to call with the value ``promise`` completes
+            with.
+        """
+
+        def on_done(value: Any) -> None:
+            if self.state is PromiseStates.running:
+                func(value)
+
+        def on_error(e: Exception) -> bool:
+            if self.state is PromiseStates.running:
+                self.error(e)
+            return EVENT_HANDLED
+
+        def on_cancel() -> None:
+            if self.state is PromiseStates.running:
+                self.cancel()
+
+        promise.push_handlers(
+            on_done=on_done, on_error=on_error, on_cancel=on_cancel
+        )
+
+    def parent_done(self, value: Any) -> None:
+        """Call :attr:`~earwax.ChainedPromise.func` with ``value``.
+
+        :param value: The value that the parent completed with.
+        """
+        try:
+            result: Any = self.func(value)
+        except Exception as e:
+            return self.error(e)
+        if not isinstance(result, Promise):
+            return self.done(result)
+        self.inner = result
+        self.attach(result, self.done)
+        if result.state is PromiseStates.ready:
+            result.run()
+
+    def run(self, *args, **kwargs) -> None:
+        """Run the parent promise if it has not already been started.
+
+        :param args: The positional arguments to pass to the parent's ``run``
+            method.
+
+        :param kwargs: The keyword arguments to pass to the parent's ``run``
+            method.
+        """
+        super().run()
+        if self.parent.state is PromiseStates.ready:
+            self.parent.run(*args, **kwargs)
+
+    def cancel(self) -> None:
+        """Cancel this promise, and whichever promise it is waiting on."""
+        super().cancel()
+        promise: Optional[Promise]
+        for promise in (self.parent, self.inner):
+            if promise is not None and promise.state is PromiseStates.running:
+                promise.cancel()
@@ -0,0 +1,169 @@
+"""Provides the MappedPromise class."""
+
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from attr import Factory, attrib, attrs
+
+try:
+    from pyglet.clock import schedule, unschedule
+except ModuleNotFoundError:
+    pass
+
+from ..profiler import profiled
+from .base import Promise, PromiseStates
+
+MappedPromiseFunctionType = Callable[[Any], Any]
+
+
+@attrs(auto_attribs=True)
+class MappedPromise(Promise):
+    """A promise that calls a function with every item of an iterable.
+
+    Work is submitted to :attr:`~earwax.MappedPromise.thread_pool`, with no
+    more than :attr:`~earwax.MappedPromise.concurrency` items in flight at
+    once. Unlike running a :class:`~earwax.ThreadedPromise` per item, all the
+    outstanding futures are checked by a single scheduled function::
+
+        promise: MappedPromise = Promise.map(
+            game.thread_pool, load_buffer, paths, concurrency=4
+        )
+
+        @promise.event
+        def on_done(buffers: List[Buffer]) -> None:
+            game.output(f'Loaded {len(buffers)} buffers.')
+
+        promise.run()
+
+    The :meth:`~earwax.Promise.on_done` event will be dispatched with a list of
+    results, in the same order as the items they were produced from.
+
+    If any call raises an error, all outstanding work is cancelled, and the
+    error is passed to the :meth:`~earwax.Promise.on_error` event.
+
+    :ivar ~earwax.MappedPromise.thread_pool: The executor to submit work to.
+
+    :ivar ~earwax.MappedPromise.func: The function to call with each item.
+
+    :ivar ~earwax.MappedPromise.items: The items to pass to
+        :attr:`~earwax.MappedPromise.func`.
+
+    :ivar ~earwax.MappedPromise.concurrency: The maximum number of items which
+        can be processed at once.
+
+    :ivar ~earwax.MappedPromise.futures: The futures which are still running,
+        keyed by the index of the item they were submitted with.
+
+    :ivar ~earwax.MappedPromise.results: The results received so far.
+    """
+
+    thread_pool: Executor
+    func: MappedPromiseFunctionType
+    items: Iterable[Any]
+    concurrency: int = 1
+
+    futures: Dict[int, Future] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    results: Dict[int, Any] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    _iterator: Optional[Iterator[Any]] = attrib(
+        default=None, init=False, repr=False
+    )
+    _submitted: int = attrib(default=0, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Check the concurrency."""
+        super().__attrs_post_init__()
+        if self.concurrency < 1:
+            raise ValueError(
+                "Concurrency must be at least 1, not %r." % self.concurrency
+            )
+
+    def submit_next(self) -> bool:
+        """Submit the next item to the thread pool.
+
+        Returns ``False`` if there are no more items to submit.
+        """
+        assert self._iterator is not None
+        try:
+            item: Any = next(self._iterator)
+        except StopIteration:
+            self._iterator = None
+            return False
+        self.futures[self._submitted] = self.thread_pool.submit(
+            self.func, item
+        )
+        self._submitted += 1
+        return True
+
+    def fill(self) -> None:
+        """Submit items until :attr:`~earwax.MappedPromise.concurrency` is hit.
+
+        If there is nothing left to submit, and nothing running, this promise
+        will be completed.
+        """
+        while (
+            self._iterator is not None
+            and len(self.futures) < self.concurrency
+            and self.submit_next()
+        ):
+            pass
+        if self._iterator is None and not self.futures:
+            unschedule(self.check)
+            self.done([self.results[i] for i in range(self._submitted)])
+
+    @profiled()
+    def check(self, dt: float) -> None:
+        """Collect finished futures, and submit more work.
+
+        :param dt: The time since the last run.
+
+            This argument is required by ``pyglet.clock.schedule``.
+        """
+        index: int
+        future: Future
+        for index, future in list(self.futures.items()):
+            if not future.done():
+                continue
+            del self.futures[index]
+            try:
+                self.results[index] = future.result()
+            except Exception as e:
+                self.stop()
+                return self.error(e)
+        self.fill()
+
+    def run(self, *args, **kwargs) -> None:
+        """Start submitting work.
+
+        The arguments are ignored, and are only present for compatibility with
+        :class:`~earwax.CombinedPromise`.
+        """
+        super().run()
+        self.futures.clear()
+        self.results.clear()
+        self._submitted = 0
+        self._iterator = iter(self.items)
+        schedule(self.check)
+        self.fill()
+
+    def stop(self) -> None:
+        """Stop checking, and cancel any outstanding work."""
+        unschedule(self.check)
+        self._iterator = None
+        future: Future
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+
+    def cancel(self) -> None:
+        """Cancel all outstanding work, and submit no more."""
+        self.stop()
+        super().cancel()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of items which are currently being processed."""
+        return len(self.futures) if self.state is PromiseStates.running else 0
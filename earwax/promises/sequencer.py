@@ -0,0 +1,235 @@
+"""Provides the Sequencer class."""
+
+from heapq import heappop, heappush
+from itertools import count
+from typing import (TYPE_CHECKING, Callable, Dict, Iterator, List, Optional,
+                    Set, Tuple)
+
+from attr import Factory, attrib, attrs
+
+try:
+    from pyglet.clock import get_default, schedule, unschedule
+except ModuleNotFoundError:
+    pass
+
+from ..profiler import profiled
+
+if TYPE_CHECKING:
+    from .staggered_promise import (StaggeredPromise,
+                                    StaggeredPromiseFunctionType)
+
+SequencerEntry = Tuple[float, int, "StaggeredPromise", float]
+
+
+def default_time() -> float:
+    """Return the time according to pyglet's default clock."""
+    return get_default().time()
+
+
+@attrs(auto_attribs=True)
+class Sequencer:
+    """Resume many suspended :class:`~earwax.StaggeredPromise` instances.
+
+    Without a sequencer, every :class:`~earwax.StaggeredPromise` schedules
+    itself with pyglet every time it suspends. With thousands of running
+    promises, this means thousands of pyglet timers.
+
+    Promises which have been given a sequencer instead place themselves in a
+    heap ordered by the time they should wake up. A single scheduled function
+    then resumes all the promises that are due::
+
+        sequencer: Sequencer = Sequencer()
+
+        @sequencer.promise(group='guards')
+        def patrol() -> StaggeredPromiseGeneratorType:
+            while True:
+                guard.move()
+                yield 2.0
+
+        patrol.run()
+
+    Promises can be put into groups, which can be paused, resumed, and
+    cancelled together::
+
+        sequencer.pause_group('guards')
+
+    A :class:`~earwax.Game` instance has a sequencer as its
+    :attr:`~earwax.Game.sequencer` attribute.
+
+    :ivar ~earwax.Sequencer.time_function: The function used to get the current
+        time.
+
+        By default, the time of pyglet's default clock is used.
+
+    :ivar ~earwax.Sequencer.heap: The heap of suspended promises.
+
+        Entries which no longer match
+        :attr:`~earwax.Sequencer.wake_times` are skipped when they are popped.
+
+    :ivar ~earwax.Sequencer.wake_times: The time that each suspended promise
+        should be resumed, keyed by the ``id`` of the promise.
+
+        Promises are not hashable, so their ids are used throughout.
+
+    :ivar ~earwax.Sequencer.groups: The promises in each group, keyed by their
+        ids.
+
+    :ivar ~earwax.Sequencer.paused_groups: The names of the groups which are
+        paused.
+
+    :ivar ~earwax.Sequencer.paused: The time each paused promise had left to
+        wait when it was paused, keyed by the ``id`` of the promise.
+
+    :ivar ~earwax.Sequencer.running: Whether or not the
+        :meth:`~earwax.Sequencer.tick` method is scheduled.
+    """
+
+    time_function: Callable[[], float] = default_time
+
+    heap: List[SequencerEntry] = attrib(
+        default=Factory(list), init=False, repr=False
+    )
+    wake_times: Dict[int, float] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    groups: Dict[str, Dict[int, "StaggeredPromise"]] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    paused_groups: Set[str] = attrib(default=Factory(set), init=False)
+    paused: Dict[int, float] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    running: bool = attrib(default=False, init=False)
+    _counter: Iterator[int] = attrib(default=Factory(count), init=False)
+
+    def __len__(self) -> int:
+        """Return the number of suspended promises."""
+        return len(self.wake_times) + len(self.paused)
+
+    def promise(
+        self, group: Optional[str] = None
+    ) -> Callable[["StaggeredPromiseFunctionType"], "StaggeredPromise"]:
+        """Make a promise which uses this sequencer.
+
+        :param group: The name of the group the new promise will belong to.
+        """
+        from .staggered_promise import StaggeredPromise
+
+        def inner(func: "StaggeredPromiseFunctionType") -> StaggeredPromise:
+            return StaggeredPromise(func, sequencer=self, group=group)
+
+        return inner
+
+    def add(self, promise: "StaggeredPromise") -> None:
+        """Add a promise to its group.
+
+        This method is called by :meth:`earwax.StaggeredPromise.run`.
+
+        :param promise: The promise to add.
+        """
+        if promise.group is not None:
+            self.groups.setdefault(promise.group, {})[id(promise)] = promise
+
+    def suspend(self, promise: "StaggeredPromise", delay: float) -> None:
+        """Resume ``promise`` after ``delay`` seconds.
+
+        If the group of ``promise`` is paused, the promise will not be resumed
+        until that group is resumed.
+
+        :param promise: The promise to suspend.
+
+        :param delay: The number of seconds to wait.
+        """
+        if promise.group in self.paused_groups:
+            self.paused[id(promise)] = delay
+            return
+        wake_time: float = self.time_function() + delay
+        self.wake_times[id(promise)] = wake_time
+        heappush(self.heap, (wake_time, next(self._counter), promise, delay))
+        if not self.running:
+            schedule(self.tick)
+            self.running = True
+
+    def remove(self, promise: "StaggeredPromise") -> None:
+        """Forget everything about ``promise``.
+
+        This method is called when a promise finishes, or is cancelled.
+
+        :param promise: The promise to remove.
+        """
+        self.wake_times.pop(id(promise), None)
+        self.paused.pop(id(promise), None)
+        if promise.group is not None and promise.group in self.groups:
+            group: Dict[int, "StaggeredPromise"] = self.groups[promise.group]
+            group.pop(id(promise), None)
+            if not group:
+                del self.groups[promise.group]
+
+    @profiled()
+    def tick(self, dt: float) -> None:
+        """Resume every promise that is due.
+
+        Promises are passed the number of seconds since they suspended.
+
+        Due entries are popped before any promise is resumed, so a promise
+        which suspends again during this tick, even with a delay of ``0.0``,
+        will not be resumed until the next one.
+
+        :param dt: The time since the last run.
+
+            This argument is required by ``pyglet.clock.schedule``.
+        """
+        now: float = self.time_function()
+        due: List[SequencerEntry] = []
+        while self.heap and self.heap[0][0] <= now:
+            due.append(heappop(self.heap))
+        wake_time: float
+        promise: "StaggeredPromise"
+        delay: float
+        for wake_time, _, promise, delay in due:
+            if self.wake_times.get(id(promise)) != wake_time:
+                continue  # Stale entry.
+            del self.wake_times[id(promise)]
+            promise.do_next(delay + now - wake_time)
+        if not self.heap:
+            unschedule(self.tick)
+            self.running = False
+
+    def pause_group(self, name: str) -> None:
+        """Pause every promise in the given group.
+
+        Promises which are added to the group while it is paused will be
+        paused as soon as they suspend.
+
+        :param name: The name of the group to pause.
+        """
+        self.paused_groups.add(name)
+        now: float = self.time_function()
+        promise: "StaggeredPromise"
+        for promise in self.groups.get(name, {}).values():
+            if id(promise) in self.wake_times:
+                self.paused[id(promise)] = max(
+                    0.0, self.wake_times.pop(id(promise)) - now
+                )
+
+    def resume_group(self, name: str) -> None:
+        """Resume every promise in a group paused with :meth:`pause_group`.
+
+        Each promise will wait for the time it had left when it was paused.
+
+        :param name: The name of the group to resume.
+        """
+        self.paused_groups.discard(name)
+        promise: "StaggeredPromise"
+        for promise in self.groups.get(name, {}).values():
+            if id(promise) in self.paused:
+                self.suspend(promise, self.paused.pop(id(promise)))
+
+    def cancel_group(self, name: str) -> None:
+        """Cancel every promise in the given group.
+
+        :param name: The name of the group to cancel.
+        """
+        promise: "StaggeredPromise"
+        for promise in list(self.groups.get(name, {}).values()):
+            promise.cancel()
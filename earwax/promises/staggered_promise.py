@@ -1,6 +1,6 @@
 """Provides the StaggeredPromise class."""
 
-from typing import Callable, Generator, Optional
+from typing import TYPE_CHECKING, Callable, Generator, Optional
 
 from attr import attrib, attrs
 
@@ -9,8 +9,12 @@ try:
 except ModuleNotFoundError:
     pass
 
+from ..profiler import profiled
 from .base import Promise, T
 
+if TYPE_CHECKING:
+    from .sequencer import Sequencer
+
 StaggeredPromiseGeneratorType = Generator[float, None, T]
 StaggeredPromiseFunctionType = Callable[..., StaggeredPromiseGeneratorType]
 
@@ -40,13 +44,33 @@ class StaggeredPromise(Promise):
         def on_next(delay: float) -> None:
             print(f'I waited {delay}.')
 
+    If you plan to run a lot of these promises at once, give them a
+    :class:`~earwax.Sequencer`, so they don't each need their own pyglet
+    timer::
+
+        @game.sequencer.promise(group='npcs')
+        def wander() -> StaggeredPromiseGeneratorType:
+            ...
+
     :ivar ~earwax.StaggeredPromise.func: The function to run.
 
+    :ivar ~earwax.StaggeredPromise.sequencer: The sequencer which will resume
+        this promise.
+
+        If this value is ``None``, ``pyglet.clock.schedule_once`` will be used
+        instead.
+
+    :ivar ~earwax.StaggeredPromise.group: The name of the
+        :attr:`sequencer <earwax.StaggeredPromise.sequencer>` group this
+        promise belongs to.
+
     :ivar ~earwax.StaggeredPromise.generator: The generator returned by
         :attr:`self.func <earwax.StaggeredPromise.func>`.
     """
 
     func: StaggeredPromiseFunctionType
+    sequencer: Optional["Sequencer"] = attrib(default=None, repr=False)
+    group: Optional[str] = None
     generator: Optional[StaggeredPromiseGeneratorType] = attrib(
         default=None, init=False, repr=False
     )
@@ -80,8 +104,11 @@ class StaggeredPromise(Promise):
         """
         super().run()
         self.generator = self.func(*args, **kwargs)
+        if self.sequencer is not None:
+            self.sequencer.add(self)
         self.do_next(None)
 
+    @profiled()
     def do_next(self, dt: Optional[float]) -> None:
         """Advance execution.
 
@@ -95,7 +122,7 @@ class StaggeredPromise(Promise):
         to the :meth:`self.on_error <earwax.Promise.on_error>` event.
 
         :param dt: The time since the last run, as passed by
-            ``pyglet.clock.schedule_once``.
+            ``pyglet.clock.schedule_once``, or :meth:`earwax.Sequencer.tick`.
 
             If this is the first time this method is called, ``dt`` will be
             ``None``.
@@ -105,12 +132,19 @@ class StaggeredPromise(Promise):
         try:
             delay: float = next(self.generator)
             self.dispatch_event("on_next", delay)
-            schedule_once(self.do_next, delay)
+            if self.sequencer is None:
+                schedule_once(self.do_next, delay)
+            else:
+                self.sequencer.suspend(self, delay)
         except StopIteration as e:
+            if self.sequencer is not None:
+                self.sequencer.remove(self)
             if not e.args:
                 e.args = (None,)
             self.done(*e.args)
         except Exception as e:
+            if self.sequencer is not None:
+                self.sequencer.remove(self)
             self.error(e)
 
     def cancel(self) -> None:
@@ -122,7 +156,10 @@ class StaggeredPromise(Promise):
         super().cancel()
         if self.generator is None:
             raise RuntimeError("This promise has no generator.")
-        unschedule(self.do_next)
+        if self.sequencer is None:
+            unschedule(self.do_next)
+        else:
+            self.sequencer.remove(self)
         self.generator.close()
 
     @classmethod
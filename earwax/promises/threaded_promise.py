@@ -10,6 +10,8 @@ try:
 except ModuleNotFoundError:
     pass
 
+from .. import tracing
+from ..profiler import profiled
 from .base import Promise, PromiseStates, T
 
 ThreadedPromiseFunctionType = Callable[..., T]
@@ -96,6 +98,7 @@ class ThreadedPromise(Promise):
         self.state = PromiseStates.ready
         return func
 
+    @profiled()
     def check(self, dt: float) -> None:
         """Check state and react accordingly.
 
@@ -141,7 +144,11 @@ class ThreadedPromise(Promise):
         """
         if self.func is None:
             raise RuntimeError("%r has no function registered." % self)
-        self.future = self.thread_pool.submit(self.func, *args, **kwargs)
+        func: Callable[..., T] = self.func
+        tracer: Optional[tracing.Tracer] = tracing.active_tracer
+        if tracer is not None:
+            func = tracer.wrap(func, type(self).__name__, "promise")
+        self.future = self.thread_pool.submit(func, *args, **kwargs)
         super().run(*args, **kwargs)
         schedule(self.check)
 
@@ -0,0 +1,276 @@
+"""Provides classes for recording and replaying input."""
+
+from json import dumps, loads
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+from attr import Factory, attrib, attrs
+from pyglet.clock import schedule_once, unschedule
+
+from .promises.sequencer import default_time
+from .utils import seed_random
+
+if TYPE_CHECKING:
+    from .game import Game
+
+recorded_event_types: List[str] = [
+    "on_key_press",
+    "on_key_release",
+    "on_mouse_press",
+    "on_mouse_release",
+    "on_mouse_motion",
+    "on_mouse_drag",
+    "on_mouse_scroll",
+    "on_joybutton_press",
+    "on_joybutton_release",
+    "on_joyhat_motion",
+    "on_text",
+    "on_text_motion",
+    "on_text_motion_select",
+]
+
+
+def make_joystick(name: str) -> SimpleNamespace:
+    """Return an object which looks enough like a joystick to replay events.
+
+    :param name: The name of the joystick's device.
+    """
+    return SimpleNamespace(device=SimpleNamespace(name=name))
+
+
+@attrs(auto_attribs=True)
+class RecordedEvent:
+    """An event which has been recorded by :class:`earwax.InputRecorder`.
+
+    :ivar ~earwax.RecordedEvent.time: The number of seconds after recording
+        started that this event was dispatched.
+
+    :ivar ~earwax.RecordedEvent.name: The name of the event.
+
+    :ivar ~earwax.RecordedEvent.args: The arguments the event was dispatched
+        with.
+
+        For joystick events, the joystick is replaced by the name of its
+        device.
+    """
+
+    time: float
+    name: str
+    args: List[Any]
+
+    def get_args(self) -> List[Any]:
+        """Return the arguments this event should be replayed with."""
+        if self.name.startswith("on_joy"):
+            return [make_joystick(self.args[0]), *self.args[1:]]
+        return list(self.args)
+
+
+@attrs(auto_attribs=True)
+class InputRecording:
+    """A stream of recorded input, and the random seeds that were in use.
+
+    Recordings are made by :class:`earwax.InputRecorder`, and can be replayed
+    in real time with :meth:`~earwax.InputRecording.replay`, or as fast as
+    possible with :meth:`earwax.HeadlessRunner.replay`.
+
+    :ivar ~earwax.InputRecording.seeds: The seeds that were passed to
+        :meth:`earwax.utils.seed_random` when recording started.
+
+    :ivar ~earwax.InputRecording.events: The recorded events, in the order
+        they were dispatched.
+    """
+
+    seeds: Dict[str, int] = Factory(dict)
+    events: List[RecordedEvent] = Factory(list)
+
+    @property
+    def duration(self) -> float:
+        """Return the time of the last event."""
+        if not self.events:
+            return 0.0
+        return self.events[-1].time
+
+    def dump(self) -> Dict[str, Any]:
+        """Return this recording as a dictionary."""
+        e: RecordedEvent
+        return dict(
+            seeds=self.seeds,
+            events=[[e.time, e.name, e.args] for e in self.events],
+        )
+
+    @classmethod
+    def load(cls, data: Dict[str, Any]) -> "InputRecording":
+        """Load a recording from a dictionary.
+
+        :param data: A dictionary as returned by
+            :meth:`~earwax.InputRecording.dump`.
+        """
+        return cls(
+            seeds=data["seeds"],
+            events=[RecordedEvent(*entry) for entry in data["events"]],
+        )
+
+    def save(self, path: Path) -> None:
+        """Save this recording as JSON.
+
+        :param path: The path to save to.
+        """
+        path.write_text(dumps(self.dump()))
+
+    @classmethod
+    def from_path(cls, path: Path) -> "InputRecording":
+        """Load a recording from a JSON file.
+
+        :param path: The path to load from.
+        """
+        return cls.load(loads(path.read_text()))
+
+    def replay(self, game: "Game") -> "InputPlayer":
+        """Replay this recording in real time.
+
+        The random number generators are seeded straight away, and every
+        event is scheduled with pyglet's clock.
+
+        Returns the :class:`earwax.InputPlayer` instance that is doing the
+        work.
+
+        :param game: The game to send the events to.
+        """
+        player: InputPlayer = InputPlayer(game, self)
+        player.start()
+        return player
+
+
+@attrs(auto_attribs=True)
+class InputRecorder:
+    """Record the input that a game receives.
+
+    When started, the random number generators returned by
+    :meth:`earwax.utils.get_random` are reseeded, and the seeds are stored
+    with the recording. Every event in ``recorded_event_types`` which passes
+    through the game's :attr:`~earwax.Game.event_matchers` is then stored
+    with the time it happened::
+
+        recorder: InputRecorder = InputRecorder(game)
+        recorder.start()
+        ...
+        recorder.stop().save(Path('session.json'))
+
+    :ivar ~earwax.InputRecorder.game: The game to record.
+
+    :ivar ~earwax.InputRecorder.time_function: The function which returns the
+        current time.
+
+        By default, the time is taken from pyglet's default clock, so
+        recordings made under :class:`earwax.HeadlessRunner` use virtual time.
+
+    :ivar ~earwax.InputRecorder.recording: The recording that is being made.
+
+    :ivar ~earwax.InputRecorder.started: The time recording started.
+    """
+
+    game: "Game"
+    time_function: Callable[[], float] = attrib(
+        default=default_time, repr=False
+    )
+    recording: InputRecording = attrib(
+        default=Factory(InputRecording), init=False, repr=False
+    )
+    started: Optional[float] = attrib(default=None, init=False)
+
+    def start(self, seeds: Optional[Dict[str, int]] = None) -> None:
+        """Start recording.
+
+        :param seeds: The seeds to pass to :meth:`earwax.utils.seed_random`.
+        """
+        if self.game.input_recorder is not None:
+            raise RuntimeError(
+                "%r is already being recorded by %r."
+                % (self.game, self.game.input_recorder)
+            )
+        self.recording = InputRecording(seeds=seed_random(seeds))
+        self.started = self.time_function()
+        self.game.input_recorder = self
+
+    def stop(self) -> InputRecording:
+        """Stop recording, and return the finished recording."""
+        if self.game.input_recorder is self:
+            self.game.input_recorder = None
+        self.started = None
+        return self.recording
+
+    def record(self, name: str, args: Sequence[Any]) -> None:
+        """Record an event.
+
+        This method is called by :meth:`earwax.EventMatcher.dispatch`.
+
+        :param name: The name of the event.
+
+        :param args: The arguments the event was dispatched with.
+        """
+        if self.started is None or name not in recorded_event_types:
+            return None
+        values: List[Any] = list(args)
+        if name.startswith("on_joy"):
+            values[0] = values[0].device.name
+        self.recording.events.append(
+            RecordedEvent(self.time_function() - self.started, name, values)
+        )
+
+
+@attrs(auto_attribs=True)
+class InputPlayer:
+    """Replay an :class:`earwax.InputRecording` in real time.
+
+    :ivar ~earwax.InputPlayer.game: The game to send events to.
+
+    :ivar ~earwax.InputPlayer.recording: The recording to replay.
+
+    :ivar ~earwax.InputPlayer.position: The index of the next event to
+        dispatch.
+    """
+
+    game: "Game"
+    recording: InputRecording
+    position: int = attrib(default=0, init=False)
+
+    @property
+    def finished(self) -> bool:
+        """Return whether or not every event has been dispatched."""
+        return self.position >= len(self.recording.events)
+
+    def start(self) -> None:
+        """Seed the random number generators, and start replaying."""
+        seed_random(self.recording.seeds)
+        self.position = 0
+        self.schedule_next(0.0)
+
+    def schedule_next(self, now: float) -> None:
+        """Schedule the next event.
+
+        :param now: The recording time of the event that was just dispatched.
+        """
+        if not self.finished:
+            event: RecordedEvent = self.recording.events[self.position]
+            schedule_once(self.dispatch_next, max(0.0, event.time - now))
+
+    def dispatch_next(self, dt: float) -> None:
+        """Dispatch every event which is due.
+
+        :param dt: The time since this method was scheduled.
+        """
+        event: RecordedEvent = self.recording.events[self.position]
+        now: float = event.time
+        while not self.finished:
+            event = self.recording.events[self.position]
+            if event.time > now:
+                break
+            self.position += 1
+            self.game.event_matchers[event.name].dispatch(*event.get_args())
+        self.schedule_next(now)
+
+    def stop(self) -> None:
+        """Stop replaying."""
+        unschedule(self.dispatch_next)
+        self.position = len(self.recording.events)
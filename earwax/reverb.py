@@ -1,6 +1,10 @@
 """Reverb module."""
 
-from attr import attrs
+from typing import Dict, List, Optional, Tuple
+
+from attr import Factory, astuple, attrib, attrs
+
+from .leaks import native_alive, share_resource, track_resource
 
 try:
     from synthizer import Context, GlobalFdnReverb
@@ -62,4 +66,162 @@ class Reverb:
         )  # noqa: E501
         r.mean_free_path = self.mean_free_path  # noqa: E501
         r.t60 = self.t60  # noqa: E501
+        track_resource(r, "reverb", lambda: native_alive(r))
         return r
+
+
+# The key reverbs are shared by.
+ReverbKey = Tuple[float, ...]
+
+
+@attrs(auto_attribs=True)
+class ReverbPool:
+    """Share synthizer reverbs between presets with the same settings.
+
+    Creating a ``GlobalFdnReverb`` allocates a lot of native state, so rather
+    than making a new reverb every time one is needed, acquire one from a
+    pool, and release it when you are done::
+
+        reverb: GlobalFdnReverb = game.reverb_pool.acquire(preset)
+        sound.connect_reverb(reverb)
+        # ...
+        game.reverb_pool.release(reverb)
+
+    Reverbs are counted, so everything that acquires a reverb with the same
+    settings gets the same reverb. When nothing uses a reverb, it is kept, in
+    case it is needed again. Only the most recently released
+    :attr:`~earwax.ReverbPool.max_idle` reverbs are kept. Older ones are
+    destroyed.
+
+    Never destroy a reverb you got from a pool, or change its settings. If
+    you need to change its settings, call :meth:`~earwax.ReverbPool.detach`
+    first.
+
+    Pooled reverbs are shared, so a running :class:`earwax.LeakDetector` does
+    not blame them on the level which acquired them. The pool of a
+    :class:`earwax.Game` is emptied with :meth:`~earwax.ReverbPool.destroy_all`
+    when the game stops running.
+
+    :ivar ~earwax.ReverbPool.context: The synthizer context to make reverbs
+        with.
+
+    :ivar ~earwax.ReverbPool.max_idle: The most reverbs to keep when they are
+        not being used.
+
+    :ivar ~earwax.ReverbPool.reverbs: Every reverb in this pool, keyed by its
+        settings.
+
+    :ivar ~earwax.ReverbPool.references: The number of times every reverb has
+        been acquired and not released, keyed by its settings.
+
+    :ivar ~earwax.ReverbPool.idle: The settings of the reverbs which are not
+        being used, least recently released first.
+    """
+
+    context: Context = attrib(repr=False)
+    max_idle: int = 4
+
+    reverbs: Dict[ReverbKey, GlobalFdnReverb] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    references: Dict[ReverbKey, int] = attrib(
+        default=Factory(dict), init=False
+    )
+    idle: List[ReverbKey] = attrib(default=Factory(list), init=False)
+
+    def get_key(self, settings: Reverb) -> ReverbKey:
+        """Return the key reverbs with the given settings are shared by.
+
+        :param settings: The reverb preset.
+        """
+        return astuple(settings, recurse=False)
+
+    def find_key(self, reverb: GlobalFdnReverb) -> Optional[ReverbKey]:
+        """Return the key of a reverb, or ``None`` if it is not in this pool.
+
+        :param reverb: The reverb to look for.
+        """
+        key: ReverbKey
+        value: GlobalFdnReverb
+        for key, value in self.reverbs.items():
+            if value is reverb:
+                return key
+        return None
+
+    def acquire(self, settings: Reverb) -> GlobalFdnReverb:
+        """Return a reverb with the given settings.
+
+        If there is already a reverb with the same settings, it is returned.
+        Otherwise, a new one is made with :meth:`~earwax.Reverb.make_reverb`.
+
+        Every call to this method should be matched by a call to
+        :meth:`~earwax.ReverbPool.release`.
+
+        :param settings: The reverb preset to use.
+        """
+        key: ReverbKey = self.get_key(settings)
+        if key in self.reverbs:
+            if key in self.idle:
+                self.idle.remove(key)
+        else:
+            reverb: GlobalFdnReverb = settings.make_reverb(self.context)
+            # The reverb belongs to this pool, not the current level.
+            share_resource(reverb)
+            self.reverbs[key] = reverb
+        self.references[key] = self.references.get(key, 0) + 1
+        return self.reverbs[key]
+
+    def release(self, reverb: GlobalFdnReverb) -> None:
+        """Stop using a reverb.
+
+        When nothing is using the reverb, it is kept until
+        :attr:`~earwax.ReverbPool.max_idle` other reverbs have been released
+        after it.
+
+        If the reverb did not come from this pool, or has been
+        :meth:`detached <earwax.ReverbPool.detach>`, it is destroyed.
+
+        :param reverb: The reverb to release.
+        """
+        key: Optional[ReverbKey] = self.find_key(reverb)
+        if key is None:
+            reverb.destroy()
+            return
+        self.references[key] -= 1
+        if self.references[key] <= 0:
+            del self.references[key]
+            self.idle.append(key)
+            self.prune()
+
+    def detach(self, reverb: GlobalFdnReverb) -> None:
+        """Remove a reverb from this pool, so its settings can be changed.
+
+        The reverb will not be returned by :meth:`~earwax.ReverbPool.acquire`
+        again, and releasing it will destroy it.
+
+        :param reverb: The reverb to detach.
+        """
+        key: Optional[ReverbKey] = self.find_key(reverb)
+        if key is not None:
+            del self.reverbs[key]
+            self.references.pop(key, None)
+            if key in self.idle:
+                self.idle.remove(key)
+
+    def prune(self) -> None:
+        """Destroy the least recently released reverbs.
+
+        Reverbs are destroyed until there are no more than
+        :attr:`~earwax.ReverbPool.max_idle` idle reverbs left.
+        """
+        while len(self.idle) > self.max_idle:
+            self.reverbs.pop(self.idle.pop(0)).destroy()
+
+    def destroy_all(self) -> None:
+        """Destroy every reverb in this pool, even ones which are in use."""
+        reverb: GlobalFdnReverb
+        for reverb in self.reverbs.values():
+            reverb.destroy()
+        self.reverbs.clear()
+        self.references.clear()
+        self.idle.clear()
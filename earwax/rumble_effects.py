@@ -47,7 +47,8 @@ class RumbleEffect:
         )
 
     The :meth:`~earwax.RumbleEffect.start` method returns an instance of
-    :class:`~earwax.StaggeredPromise`. This gives you the ability to save your
+    :class:`~earwax.StaggeredPromise`, which is resumed by the game's
+    :attr:`~earwax.Game.sequencer`. This gives you the ability to save your
     effect, then use it at will::
 
         effect: RumbleEffect = RumbleEffect(
@@ -106,7 +107,7 @@ class RumbleEffect:
         :param joystick: The joystick to rumble.
         """
 
-        @StaggeredPromise.decorate
+        @game.sequencer.promise()
         def inner() -> Generator[float, None, None]:
             """Run this effect."""
             value: float = self.start_value
@@ -174,7 +175,7 @@ class RumbleSequence:
         :param joystick: The joystick to rumble.
         """
 
-        @StaggeredPromise.decorate
+        @game.sequencer.promise()
         def inner() -> Generator[float, None, None]:
             """Promise function."""
             line: RumbleSequenceLine
@@ -0,0 +1,409 @@
+"""Provides serializers for saving dumped data in different formats.
+
+Objects which use :class:`~earwax.mixins.DumpLoadMixin` dump themselves to
+dictionaries. Serializers turn those dictionaries into bytes, and back again.
+
+Two serializers are provided: :class:`~earwax.YamlSerializer`, which writes
+human readable YAML, and :class:`~earwax.BinarySerializer`, which writes a
+compact binary format that loads much faster.
+
+The serializer used to save a file is chosen by its extension, and the
+serializer used to load a file is chosen by looking at its contents, so both
+formats can be loaded no matter what they are called::
+
+    world.save(Path('world.yaml'))  # YAML.
+    world.save(Path('world.ewb'))  # Binary.
+"""
+
+import os
+from concurrent.futures import Executor, Future
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from attr import Factory, attrib, attrs
+
+from .codec import BinaryCodec, CodecError
+from .yaml import CDumper, CLoader, dump, load
+
+
+class UnknownSerializer(Exception):
+    """No serializer with the given name has been registered."""
+
+
+@attrs(auto_attribs=True)
+class Serializer:
+    """The base class for all serializers.
+
+    :ivar ~earwax.Serializer.name: The name of this serializer, used when
+        choosing a format by name.
+
+    :ivar ~earwax.Serializer.extensions: The file extensions this serializer
+        will be chosen for when saving, including the leading dot.
+    """
+
+    name: str
+    extensions: List[str] = Factory(list)
+
+    def dumps(self, data: Any) -> bytes:
+        """Return ``data`` as bytes.
+
+        :param data: The data to serialize.
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """Return the data serialized in ``data``.
+
+        :param data: The bytes to load from.
+        """
+        raise NotImplementedError
+
+    def recognises(self, data: bytes) -> bool:
+        """Return whether or not ``data`` was written by this serializer.
+
+        :param data: The start of a file.
+        """
+        return False
+
+
+@attrs(auto_attribs=True)
+class YamlSerializer(Serializer):
+    """Serialize data as YAML.
+
+    This is the default serializer, and will be used to load any file that no
+    other serializer recognises.
+    """
+
+    name: str = "yaml"
+    extensions: List[str] = Factory(lambda: [".yaml", ".yml"])
+
+    def dumps(self, data: Any) -> bytes:
+        """Return ``data`` as YAML."""
+        return dump(data, Dumper=CDumper).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """Load YAML."""
+        return load(data, Loader=CLoader)
+
+
+@attrs(auto_attribs=True)
+class BinarySerializer(Serializer):
+    """Serialize data with a :class:`~earwax.BinaryCodec`.
+
+    Files start with :attr:`~earwax.BinarySerializer.magic`, and a version
+    byte, so they can be recognised, and so the format can change without
+    breaking older files.
+
+    :ivar ~earwax.BinarySerializer.magic: The bytes every file starts with.
+
+    :ivar ~earwax.BinarySerializer.version: The version of the format which
+        is written.
+
+    :ivar ~earwax.BinarySerializer.codec: The codec which encodes and decodes
+        data.
+    """
+
+    name: str = "binary"
+    extensions: List[str] = Factory(lambda: [".ewb"])
+    magic: bytes = b"EARWAX"
+    version: int = 1
+
+    codec: BinaryCodec = attrib(
+        default=Factory(lambda: BinaryCodec(import_enums=True)),
+        init=False,
+        repr=False,
+    )
+
+    @property
+    def header(self) -> bytes:
+        """Return the bytes which every file starts with."""
+        return self.magic + bytes([self.version])
+
+    def dumps(self, data: Any) -> bytes:
+        """Return ``data`` encoded with a header."""
+        buffer: bytearray = bytearray(self.header)
+        self.codec.write(buffer, data)
+        return bytes(buffer)
+
+    def loads(self, data: bytes) -> Any:
+        """Check the header, then decode ``data``."""
+        if not data.startswith(self.magic):
+            raise CodecError("This is not a %s file." % self.name)
+        start: int = len(self.magic)
+        version: int = data[start] if len(data) > start else 0
+        if version != self.version:
+            raise CodecError("Unsupported version %d." % version)
+        value: Any
+        offset: int
+        value, offset = self.codec.read(data, start + 1)
+        if offset != len(data):
+            raise CodecError(
+                "%d bytes left over after decoding." % (len(data) - offset)
+            )
+        return value
+
+    def recognises(self, data: bytes) -> bool:
+        """Return whether ``data`` starts with the magic bytes."""
+        return data.startswith(self.magic)
+
+
+# The default serializer.
+yaml_serializer: YamlSerializer = YamlSerializer()
+
+# All the registered serializers, keyed by name.
+serializers: Dict[str, Serializer] = {}
+
+
+def register_serializer(serializer: Serializer) -> None:
+    """Register a serializer, so it can be chosen by name or extension.
+
+    :param serializer: The serializer to register.
+    """
+    serializers[serializer.name] = serializer
+
+
+register_serializer(yaml_serializer)
+register_serializer(BinarySerializer())
+
+
+def get_serializer(
+    name: Optional[str] = None, path: Optional[Path] = None
+) -> Serializer:
+    """Return a serializer.
+
+    If ``name`` is given, the serializer with that name is returned.
+    Otherwise, the serializer is chosen by the extension of ``path``. If no
+    serializer matches, YAML is used.
+
+    :param name: The name of the serializer to return.
+
+    :param path: The path whose extension should be used.
+    """
+    if name is not None:
+        try:
+            return serializers[name]
+        except KeyError:
+            raise UnknownSerializer(name)
+    if path is not None:
+        suffix: str = path.suffix.lower()
+        serializer: Serializer
+        for serializer in serializers.values():
+            if suffix in serializer.extensions:
+                return serializer
+    return yaml_serializer
+
+
+def detect_serializer(data: bytes) -> Serializer:
+    """Return the serializer which wrote ``data``.
+
+    If no serializer recognises ``data``, YAML is assumed.
+
+    :param data: The data to look at.
+    """
+    serializer: Serializer
+    for serializer in serializers.values():
+        if serializer.recognises(data):
+            return serializer
+    return yaml_serializer
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path``, so a crash never leaves it half written.
+
+    The data is written to a temporary file, which is flushed to disk, then
+    renamed over ``path``.
+
+    :param path: The path to write to.
+
+    :param data: The data to write.
+    """
+    temporary: Path = path.with_name(path.name + ".tmp")
+    with temporary.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    if os.name == "posix":
+        # Make sure the rename itself is on disk.
+        directory: int = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def save_data(
+    data: Any, path: Path, serializer: Optional[str] = None
+) -> None:
+    """Serialize ``data``, and write it to ``path``.
+
+    The file is written with :func:`write_atomic`.
+
+    :param data: The data to save.
+
+    :param path: The path to write to.
+
+    :param serializer: The name of the serializer to use.
+
+        If this value is ``None``, the serializer will be chosen by the
+        extension of ``path``.
+    """
+    write_atomic(path, get_serializer(serializer, path).dumps(data))
+
+
+def load_data(path: Path, serializer: Optional[str] = None) -> Any:
+    """Load data from ``path``.
+
+    :param path: The path to load from.
+
+    :param serializer: The name of the serializer to use.
+
+        If this value is ``None``, the serializer will be chosen by looking at
+        the contents of ``path``.
+    """
+    data: bytes = path.read_bytes()
+    if serializer is None:
+        return detect_serializer(data).loads(data)
+    return get_serializer(serializer).loads(data)
+
+
+def get_earwax_version() -> str:
+    """Return the installed version of Earwax, or ``'unknown'``."""
+    try:
+        return version("earwax")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@attrs(auto_attribs=True)
+class DataCache:
+    """A fast loading copy of a data file, stored next to it.
+
+    Parsing large YAML files is slow, so the first time a file is loaded
+    through a cache, its data is saved with a
+    :class:`~earwax.BinarySerializer`. Later loads use that copy, for as long
+    as the file's contents and the version of Earwax stay the same::
+
+        cache: DataCache = DataCache(Path('world.yaml'))
+        data: Dict[str, Any] = cache.load(executor=game.get_executor('cpu'))
+
+    Cache files start with a key holding a hash of the source file, so a
+    stale cache is found without decoding all of it.
+
+    :ivar ~earwax.DataCache.path: The file to load.
+
+    :ivar ~earwax.DataCache.cache_path: The file to store the cache in.
+
+        By default, this is ``path`` with ``.cache`` added to it.
+
+    :ivar ~earwax.DataCache.serializer: The serializer which writes cache
+        files.
+
+    :ivar ~earwax.DataCache.logger: The logger to report problems with.
+
+    :ivar ~earwax.DataCache.hit: Whether or not the last call to
+        :meth:`~earwax.DataCache.load` used the cache.
+
+    :ivar ~earwax.DataCache.future: The future which is rebuilding the cache
+        in the background, if any.
+    """
+
+    path: Path
+    cache_path: Path = attrib()
+
+    @cache_path.default
+    def get_default_cache_path(instance: "DataCache") -> Path:
+        """Add ``.cache`` to the source path."""
+        return instance.path.with_name(instance.path.name + ".cache")
+
+    serializer: BinarySerializer = Factory(BinarySerializer)
+    logger: Logger = attrib(
+        default=Factory(lambda: getLogger(__name__)), repr=False
+    )
+
+    hit: bool = attrib(default=False, init=False)
+    future: Optional[Future] = attrib(default=None, init=False, repr=False)
+
+    def get_key(self, source: bytes) -> Dict[str, str]:
+        """Return the key a cache of ``source`` should have.
+
+        :param source: The contents of :attr:`~earwax.DataCache.path`.
+        """
+        return {
+            "sha256": sha256(source).hexdigest(),
+            "earwax": get_earwax_version(),
+        }
+
+    def read(self, key: Dict[str, str]) -> Optional[Any]:
+        """Return the cached data, or ``None`` if it is missing or stale.
+
+        :param key: The key the cache must have.
+        """
+        try:
+            data: bytes = self.cache_path.read_bytes()
+        except OSError:
+            return None
+        header: bytes = self.serializer.header
+        if not data.startswith(header):
+            return None
+        try:
+            offset: int
+            cached_key: Any
+            cached_key, offset = self.serializer.codec.read(data, len(header))
+            if cached_key != key:
+                return None
+            value: Any
+            value, offset = self.serializer.codec.read(data, offset)
+        except CodecError:
+            self.logger.warning("Ignoring broken cache %s.", self.cache_path)
+            return None
+        if offset != len(data):
+            return None
+        return value
+
+    def write(self, key: Dict[str, str], data: Any) -> None:
+        """Write the cache with :func:`write_atomic`.
+
+        :param key: The key of the cached data.
+
+        :param data: The data to cache.
+        """
+        buffer: bytearray = bytearray(self.serializer.header)
+        self.serializer.codec.write(buffer, key)
+        self.serializer.codec.write(buffer, data)
+        try:
+            write_atomic(self.cache_path, bytes(buffer))
+        except OSError:
+            self.logger.exception("Unable to write cache %s.", self.cache_path)
+
+    def load(self, executor: Optional[Executor] = None) -> Any:
+        """Load the data in :attr:`~earwax.DataCache.path`.
+
+        If the cache is valid, it is used. Otherwise, the file is loaded
+        normally, and the cache is rebuilt.
+
+        Binary files load quickly already, so they are never cached.
+
+        :param executor: The executor to rebuild the cache with.
+
+            If this value is ``None``, the cache is rebuilt before this method
+            returns.
+        """
+        source: bytes = self.path.read_bytes()
+        serializer: Serializer = detect_serializer(source)
+        if isinstance(serializer, BinarySerializer):
+            self.hit = False
+            return serializer.loads(source)
+        key: Dict[str, str] = self.get_key(source)
+        data: Any = self.read(key)
+        self.hit = data is not None
+        if data is None:
+            data = serializer.loads(source)
+            if executor is None:
+                self.write(key, data)
+            else:
+                self.future = executor.submit(self.write, key, data)
+        return data
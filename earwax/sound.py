@@ -3,11 +3,15 @@
 from concurrent.futures import Executor
 from pathlib import Path
 from random import choice
+from threading import Lock
 from typing import (Any, Callable, Dict, Generator, Iterator, List, Optional,
                     Union)
 
 from attr import Factory, attrib, attrs
 
+from . import tracing
+from .leaks import native_alive, share_resource, track_resource
+from .tracing import Tracer, traced
 from .utils import random_file as _random_file
 
 try:
@@ -66,6 +70,15 @@ class BufferCache:
     :ivar ~earwax.BufferCache.buffers: The loaded buffers.
 
     :ivar ~earwax.BufferCache.current_size: The current size of the cache.
+
+    :ivar ~earwax.BufferCache.hits: The number of times
+        :meth:`~earwax.BufferCache.get_buffer` found a cached buffer.
+
+    :ivar ~earwax.BufferCache.misses: The number of times
+        :meth:`~earwax.BufferCache.get_buffer` had to load a buffer.
+
+    :ivar ~earwax.BufferCache.lock: The lock which guards the cache, so
+        buffers can be loaded from other threads.
     """
 
     max_size: int
@@ -77,6 +90,17 @@ class BufferCache:
         default=Factory(dict), init=False, repr=False
     )
     current_size: int = attrib(default=Factory(int), init=False)
+    hits: int = attrib(default=0, init=False, repr=False)
+    misses: int = attrib(default=0, init=False, repr=False)
+    lock: Lock = attrib(default=Factory(Lock), init=False, repr=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of buffer requests which were cached."""
+        total: int = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
 
     def get_size(self, buffer: Buffer) -> int:
         """Return the size of the provided buffer.
@@ -95,6 +119,13 @@ class BufferCache:
         """
         return f"{protocol}://{path}"
 
+    @traced(
+        category="sound",
+        get_args=lambda cache, protocol, path: dict(
+            uri=cache.get_uri(protocol, path),
+            cached=cache.get_uri(protocol, path) in cache.buffers,
+        ),
+    )
     def get_buffer(self, protocol: str, path: str) -> Buffer:
         """Load and return a Buffer instance.
 
@@ -134,14 +165,69 @@ class BufferCache:
         :param path: The path to whatever data your buffer will contain.
         """
         uri: str = self.get_uri(protocol, path)
-        if uri not in self.buffers:
-            # Firstly load the buffer.
-            buffer: Buffer = Buffer.from_stream(protocol, path)
+        with self.lock:
+            if uri in self.buffers:
+                self.hits += 1
+                self.touch(uri)
+                return self.buffers[uri]
+            self.misses += 1
+        # Decode outside the lock, so other threads can use the cache.
+        return self.add_buffer(uri, self.load_buffer(protocol, path))
+
+    def load_buffer(self, protocol: str, path: str) -> Buffer:
+        """Load and return a buffer, without caching it.
+
+        This method can be called from any thread.
+
+        :param protocol: The protocol to load with.
+
+        :param path: The path to load.
+        """
+        uri: str = self.get_uri(protocol, path)
+        tracer: Optional[Tracer] = tracing.active_tracer
+        start: float = 0.0 if tracer is None else tracer.now()
+        buffer: Buffer = Buffer.from_stream(protocol, path)
+        track_resource(buffer, "buffer", lambda: native_alive(buffer))
+        if tracer is not None:
+            tracer.complete(
+                "decode", "sound", start, uri=uri, size=self.get_size(buffer)
+            )
+        return buffer
+
+    def add_buffer(self, uri: str, buffer: Buffer) -> Buffer:
+        """Add a loaded buffer to this cache, and return the cached buffer.
+
+        If another thread cached a buffer with the same URI first, ``buffer``
+        is destroyed, and the existing buffer is returned instead.
+
+        Cached buffers outlive the levels which loaded them, so they are
+        shared with any running :class:`earwax.LeakDetector`.
+
+        :param uri: The URI of the buffer, as returned by
+            :meth:`~earwax.BufferCache.get_uri`.
+
+        :param buffer: The buffer to add.
+        """
+        with self.lock:
+            if uri in self.buffers:
+                buffer.destroy()
+                self.touch(uri)
+                return self.buffers[uri]
             self.buffer_uris.insert(0, uri)
             self.buffers[uri] = buffer
             self.current_size += self.get_size(buffer)
             self.prune_buffers()
-        return self.buffers[uri]
+        share_resource(buffer)
+        return buffer
+
+    def touch(self, uri: str) -> None:
+        """Mark a buffer as recently used, so it will be pruned last.
+
+        :param uri: The URI of the buffer.
+        """
+        if uri in self.buffer_uris and self.buffer_uris[0] != uri:
+            self.buffer_uris.remove(uri)
+            self.buffer_uris.insert(0, uri)
 
     def prune_buffers(self) -> None:
         """Prune old buffers.
@@ -251,6 +337,7 @@ class Sound:
         self.generator.looping = self.looping
         self.generator.set_userdata(self)
         self.reset_source()
+        track_resource(self, "sound", lambda: not self.destroyed)
 
     @classmethod
     def from_stream(
@@ -472,6 +559,68 @@ class Sound:
         self.generator.position = 0.0
 
 
+@attrs(auto_attribs=True)
+class NullSound(Sound):
+    """A sound which makes no noise.
+
+    Instances of this class are returned by :class:`earwax.NullSoundManager`,
+    and behave like normal sounds, except that they have no synthizer objects
+    attached, so they can be used without an audio context.
+    """
+
+    def __attrs_post_init__(self) -> None:
+        """Track this sound, since there is no generator to set up."""
+        track_resource(self, "sound", lambda: not self.destroyed)
+
+    def reset_source(self) -> None:  # type: ignore[override]
+        """Do nothing, since there is no source."""
+        self.check_destroyed()
+
+    def set_position(self, position: PositionType) -> None:
+        """Store the new position.
+
+        :param position: The new position.
+        """
+        self.position = position
+
+    def set_looping(self, looping: bool) -> None:
+        """Store the new looping value.
+
+        :param looping: Whether or not to loop.
+        """
+        self.looping = looping
+
+    def pause(self) -> None:
+        """Mark this sound as paused."""
+        self.check_destroyed()
+        self._paused = True
+
+    def play(self) -> None:
+        """Mark this sound as playing."""
+        self.check_destroyed()
+        self._paused = False
+
+    def destroy_generator(self) -> None:
+        """Do nothing, since there is no generator."""
+        self.check_destroyed()
+
+    def connect_reverb(self, reverb: GlobalFdnReverb) -> None:
+        """Store the reverb.
+
+        :param reverb: The reverb to store.
+        """
+        self.check_destroyed()
+        self.reverb = reverb
+
+    def disconnect_reverb(self) -> None:
+        """Forget the stored reverb."""
+        self.reverb = None
+
+    def restart(self) -> None:
+        """Do nothing."""
+        pass
+
+
 class SoundManagerError(Exception):
     """The base class for all sound manager errors."""
 
@@ -563,6 +712,10 @@ class SoundManager:
         kwargs.setdefault("reverb", self.default_reverb)
         kwargs.setdefault("on_destroy", self.remove_sound)
 
+    @traced(
+        category="sound",
+        get_args=lambda manager, path, **kwargs: dict(path=str(path)),
+    )
     def play_path(self, path: Path, /, **kwargs) -> Sound:
         """Play a sound from a path.
 
@@ -612,6 +765,76 @@ class SoundManager:
         self.sounds.append(sound)
         return sound
 
+    def play_cached(self, protocol: str, path: str, /, **kwargs) -> Sound:
+        """Play a cached buffer if there is one, or stream the sound if not.
+
+        If ``protocol`` is ``'file'``, and
+        :attr:`~earwax.SoundManager.buffer_cache` already holds a buffer for
+        ``path``, the sound is played with
+        :meth:`~earwax.SoundManager.play_path`, so sounds which have been
+        loaded ahead of time (by a :class:`earwax.story.RoomPrefetcher` for
+        example) start without touching the disk. Otherwise,
+        :meth:`~earwax.SoundManager.play_stream` is used.
+
+        :param protocol: The protocol to use.
+
+        :param path: The path to use.
+
+        :param kwargs: Extra keyword arguments to pass to the method which
+            plays the sound.
+        """
+        if protocol == "file" and self.buffer_cache is not None:
+            # Use the same URI as ``play_path`` would.
+            uri: str = self.buffer_cache.get_uri(protocol, str(Path(path)))
+            if uri in self.buffer_cache.buffers:
+                return self.play_path(Path(path), **kwargs)
+        return self.play_stream(protocol, path, **kwargs)
+
+
+@attrs(auto_attribs=True)
+class NullSoundManager(SoundManager):
+    """A sound manager which plays :class:`earwax.NullSound` instances.
+
+    No buffers are loaded, and no audio context is needed, which makes this
+    class useful for running games without audio, such as with
+    :class:`earwax.HeadlessRunner`::
+
+        manager: NullSoundManager = NullSoundManager(None)
+        sound: Sound = manager.play_path(Path('sound.wav'))
+    """
+
+    def play_path(self, path: Path, /, **kwargs) -> Sound:
+        """Pretend to play a sound from a path.
+
+        :param path: The path to pretend to play.
+
+            If the given path is a directory, then a random file from that
+            directory will be chosen, as with :meth:`earwax.Sound.from_path`.
+
+        :param kwargs: Extra keyword arguments to pass to the constructor of
+            :class:`earwax.NullSound`.
+        """
+        _random_file(path)
+        self.update_kwargs(kwargs)
+        sound: Sound = NullSound(self.context, None, **kwargs)
+        self.sounds.append(sound)
+        return sound
+
+    def play_stream(self, protocol: str, path: str, /, **kwargs) -> Sound:
+        """Pretend to stream a sound.
+
+        :param protocol: The protocol that would have been used.
+
+        :param path: The path that would have been used.
+
+        :param kwargs: Extra keyword arguments to pass to the constructor of
+            :class:`earwax.NullSound`.
+        """
+        self.update_kwargs(kwargs)
+        sound: Sound = NullSound(self.context, None, **kwargs)
+        self.sounds.append(sound)
+        return sound
+
 
 @attrs(auto_attribs=True, frozen=True)
 class BufferDirectory:
@@ -641,6 +864,13 @@ class BufferDirectory:
 
     :ivar ~earwax.BufferDirectory.glob: The glob to use when loading files.
 
+    :ivar ~earwax.BufferDirectory.thread_pool: An executor to load buffers
+        with.
+
+        If this value is ``None``, buffers will be loaded one at a time. The
+        ``'audio-decode'`` executor from :meth:`earwax.Game.get_executor` is a
+        good choice.
+
     :ivar ~earwax.BufferDirectory.buffers: A dictionary of of ``filename:
         Buffer`` pairs.
 
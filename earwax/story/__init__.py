@@ -31,10 +31,12 @@ from typing import List
 from .context import StoryContext
 from .edit_level import EditLevel, ObjectPositionLevel
 from .play_level import PlayLevel
-from .world import (DumpablePoint, DumpableReverb, ObjectTypes, RoomExit,
-                    RoomObject, RoomObjectClass, RoomObjectTypes, StoryWorld,
-                    WorldAction, WorldAmbiance, WorldMessages, WorldRoom,
-                    WorldState, WorldStateCategories)
+from .room_prefetcher import RoomPrefetcher
+from .state_saver import StateSaver
+from .world import (DumpablePoint, DumpableReverb, LazyRooms, ObjectTypes,
+                    RoomExit, RoomObject, RoomObjectClass, RoomObjectTypes,
+                    StoryWorld, WorldAction, WorldAmbiance, WorldIndex,
+                    WorldMessages, WorldRoom, WorldState, WorldStateCategories)
 
 __all__: List[str] = ["ObjectTypes"]
 __all__.extend(
@@ -42,6 +44,7 @@ __all__.extend(
     for thing in [
         DumpablePoint,
         DumpableReverb,
+        LazyRooms,
         RoomExit,
         RoomObject,
         RoomObjectClass,
@@ -49,6 +52,7 @@ __all__.extend(
         StoryWorld,
         WorldAction,
         WorldAmbiance,
+        WorldIndex,
         WorldMessages,
         WorldRoom,
         WorldState,
@@ -56,6 +60,8 @@ __all__.extend(
         EditLevel,
         ObjectPositionLevel,
         PlayLevel,
+        RoomPrefetcher,
+        StateSaver,
         StoryContext,
     ]
 )
@@ -4,7 +4,7 @@ import os.path
 import webbrowser
 from logging import Logger, getLogger
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Type
+from typing import Any, Callable, Dict, List, Optional, Type
 
 from attr import Factory, attrib, attrs
 
@@ -19,19 +19,25 @@ from ..game import Game
 from ..menus import ConfigMenu, Menu
 from ..track import Track, TrackTypes
 from ..types import NoneGenerator
-from ..yaml import CLoader, load
 from .edit_level import EditLevel, push_rooms_menu
 from .play_level import PlayLevel
+from .state_saver import StateSaver
 from .world import RoomExit, StoryWorld, WorldRoom, WorldState
 
 
 @attrs(auto_attribs=True)
 class StoryContext:
-    """Holds references to various objects required to make a story work."""
+    """Holds references to various objects required to make a story work.
+
+    If ``journal`` is ``True``, every room move and inventory change is
+    recorded by :attr:`state_saver`, so loading a game restores the last
+    thing the player did, rather than the last time they saved.
+    """
 
     game: Game
     world: StoryWorld
     edit: bool = Factory(bool)
+    journal: bool = False
     logger: Logger = attrib(init=False, repr=False)
 
     @logger.default
@@ -48,6 +54,17 @@ class StoryContext:
         """Get the default configuration filename."""
         return instance.game.get_settings_path() / "game.yaml"
 
+    state_saver: StateSaver = attrib(init=False, repr=False)
+
+    @state_saver.default
+    def get_default_state_saver(instance: "StoryContext") -> StateSaver:
+        """Get a state saver which writes to the configuration file."""
+        return StateSaver(
+            instance.config_file,
+            instance.game.thread_pool,
+            journal=instance.journal,
+        )
+
     state: WorldState = attrib()
 
     @state.default
@@ -77,22 +94,32 @@ class StoryContext:
             )
         else:
             self.state.room_id = self.world.initial_room_id
-        room: WorldRoom
-        inaccessible_rooms: List[WorldRoom] = list(self.world.rooms.values())
-        for room in self.world.rooms.values():
-            x: RoomExit
-            for x in room.exits:
-                did: str = x.destination_id
-                if did not in self.world.rooms:
-                    self.logger.critical("Invalid exit destination: %s.", did)
-                    self.errors.append(
-                        "Invalid destination %r for exit %s of room %s."
-                        % (did, x.action.name, room.name)
-                    )
-                if x.destination in inaccessible_rooms:
-                    inaccessible_rooms.remove(x.destination)
-        for room in inaccessible_rooms:
-            msg: str = "There is no way to access the %s room." % room
+        # Use exit destination IDs, so lazy worlds are not loaded.
+        inaccessible_rooms: Dict[str, None] = dict.fromkeys(self.world.rooms)
+        destinations: Dict[str, List[str]] = self.world.get_exit_destinations()
+        room_id: str
+        destination_ids: List[str]
+        for room_id, destination_ids in destinations.items():
+            did: str
+            for did in destination_ids:
+                if did in self.world.rooms:
+                    inaccessible_rooms.pop(did, None)
+                    continue
+                self.logger.critical("Invalid exit destination: %s.", did)
+                room: WorldRoom = self.world.rooms[room_id]
+                x: RoomExit
+                for x in room.exits:
+                    if x.destination_id == did:
+                        self.errors.append(
+                            "Invalid destination %r for exit %s of room %s."
+                            % (did, x.action.name, room.name)
+                        )
+                        break
+        for room_id in inaccessible_rooms:
+            msg: str = (
+                "There is no way to access the %s room."
+                % self.world.rooms[room_id]
+            )
             self.logger.warning(msg)
             self.warnings.append(msg)
         music: str
@@ -198,13 +225,12 @@ class StoryContext:
 
         def yes() -> None:
             """Perform the load."""
-            if self.config_file.is_file():
-                self.logger.info(
-                    "Loading configuration file %s." % self.config_file
-                )
-                with self.config_file.open("r") as f:
-                    d: Dict[str, Any] = load(f, Loader=CLoader)
-                    self.logger.info("Loaded configuration data: %r." % d)
+            self.logger.info(
+                "Loading configuration file %s." % self.config_file
+            )
+            d: Optional[Dict[str, Any]] = self.state_saver.load()
+            if d is not None:
+                self.logger.info("Loaded configuration data: %r." % d)
                 self.state = WorldState.load(d, self.world)
                 # Remove any duplicates.
                 self.state.inventory_ids = list(set(self.state.inventory_ids))
@@ -331,6 +331,7 @@ class EditLevel(PlayLevel):
             """Set the description."""
             self.game.pop_level()
             r.description = text
+            self.world.index.add_shadows(r)
             self.game.output("Description set.")
 
         self.game.output("Enter a new description: %s" % r.description)
@@ -355,6 +356,7 @@ class EditLevel(PlayLevel):
         def inner(other: WorldRoom) -> None:
             """Set the room name."""
             room.name = f"#{other.id}"
+            self.world.index.add_shadows(room)
 
         push_rooms_menu(
             self.game, self.get_rooms(include_current=False), inner
@@ -367,6 +369,7 @@ class EditLevel(PlayLevel):
         def inner(new_room: WorldRoom) -> None:
             """Set the description of this room."""
             current_room.description = f"#{new_room.id}"
+            self.world.index.add_shadows(current_room)
             self.game.output("Description set.")
 
         push_rooms_menu(
@@ -428,6 +431,8 @@ class EditLevel(PlayLevel):
         def on_submit(text: str) -> None:
             """Rename ``obj``."""
             obj.name = text
+            if isinstance(obj, WorldRoom):
+                self.world.index.add_shadows(obj)
             self.game.output("Done.")
             self.game.pop_level()
 
@@ -810,24 +815,22 @@ class EditLevel(PlayLevel):
             elif len(self.world.rooms) == 1:
                 msg = "You cannot delete the only room."
             else:
-                r: WorldRoom
-                for r in self.get_rooms():
-                    if r.name.startswith("#") and r.name[1:] == obj.id:
-                        msg = "First stop shadowing this room's name."
-                        break
-                    if (
-                        r.description.startswith("#")
-                        and r.description[1:] == obj.id
-                    ):
-                        msg = "First stop shadowing this room's description."
-                        break
-                    x: RoomExit
-                    for x in r.exits:
-                        if x.destination is obj:
-                            msg = (
-                                "There is an entrance to this room from "
-                                f"{r.get_name()} via {x.action.name}"
-                            )
+                name_shadows: List[WorldRoom]
+                description_shadows: List[WorldRoom]
+                name_shadows, description_shadows = self.world.get_shadows(
+                    obj.id
+                )
+                entrances: List[RoomExit] = self.world.get_entrances(obj.id)
+                if name_shadows:
+                    msg = "First stop shadowing this room's name."
+                elif description_shadows:
+                    msg = "First stop shadowing this room's description."
+                elif entrances:
+                    x: RoomExit = entrances[-1]
+                    msg = (
+                        "There is an entrance to this room from "
+                        f"{x.location.get_name()} via {x.action.name}"
+                    )
         if msg is not None:
             return self.game.output(msg)
 
@@ -835,13 +838,13 @@ class EditLevel(PlayLevel):
             if isinstance(obj, WorldRoom):
                 assert self.world.initial_room is not None
                 assert self.world.initial_room_id is not None
-                del self.world.rooms[obj.id]
+                self.world.remove_room(obj)
                 self.state.room_id = self.world.initial_room_id
                 self.set_room(self.world.initial_room)
             elif isinstance(obj, RoomExit):
-                obj.location.exits.remove(obj)
+                obj.location.remove_exit(obj)
             elif isinstance(obj, RoomObject):
-                del obj.location.objects[obj.id]
+                obj.location.remove_object(obj)
                 self.set_room(self.room)
                 if obj.id in self.state.inventory_ids:
                     self.state.inventory_ids.remove(obj.id)
@@ -1115,7 +1118,8 @@ class EditLevel(PlayLevel):
         def delete_reverb() -> None:
             def yes() -> None:
                 if self.reverb is not None:
-                    self.reverb.destroy()
+                    assert self.game.reverb_pool is not None
+                    self.game.reverb_pool.release(self.reverb)
                 self.reverb = None
                 room.reverb = None
                 self.game.output("Reverb deleted.")
@@ -1129,6 +1133,10 @@ class EditLevel(PlayLevel):
         if room.reverb is None:
             room.reverb = DumpableReverb()
             self.set_room(room)
+        if self.reverb is not None:
+            # The editor changes the reverb, so it can no longer be shared.
+            assert self.game.reverb_pool is not None
+            self.game.reverb_pool.detach(self.reverb)
         m: ReverbEditor = ReverbEditor(
             self.game,
             "Reverb",  # type: ignore[arg-type]
@@ -12,10 +12,12 @@ from ..ambiance import Ambiance
 from ..level import Level
 from ..menus import Menu
 from ..point import Point
+from ..promises import ThreadedPromise
 from ..sound import AlreadyDestroyed, Sound
 from ..track import Track, TrackTypes
 from ..types import NoneGenerator
-from ..yaml import CDumper, dump
+from .room_prefetcher import RoomPrefetcher
+from .state_saver import StateSaver
 from .world import (DumpablePoint, ObjectTypes, RoomExit, RoomObject,
                     StoryWorld, WorldAction, WorldAmbiance, WorldRoom,
                     WorldState, WorldStateCategories)
@@ -46,11 +48,20 @@ class PlayLevel(Level):
     :ivar ~earwax.story.edit_level.EditLevel.reverb: The reverb object for the
         current room.
 
+        This reverb comes from the game's :attr:`~earwax.Game.reverb_pool`,
+        so rooms with the same reverb settings share it.
+
     :ivar object_ambiances: The ambiances for a all objects in the room,
         excluding those in the players' :attr:`inventory`.
 
     :ivar object_tracks: The tracks for each object in the current room,
         excluding those objects that are in the player's :attr:`inventory`.
+
+    :ivar prefetcher: The object which loads the sounds of nearby rooms in
+        the background.
+
+        Ambiances are played with :meth:`earwax.SoundManager.play_cached`, so
+        they use the buffers it loads.
     """
 
     world_context: "StoryContext"
@@ -63,6 +74,17 @@ class PlayLevel(Level):
     reverb: Optional["GlobalFdnReverb"] = None
     object_ambiances: Dict[str, List[Ambiance]] = Factory(dict)
     object_tracks: Dict[str, List[Track]] = Factory(dict)
+    prefetcher: RoomPrefetcher = attrib(repr=False)
+
+    @prefetcher.default
+    def get_default_prefetcher(instance: "PlayLevel") -> RoomPrefetcher:
+        """Return a prefetcher which uses the game's buffer cache."""
+        return RoomPrefetcher(
+            instance.game.buffer_cache,
+            instance.game.get_executor("audio-decode"),
+            max_size=instance.game.config.sound.prefetch_size.value,
+            logger=instance.world_context.logger,
+        )
 
     def __attrs_post_init__(self) -> None:
         """Load inventory and bind actions."""
@@ -126,13 +148,13 @@ class PlayLevel(Level):
         obj: RoomObject
         while self.inventory:
             obj = self.inventory.pop()
-            obj.location.objects[obj.id] = obj
-        room: WorldRoom
-        for room in list(self.world.rooms.values()):
-            for obj in list(room.objects.values()):
-                if obj.id in self.state.inventory_ids:
-                    self.inventory.append(obj)
-                    del room.objects[obj.id]
+            obj.location.add_object(obj)
+        object_id: str
+        for object_id in self.state.inventory_ids:
+            found: Optional[RoomObject] = self.world.get_object(object_id)
+            if found is not None:
+                self.inventory.append(found)
+                found.location.remove_object(found)
 
     def get_objects(self) -> List[RoomObject]:
         """Return a list of objects that the player can see.
@@ -209,9 +231,17 @@ class PlayLevel(Level):
         self.set_room(self.state.room)
 
     def on_pop(self) -> None:
-        """Stop all the action sounds."""
+        """Stop all the action sounds, and stop prefetching.
+
+        The reverb is returned to the game's :attr:`~earwax.Game.reverb_pool`.
+        """
         self.stop_action_sounds()
-        return super().on_pop()
+        self.prefetcher.clear()
+        super().on_pop()
+        if self.reverb is not None:
+            assert self.game.reverb_pool is not None
+            self.game.reverb_pool.release(self.reverb)
+            self.reverb = None
 
     def main_menu(self) -> NoneGenerator:
         """Return to the main menu."""
@@ -331,20 +361,20 @@ class PlayLevel(Level):
 
     def set_room(self, room: WorldRoom) -> None:
         """Move to a new room."""
-        if (
-            self.state.room is not room
-            and self.state.room.reverb != room.reverb
-            and self.reverb is not None
-        ):
-            self.reverb.destroy()
-            self.reverb = None
+        old_reverb: Optional[GlobalFdnReverb] = self.reverb
+        self.reverb = None
         if room.reverb is not None:
-            assert self.game.audio_context is not None
-            self.reverb = room.reverb.make_reverb(self.game.audio_context)
+            assert self.game.reverb_pool is not None
+            # Acquire first, so a reverb shared with the last room is kept.
+            self.reverb = self.game.reverb_pool.acquire(room.reverb)
+        if old_reverb is not None:
+            assert self.game.reverb_pool is not None
+            self.game.reverb_pool.release(old_reverb)
         assert self.game.ambiance_sound_manager is not None
         self.state.room_id = room.id
         self.state.object_index = None
         self.state.category_index = 0
+        self.record_state("room_id", "object_index", "category_index")
         self.stop_action_sounds()
         self.stop_ambiances()
         self.ambiances.clear()
@@ -372,12 +402,14 @@ class PlayLevel(Level):
                 track = Track("file", a.path, TrackTypes.ambiance)
                 track.play(
                     self.game.ambiance_sound_manager,
+                    use_cache=True,
                     gain=self.get_gain(track.track_type, a.volume_multiplier),
                 )
                 self.tracks.append(track)
         obj: RoomObject
         for obj in self.get_objects():
             self.play_object_ambiances(obj)
+        self.prefetcher.update(room)
 
     def play_object_ambiances(self, obj: RoomObject) -> None:
         """Play all the ambiances for the given object.
@@ -394,6 +426,7 @@ class PlayLevel(Level):
                 self.tracks.append(track)
                 track.play(
                     self.game.ambiance_sound_manager,
+                    use_cache=True,
                     gain=gain,
                     reverb=self.reverb,
                 )
@@ -403,6 +436,7 @@ class PlayLevel(Level):
                 self.ambiances.append(ambiance)
                 ambiance.play(
                     self.game.ambiance_sound_manager,
+                    use_cache=True,
                     gain=gain,
                     reverb=self.reverb,
                 )
@@ -593,9 +627,16 @@ class PlayLevel(Level):
         else:
             self.game.output(self.world.messages.no_objects)
 
-    def save_state(self) -> None:
-        """Save the current state."""
-        print("Trying to save world state.")
+    def save_state(self, announce: bool = True) -> None:
+        """Save the current state.
+
+        The state is dumped straight away, but it is written to disk in the
+        background by the context's
+        :attr:`~earwax.story.StoryContext.state_saver`.
+
+        :param announce: Whether or not to tell the player when the game has
+            been saved.
+        """
         directory: Path = self.game.get_settings_path()
         if not directory.is_dir():
             try:
@@ -612,14 +653,40 @@ class PlayLevel(Level):
                     "Failed to create game settings directory."
                 )
         data: Dict[str, Any] = self.state.dump()
-        try:
-            self.world_context.logger.info("Saving game state: %r.", data)
-            with self.world_context.config_file.open("w") as f:
-                f.write(dump(data, Dumper=CDumper))
-            self.game.output("Game saved.")
-        except Exception as e:
+        self.world_context.logger.info("Saving game state: %r.", data)
+        promise: ThreadedPromise = self.world_context.state_saver.save(data)
+
+        @promise.event
+        def on_done(value: None) -> None:
+            if announce:
+                self.game.output("Game saved.")
+
+        @promise.event
+        def on_error(e: Exception) -> None:
             self.game.output("Unable to create save file: %s" % e)
-            self.world_context.logger.exception("Failed to create save file.")
+            self.world_context.logger.error(
+                "Failed to create save file.", exc_info=e
+            )
+
+    def record_state(self, *names: str) -> None:
+        """Record changes to the state in the journal.
+
+        If enough changes have been recorded, the whole state is saved.
+
+        :param names: The names of the state attributes which have changed.
+        """
+        saver: StateSaver = self.world_context.state_saver
+        if not saver.journal:
+            return
+        data: Dict[str, Any] = self.state.dump()[WorldState.__value_key__]
+        name: str
+        try:
+            if saver.record(
+                **{name: data[name] for name in names}
+            ):
+                self.save_state(announce=False)
+        except OSError:
+            self.world_context.logger.exception("Failed to record changes.")
 
     def object_menu(self, obj: RoomObject) -> Callable[[], None]:
         """Return a callable which shows the inventory menu for an object."""
@@ -666,8 +733,9 @@ class PlayLevel(Level):
             action = obj.take_action
         self.do_action(action, obj)
         self.inventory.append(obj)
-        del obj.location.objects[obj.id]
+        obj.location.remove_object(obj)
         self.state.inventory_ids.append(obj.id)
+        self.record_state("inventory_ids")
         self.game.reveal_level(self)
         self.stop_object_ambiances(obj)
 
@@ -682,8 +750,9 @@ class PlayLevel(Level):
             else:
                 action = obj.drop_action
             self.do_action(action, obj, pan=False)
-            self.state.room.objects[obj.id] = obj
+            self.state.room.add_object(obj)
             self.state.inventory_ids.remove(obj.id)
+            self.record_state("inventory_ids")
             self.inventory.remove(obj)
             self.play_object_ambiances(obj)
 
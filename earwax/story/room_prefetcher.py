@@ -0,0 +1,225 @@
+"""Provides the RoomPrefetcher class."""
+
+from concurrent.futures import Executor
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from attr import Factory, attrib, attrs
+
+from ..promises import ThreadedPromise
+from ..sound import Buffer, BufferCache
+from .world import RoomObject, WorldAction, WorldRoom
+
+
+@attrs(auto_attribs=True)
+class RoomPrefetcher:
+    """Loads the sounds of nearby rooms in the background.
+
+    Every time :meth:`~earwax.story.RoomPrefetcher.update` is called with the
+    room the player is in, the sounds of that room, the rooms its exits lead
+    to, and the rooms the player has recently left, are loaded into
+    :attr:`~earwax.story.RoomPrefetcher.buffer_cache`. Sounds which are
+    played with :meth:`earwax.SoundManager.play_cached` use those buffers
+    instead of opening streams, so moving to the next room does not have to
+    wait for the disk.
+
+    Sounds are loaded in that order, until the sounds which are wanted take up
+    :attr:`~earwax.story.RoomPrefetcher.max_size` bytes. Sounds which are no
+    longer wanted stay in the cache, and are pruned by it as normal.
+
+    :ivar ~earwax.story.RoomPrefetcher.buffer_cache: The cache to load sounds
+        into.
+
+    :ivar ~earwax.story.RoomPrefetcher.thread_pool: The executor to load
+        sounds with.
+
+    :ivar ~earwax.story.RoomPrefetcher.max_size: The most sound data (in
+        bytes) which will be loaded ahead of time.
+
+    :ivar ~earwax.story.RoomPrefetcher.max_recent_rooms: The number of rooms
+        the player has left whose sounds will be kept loaded.
+
+    :ivar ~earwax.story.RoomPrefetcher.max_pending: The most sounds which will
+        be loaded at once.
+
+    :ivar ~earwax.story.RoomPrefetcher.logger: The logger to report sounds
+        which could not be loaded with.
+
+    :ivar ~earwax.story.RoomPrefetcher.recent_room_ids: The IDs of the rooms
+        the player has visited, most recent first.
+
+    :ivar ~earwax.story.RoomPrefetcher.queue: The paths which are waiting to
+        be loaded.
+
+    :ivar ~earwax.story.RoomPrefetcher.pending: The promises which are loading
+        sounds, keyed by path.
+
+    :ivar ~earwax.story.RoomPrefetcher.size: The size of the wanted sounds
+        which are already loaded.
+    """
+
+    buffer_cache: BufferCache = attrib(repr=False)
+    thread_pool: Executor = attrib(repr=False)
+    max_size: int = 1024 ** 2 * 100
+    max_recent_rooms: int = 3
+    max_pending: int = 2
+    logger: Logger = attrib(
+        default=Factory(lambda: getLogger(__name__)), repr=False
+    )
+
+    recent_room_ids: List[str] = attrib(default=Factory(list), init=False)
+    queue: List[str] = attrib(default=Factory(list), init=False, repr=False)
+    pending: Dict[str, ThreadedPromise] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    size: int = attrib(default=0, init=False)
+
+    def get_paths(self, room: WorldRoom) -> List[str]:
+        """Return the paths of every sound the given room might play.
+
+        That includes the ambiances of the room and its objects, and the
+        sounds of the actions of its objects and exits.
+
+        Paths are normalised in the same way as
+        :meth:`earwax.SoundManager.play_path` normalises them, so each sound
+        is only loaded once.
+
+        :param room: The room to get sounds for.
+        """
+        paths: List[str] = [str(Path(a.path)) for a in room.ambiances]
+        actions: List[Optional[WorldAction]] = []
+        obj: RoomObject
+        for obj in room.objects.values():
+            paths.extend(str(Path(a.path)) for a in obj.ambiances)
+            actions.extend(obj.actions)
+            actions.extend(
+                [
+                    obj.actions_action,
+                    obj.take_action,
+                    obj.drop_action,
+                    obj.use_action,
+                ]
+            )
+        actions.extend(x.action for x in room.exits)
+        action: Optional[WorldAction]
+        for action in actions:
+            if action is not None and action.sound is not None:
+                paths.append(str(Path(action.sound)))
+        return list(dict.fromkeys(paths))
+
+    def get_rooms(self, room: WorldRoom) -> List[WorldRoom]:
+        """Return the rooms whose sounds should be loaded, best first.
+
+        If the world is :attr:`~earwax.story.StoryWorld.lazy`, the rooms the
+        exits lead to are loaded.
+
+        :param room: The room the player is in.
+        """
+        room_ids: List[str] = [room.id]
+        room_ids.extend(x.destination_id for x in room.exits)
+        room_ids.extend(self.recent_room_ids)
+        room_id: str
+        return [
+            room.world.rooms[room_id]
+            for room_id in dict.fromkeys(room_ids)
+            if room_id in room.world.rooms
+        ]
+
+    def update(self, room: WorldRoom) -> None:
+        """Start loading the sounds around the given room.
+
+        Sounds which were queued for other rooms, but have not started
+        loading yet, are forgotten.
+
+        :param room: The room the player has just entered.
+        """
+        if room.id in self.recent_room_ids:
+            self.recent_room_ids.remove(room.id)
+        self.recent_room_ids.insert(0, room.id)
+        del self.recent_room_ids[self.max_recent_rooms + 1 :]
+        paths: List[str] = []
+        r: WorldRoom
+        for r in self.get_rooms(room):
+            paths.extend(self.get_paths(r))
+        self.queue.clear()
+        self.size = 0
+        cached: List[str] = []
+        path: str
+        for path in dict.fromkeys(paths):
+            uri: str = self.buffer_cache.get_uri("file", path)
+            buffer: Optional[Buffer] = self.buffer_cache.buffers.get(uri)
+            if buffer is None:
+                if path not in self.pending:
+                    self.queue.append(path)
+            elif self.size < self.max_size:
+                self.size += self.buffer_cache.get_size(buffer)
+                cached.append(uri)
+        with self.buffer_cache.lock:
+            # Touch the most important sounds last, so they are pruned last.
+            for uri in reversed(cached):
+                self.buffer_cache.touch(uri)
+        self.pump()
+
+    def pump(self) -> None:
+        """Start loading queued sounds, if there is room for them."""
+        while (
+            self.queue
+            and len(self.pending) < self.max_pending
+            and self.size < self.max_size
+        ):
+            self.prefetch(self.queue.pop(0))
+
+    def prefetch(self, path: str) -> ThreadedPromise:
+        """Load a sound in the background.
+
+        When the sound has loaded, :meth:`~earwax.story.RoomPrefetcher.pump`
+        is called to load the next one.
+
+        :param path: The path of the sound to load.
+        """
+        promise: ThreadedPromise = ThreadedPromise(
+            self.thread_pool, func=self.load
+        )
+        self.pending[path] = promise
+
+        @promise.event
+        def on_done(size: int) -> None:
+            self.pending.pop(path, None)
+            self.size += size
+            self.pump()
+
+        @promise.event
+        def on_error(e: Exception) -> None:
+            self.pending.pop(path, None)
+            self.logger.warning("Unable to prefetch %s: %s", path, e)
+            self.pump()
+
+        promise.run(path)
+        return promise
+
+    def load(self, path: str) -> int:
+        """Load a sound into the cache, and return its size.
+
+        This method is called by :meth:`~earwax.story.RoomPrefetcher.prefetch`
+        on a worker thread. Paths which are not files, such as directories of
+        random sounds, are skipped.
+
+        :param path: The path of the sound to load.
+        """
+        if not Path(path).is_file():
+            return 0
+        buffer: Buffer = self.buffer_cache.get_buffer("file", path)
+        return self.buffer_cache.get_size(buffer)
+
+    def clear(self) -> None:
+        """Stop loading sounds.
+
+        Sounds which have started loading cannot be stopped, but their
+        promises are cancelled.
+        """
+        self.queue.clear()
+        promise: ThreadedPromise
+        for promise in list(self.pending.values()):
+            promise.cancel()
+        self.pending.clear()
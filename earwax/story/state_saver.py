@@ -0,0 +1,243 @@
+"""Provides the StateSaver class."""
+
+from concurrent.futures import Executor
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from attr import Factory, attrib, attrs
+
+from ..mixins import DumpLoadMixin
+from ..promises import ThreadedPromise
+from ..serializers import load_data, save_data, write_atomic
+
+# The key which holds the journal sequence number in saved states.
+sequence_key: str = "journal_sequence"
+
+JournalEntry = Tuple[int, Dict[str, Any]]
+
+
+@attrs(auto_attribs=True)
+class StateSaver:
+    """Saves :class:`~earwax.story.WorldState` instances in the background.
+
+    The state is dumped on the main thread, which is cheap, because states
+    only hold primitive values. Serializing the dump, and writing it to disk,
+    happens with :attr:`~earwax.story.StateSaver.thread_pool`. Files are
+    written with :func:`~earwax.serializers.write_atomic`, so a crash never
+    leaves a half written save.
+
+    If :attr:`~earwax.story.StateSaver.journal` is ``True``, changes can be
+    appended to a journal with :meth:`~earwax.story.StateSaver.record`.
+    Appending a line to a file is much cheaper than saving the whole state,
+    so changes can be recorded every time the player moves. When the state is
+    loaded, the journal is replayed on top of the last save. Every time the
+    state is saved, entries that the save includes are removed from the
+    journal.
+
+    :ivar ~earwax.story.StateSaver.path: The file to save states to.
+
+    :ivar ~earwax.story.StateSaver.thread_pool: The executor to write files
+        with.
+
+    :ivar ~earwax.story.StateSaver.journal: Whether or not to record changes.
+
+    :ivar ~earwax.story.StateSaver.compact_after: The number of changes which
+        can be recorded before :meth:`~earwax.story.StateSaver.record` asks for
+        a full save.
+
+    :ivar ~earwax.story.StateSaver.journal_path: The file to append changes
+        to.
+
+        By default, this is :attr:`~earwax.story.StateSaver.path`, with
+        ``.journal`` added to it.
+
+    :ivar ~earwax.story.StateSaver.sequence: The sequence number of the last
+        change, or ``None`` if the files on disk have not been read yet.
+
+    :ivar ~earwax.story.StateSaver.recorded: The number of changes which have
+        been recorded since the last save.
+
+    :ivar ~earwax.story.StateSaver.saves: The number of times
+        :meth:`~earwax.story.StateSaver.save` has been called.
+
+    :ivar ~earwax.story.StateSaver.written: The number of the most recent
+        save which has been written.
+
+        If saves finish out of order, older ones are not written.
+
+    :ivar ~earwax.story.StateSaver.lock: The lock which guards the journal.
+
+        This lock is taken on the main thread, so it is never held while a
+        full save is written.
+
+    :ivar ~earwax.story.StateSaver.write_lock: The lock which makes sure only
+        one save is written at once.
+    """
+
+    path: Path
+    thread_pool: Executor = attrib(repr=False)
+    journal: bool = False
+    compact_after: int = 100
+    journal_path: Path = attrib()
+
+    @journal_path.default
+    def get_default_journal_path(instance: "StateSaver") -> Path:
+        """Add ``.journal`` to the save path."""
+        return instance.path.with_name(instance.path.name + ".journal")
+
+    sequence: Optional[int] = attrib(default=None, init=False)
+    recorded: int = attrib(default=0, init=False)
+    saves: int = attrib(default=0, init=False)
+    written: int = attrib(default=0, init=False)
+    lock: Lock = attrib(default=Factory(Lock), init=False, repr=False)
+    write_lock: Lock = attrib(default=Factory(Lock), init=False, repr=False)
+
+    def read_journal(self) -> List[JournalEntry]:
+        """Return every complete entry in the journal.
+
+        If the game crashed while an entry was being written, that entry is
+        skipped.
+        """
+        entries: List[JournalEntry] = []
+        try:
+            text: str = self.journal_path.read_text()
+        except FileNotFoundError:
+            return entries
+        line: str
+        for line in text.splitlines():
+            try:
+                entry: Dict[str, Any] = loads(line)
+                entries.append((entry["sequence"], entry["changes"]))
+            except (JSONDecodeError, KeyError, TypeError):
+                continue
+        return entries
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load the last saved state, and replay the journal on top of it.
+
+        If there is no saved state, ``None`` is returned.
+        """
+        with self.lock:
+            if not self.path.is_file():
+                self.sequence = 0
+                return None
+            data: Dict[str, Any] = load_data(self.path)
+            saved: int = data.pop(sequence_key, 0)
+            self.sequence = saved
+            value: Dict[str, Any] = data.get(DumpLoadMixin.__value_key__, {})
+            sequence: int
+            changes: Dict[str, Any]
+            for sequence, changes in self.read_journal():
+                if sequence > saved:
+                    value.update(changes)
+                    self.sequence = sequence
+            return data
+
+    def get_sequence(self) -> int:
+        """Return the sequence number of the last change.
+
+        If no files have been read yet, the existing save and journal are
+        checked first, so that new entries follow old ones.
+        """
+        if self.sequence is None:
+            sequence: int = 0
+            if self.path.is_file():
+                sequence = load_data(self.path).get(sequence_key, 0)
+            entry: JournalEntry
+            for entry in self.read_journal():
+                sequence = max(sequence, entry[0])
+            self.sequence = sequence
+        return self.sequence
+
+    def record(self, **changes: Any) -> bool:
+        """Append changes to the journal.
+
+        Returns ``True`` if :attr:`~earwax.story.StateSaver.compact_after`
+        changes have been recorded since the last save, and the state should
+        be saved again.
+
+        If :attr:`~earwax.story.StateSaver.journal` is ``False``, nothing
+        happens.
+
+        :param changes: The names of the state attributes which have changed,
+            and their new values.
+        """
+        if not self.journal:
+            return False
+        with self.lock:
+            sequence: int = self.get_sequence() + 1
+            self.sequence = sequence
+            with self.journal_path.open("a+b") as f:
+                if f.tell():
+                    # Make sure a torn entry cannot swallow this one.
+                    f.seek(-1, 2)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                entry: str = dumps({"sequence": sequence, "changes": changes})
+                f.write(entry.encode() + b"\n")
+        self.recorded += 1
+        return self.recorded >= self.compact_after
+
+    def save(self, data: Dict[str, Any]) -> ThreadedPromise:
+        """Save a dumped state in the background.
+
+        Returns a promise which has already been started, and which will be
+        done when the state has been written.
+
+        :param data: The state to save, as returned by
+            :meth:`WorldState.dump <earwax.story.WorldState.dump>`.
+        """
+        with self.lock:
+            sequence: int = self.get_sequence()
+        self.recorded = 0
+        self.saves += 1
+        promise: ThreadedPromise = ThreadedPromise(
+            self.thread_pool, func=self.write
+        )
+        promise.run({**data, sequence_key: sequence}, sequence, self.saves)
+        return promise
+
+    def write(self, data: Dict[str, Any], sequence: int, number: int) -> None:
+        """Write a state, then remove the entries it includes from the journal.
+
+        This method is called by :meth:`~earwax.story.StateSaver.save`, on a
+        worker thread.
+
+        The state is serialized and written without holding
+        :attr:`~earwax.story.StateSaver.lock`, so changes can still be
+        recorded while it is written.
+
+        :param data: The data to write.
+
+        :param sequence: The sequence number of the last change included in
+            ``data``.
+
+        :param number: The number of this save.
+        """
+        with self.write_lock:
+            if number < self.written:
+                return
+            self.written = number
+            save_data(data, self.path)
+            with self.lock:
+                entries: List[JournalEntry] = [
+                    entry
+                    for entry in self.read_journal()
+                    if entry[0] > sequence
+                ]
+                if entries:
+                    lines: List[str] = []
+                    n: int
+                    changes: Dict[str, Any]
+                    for n, changes in entries:
+                        lines.append(
+                            dumps({"sequence": n, "changes": changes})
+                        )
+                    write_atomic(
+                        self.journal_path,
+                        ("\n".join(lines) + "\n").encode(),
+                    )
+                elif self.journal_path.exists():
+                    self.journal_path.unlink()
@@ -2,7 +2,8 @@
 
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+from typing import (TYPE_CHECKING, Any, Dict, ItemsView, Iterable, Iterator,
+                    List, Optional, Tuple, Union, ValuesView)
 
 from attr import Factory, attrib, attrs
 from shortuuid import uuid
@@ -11,6 +12,7 @@ from ..credit import Credit
 from ..mixins import DumpLoadMixin
 from ..point import Point
 from ..reverb import Reverb
+from ..serializers import DataCache, load_data
 
 if TYPE_CHECKING:
     from ..game import Game
@@ -205,7 +207,8 @@ class RoomObject(StringMixin, DumpLoadMixin):
 
         If this object is picked up, the location will not change, but this
         object will be removed from the location's
-        :attr:`~earwax.story.WorldRoom.objects` dictionary.
+        :attr:`~earwax.story.WorldRoom.objects` dictionary. When it is
+        dropped, the location becomes the room it was dropped in.
     """
 
     id: str = Factory(uuid)
@@ -402,8 +405,21 @@ class WorldRoom(DumpLoadMixin, StringMixin):
         x: RoomExit = RoomExit(destination.id, **kwargs)
         x.location = self
         self.exits.append(x)
+        index: Optional[WorldIndex] = self.get_index()
+        if index is not None:
+            index.add_exit(x)
         return x
 
+    def remove_exit(self, x: RoomExit) -> None:
+        """Remove an exit from this room.
+
+        :param x: The exit to remove.
+        """
+        self.exits.remove(x)
+        index: Optional[WorldIndex] = self.get_index()
+        if index is not None:
+            index.remove_exit(x)
+
     def create_object(self, **kwargs) -> RoomObject:
         """Create and return an exit from the provided ``kwargs``.
 
@@ -415,9 +431,200 @@ class WorldRoom(DumpLoadMixin, StringMixin):
             :class:`~earwax.story.RoomObject`.
         """
         obj: RoomObject = RoomObject(**kwargs)
+        self.add_object(obj)
+        return obj
+
+    def add_object(self, obj: RoomObject) -> None:
+        """Put an object in this room.
+
+        The object's :attr:`~earwax.story.RoomObject.location` will be set to
+        this room.
+
+        :param obj: The object to add.
+        """
         obj.location = self
         self.objects[obj.id] = obj
-        return obj
+        index: Optional[WorldIndex] = self.get_index()
+        if index is not None:
+            index.add_object(obj)
+
+    def remove_object(self, obj: RoomObject) -> None:
+        """Remove an object from this room.
+
+        The object's :attr:`~earwax.story.RoomObject.location` is not
+        changed, so objects in the player's inventory remember where they were
+        taken from.
+
+        :param obj: The object to remove.
+        """
+        del self.objects[obj.id]
+        index: Optional[WorldIndex] = self.get_index()
+        if index is not None:
+            index.remove_object(obj)
+
+    def get_index(self) -> Optional["WorldIndex"]:
+        """Return the index of this room's world.
+
+        If this room has not been added to a world yet, ``None`` is returned.
+        """
+        world: Optional[StoryWorld] = getattr(self, "world", None)
+        if world is None:
+            return None
+        return world.index
+
+
+@attrs(auto_attribs=True)
+class WorldIndex:
+    """Indexes which let a world find things without searching every room.
+
+    Every :class:`~earwax.story.StoryWorld` has an instance of this class,
+    which is kept up to date as rooms are added and removed, and as exits and
+    objects are created and removed with the methods on
+    :class:`~earwax.story.WorldRoom`.
+
+    If you change the :attr:`~earwax.story.WorldRoom.name` or
+    :attr:`~earwax.story.WorldRoom.description` of a room yourself, call
+    :meth:`~earwax.story.WorldIndex.add_shadows` afterwards.
+
+    :ivar ~earwax.story.WorldIndex.objects: Every object which is in a room,
+        and the room it is in, keyed by object ID.
+
+    :ivar ~earwax.story.WorldIndex.entrances: The exits which lead to every
+        room, keyed by the ID of their destination.
+
+    :ivar ~earwax.story.WorldIndex.name_shadows: The rooms which shadow the
+        name of every room, keyed by the ID of the shadowed room.
+
+    :ivar ~earwax.story.WorldIndex.description_shadows: The rooms which shadow
+        the description of every room, keyed by the ID of the shadowed room.
+
+    :ivar ~earwax.story.WorldIndex.shadowed: The IDs of the rooms whose name
+        and description every room shadows, keyed by room ID.
+
+        This dictionary is used to remove rooms from
+        :attr:`~earwax.story.WorldIndex.name_shadows`, and
+        :attr:`~earwax.story.WorldIndex.description_shadows`.
+    """
+
+    objects: Dict[str, Tuple[RoomObject, WorldRoom]] = Factory(dict)
+    entrances: Dict[str, List[RoomExit]] = Factory(dict)
+    name_shadows: Dict[str, List[WorldRoom]] = Factory(dict)
+    description_shadows: Dict[str, List[WorldRoom]] = Factory(dict)
+    shadowed: Dict[str, Tuple[Optional[str], Optional[str]]] = Factory(dict)
+
+    def add_object(self, obj: RoomObject) -> None:
+        """Index an object, in its current location.
+
+        :param obj: The object to index.
+        """
+        self.objects[obj.id] = (obj, obj.location)
+
+    def remove_object(self, obj: RoomObject) -> None:
+        """Stop indexing an object.
+
+        :param obj: The object to forget.
+        """
+        self.objects.pop(obj.id, None)
+
+    def add_exit(self, x: RoomExit) -> None:
+        """Index an exit by its destination.
+
+        :param x: The exit to index.
+        """
+        entrances: List[RoomExit] = self.entrances.setdefault(
+            x.destination_id, []
+        )
+        e: RoomExit
+        if not any(e is x for e in entrances):
+            entrances.append(x)
+
+    def remove_exit(self, x: RoomExit) -> None:
+        """Stop indexing an exit.
+
+        :param x: The exit to forget.
+        """
+        e: RoomExit
+        entrances: List[RoomExit] = [
+            e for e in self.entrances.get(x.destination_id, []) if e is not x
+        ]
+        if entrances:
+            self.entrances[x.destination_id] = entrances
+        else:
+            self.entrances.pop(x.destination_id, None)
+
+    def add_shadows(self, room: WorldRoom) -> None:
+        """Index the rooms whose name and description ``room`` shadows.
+
+        Any shadows which were previously indexed for ``room`` are removed
+        first.
+
+        :param room: The room to index.
+        """
+        self.remove_shadows(room)
+        name_id: Optional[str] = None
+        description_id: Optional[str] = None
+        if room.name.startswith("#"):
+            name_id = room.name[1:]
+            self.name_shadows.setdefault(name_id, []).append(room)
+        if room.description.startswith("#"):
+            description_id = room.description[1:]
+            self.description_shadows.setdefault(description_id, []).append(
+                room
+            )
+        if name_id is not None or description_id is not None:
+            self.shadowed[room.id] = (name_id, description_id)
+
+    def remove_shadows(self, room: WorldRoom) -> None:
+        """Stop indexing the shadows of ``room``.
+
+        :param room: The room whose shadows should be forgotten.
+        """
+        name_id: Optional[str]
+        description_id: Optional[str]
+        name_id, description_id = self.shadowed.pop(room.id, (None, None))
+        shadows: Dict[str, List[WorldRoom]]
+        room_id: Optional[str]
+        for shadows, room_id in (
+            (self.name_shadows, name_id),
+            (self.description_shadows, description_id),
+        ):
+            if room_id is None:
+                continue
+            r: WorldRoom
+            rooms: List[WorldRoom] = [
+                r for r in shadows.get(room_id, []) if r is not room
+            ]
+            if rooms:
+                shadows[room_id] = rooms
+            else:
+                shadows.pop(room_id, None)
+
+    def add_room(self, room: WorldRoom) -> None:
+        """Index a room, and everything in it.
+
+        :param room: The room to index.
+        """
+        obj: RoomObject
+        for obj in room.objects.values():
+            self.add_object(obj)
+        x: RoomExit
+        for x in room.exits:
+            self.add_exit(x)
+        self.add_shadows(room)
+
+    def remove_room(self, room: WorldRoom) -> None:
+        """Stop indexing a room, and everything in it.
+
+        :param room: The room to forget.
+        """
+        obj: RoomObject
+        for obj in room.objects.values():
+            if self.objects.get(obj.id, (None, None))[1] is room:
+                self.remove_object(obj)
+        x: RoomExit
+        for x in room.exits:
+            self.remove_exit(x)
+        self.remove_shadows(room)
 
 
 @attrs(auto_attribs=True)
@@ -531,6 +738,112 @@ class WorldMessages(DumpLoadMixin):
         return "World messages"
 
 
+class LazyRooms(Dict[str, Any]):
+    """A dictionary of rooms which are only loaded when they are first used.
+
+    Instances of this class are created by :meth:`StoryWorld.load
+    <earwax.story.StoryWorld.load>` when ``lazy`` is ``True``. Every room
+    starts out as the dictionary it was dumped as, and is loaded by
+    ``__getitem__``, or ``get``. Checking whether or not a room exists, and
+    iterating over room IDs, does not load anything.
+
+    Calling ``values`` or ``items`` loads every room, so dumping the world
+    works as normal.
+
+    :ivar ~earwax.story.LazyRooms.world: The world these rooms belong to.
+
+    :ivar ~earwax.story.LazyRooms.names: The names of every room, keyed by
+        room ID.
+
+    :ivar ~earwax.story.LazyRooms.exit_destinations: The destination IDs of
+        the exits of every room, keyed by room ID.
+
+    :ivar ~earwax.story.LazyRooms.object_locations: The IDs of the rooms every
+        object starts in, keyed by object ID.
+    """
+
+    def __init__(
+        self, world: "StoryWorld", data: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Index the dumped rooms.
+
+        :param world: The world the rooms belong to.
+
+        :param data: The dumped rooms, keyed by room ID.
+        """
+        super().__init__(data)
+        self.world: StoryWorld = world
+        self.names: Dict[str, str] = {}
+        self.exit_destinations: Dict[str, List[str]] = {}
+        self.object_locations: Dict[str, str] = {}
+        value_key: str = WorldRoom.__value_key__
+        room_id: str
+        room_data: Dict[str, Any]
+        for room_id, room_data in data.items():
+            value: Dict[str, Any] = room_data.get(value_key, {})
+            self.names[room_id] = value.get("name", "Unnamed Room")
+            x: Dict[str, Any]
+            self.exit_destinations[room_id] = [
+                x[value_key]["destination_id"] for x in value.get("exits", [])
+            ]
+            object_id: str
+            for object_id in value.get("objects", {}):
+                self.object_locations[object_id] = room_id
+
+    def is_loaded(self, room_id: str) -> bool:
+        """Return whether or not the given room has been loaded.
+
+        :param room_id: The ID of the room to check.
+        """
+        return isinstance(super().__getitem__(room_id), WorldRoom)
+
+    def loaded(self) -> List["WorldRoom"]:
+        """Return every room which has already been loaded."""
+        value: Any
+        return [
+            value for value in super().values() if isinstance(value, WorldRoom)
+        ]
+
+    def load_room(self, room_id: str) -> "WorldRoom":
+        """Load a room, and set the locations of its objects and exits.
+
+        :param room_id: The ID of the room to load.
+        """
+        room: WorldRoom = WorldRoom.load(super().__getitem__(room_id))
+        self.world.attach_room(room)
+        super().__setitem__(room_id, room)
+        return room
+
+    def __getitem__(self, room_id: str) -> "WorldRoom":
+        """Return a room, loading it if necessary."""
+        value: Any = super().__getitem__(room_id)
+        if isinstance(value, WorldRoom):
+            return value
+        return self.load_room(room_id)
+
+    def get(self, room_id: str, default: Any = None) -> Any:
+        """Return a room, or ``default`` if it does not exist."""
+        if room_id in self:
+            return self[room_id]
+        return default
+
+    def load_all(self) -> None:
+        """Load every room."""
+        room_id: str
+        for room_id in list(self):
+            self[room_id]
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        """Load every room, and return them."""
+        self.load_all()
+        return super().values()
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        """Load every room, and return them with their IDs."""
+        self.load_all()
+        return super().items()
+
+
 @attrs(auto_attribs=True)
 class StoryWorld(DumpLoadMixin):
     """The top level world object.
@@ -587,6 +900,12 @@ class StoryWorld(DumpLoadMixin):
         Objects are mapped to these classes by way of their
         :attr:`~earwax.story.RoomObject.class_names` and
         :attr:`~earwax.story.RoomObject.classes` lists.
+
+    :ivar ~earwax.story.StoryWorld.index: The indexes used to find objects,
+        entrances and shadows.
+
+        If this world is :attr:`~earwax.story.StoryWorld.lazy`, only the
+        rooms which have been loaded are indexed.
     """
 
     game: "Game"
@@ -608,25 +927,56 @@ class StoryWorld(DumpLoadMixin):
     )
     panner_strategy: str = Factory(lambda: "HRTF")
     object_classes: List[RoomObjectClass] = Factory(list)
+    index: WorldIndex = attrib(Factory(WorldIndex), init=False, repr=False)
 
-    __excluded_attribute_names__ = ["game"]
+    __excluded_attribute_names__ = ["game", "index"]
 
     def __attrs_post_init__(self) -> None:
         """Set all the location attributes."""
         room: WorldRoom
         for room in self.rooms.values():
-            room.world = self
-            obj: RoomObject
-            for obj in room.objects.values():
-                obj.location = room
-            x: RoomExit
-            for x in room.exits:
-                x.location = room
+            self.attach_room(room)
+
+    def attach_room(self, room: WorldRoom) -> None:
+        """Set the location attributes of a room, and its contents.
+
+        The room is also added to :attr:`~earwax.story.StoryWorld.index`.
+
+        :param room: The room to attach to this world.
+        """
+        room.world = self
+        obj: RoomObject
+        for obj in room.objects.values():
+            obj.location = room
+        x: RoomExit
+        for x in room.exits:
+            x.location = room
+        self.index.add_room(room)
+
+    @property
+    def lazy(self) -> bool:
+        """Return whether or not rooms are loaded as they are used."""
+        return isinstance(self.rooms, LazyRooms)
 
     @classmethod
-    def load(cls, data: Dict[str, Any], *args) -> Any:
-        """Load credits before anything else."""
+    def load(cls, data: Dict[str, Any], *args, lazy: bool = False) -> Any:
+        """Load credits before anything else.
+
+        :param data: The data to load from.
+
+        :param args: Extra positional arguments to pass to the constructor.
+
+        :param lazy: If ``True``, rooms will not be loaded until they are
+            used. See :class:`~earwax.story.LazyRooms`.
+        """
+        rooms_data: Optional[Dict[str, Dict[str, Any]]] = None
+        if lazy:
+            value: Dict[str, Any] = dict(data.get(cls.__value_key__, {}))
+            rooms_data = value.pop("rooms", {})
+            data = {**data, cls.__value_key__: value}
         world: StoryWorld = super().load(data, *args)
+        if rooms_data is not None:
+            world.rooms = LazyRooms(world, rooms_data)
         config_data: Dict[str, Any] = data.get("config", None)
         if config_data is not None:
             world.game.config.populate_from_dict(config_data)
@@ -646,6 +996,50 @@ class StoryWorld(DumpLoadMixin):
             )
         return world
 
+    @classmethod
+    def from_filename(
+        cls,
+        filename: Path,
+        *args,
+        serializer: Optional[str] = None,
+        use_cache: bool = True,
+        lazy: bool = False,
+        cache: Optional[DataCache] = None,
+    ) -> Any:
+        """Load a world, using a cache if possible.
+
+        Unless ``serializer`` is given, or ``use_cache`` is ``False``, the
+        world's data is loaded through a :class:`~earwax.DataCache` stored
+        next to ``filename``. If the cache is stale, it is rebuilt with the
+        game's ``'cpu'`` executor, since encoding a large world keeps the
+        processor busy. The :attr:`~earwax.DataCache.future` of the cache can
+        be used to wait for it.
+
+        :param filename: The path to load from.
+
+        :param args: Extra positional arguments to pass to the ``load``
+            constructor. The first must be the game.
+
+        :param serializer: The name of the serializer to load with.
+
+        :param use_cache: Whether or not to use a cache.
+
+        :param lazy: Whether or not to load rooms as they are used.
+
+        :param cache: The cache to load through.
+
+            If this value is ``None``, a new cache for ``filename`` is used.
+        """
+        data: Dict[str, Any]
+        if serializer is not None or not use_cache:
+            data = load_data(filename, serializer=serializer)
+        else:
+            game: "Game" = args[0]
+            if cache is None:
+                cache = DataCache(filename)
+            data = cache.load(executor=game.get_executor("cpu"))
+        return cls.load(data, *args, lazy=lazy)
+
     @property
     def initial_room(self) -> Optional[WorldRoom]:
         """Return the initial room for this world."""
@@ -653,11 +1047,124 @@ class StoryWorld(DumpLoadMixin):
             return self.rooms[self.initial_room_id]
         return None
 
-    def all_objects(self) -> Iterator[RoomObject]:
-        """Return a generator of every object contained by this world."""
+    def find_rooms(self, object_ids: Iterable[str]) -> List[WorldRoom]:
+        """Return the rooms which may contain any of the given objects.
+
+        If this world is :attr:`~earwax.story.StoryWorld.lazy`, every loaded
+        room is returned, along with the rooms the objects started in.
+        Otherwise, every room is returned.
+
+        :param object_ids: The IDs of the objects to look for.
+        """
+        rooms: Dict[str, Any] = self.rooms
+        if not isinstance(rooms, LazyRooms):
+            return list(rooms.values())
+        room_ids: List[str] = [room.id for room in rooms.loaded()]
+        object_id: str
+        for object_id in object_ids:
+            location: Optional[str] = rooms.object_locations.get(object_id)
+            if location is not None and location not in room_ids:
+                room_ids.append(location)
+        room_id: str
+        return [rooms[room_id] for room_id in room_ids if room_id in rooms]
+
+    def get_exit_destinations(self) -> Dict[str, List[str]]:
+        """Return the destination IDs of every room's exits.
+
+        Rooms are not loaded if this world is
+        :attr:`~earwax.story.StoryWorld.lazy`.
+        """
+        rooms: Dict[str, Any] = self.rooms
+        if isinstance(rooms, LazyRooms):
+            room_id: str
+            return {
+                room_id: [x.destination_id for x in rooms[room_id].exits]
+                if rooms.is_loaded(room_id)
+                else rooms.exit_destinations[room_id]
+                for room_id in rooms
+            }
         room: WorldRoom
-        for room in self.rooms.values():
-            yield from room.objects.values()
+        x: RoomExit
+        return {
+            room.id: [x.destination_id for x in room.exits]
+            for room in rooms.values()
+        }
+
+    def get_object(self, object_id: str) -> Optional[RoomObject]:
+        """Return the object with the given ID, if it is in a room.
+
+        If this world is :attr:`~earwax.story.StoryWorld.lazy`, and the object
+        has not been found, the room it started in is loaded.
+
+        :param object_id: The ID of the object to return.
+        """
+        entry: Optional[Tuple[RoomObject, WorldRoom]] = self.index.objects.get(
+            object_id
+        )
+        rooms: Dict[str, Any] = self.rooms
+        if entry is None and isinstance(rooms, LazyRooms):
+            room_id: Optional[str] = rooms.object_locations.get(object_id)
+            if (
+                room_id is not None
+                and room_id in rooms
+                and not rooms.is_loaded(room_id)
+            ):
+                rooms.load_room(room_id)
+                entry = self.index.objects.get(object_id)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def get_entrances(self, room_id: str) -> List[RoomExit]:
+        """Return every exit which leads to the given room.
+
+        If this world is :attr:`~earwax.story.StoryWorld.lazy`, any rooms with
+        exits to the given room are loaded first.
+
+        :param room_id: The ID of the destination room.
+        """
+        rooms: Dict[str, Any] = self.rooms
+        if isinstance(rooms, LazyRooms):
+            other_id: str
+            destination_ids: List[str]
+            for other_id, destination_ids in rooms.exit_destinations.items():
+                if room_id in destination_ids and not rooms.is_loaded(
+                    other_id
+                ):
+                    rooms.load_room(other_id)
+        return list(self.index.entrances.get(room_id, []))
+
+    def get_shadows(
+        self, room_id: str
+    ) -> Tuple[List[WorldRoom], List[WorldRoom]]:
+        """Return the rooms which shadow the given room.
+
+        The return value is a tuple of the rooms which shadow the given room's
+        name, and the rooms which shadow its description.
+
+        If this world is :attr:`~earwax.story.StoryWorld.lazy`, every room is
+        loaded first.
+
+        :param room_id: The ID of the shadowed room.
+        """
+        if isinstance(self.rooms, LazyRooms):
+            self.rooms.load_all()
+        return (
+            list(self.index.name_shadows.get(room_id, [])),
+            list(self.index.description_shadows.get(room_id, [])),
+        )
+
+    def all_objects(self) -> Iterator[RoomObject]:
+        """Return a generator of every object contained by this world.
+
+        If this world is :attr:`~earwax.story.StoryWorld.lazy`, every room is
+        loaded first.
+        """
+        if isinstance(self.rooms, LazyRooms):
+            self.rooms.load_all()
+        entry: Tuple[RoomObject, WorldRoom]
+        for entry in list(self.index.objects.values()):
+            yield entry[0]
 
     def add_room(
         self, room: WorldRoom, initial: Optional[bool] = None
@@ -675,10 +1182,21 @@ class StoryWorld(DumpLoadMixin):
             ``None``.
         """
         self.rooms[room.id] = room
-        room.world = self
+        self.attach_room(room)
         if initial or (initial is None and self.initial_room_id is None):
             self.initial_room_id = room.id
 
+    def remove_room(self, room: WorldRoom) -> None:
+        """Remove a room from this world.
+
+        No checks are performed, so any exits leading to the room will be
+        broken.
+
+        :param room: The room to remove.
+        """
+        del self.rooms[room.id]
+        self.index.remove_room(room)
+
     def __str__(self) -> str:
         """Return a string."""
         return f"World({self.name!r})"
@@ -5,6 +5,8 @@ from typing import Callable
 from attr import Factory, attrib, attrs
 from pyglet.clock import schedule_once, unschedule
 
+from .profiler import callable_name, profiled
+
 IntervalFunction = Callable[[], float]
 TaskFunction = Callable[[float], None]
 
@@ -51,6 +53,7 @@ class Task:
         if immediately:
             self.func(0.0)
 
+    @profiled(get_name=lambda t: "Task: %s" % callable_name(t.func))
     def _run(self, dt: float) -> None:
         """Run :attr:`~earwax.Task.func`, and reschedule this function.
 
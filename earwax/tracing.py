@@ -0,0 +1,334 @@
+"""Provides a tracer which writes Chrome trace event files."""
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from json import dumps
+from os import getpid
+from pathlib import Path
+from threading import current_thread, get_ident
+from time import perf_counter
+from typing import (TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List,
+                    Optional, TypeVar)
+
+from attr import Factory, attrib, attrs
+
+if TYPE_CHECKING:
+    from .game import Game
+
+CallbackType = TypeVar("CallbackType", bound=Callable[..., Any])
+ArgsFunction = Callable[..., Dict[str, Any]]
+TraceEvent = Dict[str, Any]
+
+# The tracer which is currently recording, if any.
+#
+# This variable is set by ``Tracer.start``, and cleared by ``Tracer.stop``.
+# When it is ``None``, traced code only pays for one global lookup.
+active_tracer: Optional["Tracer"] = None
+
+
+@attrs(auto_attribs=True)
+class Tracer:
+    """Record engine events in the Chrome trace event format.
+
+    The resulting files can be opened with ``chrome://tracing``, or
+    `Perfetto <https://ui.perfetto.dev/>`__::
+
+        tracer: Tracer = Tracer(game, path=Path('trace.json'))
+        tracer.start()
+        game.run(window)
+        # The trace has now been written to trace.json.
+
+    While a tracer is running, the following are recorded:
+
+    * Level pushes, pops, and replacements.
+
+    * Calls to :meth:`earwax.SoundManager.play_path`.
+
+    * Calls to :meth:`earwax.BufferCache.get_buffer`, and the time taken to
+        decode buffers which were not cached.
+
+    * Action executions.
+
+    * The life of every promise, from when it is run, until it is done,
+        fails, or is cancelled. The functions run by
+        :class:`earwax.ThreadedPromise` instances are also recorded on the
+        threads which run them.
+
+    * The number of bytes received by every
+        :meth:`earwax.NetworkConnection.poll`.
+
+    Events are stored in a ring buffer, so only the most recent
+    :attr:`~earwax.Tracer.capacity` events are kept.
+
+    :ivar ~earwax.Tracer.game: The game to trace.
+
+    :ivar ~earwax.Tracer.path: The path to save the trace to when
+        :meth:`~earwax.Tracer.stop` is called.
+
+        If this value is ``None``, the trace will not be saved automatically.
+
+    :ivar ~earwax.Tracer.capacity: The maximum number of events to keep.
+
+    :ivar ~earwax.Tracer.events: The recorded events, oldest first.
+
+    :ivar ~earwax.Tracer.thread_names: The names of the threads which have
+        recorded events.
+
+    :ivar ~earwax.Tracer.pid: The process ID to record events under.
+
+    :ivar ~earwax.Tracer.started: The ``perf_counter`` time that timestamps
+        are relative to.
+    """
+
+    game: "Game"
+    path: Optional[Path] = None
+    capacity: int = 100000
+
+    events: Deque[TraceEvent] = attrib(init=False, repr=False)
+
+    @events.default
+    def get_default_events(instance: "Tracer") -> Deque[TraceEvent]:
+        """Return a ring buffer.
+
+        :param instance: The tracer to return the buffer for.
+        """
+        return deque(maxlen=instance.capacity)
+
+    thread_names: Dict[int, str] = attrib(
+        default=Factory(dict), init=False, repr=False
+    )
+    pid: int = attrib(default=Factory(getpid), init=False, repr=False)
+    started: float = attrib(
+        default=Factory(perf_counter), init=False, repr=False
+    )
+
+    @property
+    def running(self) -> bool:
+        """Return whether or not this tracer is recording."""
+        return active_tracer is self
+
+    def start(self) -> None:
+        """Start recording.
+
+        This tracer is also stored as the game's :attr:`~earwax.Game.tracer`.
+        """
+        global active_tracer
+        if active_tracer is not None:
+            raise RuntimeError("%r is already running." % active_tracer)
+        active_tracer = self
+        self.game.tracer = self
+
+    def stop(self) -> None:
+        """Stop recording.
+
+        If :attr:`~earwax.Tracer.path` is not ``None``, the trace will be
+        saved there.
+        """
+        global active_tracer
+        if active_tracer is self:
+            active_tracer = None
+        if self.path is not None:
+            self.save(self.path)
+
+    def clear(self) -> None:
+        """Forget all recorded events."""
+        self.events.clear()
+        self.thread_names.clear()
+
+    def now(self) -> float:
+        """Return the current timestamp in microseconds."""
+        return (perf_counter() - self.started) * 1000000
+
+    def add_event(
+        self, phase: str, name: str, category: str, **kwargs
+    ) -> TraceEvent:
+        """Add an event to :attr:`~earwax.Tracer.events`.
+
+        This method is thread safe.
+
+        :param phase: The ``ph`` value of the event, as described in the
+            trace event format documentation.
+
+        :param name: The name of the event.
+
+        :param category: The category of the event.
+
+        :param kwargs: Extra values for the event.
+
+            If no ``ts`` value is given, the current time will be used.
+        """
+        tid: int = get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = current_thread().name
+        event: TraceEvent = dict(
+            ph=phase, name=name, cat=category, pid=self.pid, tid=tid
+        )
+        event.update(kwargs)
+        if "ts" not in event:
+            event["ts"] = self.now()
+        self.events.append(event)
+        return event
+
+    def complete(
+        self, name: str, category: str, start: float, **args
+    ) -> TraceEvent:
+        """Add a span which started at ``start``, and ends now.
+
+        :param name: The name of the span.
+
+        :param category: The category of the span.
+
+        :param start: The timestamp the span started at, as returned by
+            :meth:`~earwax.Tracer.now`.
+
+        :param args: Extra information to store with the span.
+        """
+        return self.add_event(
+            "X", name, category, ts=start, dur=self.now() - start, args=args
+        )
+
+    def instant(self, name: str, category: str, **args) -> TraceEvent:
+        """Add an instant event.
+
+        :param name: The name of the event.
+
+        :param category: The category of the event.
+
+        :param args: Extra information to store with the event.
+        """
+        return self.add_event("i", name, category, s="t", args=args)
+
+    def begin_async(
+        self, name: str, category: str, id: int, **args
+    ) -> TraceEvent:
+        """Start a span which may end on a later frame.
+
+        :param name: The name of the span.
+
+        :param category: The category of the span.
+
+        :param id: A number to match this event with the call to
+            :meth:`~earwax.Tracer.end_async`.
+
+        :param args: Extra information to store with the event.
+        """
+        return self.add_event("b", name, category, id=id, args=args)
+
+    def end_async(
+        self, name: str, category: str, id: int, **args
+    ) -> TraceEvent:
+        """End a span which was started with :meth:`begin_async`.
+
+        :param name: The name of the span.
+
+        :param category: The category of the span.
+
+        :param id: The same ``id`` that was passed to
+            :meth:`~earwax.Tracer.begin_async`.
+
+        :param args: Extra information to store with the event.
+        """
+        return self.add_event("e", name, category, id=id, args=args)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args) -> Iterator[None]:
+        """Record the time taken by the body of a ``with`` statement.
+
+        :param name: The name of the span.
+
+        :param category: The category of the span.
+
+        :param args: Extra information to store with the span.
+        """
+        start: float = self.now()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, **args)
+
+    def wrap(
+        self, func: CallbackType, name: str, category: str
+    ) -> CallbackType:
+        """Return a function which records a span every time it is called.
+
+        This is useful for recording work done on other threads.
+
+        :param func: The function to wrap.
+
+        :param name: The name of the span.
+
+        :param category: The category of the span.
+        """
+
+        @wraps(func)
+        def inner(*args, **kwargs) -> Any:
+            with self.span(name, category):
+                return func(*args, **kwargs)
+
+        return inner  # type: ignore[return-value]
+
+    def dump(self) -> Dict[str, Any]:
+        """Return the trace as a dictionary.
+
+        Thread names are included as metadata events.
+        """
+        tid: int
+        name: str
+        metadata: List[TraceEvent] = [
+            dict(
+                ph="M",
+                name="thread_name",
+                pid=self.pid,
+                tid=tid,
+                args=dict(name=name),
+            )
+            for tid, name in self.thread_names.items()
+        ]
+        return dict(
+            traceEvents=metadata + list(self.events), displayTimeUnit="ms"
+        )
+
+    def save(self, path: Path) -> None:
+        """Save the trace as JSON.
+
+        :param path: The path to write to.
+        """
+        path.write_text(dumps(self.dump()))
+
+
+def traced(
+    name: Optional[str] = None,
+    category: str = "earwax",
+    get_args: Optional[ArgsFunction] = None,
+) -> Callable[[CallbackType], CallbackType]:
+    """Decorate a method, so its calls are recorded by :class:`earwax.Tracer`.
+
+    :param name: The name of the span.
+
+        If this value is ``None``, the function's qualified name will be used.
+
+    :param category: The category of the span.
+
+    :param get_args: A function which will be called with the same arguments
+        as the decorated method, and should return a dictionary of extra
+        information to store with the span.
+    """
+
+    def inner(func: CallbackType) -> CallbackType:
+        span_name: str = func.__qualname__ if name is None else name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            tracer: Optional[Tracer] = active_tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            extra: Dict[str, Any] = (
+                {} if get_args is None else get_args(*args, **kwargs)
+            )
+            with tracer.span(span_name, category, **extra):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return inner
@@ -72,16 +72,31 @@ class Track:
         path = random_file(path)
         return cls("file", str(path), type)
 
-    def play(self, manager: SoundManager, **kwargs) -> None:
+    def play(
+        self, manager: SoundManager, use_cache: bool = False, **kwargs
+    ) -> None:
         """Play this track on a loop.
 
         :param manager: The sound manager to play through.
 
+        :param use_cache: Whether or not to play a cached buffer, if the
+            manager's cache has one.
+
+            If this value is ``True``, the sound is played with
+            :meth:`~earwax.SoundManager.play_cached`.
+
         :param kwargs: The extra keyword arguments to send to the given
             manager's :meth:`~earwax.SoundManager.play_stream` method.
         """
         kwargs.setdefault("looping", True)
-        self.sound = manager.play_stream(self.protocol, self.path, **kwargs)
+        if use_cache:
+            self.sound = manager.play_cached(
+                self.protocol, self.path, **kwargs
+            )
+        else:
+            self.sound = manager.play_stream(
+                self.protocol, self.path, **kwargs
+            )
 
     def stop(self) -> None:
         """Stop this track playing."""
@@ -2,8 +2,11 @@
 
 from datetime import timedelta
 from pathlib import Path
-from random import choice
-from typing import List, Optional
+from random import Random, SystemRandom
+from typing import Dict, List, Optional
+
+random_stream_names: List[str] = ["die", "point", "box", "files"]
+random_streams: Dict[str, Random] = {}
 
 
 def nearest_square(n: int, allow_higher: bool = False) -> int:
@@ -141,9 +144,55 @@ def format_timedelta(td: timedelta, *args, **kwargs) -> str:
 def random_file(path: Path) -> Path:
     """Call recursively until a file is reached.
 
+    Directory entries are sorted before one is chosen, since the order they
+    are listed in depends on the file system, and would stop seeded choices
+    from being replayed.
+
     :param path: The path to start with.
     """
     if path.is_dir():
-        path = choice(list(path.iterdir()))
+        path = get_random("files").choice(sorted(path.iterdir()))
         return random_file(path)
     return path
+
+
+def get_random(name: str) -> Random:
+    """Return the random number generator with the given name.
+
+    Earwax uses a separate generator for each kind of random decision it
+    makes, so that a recorded session can be replayed exactly by
+    :meth:`~earwax.utils.seed_random`:
+
+    * ``'die'``: Used by :meth:`earwax.Die.roll`.
+
+    * ``'point'``: Used by :meth:`earwax.Point.random`.
+
+    * ``'box'``: Used to decide when doors close in :meth:`earwax.Box.open`.
+
+    * ``'files'``: Used by :meth:`~earwax.utils.random_file`.
+
+    :param name: The name of the generator.
+    """
+    if name not in random_streams:
+        random_streams[name] = Random()
+    return random_streams[name]
+
+
+def seed_random(seeds: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Seed the generators returned by :meth:`~earwax.utils.get_random`.
+
+    Returns the seeds that were used.
+
+    :param seeds: A dictionary of ``{name: seed}`` pairs.
+
+        If this value is ``None``, a new seed will be chosen for every name in
+        ``random_stream_names``.
+    """
+    if seeds is None:
+        r: SystemRandom = SystemRandom()
+        seeds = {name: r.getrandbits(32) for name in random_stream_names}
+    name: str
+    seed: int
+    for name, seed in seeds.items():
+        get_random(name).seed(seed)
+    return seeds
@@ -0,0 +1,135 @@
+"""Test the AssetStore class."""
+
+import os
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict
+
+from earwax.cmd.asset_store import AssetStore
+
+
+def test_init(tmp_path: Path) -> None:
+    """Test initialisation."""
+    s: AssetStore = AssetStore(tmp_path)
+    assert s.directory == tmp_path
+    assert s.link is False
+    assert s.jobs is None
+    assert s.manifest_path == tmp_path / "assets.json"
+    assert s.hashes == {}
+    assert s.assets == set()
+    assert s.worlds == {}
+    assert s.copied == 0
+    assert s.skipped == 0
+
+
+def test_gather(tmp_path: Path) -> None:
+    """Test that identical files are stored once."""
+    first: Path = tmp_path / "first.wav"
+    first.write_bytes(b"sound")
+    second: Path = tmp_path / "second.WAV"
+    second.write_bytes(b"sound")
+    other: Path = tmp_path / "other.ogg"
+    other.write_bytes(b"other")
+    folder: Path = tmp_path / "random"
+    folder.mkdir()
+    (folder / "1.wav").write_bytes(b"one")
+    (folder / "2.wav").write_bytes(b"two")
+    s: AssetStore = AssetStore(tmp_path / "sounds", jobs=2)
+    paths: Dict[str, str] = s.gather(
+        [str(first), str(second), str(other), str(first), str(folder)]
+    )
+    name: str = sha256(b"sound").hexdigest() + ".wav"
+    assert paths[str(first)] == str(s.directory / name)
+    assert paths[str(second)] == paths[str(first)]
+    assert Path(paths[str(first)]).read_bytes() == b"sound"
+    assert Path(paths[str(other)]).read_bytes() == b"other"
+    stored: Path = Path(paths[str(folder)])
+    assert stored.is_dir()
+    assert sorted(p.name for p in stored.iterdir()) == ["1.wav", "2.wav"]
+    assert (stored / "2.wav").read_bytes() == b"two"
+    assert s.copied == 4
+    assert s.skipped == 0
+    assert len(s.assets) == 3
+    assert not list(s.directory.glob("*.tmp"))
+
+
+def test_incremental(tmp_path: Path) -> None:
+    """Test that unchanged files are not hashed or copied again."""
+    source: Path = tmp_path / "sound.wav"
+    source.write_bytes(b"old")
+    s: AssetStore = AssetStore(tmp_path / "sounds")
+    old: str = s.gather([str(source)])[str(source)]
+    s.claim("world.yaml")
+    s.save_manifest()
+    s = AssetStore(tmp_path / "sounds")
+    assert s.assets == {Path(old).name}
+    assert s.worlds == {"world.yaml": {Path(old).name}}
+    assert s.gather([str(source)]) == {str(source): old}
+    assert s.copied == 0
+    assert s.skipped == 1
+    # The saved hash is trusted while the size and time are the same.
+    s.hashes[str(source.resolve())]["sha256"] = "fake"
+    assert s.hash_file(source) == "fake"
+    source.write_bytes(b"new sound")
+    s.save_manifest()
+    s = AssetStore(tmp_path / "sounds")
+    new: str = s.gather([str(source)])[str(source)]
+    assert new != old
+    assert Path(new).read_bytes() == b"new sound"
+    s.claim("world.yaml")
+    assert s.prune() == [Path(old).name]
+    assert not Path(old).exists()
+    assert Path(new).exists()
+    assert s.assets == {Path(new).name}
+
+
+def test_prune(tmp_path: Path) -> None:
+    """Test that only assets made by the store are pruned."""
+    directory: Path = tmp_path / "sounds"
+    directory.mkdir()
+    mine: Path = directory / "readme.txt"
+    mine.write_text("Not an asset.")
+    s: AssetStore = AssetStore(directory)
+    s.assets.add("missing.wav")
+    assert s.prune() == ["missing.wav"]
+    assert mine.is_file()
+
+
+def test_worlds(tmp_path: Path) -> None:
+    """Test that assets used by other worlds are not pruned."""
+    shared: Path = tmp_path / "shared.wav"
+    shared.write_bytes(b"shared")
+    first: Path = tmp_path / "first.wav"
+    first.write_bytes(b"first")
+    second: Path = tmp_path / "second.wav"
+    second.write_bytes(b"second")
+    directory: Path = tmp_path / "sounds"
+    s: AssetStore = AssetStore(directory)
+    names: Dict[str, str] = s.gather([str(shared), str(first)])
+    s.claim("first.yaml")
+    s.save_manifest()
+    s = AssetStore(directory)
+    names.update(s.gather([str(second)]))
+    s.claim("second.yaml")
+    # The first world's assets were not gathered this time, but are kept.
+    assert s.prune() == []
+    s.save_manifest()
+    s = AssetStore(directory)
+    s.gather([str(shared)])
+    s.claim("first.yaml")
+    assert s.prune() == [Path(names[str(first)]).name]
+    assert Path(names[str(shared)]).is_file()
+    assert Path(names[str(second)]).is_file()
+    s.claim("second.yaml")
+    assert s.prune() == [Path(names[str(second)]).name]
+
+
+def test_link(tmp_path: Path) -> None:
+    """Test hard linking."""
+    source: Path = tmp_path / "sound.wav"
+    source.write_bytes(b"sound")
+    s: AssetStore = AssetStore(tmp_path / "sounds", link=True)
+    stored: Path = Path(s.gather([str(source)])[str(source)])
+    assert stored.read_bytes() == b"sound"
+    if os.name == "posix":
+        assert stored.stat().st_ino == source.stat().st_ino
@@ -0,0 +1,103 @@
+"""Test replicating box level state."""
+
+from typing import List
+
+from earwax import (Box, BoxLevel, Door, Game, Point, ReplicatedDoor,
+                    ReplicatedPerspective, Replicator)
+
+
+def make_world(game: Game) -> BoxLevel:
+    """Return a level with a door in it."""
+    level: BoxLevel = BoxLevel(game)
+    level.add_box(Box(game, Point(0, 0, 0), Point(10, 10, 0)))
+    level.add_box(
+        Box(game, Point(11, 0, 0), Point(11, 0, 0), data=Door(open=False))
+    )
+    return level
+
+
+def make_replicator(level: BoxLevel) -> Replicator:
+    """Return a replicator for a level made by ``make_world``."""
+    r: Replicator = Replicator(history_size=4)
+    r.add(1, ReplicatedPerspective(level))
+    r.add(2, ReplicatedDoor(level.boxes[1]))
+    return r
+
+
+def test_replication() -> None:
+    """Test sending deltas from a server to a client."""
+    server_level: BoxLevel = make_world(Game())
+    client_level: BoxLevel = make_world(Game())
+    server: Replicator = make_replicator(server_level)
+    client: Replicator = make_replicator(client_level)
+    assert server.tick() == 1
+    full: bytes = server.encode_for("client")
+    assert client.apply(full) == 1
+    server.acknowledge("client", 1)
+    # Nothing has changed.
+    server.tick()
+    empty: bytes = server.encode_for("client")
+    assert len(empty) < len(full)
+    assert client.apply(empty) == 2
+    server_level.move()()
+    server_level.turn(90)()
+    server.tick()
+    moved: bytes = server.encode_for("client")
+    # Clients which have acknowledged the same tick share data.
+    assert server.encode(1) is moved
+    client.apply(moved)
+    assert client_level.coordinates == Point(0, 1, 0)
+    assert client_level.bearing == 90
+    server_level.boxes[1].open()
+    server.tick()
+    client.apply(server.encode_for("client"))
+    door: Box = client_level.boxes[1]
+    assert isinstance(door.data, Door)
+    assert door.data.open is True
+    # The client never acknowledged, so the delta included the move too.
+    assert server.encode_for("client") == server.encode(1)
+    assert client.dirty == set()
+
+
+def test_quantisation() -> None:
+    """Test that tiny movements are not replicated."""
+    level: BoxLevel = make_world(Game())
+    r: Replicator = make_replicator(level)
+    r.tick()
+    r.acknowledge("client", 1)
+    level.set_coordinates(Point(0.001, 0, 0))
+    r.mark_dirty(1)
+    r.tick()
+    assert r.history[-1][0] == 1
+    level.set_coordinates(Point(0.5, 0.25, 0))
+    r.mark_all_dirty()
+    r.tick()
+    client_level: BoxLevel = make_world(Game())
+    client: Replicator = make_replicator(client_level)
+    client.apply(r.encode_for("client"))
+    assert client_level.coordinates == Point(0.5, 0.25, 0)
+
+
+def test_history() -> None:
+    """Test that old clients get full snapshots, and removals are sent."""
+    level: BoxLevel = make_world(Game())
+    r: Replicator = make_replicator(level)
+    r.tick()
+    ticks: List[int] = []
+    for _ in range(5):
+        level.turn(45)()
+        ticks.append(r.tick())
+    assert len(r.history) == 4
+    # Tick 1 has been forgotten.
+    assert r.encode(1) == r.encode(0)
+    assert r.encode(1) != r.encode(2)
+    client_level: BoxLevel = make_world(Game())
+    client: Replicator = make_replicator(client_level)
+    r.remove(2)
+    r.tick()
+    client.apply(r.encode(ticks[-1]))
+    assert list(client.entities) == [1]
+    client = make_replicator(client_level)
+    client.apply(r.encode(0))
+    assert list(client.entities) == [1]
+    assert client_level.bearing == level.bearing
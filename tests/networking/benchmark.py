@@ -0,0 +1,266 @@
+"""Benchmark networking over loopback sockets.
+
+An echo server and a client both run in this process, and are driven by a
+:class:`earwax.HeadlessRunner`, so every byte goes through the same poll loop
+that games use.
+
+Run this module to write results as JSON::
+
+    python -m tests.networking.benchmark --output results.json
+
+Results from different versions can then be compared, to see how changes to
+the networking code affect performance.
+"""
+
+from argparse import ArgumentParser
+from collections import deque
+from importlib.metadata import PackageNotFoundError, version
+from json import dumps
+from pathlib import Path
+from platform import platform, python_version
+from time import perf_counter, process_time
+from typing import Any, Deque, Dict, List, Optional
+
+from attr import Factory, attrib, attrs
+
+from earwax import (Framing, Game, HeadlessRunner, NetworkConnection,
+                    NetworkServer)
+
+default_sizes: List[int] = [16, 256, 4096, 65536]
+default_framings: List[Framing] = [
+    Framing.raw,
+    Framing.lines,
+    Framing.length_prefixed,
+]
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Return the given percentile of a sorted list.
+
+    :param values: The sorted values.
+
+    :param p: The percentile to return, from ``0`` to ``100``.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+@attrs(auto_attribs=True)
+class BenchmarkResult:
+    """The results of running one benchmark.
+
+    :ivar ~BenchmarkResult.framing: The framing which was used.
+
+    :ivar ~BenchmarkResult.size: The size of each message.
+
+    :ivar ~BenchmarkResult.messages: The number of messages which were echoed.
+
+    :ivar ~BenchmarkResult.seconds: The wall clock time taken.
+
+    :ivar ~BenchmarkResult.cpu_seconds: The CPU time taken.
+
+    :ivar ~BenchmarkResult.latencies: The round trip time of every message,
+        sorted.
+
+        For raw data, messages are not delimited, so this list is empty, and
+        no latency is reported.
+    """
+
+    framing: Framing
+    size: int
+    messages: int
+    seconds: float
+    cpu_seconds: float
+    latencies: List[float] = attrib(default=Factory(list), repr=False)
+
+    def dump(self) -> Dict[str, Any]:
+        """Return this result as a dictionary."""
+        megabytes: float = self.messages * self.size * 2 / (1024 * 1024)
+        latency: Optional[Dict[str, float]] = None
+        if self.latencies:
+            latency = {
+                "p50": percentile(self.latencies, 50),
+                "p90": percentile(self.latencies, 90),
+                "p99": percentile(self.latencies, 99),
+                "max": self.latencies[-1],
+            }
+        return {
+            "framing": self.framing.name,
+            "size": self.size,
+            "messages": self.messages,
+            "seconds": self.seconds,
+            "messages_per_second": self.messages / self.seconds,
+            "megabytes_per_second": megabytes / self.seconds,
+            "cpu_seconds_per_megabyte": self.cpu_seconds / megabytes,
+            "latency": latency,
+        }
+
+
+def run_benchmark(
+    framing: Framing, size: int, messages: int, window: int = 64
+) -> BenchmarkResult:
+    """Echo messages through a loopback server.
+
+    :param framing: The framing to use on both ends.
+
+    :param size: The size of each message.
+
+    :param messages: The number of messages to send.
+
+    :param window: The largest number of messages which can be waiting to be
+        echoed back.
+    """
+    server: NetworkServer = NetworkServer(framing=framing)
+    con: NetworkConnection = NetworkConnection(framing=framing)
+    payload: bytes = b"x" * size
+    message: bytes = con.frame(payload)
+    sent_times: Deque[float] = deque()
+    latencies: List[float] = []
+    state: Dict[str, int] = {"sent": 0, "received": 0, "bytes": 0}
+
+    @server.event
+    def on_data(client: NetworkConnection, data: bytes) -> None:
+        client.send(data)
+
+    @server.event
+    def on_line(client: NetworkConnection, line: memoryview) -> None:
+        client.send_message(bytes(line))
+
+    @server.event
+    def on_message(client: NetworkConnection, msg: memoryview) -> None:
+        client.send_message(bytes(msg))
+
+    def received() -> None:
+        latencies.append(perf_counter() - sent_times.popleft())
+        state["received"] += 1
+
+    @con.event("on_data")
+    def on_echo(data: bytes) -> None:
+        state["bytes"] += len(data)
+        while state["bytes"] >= size:
+            state["bytes"] -= size
+            received()
+
+    con.push_handlers(
+        on_line=lambda line: received(), on_message=lambda msg: received()
+    )
+
+    def pump() -> bool:
+        while (
+            state["sent"] < messages
+            and state["sent"] - state["received"] < window
+        ):
+            sent_times.append(perf_counter())
+            con.send(message)
+            state["sent"] += 1
+        return state["received"] == messages
+
+    with HeadlessRunner(Game()) as r:
+        server.listen()
+        con.connect(*server.address)
+        started: float = perf_counter()
+        cpu_started: float = process_time()
+        if not r.run_until(pump, timeout=3600.0):
+            raise RuntimeError("Benchmark did not finish.")
+        seconds: float = perf_counter() - started
+        cpu_seconds: float = process_time() - cpu_started
+        con.close()
+        server.close()
+    if framing is Framing.raw:
+        # Raw reads are not aligned with messages.
+        latencies = []
+    return BenchmarkResult(
+        framing, size, messages, seconds, cpu_seconds, sorted(latencies)
+    )
+
+
+def run_benchmarks(
+    sizes: Optional[List[int]] = None,
+    framings: Optional[List[Framing]] = None,
+    megabytes: float = 8.0,
+    max_messages: int = 20000,
+) -> Dict[str, Any]:
+    """Run every combination of message size and framing.
+
+    Returns a dictionary which can be saved as JSON.
+
+    :param sizes: The message sizes to try.
+
+    :param framings: The framings to try.
+
+    :param megabytes: The amount of data to send for each benchmark.
+
+    :param max_messages: The most messages to send for each benchmark.
+    """
+    if sizes is None:
+        sizes = default_sizes
+    if framings is None:
+        framings = default_framings
+    earwax_version: str
+    try:
+        earwax_version = version("earwax")
+    except PackageNotFoundError:
+        earwax_version = "unknown"
+    results: List[Dict[str, Any]] = []
+    for framing in framings:
+        for size in sizes:
+            messages: int = max(
+                1, min(max_messages, int(megabytes * 1024 * 1024 / size))
+            )
+            results.append(run_benchmark(framing, size, messages).dump())
+    return {
+        "earwax": earwax_version,
+        "python": python_version(),
+        "platform": platform(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run benchmarks from the command line."""
+    parser: ArgumentParser = ArgumentParser(
+        description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="The file to write results to."
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        action="append",
+        dest="sizes",
+        help="A message size to try. Can be given more than once.",
+    )
+    parser.add_argument(
+        "-f",
+        "--framing",
+        choices=[f.name for f in Framing],
+        action="append",
+        dest="framings",
+        help="A framing to try. Can be given more than once.",
+    )
+    parser.add_argument(
+        "-m",
+        "--megabytes",
+        type=float,
+        default=8.0,
+        help="The amount of data to send for each benchmark.",
+    )
+    args = parser.parse_args()
+    framings: Optional[List[Framing]] = None
+    if args.framings:
+        framings = [Framing[name] for name in args.framings]
+    data: Dict[str, Any] = run_benchmarks(
+        sizes=args.sizes, framings=framings, megabytes=args.megabytes
+    )
+    text: str = dumps(data, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text)
+
+
+if __name__ == "__main__":
+    main()
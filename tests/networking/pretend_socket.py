@@ -21,6 +21,16 @@ class PretendSocket(socket):
         """
         self.data = data
 
+    def send(  # type: ignore[override]
+        self, data: bytes, flags: int = 0
+    ) -> int:
+        """Pretend to send some data.
+
+        Really set ``self.data`` to ``data``, and return its length.
+        """
+        self.data = bytes(data)
+        return len(data)
+
     def recv(  # type: ignore[override]
         self, bufsize: int, flags: int = 0
     ) -> bytes:
@@ -38,6 +48,18 @@ class PretendSocket(socket):
         self.data = None
         return data
 
+    def recv_into(  # type: ignore[override]
+        self, buffer: memoryview, nbytes: int = 0, flags: int = 0
+    ) -> int:
+        """Pretend to receive data into a buffer.
+
+        Really copy ``self.data`` into ``buffer``, as :meth:`recv` would
+        return it.
+        """
+        data: bytes = self.recv(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
     def close(self) -> None:
         """Pretend to close this pretend socket.
 
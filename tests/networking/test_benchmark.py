@@ -0,0 +1,36 @@
+"""Make sure the networking benchmarks still run."""
+
+from typing import Any, Dict
+
+from earwax import Framing
+
+from .benchmark import run_benchmark, run_benchmarks
+
+
+def test_run_benchmark() -> None:
+    """Test a single benchmark."""
+    result = run_benchmark(Framing.lines, 100, 50, window=8)
+    assert result.messages == 50
+    assert len(result.latencies) == 50
+    assert result.latencies == sorted(result.latencies)
+    data: Dict[str, Any] = result.dump()
+    assert data["framing"] == "lines"
+    assert data["messages_per_second"] > 0
+    assert 0 < data["latency"]["p50"] <= data["latency"]["max"]
+
+
+def test_run_benchmarks() -> None:
+    """Test running every framing."""
+    data: Dict[str, Any] = run_benchmarks(
+        sizes=[10, 1000], megabytes=0.01, max_messages=100
+    )
+    assert [(r["framing"], r["size"]) for r in data["results"]] == [
+        ("raw", 10),
+        ("raw", 1000),
+        ("lines", 10),
+        ("lines", 1000),
+        ("length_prefixed", 10),
+        ("length_prefixed", 1000),
+    ]
+    assert data["results"][0]["latency"] is None
+    assert "python" in data
@@ -0,0 +1,127 @@
+"""Test compressing network streams."""
+
+from os import urandom
+from socket import socket
+from typing import List
+from zlib import compressobj
+
+from earwax import (ConnectionStates, Framing, Game, HeadlessRunner,
+                    NetworkConnection, NetworkServer)
+
+
+def test_compression() -> None:
+    """Test compressing data sent from a server to a client."""
+    server: NetworkServer = NetworkServer(framing=Framing.lines)
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.lines, buffer_size=64
+    )
+    lines: List[bytes] = []
+
+    @server.event
+    def on_connect(client: NetworkConnection) -> None:
+        client.send_message(b"compress")
+        client.start_compression()
+        client.send_message(b"A room description. " * 100)
+        client.send_message(b"Second line")
+
+    @con.event
+    def on_line(line: memoryview) -> None:
+        if line == b"compress":
+            con.start_decompression()
+        else:
+            lines.append(bytes(line))
+
+    with HeadlessRunner(Game()) as r:
+        server.listen()
+        con.connect(*server.address)
+        assert r.run_until(lambda: len(lines) == 2, timeout=5.0)
+        assert lines == [b"A room description. " * 100, b"Second line"]
+        client: NetworkConnection = server.clients[0]
+        assert client.send_stats.bytes_sent < 500
+        assert con.decompressor is not None
+        client.stop_compression()
+        client.send_message(b"Plain again")
+        assert r.run_until(lambda: len(lines) == 3, timeout=5.0)
+        assert lines[-1] == b"Plain again"
+        assert con.decompressor is None
+        con.close()
+        server.close()
+
+
+def test_raw() -> None:
+    """Test decompressing raw data."""
+    con: NetworkConnection = NetworkConnection(buffer_size=16)
+    data: List[bytes] = []
+    payload: bytes = urandom(1000)
+    compressor = compressobj()
+    compressed: bytes = compressor.compress(payload) + compressor.flush()
+
+    @con.event
+    def on_data(chunk: bytes) -> None:
+        if chunk.startswith(b"start:"):
+            con.start_decompression(chunk[6:])
+        else:
+            data.append(chunk)
+
+    listener: socket = socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    with HeadlessRunner(Game()) as r:
+        con.connect(*listener.getsockname())
+        assert r.run_until(
+            lambda: con.state is ConnectionStates.connected, timeout=5.0
+        )
+        peer: socket = listener.accept()[0]
+        peer.sendall(b"start:" + compressed[:10])
+        assert r.run_until(lambda: con.decompressor is not None, timeout=5.0)
+        peer.sendall(compressed[10:] + b"tail")
+        assert r.run_until(
+            lambda: b"".join(data) == payload + b"tail", timeout=5.0
+        )
+        assert con.decompressor is None
+        con.close()
+        peer.close()
+    listener.close()
+
+
+def test_inflate_lines() -> None:
+    """Test that inflated lines are dispatched as the buffer fills up."""
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.lines, buffer_size=64, max_message_size=256
+    )
+    lines: List[bytes] = []
+    errors: List[Exception] = []
+    payload: bytes = b"A short line.\r\n" * 100
+    compressor = compressobj()
+    compressed: bytes = compressor.compress(payload) + compressor.flush()
+    assert len(compressed) < 64
+
+    @con.event
+    def on_line(line: memoryview) -> None:
+        if line == b"compress":
+            con.start_decompression()
+        else:
+            lines.append(bytes(line))
+
+    @con.event
+    def on_error(e: Exception) -> bool:
+        errors.append(e)
+        return True
+
+    listener: socket = socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    with HeadlessRunner(Game()) as r:
+        con.connect(*listener.getsockname())
+        assert r.run_until(
+            lambda: con.state is ConnectionStates.connected, timeout=5.0
+        )
+        peer: socket = listener.accept()[0]
+        peer.sendall(b"compress\r\n" + compressed)
+        assert r.run_until(lambda: len(lines) == 100, timeout=5.0)
+        assert set(lines) == {b"A short line."}
+        assert errors == []
+        assert len(con.buffer) == 64
+        con.close()
+        peer.close()
+    listener.close()
@@ -0,0 +1,185 @@
+"""Test receiving framed data over loopback sockets."""
+
+from socket import socket
+from struct import pack
+from typing import List, Tuple
+
+from pytest import raises
+
+from earwax import (ConnectionStates, Framing, Game, HeadlessRunner,
+                    MessageTooLarge, NetworkConnection)
+
+
+def connect(
+    runner: HeadlessRunner, con: NetworkConnection
+) -> Tuple[socket, socket]:
+    """Connect ``con`` to a new loopback server.
+
+    Returns the listening socket, and the accepted peer.
+    """
+    server: socket = socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    con.connect("127.0.0.1", server.getsockname()[1])
+    assert runner.run_until(
+        lambda: con.state is ConnectionStates.connected, timeout=5.0
+    )
+    peer: socket = server.accept()[0]
+    return server, peer
+
+
+def test_lines() -> None:
+    """Test splitting data into lines."""
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.lines, buffer_size=8
+    )
+    lines: List[bytes] = []
+    disconnected: List[bool] = []
+
+    @con.event
+    def on_line(line: memoryview) -> None:
+        lines.append(bytes(line))
+
+    @con.event
+    def on_disconnect() -> None:
+        disconnected.append(True)
+
+    with HeadlessRunner(Game()) as r:
+        server, peer = connect(r, con)
+        peer.sendall(b"Hello\r\nwor")
+        r.run_until(lambda: len(lines) == 1, timeout=5.0)
+        assert lines == [b"Hello"]
+        assert con.received == 3
+        # This line is longer than the buffer.
+        peer.sendall(b"ld, this is a long line\r\n\r\nlast")
+        r.run_until(lambda: len(lines) == 3, timeout=5.0)
+        assert lines == [b"Hello", b"world, this is a long line", b""]
+        assert len(con.buffer) > 8
+        peer.sendall(b"\r")
+        r.step()
+        peer.sendall(b"\n")
+        r.run_until(lambda: len(lines) == 4, timeout=5.0)
+        assert lines[-1] == b"last"
+        peer.close()
+        r.run_until(lambda: bool(disconnected), timeout=5.0)
+        assert con.socket is None
+        server.close()
+
+
+def test_messages() -> None:
+    """Test receiving length-prefixed messages."""
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.length_prefixed, buffer_size=16
+    )
+    messages: List[bytes] = []
+
+    @con.event
+    def on_message(message: memoryview) -> None:
+        messages.append(bytes(message))
+
+    assert con.frame(b"test") == pack("!I", 4) + b"test"
+    with HeadlessRunner(Game()) as r:
+        server, peer = connect(r, con)
+        big: bytes = b"x" * 100
+        peer.sendall(
+            con.frame(b"first") + con.frame(big) + con.frame(b"") + b"\0"
+        )
+        r.run_until(lambda: len(messages) == 3, timeout=5.0)
+        assert messages == [b"first", big, b""]
+        peer.sendall(b"\0\0\2hi")
+        r.run_until(lambda: len(messages) == 4, timeout=5.0)
+        assert messages[-1] == b"hi"
+        assert con.received == 0
+        con.close()
+        peer.close()
+        server.close()
+
+
+def test_raw() -> None:
+    """Test that raw data is dispatched as bytes."""
+    con: NetworkConnection = NetworkConnection(buffer_size=4)
+    data: List[bytes] = []
+    con.event("on_data")(data.append)
+    with HeadlessRunner(Game()) as r:
+        server, peer = connect(r, con)
+        con.send_message(b"unchanged")
+        assert peer.recv(1024) == b"unchanged"
+        peer.sendall(b"Hello world")
+        r.run_until(lambda: b"".join(data) == b"Hello world", timeout=5.0)
+        assert len(con.buffer) == 4
+        con.close()
+        peer.close()
+        server.close()
+
+
+def test_too_large() -> None:
+    """Test that frames bigger than the maximum size are errors."""
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.lines, buffer_size=4, max_message_size=8
+    )
+    errors: List[Exception] = []
+
+    @con.event
+    def on_error(e: Exception) -> bool:
+        errors.append(e)
+        return True
+
+    with HeadlessRunner(Game()) as r:
+        server, peer = connect(r, con)
+        peer.sendall(b"This line is too long.")
+        r.run_until(lambda: bool(errors), timeout=5.0)
+        assert isinstance(errors[0], MessageTooLarge)
+        con.close()
+        peer.close()
+        server.close()
+
+
+def test_too_large_message() -> None:
+    """Test that messages after one which is too large are received."""
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.length_prefixed, buffer_size=16, max_message_size=32
+    )
+    messages: List[bytes] = []
+    errors: List[Exception] = []
+
+    @con.event
+    def on_message(message: memoryview) -> None:
+        messages.append(bytes(message))
+
+    @con.event
+    def on_error(e: Exception) -> bool:
+        errors.append(e)
+        return True
+
+    with HeadlessRunner(Game()) as r:
+        server, peer = connect(r, con)
+        peer.sendall(con.frame(b"x" * 100) + con.frame(b"valid"))
+        r.run_until(lambda: bool(messages), timeout=5.0)
+        assert messages == [b"valid"]
+        assert len(errors) == 1
+        assert isinstance(errors[0], MessageTooLarge)
+        peer.sendall(con.frame(b"also valid"))
+        r.run_until(lambda: len(messages) == 2, timeout=5.0)
+        assert messages[-1] == b"also valid"
+        assert con.received == 0
+        con.close()
+        peer.close()
+        server.close()
+
+
+def test_refused() -> None:
+    """Test that refused connections are errors."""
+    server: socket = socket()
+    server.bind(("127.0.0.1", 0))
+    port: int = server.getsockname()[1]
+    server.close()
+    con: NetworkConnection = NetworkConnection()
+    with HeadlessRunner(Game()) as r:
+        con.connect("127.0.0.1", port)
+        with raises(ConnectionRefusedError):
+            r.run_until(
+                lambda: con.state is not ConnectionStates.connecting,
+                timeout=5.0,
+            )
+        assert con.state is ConnectionStates.error
+        assert con.socket is None
@@ -0,0 +1,88 @@
+"""Test the non-blocking send queue."""
+
+from socket import socket
+from typing import List
+
+from earwax import ConnectionStates, Game, HeadlessRunner, NetworkConnection
+
+
+def test_send_queue() -> None:
+    """Test that big sends do not block, and ``on_drain`` is dispatched."""
+    con: NetworkConnection = NetworkConnection(high_water_mark=1024)
+    drained: List[bool] = []
+
+    @con.event
+    def on_drain() -> None:
+        drained.append(True)
+
+    server: socket = socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    with HeadlessRunner(Game()) as r:
+        con.connect("127.0.0.1", server.getsockname()[1])
+        # Data sent while connecting is queued.
+        assert con.send(b"first") is True
+        assert con.queued == 5
+        assert r.run_until(
+            lambda: con.state is ConnectionStates.connected, timeout=5.0
+        )
+        peer: socket = server.accept()[0]
+        peer.setblocking(False)
+        data: bytes = b"x" * (16 * 1024 * 1024)
+        assert con.send(data) is False
+        assert con.queued > 0
+        assert con.send(b"last") is False
+        received: List[bytes] = []
+        size: int = len(data) + 9
+
+        def read() -> bool:
+            try:
+                received.append(peer.recv(1 << 20))
+            except BlockingIOError:
+                pass
+            return sum(len(chunk) for chunk in received) == size
+
+        assert r.run_until(read, timeout=600.0)
+        result: bytes = b"".join(received)
+        assert result.startswith(b"firstxxx")
+        assert result.endswith(b"xxxlast")
+        r.step()
+        assert drained == [True]
+        assert con.queued == 0
+        assert len(con.send_queue) == 0
+        assert con.send_stats.bytes_sent == size
+        assert con.send_stats.messages == 3
+        assert con.send_stats.max_queued >= len(data)
+        assert con.send_stats.latency.count == 3
+        con.close()
+        peer.close()
+    server.close()
+
+
+def test_coalesce() -> None:
+    """Test joining small writes together."""
+    con: NetworkConnection = NetworkConnection(coalesce=True)
+    server: socket = socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    with HeadlessRunner(Game()) as r:
+        con.connect("127.0.0.1", server.getsockname()[1])
+        assert r.run_until(
+            lambda: con.state is ConnectionStates.connected, timeout=5.0
+        )
+        peer: socket = server.accept()[0]
+        for i in range(100):
+            con.send(b"%d\r\n" % i)
+        # Nothing is sent until the next poll.
+        assert con.send_stats.writes == 0
+        r.step()
+        assert con.send_stats.writes == 1
+        assert con.send_stats.messages == 100
+        expected: bytes = b"".join(b"%d\r\n" % i for i in range(100))
+        received: bytes = b""
+        while len(received) < len(expected):
+            received += peer.recv(4096)
+        assert received == expected
+        con.close()
+        peer.close()
+    server.close()
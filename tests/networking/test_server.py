@@ -0,0 +1,94 @@
+"""Test the NetworkServer class."""
+
+from socket import create_connection, socket
+from typing import List, Tuple
+
+from earwax import (ConnectionStates, Framing, Game, HeadlessRunner,
+                    NetworkConnection, NetworkServer)
+
+
+def recv_exactly(sock: socket, size: int) -> bytes:
+    """Receive exactly ``size`` bytes from a blocking socket."""
+    data: bytes = b""
+    while len(data) < size:
+        chunk: bytes = sock.recv(size - len(data))
+        assert chunk
+        data += chunk
+    return data
+
+
+def test_server() -> None:
+    """Test accepting many clients, and broadcasting to them."""
+    server: NetworkServer = NetworkServer(framing=Framing.lines)
+    connected: List[NetworkConnection] = []
+    disconnected: List[NetworkConnection] = []
+    lines: List[Tuple[NetworkConnection, bytes]] = []
+    server.event("on_connect")(connected.append)
+    server.event("on_disconnect")(disconnected.append)
+
+    @server.event
+    def on_line(client: NetworkConnection, line: memoryview) -> None:
+        lines.append((client, bytes(line)))
+
+    with HeadlessRunner(Game()) as r:
+        server.listen()
+        peers: List[socket] = [
+            create_connection(server.address, timeout=5.0) for _ in range(100)
+        ]
+        assert r.run_until(lambda: len(server.clients) == 100, timeout=5.0)
+        assert connected == server.clients
+        assert all(
+            client.state is ConnectionStates.connected
+            for client in server.clients
+        )
+        peers[5].sendall(b"Hello\r\n")
+        assert r.run_until(lambda: bool(lines), timeout=5.0)
+        client: NetworkConnection = lines[0][0]
+        assert lines == [(client, b"Hello")]
+        assert client.socket is not None
+        assert client.socket.getpeername() == peers[5].getsockname()
+        assert server.broadcast_message(b"Everyone", exclude=client) == 99
+        peer: socket
+        for i, peer in enumerate(peers):
+            if i != 5:
+                assert recv_exactly(peer, 10) == b"Everyone\r\n"
+        client.send_message(b"Just you")
+        assert recv_exactly(peers[5], 10) == b"Just you\r\n"
+        peers.pop().close()
+        assert r.run_until(lambda: len(disconnected) == 1, timeout=5.0)
+        assert len(server.clients) == 99
+        assert disconnected[0] not in server.clients
+        server.close()
+        assert len(disconnected) == 100
+        assert server.clients == []
+        assert server.socket is None
+        for peer in peers:
+            assert peer.recv(1024) == b""
+            peer.close()
+
+
+def test_connection() -> None:
+    """Test connecting to a server with a network connection."""
+    server: NetworkServer = NetworkServer(framing=Framing.length_prefixed)
+    con: NetworkConnection = NetworkConnection(
+        framing=Framing.length_prefixed
+    )
+    received: List[bytes] = []
+
+    @server.event
+    def on_message(client: NetworkConnection, message: memoryview) -> None:
+        client.send_message(bytes(message).upper())
+
+    @con.event("on_message")
+    def on_reply(message: memoryview) -> None:
+        received.append(bytes(message))
+
+    with HeadlessRunner(Game()) as r:
+        server.listen()
+        con.connect(*server.address)
+        con.send_message(b"hello")
+        assert r.run_until(lambda: bool(received), timeout=5.0)
+        assert received == [b"HELLO"]
+        con.close()
+        assert r.run_until(lambda: not server.clients, timeout=5.0)
+        server.close()
@@ -0,0 +1,325 @@
+"""Tests for the combined promise classes."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from pyglet.event import EVENT_HANDLED
+from pyglet.window import Window
+from pytest import raises
+
+from earwax import (ChainedPromise, CombinedPromise, Game, GatheredPromise,
+                    MappedPromise, Promise, PromiseStates, RacedPromise,
+                    StaggeredPromise)
+from earwax.types import StaggeredPromiseGeneratorType
+
+
+class Works(Exception):
+    """Something worked."""
+
+
+def delayed(value: Any, delay: float) -> StaggeredPromise:
+    """Return a promise which is done with ``value`` after ``delay``."""
+
+    @StaggeredPromise.decorate
+    def promise() -> StaggeredPromiseGeneratorType:
+        yield delay
+        return value
+
+    return promise
+
+
+def test_all(game: Game, window: Window) -> None:
+    """Test the ``Promise.all`` method."""
+    first: StaggeredPromise = delayed(1, 0.2)
+    second: StaggeredPromise = delayed(2, 0.1)
+    promise: GatheredPromise = Promise.all(first, second)
+    assert isinstance(promise, GatheredPromise)
+    assert promise.children == [first, second]
+    results: List[List[int]] = []
+
+    @promise.event
+    def on_done(value: List[int]) -> None:
+        results.append(value)
+        window.close()
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+        assert first.state is PromiseStates.running
+        assert second.state is PromiseStates.running
+
+    game.run(window)
+    assert results == [[1, 2]]
+    assert promise.state is PromiseStates.done
+
+
+def test_all_error(game: Game, window: Window) -> None:
+    """Test that an error cancels the other children."""
+
+    @StaggeredPromise.decorate
+    def fails() -> StaggeredPromiseGeneratorType:
+        yield 0.1
+        raise Works()
+
+    slow: StaggeredPromise = delayed(1, 5.0)
+    promise: GatheredPromise = Promise.all(fails, slow)
+
+    @promise.event
+    def on_error(e: Exception) -> bool:
+        assert isinstance(e, Works)
+        window.close()
+        return EVENT_HANDLED
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+
+    game.run(window)
+    assert promise.state is PromiseStates.error
+    assert fails.state is PromiseStates.error
+    assert slow.state is PromiseStates.cancelled
+
+
+def test_race(game: Game, window: Window) -> None:
+    """Test the ``Promise.race`` method."""
+    slow: StaggeredPromise = delayed("slow", 5.0)
+    fast: StaggeredPromise = delayed("fast", 0.1)
+    promise: RacedPromise = Promise.race(slow, fast)
+    assert isinstance(promise, RacedPromise)
+    results: List[str] = []
+
+    @promise.event
+    def on_done(value: str) -> None:
+        results.append(value)
+        window.close()
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+
+    game.run(window)
+    assert results == ["fast"]
+    assert promise.state is PromiseStates.done
+    assert fast.state is PromiseStates.done
+    assert slow.state is PromiseStates.cancelled
+
+
+def test_cancel(game: Game, window: Window) -> None:
+    """Test that cancelling a combined promise cancels its children."""
+    first: StaggeredPromise = delayed(1, 5.0)
+    second: StaggeredPromise = delayed(2, 5.0)
+    promise: GatheredPromise = Promise.all(first, second)
+    cancelled: List[bool] = []
+
+    @promise.event
+    def on_cancel() -> None:
+        cancelled.append(True)
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+        promise.cancel()
+        window.close()
+
+    game.run(window)
+    assert cancelled == [True]
+    assert promise.state is PromiseStates.cancelled
+    assert first.state is PromiseStates.cancelled
+    assert second.state is PromiseStates.cancelled
+
+
+def test_then(game: Game, window: Window) -> None:
+    """Test the ``then`` method."""
+    first: StaggeredPromise = delayed(3, 0.1)
+    promise: ChainedPromise = first.then(
+        lambda value: delayed(value + 1, 0.1)
+    ).then(lambda value: value * 2)
+    assert isinstance(promise, ChainedPromise)
+    results: List[int] = []
+
+    @promise.event
+    def on_done(value: int) -> None:
+        results.append(value)
+        window.close()
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+        assert first.state is PromiseStates.running
+
+    game.run(window)
+    assert results == [8]
+    assert promise.state is PromiseStates.done
+
+
+def test_then_cancel(game: Game, window: Window) -> None:
+    """Test that cancelling a chained promise cancels its parent."""
+    first: StaggeredPromise = delayed(1, 5.0)
+    promise: ChainedPromise = first.then(print)
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+        promise.cancel()
+        window.close()
+
+    game.run(window)
+    assert promise.state is PromiseStates.cancelled
+    assert first.state is PromiseStates.cancelled
+
+
+def test_map(
+    game: Game, window: Window, thread_pool: ThreadPoolExecutor
+) -> None:
+    """Test the ``Promise.map`` method."""
+    promise: MappedPromise = Promise.map(
+        thread_pool, lambda x: x * 2, range(20), concurrency=3
+    )
+    assert isinstance(promise, MappedPromise)
+    assert promise.concurrency == 3
+    results: List[List[int]] = []
+
+    @promise.event
+    def on_done(value: List[int]) -> None:
+        results.append(value)
+        window.close()
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+        assert promise.pending == 3
+
+    game.run(window)
+    assert results == [[x * 2 for x in range(20)]]
+    assert promise.pending == 0
+
+
+def test_map_error(
+    game: Game, window: Window, thread_pool: ThreadPoolExecutor
+) -> None:
+    """Test that ``Promise.map`` stops on the first error."""
+
+    def func(x: int) -> int:
+        if x == 3:
+            raise Works()
+        return x
+
+    promise: MappedPromise = Promise.map(thread_pool, func, range(10))
+
+    @promise.event
+    def on_error(e: Exception) -> bool:
+        assert isinstance(e, Works)
+        window.close()
+        return EVENT_HANDLED
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+
+    game.run(window)
+    assert promise.state is PromiseStates.error
+    assert 5 not in promise.results
+
+
+def test_race_winner_not_cancelled() -> None:
+    """Test that the winner of a race is not cancelled."""
+    winner: Promise = Promise()
+    loser: Promise = Promise()
+    events: List[str] = []
+    winner.push_handlers(
+        on_done=lambda value: events.append("done"),
+        on_cancel=lambda: events.append("cancelled"),
+    )
+    promise: RacedPromise = Promise.race(winner, loser)
+    promise.run()
+    winner.done(1)
+    assert events == ["done"]
+    assert winner.state is PromiseStates.done
+    assert loser.state is PromiseStates.cancelled
+    assert promise.state is PromiseStates.done
+
+
+def test_all_error_not_cancelled() -> None:
+    """Test that a child which raises an error is not cancelled."""
+    fails: Promise = Promise()
+    other: Promise = Promise()
+    events: List[str] = []
+    fails.push_handlers(
+        on_error=lambda e: EVENT_HANDLED,
+        on_cancel=lambda: events.append("cancelled"),
+    )
+    promise: GatheredPromise = Promise.all(fails, other)
+    errors: List[Exception] = []
+
+    @promise.event
+    def on_error(e: Exception) -> bool:
+        errors.append(e)
+        return EVENT_HANDLED
+
+    promise.run()
+    fails.error(Works())
+    assert events == []
+    assert len(errors) == 1
+    assert fails.state is PromiseStates.error
+    assert other.state is PromiseStates.cancelled
+
+
+def test_all_early() -> None:
+    """Test children which complete before the gathered promise is run."""
+    first: Promise = Promise()
+    second: Promise = Promise()
+    promise: GatheredPromise = Promise.all(first, second)
+    results: List[List[int]] = []
+    promise.push_handlers(on_done=results.append)
+    first.run()
+    first.done(1)
+    second.run()
+    second.done(2)
+    assert results == []
+    promise.run()
+    assert results == [[1, 2]]
+    assert promise.state is PromiseStates.done
+    empty: GatheredPromise = Promise.all()
+    empty.push_handlers(on_done=results.append)
+    empty.run()
+    assert results == [[1, 2], []]
+    with raises(RuntimeError):
+        Promise.all(first)
+
+
+def test_combined_abstract() -> None:
+    """Test that ``CombinedPromise`` cannot be used on its own."""
+    with raises(TypeError):
+        CombinedPromise([])  # type: ignore[abstract]
+
+
+def test_pending_count() -> None:
+    """Test that ``Promise.pending_count`` is restored after combining."""
+    pending: int = Promise.pending_count
+    first: Promise = Promise()
+    second: Promise = Promise()
+    race: RacedPromise = Promise.race(first, second)
+    race.run()
+    assert Promise.pending_count == pending + 3
+    first.done(1)
+    assert Promise.pending_count == pending
+    first = Promise()
+    second = Promise()
+    gathered: GatheredPromise = Promise.all(first, second)
+    gathered.run()
+    assert Promise.pending_count == pending + 3
+    second.done(2)
+    assert Promise.pending_count == pending + 2
+    first.done(1)
+    assert gathered.state is PromiseStates.done
+    assert Promise.pending_count == pending
+    failed: Promise = Promise()
+    gathered = Promise.all(failed, Promise())
+
+    @gathered.event
+    def on_error(e: Exception) -> bool:
+        return EVENT_HANDLED
+
+    gathered.run()
+    failed.error(Works())
+    assert Promise.pending_count == pending
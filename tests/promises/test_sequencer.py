@@ -0,0 +1,140 @@
+"""Tests for the Sequencer class."""
+
+from typing import List
+
+from pyglet.clock import schedule_once
+from pyglet.window import Window
+
+from earwax import (Game, HeadlessRunner, PromiseStates, Sequencer,
+                    StaggeredPromise)
+from earwax.types import StaggeredPromiseGeneratorType
+
+
+def test_init(game: Game) -> None:
+    """Test initialisation."""
+    s: Sequencer = Sequencer()
+    assert s.heap == []
+    assert s.groups == {}
+    assert s.paused_groups == set()
+    assert s.running is False
+    assert len(s) == 0
+    assert isinstance(game.sequencer, Sequencer)
+
+
+def test_promise() -> None:
+    """Test the ``promise`` decorator."""
+    s: Sequencer = Sequencer()
+
+    @s.promise(group="test")
+    def promise() -> StaggeredPromiseGeneratorType:
+        yield 1.0
+
+    assert isinstance(promise, StaggeredPromise)
+    assert promise.sequencer is s
+    assert promise.group == "test"
+
+
+def test_run(game: Game, window: Window) -> None:
+    """Test that lots of promises are resumed in order."""
+    s: Sequencer = game.sequencer
+    numbers: List[int] = []
+    promises: List[StaggeredPromise] = []
+    i: int
+    for i in range(100):
+
+        @s.promise()
+        def promise(i: int = i) -> StaggeredPromiseGeneratorType:
+            yield (100 - i) / 1000
+            numbers.append(i)
+
+        promises.append(promise)
+
+    @game.event
+    def before_run() -> None:
+        p: StaggeredPromise
+        for p in promises:
+            p.run()
+        assert len(s) == 100
+        assert s.running is True
+        schedule_once(lambda dt: window.close(), 0.5)
+
+    game.run(window)
+    assert numbers == list(reversed(range(100)))
+    assert len(s) == 0
+    assert s.running is False
+    for p in promises:
+        assert p.state is PromiseStates.done
+
+
+def test_pause_resume(game: Game, window: Window) -> None:
+    """Test pausing and resuming groups."""
+    s: Sequencer = game.sequencer
+    numbers: List[int] = []
+
+    @s.promise(group="paused")
+    def paused() -> StaggeredPromiseGeneratorType:
+        yield 0.1
+        numbers.append(1)
+
+    @s.promise(group="running")
+    def running() -> StaggeredPromiseGeneratorType:
+        yield 0.2
+        numbers.append(2)
+        s.resume_group("paused")
+
+    @game.event
+    def before_run() -> None:
+        paused.run()
+        running.run()
+        s.pause_group("paused")
+        schedule_once(lambda dt: window.close(), 0.5)
+
+    game.run(window)
+    assert numbers == [2, 1]
+    assert s.paused_groups == set()
+
+
+def test_cancel_group(game: Game, window: Window) -> None:
+    """Test cancelling groups."""
+    s: Sequencer = game.sequencer
+
+    @s.promise(group="test")
+    def promise() -> StaggeredPromiseGeneratorType:
+        yield 5.0
+        raise RuntimeError("Should have been cancelled.")
+
+    @game.event
+    def before_run() -> None:
+        promise.run()
+        s.cancel_group("test")
+        window.close()
+
+    game.run(window)
+    assert promise.state is PromiseStates.cancelled
+    assert len(s) == 0
+    assert s.groups == {}
+
+
+def test_zero_delay() -> None:
+    """Test that promises which yield ``0.0`` are resumed once per tick."""
+    g: Game = Game()
+    s: Sequencer = g.sequencer
+    numbers: List[int] = []
+
+    @s.promise()
+    def promise() -> StaggeredPromiseGeneratorType:
+        i: int
+        for i in range(3):
+            numbers.append(i)
+            yield 0.0
+
+    with HeadlessRunner(g) as r:
+        promise.run()
+        assert numbers == [0]
+        r.step()
+        assert numbers == [0, 1]
+        r.step()
+        assert numbers == [0, 1, 2]
+        r.step()
+        assert promise.state is PromiseStates.done
+        assert len(s) == 0
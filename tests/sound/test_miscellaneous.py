@@ -84,6 +84,31 @@ def test_max_size(buffer_cache: BufferCache) -> None:
     assert buffer_cache.buffers[buffer_cache.buffer_uris[0]] is b2
 
 
+def test_touch(buffer_cache: BufferCache) -> None:
+    """Test that recently used buffers are pruned last."""
+    b1: Buffer = buffer_cache.get_buffer("file", "sound.wav")
+    uri: str = buffer_cache.buffer_uris[0]
+    buffer_cache.get_buffer("file", "move.wav")
+    assert buffer_cache.buffer_uris[-1] == uri
+    assert buffer_cache.get_buffer("file", "sound.wav") is b1
+    assert buffer_cache.buffer_uris[0] == uri
+    buffer_cache.max_size = buffer_cache.get_size(b1)
+    buffer_cache.prune_buffers()
+    assert buffer_cache.buffer_uris == [uri]
+
+
+def test_add_buffer(buffer_cache: BufferCache) -> None:
+    """Test adding buffers which were loaded elsewhere."""
+    uri: str = buffer_cache.get_uri("file", "sound.wav")
+    b1: Buffer = buffer_cache.load_buffer("file", "sound.wav")
+    assert buffer_cache.buffers == {}
+    assert buffer_cache.add_buffer(uri, b1) is b1
+    assert buffer_cache.current_size == buffer_cache.get_size(b1)
+    b2: Buffer = buffer_cache.load_buffer("file", "sound.wav")
+    assert buffer_cache.add_buffer(uri, b2) is b1
+    assert buffer_cache.current_size == buffer_cache.get_size(b1)
+
+
 def test_buffer_directory(buffer_cache: BufferCache):
     """Test the BufferDirectory class."""
     with raises(SynthizerError):
@@ -4,7 +4,7 @@ from time import sleep
 
 from synthizer import Context, GlobalFdnReverb
 
-from earwax import Reverb
+from earwax import Reverb, ReverbPool
 
 
 def test_init() -> None:
@@ -22,3 +22,34 @@ def test_make_reverb(context: Context) -> None:
     assert gr.gain == 0.5
     assert gr.t60 == 0.2
     assert isinstance(gr, GlobalFdnReverb)
+
+
+def test_pool(context: Context) -> None:
+    """Test that reverbs with the same settings are shared."""
+    p: ReverbPool = ReverbPool(context, max_idle=1)
+    assert p.context is context
+    small: GlobalFdnReverb = p.acquire(Reverb(t60=0.2))
+    assert isinstance(small, GlobalFdnReverb)
+    assert p.acquire(Reverb(t60=0.2)) is small
+    assert p.references == {p.get_key(Reverb(t60=0.2)): 2}
+    large: GlobalFdnReverb = p.acquire(Reverb(t60=5.0))
+    assert large is not small
+    assert len(p.reverbs) == 2
+    p.release(small)
+    p.release(small)
+    assert p.idle == [p.get_key(Reverb(t60=0.2))]
+    assert p.acquire(Reverb(t60=0.2)) is small
+    assert p.idle == []
+    p.release(small)
+    p.release(large)
+    assert p.idle == [p.get_key(Reverb(t60=5.0))]
+    assert p.find_key(small) is None
+    assert p.find_key(large) == p.get_key(Reverb(t60=5.0))
+    p.detach(large)
+    assert p.reverbs == {}
+    assert p.idle == []
+    p.release(large)
+    p.acquire(Reverb())
+    p.destroy_all()
+    assert p.reverbs == {}
+    assert p.references == {}
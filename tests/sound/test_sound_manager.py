@@ -2,14 +2,18 @@
 
 from pathlib import Path
 from time import sleep
+from typing import List, Tuple
 
+from attr import Factory, attrib, attrs
 from pyglet.clock import schedule_once
 from pyglet.window import Window
 from pytest import raises
 from synthizer import (Buffer, BufferGenerator, Context, DirectSource,
                        StreamingGenerator)
 
-from earwax import AlreadyDestroyed, BufferCache, NoCache, Sound, SoundManager
+from earwax import (AlreadyDestroyed, Ambiance, BufferCache, NoCache,
+                    NullSoundManager, Point, Sound, SoundManager, Track,
+                    TrackTypes)
 
 
 def test_init(sound_manager: SoundManager) -> None:
@@ -114,6 +118,73 @@ def test_play_stream(sound_manager: SoundManager) -> None:
     assert sound._destroyed is False
 
 
+def test_play_cached(sound_manager: SoundManager) -> None:
+    """Test that only play_cached uses cached buffers."""
+    assert sound_manager.buffer_cache is not None
+    buffer: Buffer = sound_manager.buffer_cache.get_buffer("file", "sound.wav")
+    sound: Sound = sound_manager.play_stream("file", "sound.wav")
+    assert isinstance(sound.generator, StreamingGenerator)
+    sound = sound_manager.play_cached("file", "sound.wav")
+    assert isinstance(sound.generator, BufferGenerator)
+    assert sound.buffer is buffer
+    sound = sound_manager.play_cached("file", "move.wav")
+    assert isinstance(sound.generator, StreamingGenerator)
+
+
+@attrs(auto_attribs=True)
+class RecordingSoundManager(NullSoundManager):
+    """A sound manager which records how sounds are played."""
+
+    played: List[Tuple[str, str]] = attrib(default=Factory(list), init=False)
+
+    def play_path(self, path: Path, /, **kwargs) -> Sound:
+        """Record a played path."""
+        self.played.append(("path", str(path)))
+        return super().play_path(path, **kwargs)
+
+    def play_stream(self, protocol: str, path: str, /, **kwargs) -> Sound:
+        """Record a played stream."""
+        self.played.append((protocol, path))
+        return super().play_stream(protocol, path, **kwargs)
+
+
+def test_play_cached_fake() -> None:
+    """Test choosing between cached buffers and streams without a context."""
+    cache: BufferCache = BufferCache(1024 ** 2)
+    cache.buffers[cache.get_uri("file", "sound.wav")] = object()
+    manager: RecordingSoundManager = RecordingSoundManager(
+        object(), buffer_cache=cache
+    )
+    manager.play_cached("file", "./sound.wav")
+    manager.play_cached("file", "move.wav")
+    manager.play_cached("http", "sound.wav")
+    manager.play_stream("file", "sound.wav")
+    assert manager.played == [
+        ("path", "sound.wav"),
+        ("file", "move.wav"),
+        ("http", "sound.wav"),
+        ("file", "sound.wav"),
+    ]
+    manager.played.clear()
+    track: Track = Track("file", "sound.wav", TrackTypes.ambiance)
+    track.play(manager)
+    track.play(manager, use_cache=True)
+    ambiance: Ambiance = Ambiance("file", "sound.wav", Point(0, 0, 0))
+    ambiance.play(manager)
+    ambiance.play(manager, use_cache=True)
+    assert manager.played == [
+        ("file", "sound.wav"),
+        ("path", "sound.wav"),
+        ("file", "sound.wav"),
+        ("path", "sound.wav"),
+    ]
+    assert len(manager.sounds) == 8
+    manager.buffer_cache = None
+    manager.played.clear()
+    manager.play_cached("file", "sound.wav")
+    assert manager.played == [("file", "sound.wav")]
+
+
 def test_play_path_looping(sound_manager: SoundManager) -> None:
     """Ensure that play path properly loops the sound."""
     sound_manager.default_looping = True
@@ -0,0 +1 @@
+"""Story tests."""
@@ -0,0 +1,505 @@
+"""Benchmark the story engine with generated worlds.
+
+Worlds of any size are made by :func:`generate_world`, then loaded, dumped,
+saved, played, and edited. Playing and editing is driven by a
+:class:`earwax.HeadlessRunner`, so sounds are played by null sound managers,
+and no audio device is needed.
+
+Run this module to write results as JSON::
+
+    python -m tests.story.benchmark --rooms 100 --rooms 1000 -o results.json
+
+Results from different versions can then be compared, to see whether the
+story engine still scales to large worlds.
+"""
+
+from argparse import ArgumentParser
+from itertools import islice
+from json import dumps
+from pathlib import Path
+from platform import platform, python_version
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter, process_time
+from typing import Any, Callable, Dict, List, Optional
+
+from attr import Factory, asdict, attrib, attrs
+
+from earwax import Game, HeadlessRunner, Level, Menu, ThreadedPromise
+from earwax.serializers import get_earwax_version
+from earwax.story import (DumpablePoint, EditLevel, PlayLevel, RoomObjectClass,
+                          RoomObjectTypes, StateSaver, StoryContext,
+                          StoryWorld, WorldAction, WorldAmbiance, WorldRoom,
+                          WorldState, WorldStateCategories)
+
+from ..networking.benchmark import percentile
+
+# The number of different sound paths generated worlds use.
+sound_count: int = 50
+
+
+@attrs(auto_attribs=True)
+class WorldSize:
+    """The size of a generated world.
+
+    :ivar ~WorldSize.rooms: The number of rooms.
+
+    :ivar ~WorldSize.objects: The number of objects in each room.
+
+    :ivar ~WorldSize.exits: The number of exits from each room.
+
+    :ivar ~WorldSize.ambiances: The number of ambiances in each room, and on
+        each object.
+
+    :ivar ~WorldSize.classes: The number of object classes.
+    """
+
+    rooms: int = 100
+    objects: int = 5
+    exits: int = 2
+    ambiances: int = 1
+    classes: int = 3
+
+    def dump(self) -> Dict[str, int]:
+        """Return this size as a dictionary."""
+        return asdict(self)
+
+
+def generate_world(game: Game, size: WorldSize, seed: int = 0) -> StoryWorld:
+    """Return a new world.
+
+    Worlds made with the same size and seed are always the same. Every room
+    has an exit to the next one, so every room can be reached from the
+    first.
+
+    :param game: The game to make the world for.
+
+    :param size: The size of the world.
+
+    :param seed: The seed for choosing sounds, exits, and object types.
+    """
+    rng: Random = Random(seed)
+    sounds: List[str] = [f"sounds/{n}.wav" for n in range(sound_count)]
+    types: List[RoomObjectTypes] = [
+        RoomObjectTypes.stuck,
+        RoomObjectTypes.takeable,
+        RoomObjectTypes.droppable,
+    ]
+    world: StoryWorld = StoryWorld(
+        game,
+        name=f"Generated World ({size.rooms} rooms)",
+        object_classes=[
+            RoomObjectClass(f"class{n}") for n in range(size.classes)
+        ],
+    )
+    class_names: List[str] = [c.name for c in world.object_classes]
+
+    def get_ambiances() -> List[WorldAmbiance]:
+        return [
+            WorldAmbiance(rng.choice(sounds)) for _ in range(size.ambiances)
+        ]
+
+    rooms: List[WorldRoom] = [
+        WorldRoom(
+            id=f"room{n}",
+            name=f"Room {n}",
+            description=f"The description of room {n}.",
+            ambiances=get_ambiances(),
+        )
+        for n in range(size.rooms)
+    ]
+    room: WorldRoom
+    for room in rooms:
+        world.add_room(room)
+    if rooms:
+        world.initial_room_id = rooms[0].id
+    n: int
+    for n, room in enumerate(rooms):
+        i: int
+        for i in range(size.exits):
+            destination: WorldRoom = rooms[(n + 1) % len(rooms)]
+            if i > 0:
+                destination = rng.choice(rooms)
+            room.create_exit(
+                destination,
+                action=WorldAction(
+                    name=f"Go to {destination.name}",
+                    sound=rng.choice(sounds),
+                ),
+            )
+        for i in range(size.objects):
+            room.create_object(
+                id=f"{room.id}_object{i}",
+                name=f"Object {i} in {room.name}",
+                type=rng.choice(types),
+                position=DumpablePoint(i, i, 0) if i % 2 else None,
+                ambiances=get_ambiances(),
+                actions=[
+                    WorldAction(
+                        name="Use", message="You use {}.", sound=sounds[i]
+                    )
+                ],
+                class_names=rng.sample(class_names, min(1, len(class_names))),
+            )
+    return world
+
+
+@attrs(auto_attribs=True)
+class BenchmarkResult:
+    """The results of timing one operation.
+
+    :ivar ~BenchmarkResult.operation: The name of the operation.
+
+    :ivar ~BenchmarkResult.size: The size of the world.
+
+    :ivar ~BenchmarkResult.cpu_seconds: The CPU time taken by all the calls.
+
+    :ivar ~BenchmarkResult.timings: The time taken by every call, sorted.
+    """
+
+    operation: str
+    size: WorldSize
+    cpu_seconds: float
+    timings: List[float] = attrib(default=Factory(list), repr=False)
+
+    def dump(self) -> Dict[str, Any]:
+        """Return this result as a dictionary."""
+        seconds: float = sum(self.timings)
+        return {
+            "operation": self.operation,
+            "world": self.size.dump(),
+            "calls": len(self.timings),
+            "seconds": seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "calls_per_second": len(self.timings) / seconds
+            if seconds
+            else None,
+            "p50": percentile(self.timings, 50),
+            "p90": percentile(self.timings, 90),
+            "max": self.timings[-1] if self.timings else 0.0,
+        }
+
+
+def measure(
+    operation: str, size: WorldSize, func: Callable[[int], Any], calls: int
+) -> BenchmarkResult:
+    """Time calls to a function.
+
+    :param operation: The name of the operation being timed.
+
+    :param size: The size of the world being used.
+
+    :param func: The function to call. It will be called with the number of
+        the call, starting at ``0``.
+
+    :param calls: The number of times to call ``func``.
+    """
+    timings: List[float] = []
+    cpu_started: float = process_time()
+    n: int
+    for n in range(calls):
+        started: float = perf_counter()
+        func(n)
+        timings.append(perf_counter() - started)
+    return BenchmarkResult(
+        operation, size, process_time() - cpu_started, sorted(timings)
+    )
+
+
+def run_benchmark(
+    size: WorldSize, calls: int = 10, seed: int = 0
+) -> List[BenchmarkResult]:
+    """Generate a world, and time everything the story engine does with it.
+
+    :param size: The size of the world to generate.
+
+    :param calls: The number of times to time each operation.
+
+        Generating the world is only timed once.
+
+    :param seed: The seed to generate the world with.
+    """
+    results: List[BenchmarkResult] = []
+    game: Game = Game()
+    started: float = perf_counter()
+    cpu_started: float = process_time()
+    world: StoryWorld = generate_world(game, size, seed=seed)
+    results.append(
+        BenchmarkResult(
+            "world.generate",
+            size,
+            process_time() - cpu_started,
+            [perf_counter() - started],
+        )
+    )
+    data: Dict[str, Any] = world.dump()
+    results.append(measure("world.dump", size, lambda n: world.dump(), calls))
+    results.append(
+        measure(
+            "world.load",
+            size,
+            lambda n: StoryWorld.load(data, game),
+            calls,
+        )
+    )
+    results.append(
+        measure(
+            "world.load.lazy",
+            size,
+            lambda n: StoryWorld.load(data, game, lazy=True),
+            calls,
+        )
+    )
+    with TemporaryDirectory() as directory:
+        path: Path = Path(directory)
+        extension: str
+        for extension in ("yaml", "ewb"):
+            filename: Path = path / f"world.{extension}"
+            results.append(
+                measure(
+                    f"world.save.{extension}",
+                    size,
+                    lambda n: world.save(filename),
+                    calls,
+                )
+            )
+        results.extend(run_state_benchmark(world, size, path, calls))
+    results.extend(run_play_benchmark(world, size, calls, seed=seed))
+    results.extend(
+        run_edit_benchmark(StoryWorld.load(data, Game()), size, calls)
+    )
+    return results
+
+
+def run_state_benchmark(
+    world: StoryWorld, size: WorldSize, directory: Path, calls: int
+) -> List[BenchmarkResult]:
+    """Time saving, journaling, and restoring world states.
+
+    :param world: The world whose state will be saved.
+
+    :param size: The size the world was generated with.
+
+    :param directory: The directory to save states in.
+
+    :param calls: The number of times to time each operation.
+    """
+    state: WorldState = WorldState(world)
+    room_ids: List[str] = list(world.rooms)
+    state.inventory_ids = [
+        obj.id for obj in islice(world.all_objects(), max(1, size.objects))
+    ]
+    results: List[BenchmarkResult] = []
+    with HeadlessRunner(world.game):
+        saver: StateSaver = StateSaver(
+            directory / "state.yaml", world.game.thread_pool, journal=True
+        )
+
+        def save(n: int) -> None:
+            promise: ThreadedPromise = saver.save(state.dump())
+            assert promise.future is not None
+            promise.future.result()
+
+        results.append(measure("state.save", size, save, calls))
+        results.append(
+            measure(
+                "state.record",
+                size,
+                lambda n: saver.record(room_id=room_ids[n % len(room_ids)]),
+                calls,
+            )
+        )
+
+        def restore(n: int) -> WorldState:
+            d: Optional[Dict[str, Any]] = saver.load()
+            assert d is not None
+            return WorldState.load(d, world)
+
+        results.append(measure("state.restore", size, restore, calls))
+    return results
+
+
+def run_play_benchmark(
+    world: StoryWorld, size: WorldSize, calls: int, seed: int = 0
+) -> List[BenchmarkResult]:
+    """Time the things a :class:`~earwax.story.PlayLevel` does.
+
+    :param world: The world to play.
+
+    :param size: The size the world was generated with.
+
+    :param calls: The number of times to time each operation.
+
+    :param seed: The seed to choose exits and inventories with.
+    """
+    rng: Random = Random(seed)
+    ctx: StoryContext = StoryContext(world.game, world)
+    level: PlayLevel = ctx.main_level
+    object_ids: List[str] = [obj.id for obj in world.all_objects()]
+    results: List[BenchmarkResult] = []
+    with HeadlessRunner(world.game).started(initial_level=level):
+
+        def set_room(n: int) -> None:
+            room: WorldRoom = level.state.room
+            if room.exits:
+                room = world.rooms[rng.choice(room.exits).destination_id]
+            level.set_room(room)
+
+        results.append(measure("play.set_room", size, set_room, calls))
+        results.append(
+            measure(
+                "play.get_objects", size, lambda n: level.get_objects(), calls
+            )
+        )
+
+        def build_inventory(n: int) -> None:
+            level.state.inventory_ids = rng.sample(
+                object_ids, min(len(object_ids), 10)
+            )
+            level.build_inventory()
+
+        results.append(
+            measure("play.build_inventory", size, build_inventory, calls)
+        )
+    return results
+
+
+def run_edit_benchmark(
+    world: StoryWorld, size: WorldSize, calls: int
+) -> List[BenchmarkResult]:
+    """Time the things an :class:`~earwax.story.EditLevel` does.
+
+    Operations are performed the same way the builder menu performs them.
+
+    :param world: The world to edit.
+
+    :param size: The size the world was generated with.
+
+    :param calls: The number of times to time each operation.
+    """
+    game: Game = world.game
+    ctx: StoryContext = StoryContext(game, world, edit=True)
+    level: PlayLevel = ctx.main_level
+    assert isinstance(level, EditLevel)
+    results: List[BenchmarkResult] = []
+    with HeadlessRunner(game).started(initial_level=level):
+
+        def create_room(n: int) -> None:
+            game.push_level(Level(game))
+            level.create_room()
+
+        def create_object(n: int) -> None:
+            game.push_level(Level(game))
+            level.create_object()
+
+        def delete_object(n: int) -> None:
+            level.state.category_index = list(WorldStateCategories).index(
+                WorldStateCategories.objects
+            )
+            level.state.object_index = 0
+            level.delete()
+            assert isinstance(game.level, Menu)
+            game.level.items[0].func()
+
+        results.append(measure("edit.create_room", size, create_room, calls))
+        results.append(
+            measure("edit.create_object", size, create_object, calls)
+        )
+        results.append(
+            measure("edit.delete_object", size, delete_object, calls)
+        )
+    return results
+
+
+def run_benchmarks(
+    sizes: Optional[List[WorldSize]] = None, calls: int = 10, seed: int = 0
+) -> Dict[str, Any]:
+    """Run every benchmark for every world size.
+
+    Returns a dictionary which can be saved as JSON.
+
+    :param sizes: The sizes of the worlds to generate.
+
+    :param calls: The number of times to time each operation.
+
+    :param seed: The seed to generate worlds with.
+    """
+    if sizes is None:
+        sizes = [WorldSize(rooms=rooms) for rooms in (100, 1000, 5000)]
+    results: List[Dict[str, Any]] = []
+    size: WorldSize
+    for size in sizes:
+        result: BenchmarkResult
+        for result in run_benchmark(size, calls=calls, seed=seed):
+            results.append(result.dump())
+    return {
+        "earwax": get_earwax_version(),
+        "python": python_version(),
+        "platform": platform(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run benchmarks from the command line."""
+    parser: ArgumentParser = ArgumentParser(
+        description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="The file to write results to."
+    )
+    parser.add_argument(
+        "-r",
+        "--rooms",
+        type=int,
+        action="append",
+        help="The number of rooms to generate. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--objects", type=int, default=5, help="The objects in each room."
+    )
+    parser.add_argument(
+        "--exits", type=int, default=2, help="The exits from each room."
+    )
+    parser.add_argument(
+        "--ambiances",
+        type=int,
+        default=1,
+        help="The ambiances in each room, and on each object.",
+    )
+    parser.add_argument(
+        "--classes", type=int, default=3, help="The number of object classes."
+    )
+    parser.add_argument(
+        "-c",
+        "--calls",
+        type=int,
+        default=10,
+        help="The number of times to time each operation.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="The seed to generate worlds with."
+    )
+    args = parser.parse_args()
+    sizes: List[WorldSize] = [
+        WorldSize(
+            rooms=rooms,
+            objects=args.objects,
+            exits=args.exits,
+            ambiances=args.ambiances,
+            classes=args.classes,
+        )
+        for rooms in args.rooms or [100, 1000, 5000]
+    ]
+    data: Dict[str, Any] = run_benchmarks(
+        sizes=sizes, calls=args.calls, seed=args.seed
+    )
+    text: str = dumps(data, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text)
+
+
+if __name__ == "__main__":
+    main()
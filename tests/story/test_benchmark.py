@@ -0,0 +1,63 @@
+"""Make sure the story benchmarks still run."""
+
+from typing import Any, Dict, List
+
+from earwax import Game
+from earwax.story import StoryContext, StoryWorld, WorldRoom
+
+from .benchmark import (BenchmarkResult, WorldSize, generate_world,
+                        run_benchmarks, run_edit_benchmark)
+
+
+def test_generate_world() -> None:
+    """Test generating worlds."""
+    size: WorldSize = WorldSize(
+        rooms=20, objects=3, exits=2, ambiances=2, classes=4
+    )
+    w: StoryWorld = generate_world(Game(), size)
+    assert len(w.rooms) == 20
+    assert len(w.object_classes) == 4
+    assert w.initial_room_id == "room0"
+    room: WorldRoom
+    for room in w.rooms.values():
+        assert len(room.objects) == 3
+        assert len(room.exits) == 2
+        assert len(room.ambiances) == 2
+    assert len(list(w.all_objects())) == 60
+    assert w.rooms["room19"].exits[0].destination_id == "room0"
+    assert generate_world(Game(), size).dump() == w.dump()
+    assert generate_world(Game(), size, seed=1).dump() != w.dump()
+    ctx: StoryContext = StoryContext(Game(), w)
+    assert ctx.errors == []
+    assert ctx.warnings == []
+
+
+def test_run_edit_benchmark() -> None:
+    """Test that the edit benchmark really edits."""
+    size: WorldSize = WorldSize(rooms=5)
+    w: StoryWorld = generate_world(Game(), size)
+    results: List[BenchmarkResult] = run_edit_benchmark(w, size, 3)
+    assert [r.operation for r in results] == [
+        "edit.create_room",
+        "edit.create_object",
+        "edit.delete_object",
+    ]
+    assert len(w.rooms) == 8
+    assert len(list(w.all_objects())) == 25
+
+
+def test_run_benchmarks() -> None:
+    """Test running every benchmark."""
+    data: Dict[str, Any] = run_benchmarks(
+        sizes=[WorldSize(rooms=10, objects=2)], calls=2
+    )
+    assert "python" in data
+    operations: List[str] = [r["operation"] for r in data["results"]]
+    assert operations[0] == "world.generate"
+    assert "play.set_room" in operations
+    assert "state.restore" in operations
+    result: Dict[str, Any]
+    for result in data["results"]:
+        assert result["world"]["rooms"] == 10
+        assert result["calls"] == (1 if result is data["results"][0] else 2)
+        assert 0 <= result["p50"] <= result["max"]
@@ -0,0 +1,119 @@
+"""Tests for the binary codec."""
+
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, List
+
+from attr import attrs
+from pytest import raises
+
+from earwax import BinaryCodec, CodecError
+
+
+@attrs(auto_attribs=True)
+class Say:
+    """A test message."""
+
+    player: int
+    text: str
+    _private: List[float]
+
+
+class Colours(Enum):
+    """Test colours."""
+
+    red = 0
+    green = "green"
+
+
+def test_values() -> None:
+    """Test encoding and decoding values."""
+    codec: BinaryCodec = BinaryCodec()
+    value: Any
+    for value in (
+        None,
+        True,
+        False,
+        0,
+        -1,
+        63,
+        -64,
+        2 ** 70,
+        -(2 ** 70),
+        1.5,
+        "",
+        "Hello é",
+        b"\0\xff",
+        [1, [2, "three"]],
+        {"a": 1, 2: None},
+    ):
+        assert codec.decode(codec.encode(value)) == value
+    assert codec.decode(codec.encode((1, 2))) == [1, 2]
+    assert len(codec.encode(5)) == 2
+    assert len(codec.encode(-5)) == 2
+    assert codec.decode(memoryview(codec.encode("test"))) == "test"
+
+
+def test_objects() -> None:
+    """Test encoding registered classes."""
+    codec: BinaryCodec = BinaryCodec()
+    codec.register(Say, 1)
+    with raises(CodecError):
+        codec.register(Say, 1)
+    message: Say = Say(5, "Hello", [0.5])
+    data: bytes = codec.encode([message, message])
+    assert b"text" not in data
+    assert codec.decode(data) == [message, message]
+    with raises(CodecError):
+        codec.encode(object())
+    with raises(CodecError):
+        BinaryCodec().decode(data)
+
+
+def test_datetimes_and_enums() -> None:
+    """Test encoding datetimes and enumeration members."""
+    codec: BinaryCodec = BinaryCodec()
+    value: Any
+    for value in (
+        datetime(2020, 1, 2, 3, 4, 5, 6),
+        datetime(2020, 1, 2, tzinfo=timezone(timedelta(hours=1))),
+    ):
+        assert codec.decode(codec.encode(value)) == value
+    data: bytes = codec.encode([Colours.red, Colours.green])
+    with raises(CodecError):
+        codec.decode(data)
+    codec.register_enum(Colours)
+    assert codec.decode(data) == [Colours.red, Colours.green]
+    codec = BinaryCodec(import_enums=True)
+    assert codec.decode(data) == [Colours.red, Colours.green]
+    with raises(CodecError):
+        codec.decode(data.replace(b"Colours", b"Coloure"))
+
+
+def test_errors() -> None:
+    """Test decoding bad data."""
+    codec: BinaryCodec = BinaryCodec()
+    data: bytes = codec.encode(["test"])
+    for i in range(len(data)):
+        with raises(CodecError):
+            codec.decode(data[:i])
+    with raises(CodecError):
+        codec.decode(data + b"\0")
+    with raises(CodecError):
+        codec.decode(b"\xff")
+
+
+def test_depth() -> None:
+    """Test that deeply nested values are refused."""
+    codec: BinaryCodec = BinaryCodec(max_depth=3)
+    value: List[Any] = [[[[]]]]
+    assert codec.decode(codec.encode(value)) == value
+    with raises(CodecError):
+        codec.encode([value])
+    with raises(CodecError):
+        codec.decode(b"\x07\x01" * 5 + b"\x07\x00")
+    # Far deeper than the recursion limit.
+    with raises(CodecError):
+        BinaryCodec().decode(b"\x07\x01" * 100000)
+    with raises(CodecError):
+        BinaryCodec().decode(b"\x08\x01\x07\x00\x00")
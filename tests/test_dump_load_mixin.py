@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from attr import Factory, attrs
 
-from earwax.mixins import DumpLoadMixin
+from earwax.mixins import DumpLoadMixin, DumpLoadPlan, get_plan
 
 AnyDict = Dict[str, Any]
 
@@ -162,3 +162,52 @@ def test_excluded_attribute_names() -> None:
     t = Thing.load(data)
     assert t.name == "Chris Norman"
     assert t.gender == "No idea"
+
+
+def test_plans() -> None:
+    """Test that plans are cached, and dump the same as get_dump_value."""
+    p: Person = Person(
+        "Chris Norman",
+        datetime(1989, 6, 14),
+        1.8,
+        addresses=[Address(AddressTypes.other, "Somewhere", "Anywhere")],
+        emails=["earwax-tests@example.com"],
+        state=Employment(),
+    )
+    d: Department = Department("Testers", employees=[p])
+    c: Company = Company("Test Company", departments={"test": d})
+    plan: DumpLoadPlan = get_plan(Person)
+    assert get_plan(Person) is plan
+    assert plan.cls is Person
+    assert [name for name, type_ in plan.fields] == [
+        "name",
+        "dob",
+        "height",
+        "addresses",
+        "emails",
+        "state",
+    ]
+    obj: DumpLoadMixin
+    for obj in (p, c):
+        assert obj.dump()[obj.__value_key__] == {
+            name: obj.get_dump_value(type_, getattr(obj, name))
+            for name, type_ in get_plan(type(obj)).fields
+        }
+    assert Company.load(c.dump()) == c
+
+    @attrs(auto_attribs=True)
+    class Shouty(DumpLoadMixin):
+        """Dumps strings in upper case."""
+
+        words: str
+
+        def get_dump_value(self, type_: Any, value: Any) -> Any:
+            return value.upper()
+
+        @classmethod
+        def get_load_value(cls, expected_type: Any, value: Any) -> Any:
+            return value.lower()
+
+    data: AnyDict = Shouty("hello").dump()
+    assert data[Shouty.__value_key__] == {"words": "HELLO"}
+    assert Shouty.load(data) == Shouty("hello")
@@ -0,0 +1,80 @@
+"""Tests for the MeteredExecutor class."""
+
+from concurrent.futures import Future
+from time import sleep
+from typing import List
+
+from pytest import raises
+
+from earwax import Game, MeteredExecutor
+
+
+def test_init() -> None:
+    """Test initialisation."""
+    e: MeteredExecutor = MeteredExecutor("test", 2)
+    assert e.name == "test"
+    assert e.max_workers == 2
+    assert e.submitted == 0
+    assert e.queue_depth == 0
+    assert e.running == 0
+    assert e.average_latency == 0.0
+    assert e.average_duration == 0.0
+    with raises(ValueError):
+        MeteredExecutor("broken", 0)
+
+
+def test_submit() -> None:
+    """Test that work is counted."""
+    e: MeteredExecutor = MeteredExecutor("test", 1)
+    futures: List[Future] = [e.submit(sleep, 0.05) for _ in range(3)]
+    assert e.submitted == 3
+    assert e.queue_depth + e.running == 3
+    assert futures[-1].cancel() is True
+    assert e.cancelled == 1
+    assert e.submitted == 2
+    futures[0].result()
+    futures[1].result()
+    assert e.completed == 2
+    assert e.queue_depth == 0
+    assert e.max_latency > 0.0
+    assert e.max_duration >= 0.05
+    e.shutdown()
+
+
+def test_failed() -> None:
+    """Test that errors are counted."""
+    e: MeteredExecutor = MeteredExecutor("test", 1)
+
+    def fails() -> None:
+        raise RuntimeError("Fails.")
+
+    with raises(RuntimeError):
+        e.submit(fails).result()
+    assert e.completed == 1
+    assert e.failed == 1
+    e.shutdown()
+
+
+def test_shutdown() -> None:
+    """Test that executors can be used after being shut down."""
+    e: MeteredExecutor = MeteredExecutor("test", 1)
+    assert e.submit(lambda: 5).result() == 5
+    e.shutdown()
+    assert e.submit(lambda: 6).result() == 6
+    assert e.completed == 2
+    e.shutdown()
+
+
+def test_get_executor(game: Game) -> None:
+    """Test the ``get_executor`` method."""
+    e: MeteredExecutor = game.get_executor("cpu")
+    assert e.name == "cpu"
+    assert e.max_workers == game.config.executors.cpu_workers.value
+    assert game.get_executor("cpu") is e
+    assert game.executors["cpu"] is e
+    assert (
+        game.get_executor("audio-decode").max_workers
+        == game.config.executors.audio_decode_workers.value
+    )
+    assert game.get_executor("other").name == "other"
+    game.shutdown_executors()
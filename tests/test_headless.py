@@ -0,0 +1,129 @@
+"""Tests for running games headlessly."""
+
+from pathlib import Path
+from typing import List
+
+from pyglet.clock import get_default
+from pyglet.window import key
+from pytest import raises
+
+from earwax import (Game, HeadlessRunner, Level, NullSound, NullSoundManager,
+                    NullSpeech, Sound, StaggeredPromise, VirtualClock)
+from earwax.types import StaggeredPromiseGeneratorType
+
+
+def test_virtual_clock() -> None:
+    """Test the VirtualClock class."""
+    c: VirtualClock = VirtualClock()
+    assert c() == 0.0
+    c.advance(1.5)
+    assert c() == 1.5
+    with raises(ValueError):
+        c.advance(-1.0)
+
+
+def test_null_speech() -> None:
+    """Test the NullSpeech class."""
+    s: NullSpeech = NullSpeech()
+    s.speak("Hello")
+    s.braille("World")
+    s.output("Both")
+    s.silence()
+    assert s.spoken == ["Hello", "Both"]
+    assert s.brailled == ["World", "Both"]
+
+
+def test_null_sound_manager() -> None:
+    """Test that null sound managers make null sounds."""
+    m: NullSoundManager = NullSoundManager(None)
+    s: Sound = m.play_path(Path("sound.wav"), looping=True)
+    assert isinstance(s, NullSound)
+    assert s.looping is True
+    assert m.sounds == [s]
+    s.pause()
+    assert s.paused is True
+    s.set_position(0.5)
+    assert s.position == 0.5
+    s.destroy()
+    assert s.destroyed is True
+    assert m.sounds == []
+
+
+def test_start_stop() -> None:
+    """Test starting and stopping a runner."""
+    g: Game = Game()
+    level: Level = Level(g)
+    r: HeadlessRunner = HeadlessRunner(g)
+    old_clock = get_default()
+    with r.started(initial_level=level):
+        assert r.running is True
+        assert get_default() is r.clock
+        assert g.level is level
+        assert g.tts is r.speech
+        assert isinstance(g.interface_sound_manager, NullSoundManager)
+        assert "on_key_press" in g.event_matchers
+        with raises(RuntimeError):
+            r.start()
+    assert r.running is False
+    assert get_default() is old_clock
+    assert g.levels == []
+
+
+def test_run_for() -> None:
+    """Test that tasks and promises follow virtual time."""
+    g: Game = Game()
+    r: HeadlessRunner = HeadlessRunner(g, fps=10)
+    runs: List[float] = []
+
+    @StaggeredPromise.decorate
+    def promise() -> StaggeredPromiseGeneratorType:
+        yield 30.0
+        g.output("Done.")
+
+    with r:
+        task = g.register_task(lambda: 1.0)(runs.append)
+        task.start()
+        promise.run()
+        assert r.run_for(60.0) == 600
+        task.stop()
+    assert r.virtual_clock.time == 60.0
+    assert len(runs) > 50  # Frames are 0.1 seconds, so tasks drift.
+    assert r.speech.spoken == ["Done."]
+
+
+def test_run_until() -> None:
+    """Test the ``run_until`` method."""
+    g: Game = Game()
+    r: HeadlessRunner = HeadlessRunner(g)
+    with r:
+        assert r.run_until(lambda: r.virtual_clock.time >= 5.0) is True
+        assert r.run_until(lambda: False, timeout=1.0) is False
+
+
+def test_input() -> None:
+    """Test simulating input."""
+    g: Game = Game()
+    level: Level = Level(g)
+    presses: List[str] = []
+
+    @level.action("Key", symbol=key.A, interval=0.5)
+    def key_action() -> None:
+        presses.append("key")
+
+    @level.action("Joystick", joystick_button=3)
+    def joystick_action() -> None:
+        presses.append("joystick")
+
+    @level.action("Hat", hat_direction=(0, 1))
+    def hat_action() -> None:
+        presses.append("hat")
+
+    r: HeadlessRunner = HeadlessRunner(g)
+    with r.started(initial_level=level):
+        r.tap_key(key.A, hold=1.1)
+        assert presses.count("key") == 3
+        r.press_joybutton(3)
+        r.release_joybutton(3)
+        r.move_hat(0, 1)
+        r.move_hat(0, 0)
+    assert presses[-2:] == ["joystick", "hat"]
@@ -0,0 +1,106 @@
+"""Tests for the leak detector."""
+
+from pathlib import Path
+
+from pytest import raises
+from synthizer import Buffer
+
+from earwax import (Game, HeadlessRunner, LeakDetector, LeakReport, Level,
+                    Sound, SoundManager, TrackedResource)
+from earwax.leaks import share_resource, track_resource
+
+
+def test_leaks() -> None:
+    """Test that sounds left playing are reported."""
+    g: Game = Game()
+    level: Level = Level(g)
+    detector: LeakDetector = LeakDetector(g)
+    with HeadlessRunner(g).started(initial_level=Level(g)):
+        detector.start()
+        assert g.leak_detector is detector
+        with raises(RuntimeError):
+            LeakDetector(g).start()
+        g.push_level(level)
+        leaked: Sound = g.interface_sound_manager.play_path(Path("leak.wav"))
+        g.interface_sound_manager.play_path(Path("tidy.wav")).destroy()
+        g.pop_level()
+        assert len(detector.reports) == 1
+        report: LeakReport = detector.reports[0]
+        assert report.level is level
+        assert len(report.resources) == 1
+        resource: TrackedResource = report.resources[0]
+        assert resource.resource is leaked
+        assert resource.kind == "sound"
+        assert resource.level_name == "Level"
+        assert "test_leaks" in "".join(resource.get_stack())
+        assert "1 resources leaked by Level." in report.format()
+        # Resources from popped levels are forgotten.
+        assert detector.alive(level) == []
+        g.push_level(level)
+        g.pop_level()
+        assert len(detector.reports) == 1
+    assert detector.running is False
+
+
+def test_share() -> None:
+    """Test that shared resources are not blamed on levels."""
+    g: Game = Game()
+    level: Level = Level(g)
+    detector: LeakDetector = LeakDetector(g)
+    shared: object = object()
+    with HeadlessRunner(g).started(initial_level=Level(g)):
+        detector.start()
+        g.push_level(level)
+        track_resource(shared, "reverb", lambda: True)
+        assert detector.alive(level)[0].resource is shared
+        share_resource(shared)
+        assert detector.alive(level) == []
+        g.pop_level()
+        assert detector.reports == []
+        assert [r.resource for r in detector.alive()] == [shared]
+
+
+def test_buffer_cache(game: Game) -> None:
+    """Test that buffers kept by the cache are not blamed on levels."""
+    level: Level = Level(game)
+    detector: LeakDetector = LeakDetector(game)
+    detector.start()
+    try:
+        game.push_level(level)
+        m: SoundManager = game.interface_sound_manager
+        m.play_path(Path("sound.wav")).destroy()
+        game.pop_level()
+        assert detector.reports == []
+        uri: str = game.buffer_cache.get_uri("file", "sound.wav")
+        buffer: Buffer = game.buffer_cache.buffers[uri]
+        assert [r.resource for r in detector.alive()] == [buffer]
+        # Duplicates are destroyed, so they are not alive either.
+        duplicate: Buffer = game.buffer_cache.load_buffer("file", "sound.wav")
+        assert game.buffer_cache.add_buffer(uri, duplicate) is buffer
+        assert [r.resource for r in detector.alive()] == [buffer]
+        # Buffers which never made it into the cache are still reported.
+        game.push_level(level)
+        leaked: Buffer = game.buffer_cache.load_buffer("file", "move.wav")
+        game.pop_level()
+        assert len(detector.reports) == 1
+        assert [r.resource for r in detector.reports[0].resources] == [leaked]
+        leaked.destroy()
+    finally:
+        detector.stop()
+
+
+def test_tracemalloc() -> None:
+    """Test comparing tracemalloc snapshots."""
+    g: Game = Game()
+    level: Level = Level(g)
+    detector: LeakDetector = LeakDetector(
+        g, capture_stacks=False, use_tracemalloc=True
+    )
+    with HeadlessRunner(g):
+        detector.start()
+        g.push_level(level)
+        g.interface_sound_manager.play_path(Path("leak.wav"))
+        g.pop_level()
+        report: LeakReport = detector.reports[0]
+        assert report.resources[0].stack == []
+        assert report.memory != []
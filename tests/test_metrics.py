@@ -0,0 +1,105 @@
+"""Tests for the metrics registry."""
+
+from json import loads
+from pathlib import Path
+
+from pyglet.window import key
+
+from earwax import (Box, BoxLevel, Counter, Game, Gauge, HeadlessRunner,
+                    Histogram, Level, MetricsLevel, MetricsRegistry, Point,
+                    Promise)
+
+
+def test_registry() -> None:
+    """Test adding metrics to a registry."""
+    m: MetricsRegistry = MetricsRegistry()
+    c: Counter = m.counter("test.counter")
+    assert m.counter("test.counter") is c
+    c.increment()
+    c.increment(2)
+    g: Gauge = m.gauge("test.gauge")
+    g.set(5.0)
+    m.gauge("test.labels", lambda: {"a": 1, "b": 2})
+    h: Histogram = m.histogram("test.histogram")
+    with h.time():
+        pass
+    h.observe(0.5)
+    assert m.collect() == {
+        "test.counter": 3,
+        "test.gauge": 5.0,
+        "test.histogram.count": 2,
+        "test.histogram.max": 0.5,
+        "test.histogram.mean": h.mean,
+        "test.histogram.p99": h.percentile(99),
+        "test.labels.a": 1,
+        "test.labels.b": 2,
+    }
+    m.remove("test.counter")
+    assert "test.counter" not in m.collect()
+
+
+def test_game_metrics() -> None:
+    """Test the gauges every game has."""
+    g: Game = Game()
+    pending: int = Promise.pending_count
+    p: Promise = Promise()
+    p.run()
+    with HeadlessRunner(g).started(initial_level=Level(g)):
+        g.interface_sound_manager.play_path(Path("sound.wav"))
+        values = g.metrics.collect()
+    assert values["levels.depth"] == 1
+    assert values["sounds.active.Interface sound manager"] == 1
+    assert values["sounds.active.Music sound manager"] == 0
+    assert values["promises.pending"] == pending + 1
+    assert values["buffers.hit_rate"] == 0.0
+    assert values["executors.queue_depth.io"] == 0
+    assert values["reverbs.count"] == 0
+    p.done(None)
+    assert Promise.pending_count == pending
+
+
+def test_box_metrics() -> None:
+    """Test the box level gauges and query histogram."""
+    g: Game = Game()
+    level: BoxLevel = BoxLevel(g)
+    level.add_box(Box(g, Point(0, 0, 0), Point(5, 5, 0), name="Room"))
+    with HeadlessRunner(g).started(initial_level=level):
+        assert level.get_containing_box(Point(1, 1, 0)) is not None
+        values = g.metrics.collect()
+        assert values["boxes.count"] == 1
+        assert values["boxes.sounds"] == 0
+        assert values["boxes.query.count"] >= 1
+        g.pop_level()
+        assert "boxes.count" not in g.metrics.collect()
+
+
+def test_export(tmp_path: Path) -> None:
+    """Test exporting metrics periodically."""
+    g: Game = Game()
+    path: Path = tmp_path / "metrics.json"
+    with HeadlessRunner(g) as r:
+        g.metrics.start_export(path, interval=1.0)
+        assert g.metrics.export_path == path
+        r.run_for(0.5)
+        assert not path.exists()
+        r.run_for(1.0)
+        assert loads(path.read_text())["levels.depth"] == 0
+        g.metrics.stop_export()
+        assert g.metrics.export_path is None
+
+
+def test_metrics_level() -> None:
+    """Test reading metrics aloud."""
+    g: Game = Game()
+    g.metrics.counter("test.counter").increment()
+    with HeadlessRunner(g).started(initial_level=Level(g)) as r:
+        g.push_level(MetricsLevel(g))
+        assert r.speech.spoken[-1].startswith("Metrics: ")
+        r.tap_key(key.DOWN)
+        assert r.speech.spoken[-1] == "buffers.count: 0"
+        r.tap_key(key.UP)
+        assert r.speech.spoken[-1] == "buffers.count: 0"
+        r.tap_key(key.R)
+        assert "test.counter: 1" in r.speech.spoken[-1]
+        r.tap_key(key.ESCAPE)
+        assert len(g.levels) == 1
@@ -0,0 +1,71 @@
+"""Tests for the profiler."""
+
+from json import loads
+from pathlib import Path
+from typing import List
+
+from pyglet.window import key
+from pytest import raises
+
+from earwax import CallbackStats, Game, HeadlessRunner, Level, Profiler
+
+
+class ProfiledLevel(Level):
+    """A level class for the profiler to find."""
+
+
+def test_callback_stats() -> None:
+    """Test the CallbackStats class."""
+    s: CallbackStats = CallbackStats("test")
+    assert s.mean == 0.0
+    assert s.percentile(50) == 0.0
+    for i in range(99):
+        s.add(0.001)
+    s.add(1.0)
+    assert s.count == 100
+    assert s.max == 1.0
+    assert round(s.total, 3) == 1.099
+    # Durations are rounded up to the next power of 2 microseconds.
+    assert s.percentile(50) == 1024 / 1000000
+    assert s.percentile(99) == 1024 / 1000000
+    assert s.percentile(100) == 1.0
+    assert s.dump()["count"] == 100
+
+
+def test_profiler(tmp_path: Path) -> None:
+    """Test profiling a game."""
+    g: Game = Game()
+    level: ProfiledLevel = ProfiledLevel(g)
+    ticks: List[float] = []
+
+    @level.action("Press", symbol=key.P)
+    def press() -> None:
+        pass
+
+    path: Path = tmp_path / "profile.json"
+    p: Profiler = Profiler(g, path=path)
+    assert p.running is False
+    p.start()
+    assert p.running is True
+    assert g.profiler is p
+    with raises(RuntimeError):
+        Profiler(g).start()
+    with HeadlessRunner(g).started(initial_level=level) as r:
+        task = g.register_task(lambda: 0.5)(ticks.append)
+        task.start()
+        r.tap_key(key.P)
+        r.run_for(2.1)
+        task.stop()
+    assert p.running is False
+    assert len(ticks) == 4
+    assert p.callbacks["Action: Press"].count == 1
+    assert p.callbacks["Event: on_key_press"].count == 1
+    assert p.callbacks["Task: list.append"].count == 4
+    assert p.levels["ProfiledLevel"].count == 6
+    assert p.slowest(1)[0].max == max(s.max for s in p.callbacks.values())
+    data = loads(path.read_text())
+    assert data["callbacks"]["Action: Press"]["count"] == 1
+    assert data["levels"]["ProfiledLevel"]["count"] == 6
+    p.clear()
+    assert p.callbacks == {}
+    assert p.levels == {}
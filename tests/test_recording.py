@@ -0,0 +1,123 @@
+"""Tests for recording and replaying input."""
+
+from pathlib import Path
+from typing import List
+
+from pyglet.window import key
+from pytest import raises
+
+from earwax import (Die, Game, HeadlessRunner, InputPlayer, InputRecorder,
+                    InputRecording, Level, RecordedEvent)
+
+
+def make_level(game: Game, rolls: List[int]) -> Level:
+    """Return a level which rolls a die when a key is pressed."""
+    level: Level = Level(game)
+    die: Die = Die(sides=100)
+
+    @level.action("Roll", symbol=key.R)
+    def roll() -> None:
+        rolls.append(die.roll())
+
+    @level.action("Joystick roll", joystick_button=2)
+    def joystick_roll() -> None:
+        rolls.append(-die.roll())
+
+    return level
+
+
+def test_record() -> None:
+    """Test recording input."""
+    g: Game = Game()
+    r: HeadlessRunner = HeadlessRunner(g)
+    recorder: InputRecorder = InputRecorder(g)
+    with r:
+        recorder.start(seeds={"die": 1})
+        assert g.input_recorder is recorder
+        with raises(RuntimeError):
+            InputRecorder(g).start()
+        r.press_key(key.A)
+        r.run_for(1.0)
+        r.release_key(key.A)
+        r.step()  # Not recorded.
+        r.press_joybutton(3)
+        r.type_text("hello")
+        recording: InputRecording = recorder.stop()
+        r.press_key(key.B)
+    assert g.input_recorder is None
+    assert recording.seeds == {"die": 1}
+    end: float = recording.duration
+    assert recording.events == [
+        RecordedEvent(0.0, "on_key_press", [key.A, 0]),
+        RecordedEvent(1.0, "on_key_release", [key.A, 0]),
+        RecordedEvent(end, "on_joybutton_press", ["Headless", 3]),
+        RecordedEvent(end, "on_text", ["hello"]),
+    ]
+    assert recording.duration > 1.0
+
+
+def test_save_load(tmp_path: Path) -> None:
+    """Test saving and loading recordings."""
+    recording: InputRecording = InputRecording(
+        seeds={"die": 5},
+        events=[
+            RecordedEvent(0.5, "on_key_press", [key.A, 0]),
+            RecordedEvent(1.0, "on_joyhat_motion", ["Gamepad", 0, 1]),
+        ],
+    )
+    path: Path = tmp_path / "recording.json"
+    recording.save(path)
+    assert InputRecording.from_path(path) == recording
+    args = recording.events[1].get_args()
+    assert args[0].device.name == "Gamepad"
+    assert args[1:] == [0, 1]
+
+
+def test_replay() -> None:
+    """Test that replaying gives the same results as recording."""
+    recorded: List[int] = []
+    g: Game = Game()
+    r: HeadlessRunner = HeadlessRunner(g)
+    recorder: InputRecorder = InputRecorder(g)
+    with r.started(initial_level=make_level(g, recorded)):
+        recorder.start()
+        for i in range(10):
+            r.tap_key(key.R, hold=0.5)
+            r.press_joybutton(2)
+            r.run_for(0.25)
+            r.release_joybutton(2)
+        recording: InputRecording = recorder.stop()
+    assert len(recorded) == 20
+    replayed: List[int] = []
+    g = Game()
+    r = HeadlessRunner(g)
+    with r.started(initial_level=make_level(g, replayed)):
+        assert r.replay(recording, extra=1.0) > 0
+        assert r.virtual_clock.time >= recording.duration + 1.0
+    assert replayed == recorded
+
+
+def test_input_player() -> None:
+    """Test replaying in real time."""
+    recorded: List[int] = []
+    g: Game = Game()
+    r: HeadlessRunner = HeadlessRunner(g)
+    recorder: InputRecorder = InputRecorder(g)
+    with r.started(initial_level=make_level(g, recorded)):
+        recorder.start()
+        r.tap_key(key.R, hold=0.5)
+        r.run_for(2.0)
+        r.tap_key(key.R)
+        recording: InputRecording = recorder.stop()
+    replayed: List[int] = []
+    g = Game()
+    r = HeadlessRunner(g)
+    with r.started(initial_level=make_level(g, replayed)):
+        player: InputPlayer = recording.replay(g)
+        assert player.finished is False
+        r.run_for(1.0)
+        assert replayed == recorded[:1]
+        r.run_for(2.0)
+        assert player.finished is True
+        player.stop()
+    assert replayed == recorded
@@ -0,0 +1,135 @@
+"""Tests for the serializers module."""
+
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict
+
+from pytest import raises
+
+from earwax import (BinarySerializer, CodecError, DataCache, Serializer,
+                    UnknownSerializer, YamlSerializer)
+from earwax.cmd.subcommands.convert import convert
+from earwax.serializers import (detect_serializer, get_serializer, load_data,
+                                save_data)
+
+from .test_dump_load_mixin import (Address, AddressTypes, Company, Department,
+                                   Employment, Person)
+
+
+def get_company() -> Company:
+    """Return a company to save."""
+    p: Person = Person(
+        "Test Person",
+        Employment().since,
+        1.75,
+        addresses=[Address(AddressTypes.work, "1 Test Street", "Testville")],
+        emails=["earwax-tests@example.com"],
+        state=Employment(),
+    )
+    d: Department = Department("Testers", employees=[p])
+    return Company("Test Company", departments={"test": d})
+
+
+def test_get_serializer() -> None:
+    """Test choosing serializers."""
+    assert isinstance(get_serializer(), YamlSerializer)
+    assert isinstance(get_serializer("binary"), BinarySerializer)
+    assert isinstance(get_serializer(path=Path("world.yaml")), YamlSerializer)
+    assert isinstance(
+        get_serializer(path=Path("world.EWB")), BinarySerializer
+    )
+    assert isinstance(get_serializer(path=Path("world.txt")), YamlSerializer)
+    with raises(UnknownSerializer):
+        get_serializer("nothing")
+
+
+def test_round_trip() -> None:
+    """Test that both serializers load what they dump."""
+    data: Dict[str, Any] = get_company().dump()
+    s: Serializer
+    for s in (YamlSerializer(), BinarySerializer()):
+        dumped: bytes = s.dumps(data)
+        assert detect_serializer(dumped).name == s.name
+        assert s.loads(dumped) == data
+    binary: BinarySerializer = BinarySerializer()
+    dumped = binary.dumps(data)
+    assert len(dumped) < len(YamlSerializer().dumps(data))
+    with raises(CodecError):
+        binary.loads(b"EARWAX\x02" + dumped[7:])
+    with raises(CodecError):
+        binary.loads(b"Not binary")
+
+
+def test_save(tmp_path: Path) -> None:
+    """Test saving and loading files with both formats."""
+    c: Company = get_company()
+    yaml_path: Path = tmp_path / "company.yaml"
+    binary_path: Path = tmp_path / "company.ewb"
+    c.save(yaml_path)
+    c.save(binary_path)
+    assert binary_path.read_bytes().startswith(b"EARWAX")
+    assert Company.from_filename(yaml_path) == c
+    assert Company.from_filename(binary_path) == c
+    # The format is worked out from the contents of the file.
+    other_path: Path = tmp_path / "company.dat"
+    c.save(other_path, serializer="binary")
+    assert Company.from_filename(other_path) == c
+    save_data({"value": 5}, other_path)
+    assert load_data(other_path) == {"value": 5}
+
+
+def test_convert(tmp_path: Path) -> None:
+    """Test the convert command."""
+    c: Company = get_company()
+    source: Path = tmp_path / "company.yaml"
+    c.save(source)
+    destination: Path = tmp_path / "company.ewb"
+    convert(Namespace(source=source, destination=destination, format=None))
+    assert destination.read_bytes().startswith(b"EARWAX")
+    assert Company.from_filename(destination) == c
+    back: Path = tmp_path / "back.yaml"
+    convert(Namespace(source=destination, destination=back, format=None))
+    assert back.read_text() == source.read_text()
+    convert(Namespace(source=source, destination=back, format="binary"))
+    assert Company.from_filename(back) == c
+    with raises(SystemExit):
+        convert(
+            Namespace(
+                source=tmp_path / "missing", destination=back, format=None
+            )
+        )
+
+
+def test_data_cache(tmp_path: Path) -> None:
+    """Test caching data files."""
+    c: Company = get_company()
+    path: Path = tmp_path / "company.yaml"
+    c.save(path)
+    cache: DataCache = DataCache(path)
+    assert cache.cache_path == tmp_path / "company.yaml.cache"
+    assert Company.load(cache.load()) == c
+    assert cache.hit is False
+    assert cache.cache_path.is_file()
+    assert Company.load(cache.load()) == c
+    assert cache.hit is True
+    # Changing the file makes the cache stale.
+    c.name = "Changed Company"
+    c.save(path)
+    with ThreadPoolExecutor() as executor:
+        assert Company.load(cache.load(executor=executor)) == c
+        assert cache.hit is False
+        assert cache.future is not None
+        cache.future.result()
+    assert Company.load(cache.load()) == c
+    assert cache.hit is True
+    # Broken caches are ignored.
+    cache.cache_path.write_bytes(cache.cache_path.read_bytes()[:-1])
+    assert Company.load(cache.load()) == c
+    assert cache.hit is False
+    # Binary files are never cached.
+    binary_path: Path = tmp_path / "company.ewb"
+    c.save(binary_path)
+    cache = DataCache(binary_path)
+    assert Company.load(cache.load()) == c
+    assert not cache.cache_path.exists()
@@ -0,0 +1,111 @@
+"""Tests for the StateSaver class."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event
+from typing import Any, Dict, List, Optional
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from earwax import Game, PromiseStates, ThreadedPromise
+from earwax.serializers import save_data
+from earwax.story import (StateSaver, StoryWorld, WorldRoom, WorldState,
+                          state_saver)
+
+
+def get_state() -> WorldState:
+    """Return a state to save."""
+    w: StoryWorld = StoryWorld(Game())
+    w.add_room(WorldRoom("first"))
+    w.add_room(WorldRoom("second"))
+    return WorldState(w)
+
+
+def wait(promise: ThreadedPromise) -> None:
+    """Wait for a promise to finish."""
+    assert promise.future is not None
+    promise.future.result(timeout=5.0)
+    promise.check(0.0)
+    assert promise.state is PromiseStates.done
+
+
+def test_save(tmp_path: Path) -> None:
+    """Test saving in the background."""
+    state: WorldState = get_state()
+    path: Path = tmp_path / "game.yaml"
+    saver: StateSaver = StateSaver(path, ThreadPoolExecutor())
+    assert saver.load() is None
+    state.inventory_ids.append("key")
+    wait(saver.save(state.dump()))
+    assert not (tmp_path / "game.yaml.tmp").exists()
+    data: Optional[Dict[str, Any]] = saver.load()
+    assert data is not None
+    assert WorldState.load(data, state.world) == state
+    assert saver.record(room_id="second") is False
+    assert not saver.journal_path.exists()
+
+
+def test_journal(tmp_path: Path) -> None:
+    """Test recording changes."""
+    state: WorldState = get_state()
+    path: Path = tmp_path / "game.yaml"
+    saver: StateSaver = StateSaver(path, ThreadPoolExecutor(), journal=True)
+    assert saver.journal_path == tmp_path / "game.yaml.journal"
+    wait(saver.save(state.dump()))
+    assert saver.record(room_id="second") is False
+    assert saver.record(inventory_ids=["key"]) is False
+    data: Optional[Dict[str, Any]] = saver.load()
+    assert data is not None
+    loaded: WorldState = WorldState.load(data, state.world)
+    assert loaded.room_id == "second"
+    assert loaded.inventory_ids == ["key"]
+    # A new saver carries on from the old sequence numbers.
+    saver = StateSaver(path, ThreadPoolExecutor(), journal=True)
+    saver.compact_after = 3
+    assert saver.record(room_id="first") is False
+    assert saver.get_sequence() == 3
+    with saver.journal_path.open("a") as f:
+        f.write('{"sequence": 4, "chan')
+    data = saver.load()
+    assert data is not None
+    assert data["__value__"]["room_id"] == "first"
+    assert saver.record(room_id="second") is False
+    assert saver.record(room_id="first") is True
+    data = saver.load()
+    assert data is not None
+    loaded = WorldState.load(data, state.world)
+    wait(saver.save(loaded.dump()))
+    assert not saver.journal_path.exists()
+    data = saver.load()
+    assert data is not None
+    assert data["__value__"]["room_id"] == "first"
+    assert data["__value__"]["inventory_ids"] == ["key"]
+
+
+def test_record_while_writing(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that changes can be recorded while a save is being written."""
+    state: WorldState = get_state()
+    saver: StateSaver = StateSaver(
+        tmp_path / "game.yaml", ThreadPoolExecutor(), journal=True
+    )
+    writing: Event = Event()
+    recorded: Event = Event()
+    waited: List[bool] = []
+
+    def slow_save(data: Any, path: Path) -> None:
+        writing.set()
+        waited.append(recorded.wait(5.0))
+        save_data(data, path)
+
+    monkeypatch.setattr(state_saver, "save_data", slow_save)
+    promise: ThreadedPromise = saver.save(state.dump())
+    assert writing.wait(5.0)
+    assert saver.record(room_id="second") is False
+    recorded.set()
+    wait(promise)
+    assert waited == [True]
+    data: Optional[Dict[str, Any]] = saver.load()
+    assert data is not None
+    assert WorldState.load(data, state.world).room_id == "second"
@@ -1,11 +1,14 @@
 """Test story classes."""
 
 from inspect import isgenerator
+from pathlib import Path
 from typing import Any, Dict, Iterator, List
 
-from earwax import Game
-from earwax.story import (DumpablePoint, RoomExit, RoomObject, StoryWorld,
-                          WorldAction, WorldAmbiance, WorldMessages, WorldRoom)
+from earwax import DataCache, Game, ThreadedPromise
+from earwax.story import (DumpablePoint, LazyRooms, RoomExit, RoomObject,
+                          RoomPrefetcher, StoryWorld, WorldAction,
+                          WorldAmbiance, WorldIndex, WorldMessages, WorldRoom,
+                          WorldState)
 
 
 def test_init(game: Game) -> None:
@@ -96,3 +99,177 @@ def test_all_objects(game: Game) -> None:
     assert isgenerator(i)
     objects_list: List[RoomObject] = list(i)
     assert objects_list == [o1, o2, o3, o4, o5]
+
+
+def test_from_filename(game: Game, tmp_path: Path) -> None:
+    """Test that worlds are loaded through a cache."""
+    w: StoryWorld = StoryWorld(game, name="Cached World")
+    w.add_room(WorldRoom("first_room"))
+    path: Path = tmp_path / "world.yaml"
+    w.save(path)
+    cache_path: Path = tmp_path / "world.yaml.cache"
+    cache: DataCache = DataCache(path)
+    w2: StoryWorld = StoryWorld.from_filename(path, game, cache=cache)
+    assert w2.dump() == w.dump()
+    assert cache.hit is False
+    assert cache.future is not None
+    cache.future.result()
+    assert game.get_executor("cpu").completed == 1
+    assert cache_path.is_file()
+    cache = DataCache(path)
+    w2 = StoryWorld.from_filename(path, game, cache=cache)
+    assert w2.dump() == w.dump()
+    assert cache.hit is True
+    cache_path.unlink()
+    w2 = StoryWorld.from_filename(path, game, use_cache=False)
+    assert w2.name == w.name
+    assert not cache_path.exists()
+
+
+def test_lazy(game: Game) -> None:
+    """Test loading rooms as they are used."""
+    w: StoryWorld = StoryWorld(game, name="Lazy World")
+    first: WorldRoom = WorldRoom("first", name="First Room")
+    second: WorldRoom = WorldRoom("second", name="Second Room")
+    third: WorldRoom = WorldRoom("third", name="Third Room")
+    room: WorldRoom
+    for room in (first, second, third):
+        w.add_room(room)
+    first.create_exit(second)
+    second.create_exit(third)
+    third.create_object(id="key", name="Key")
+    data: Dict[str, Any] = w.dump()
+    w2: StoryWorld = StoryWorld.load(data, game, lazy=True)
+    assert w2.lazy is True
+    rooms: Any = w2.rooms
+    assert isinstance(rooms, LazyRooms)
+    assert rooms.loaded() == []
+    assert list(rooms) == ["first", "second", "third"]
+    assert "second" in rooms
+    assert rooms.names == {
+        "first": "First Room",
+        "second": "Second Room",
+        "third": "Third Room",
+    }
+    assert rooms.object_locations == {"key": "third"}
+    assert w2.get_exit_destinations() == w.get_exit_destinations()
+    assert rooms.loaded() == []
+    state: WorldState = WorldState(w2)
+    room = state.room
+    assert room.id == "first"
+    assert room.world is w2
+    assert rooms.loaded() == [room]
+    x: RoomExit = room.exits[0]
+    assert x.location is room
+    assert x.destination.id == "second"
+    assert not rooms.is_loaded("third")
+    assert [r.id for r in w2.find_rooms(["key"])] == [
+        "first",
+        "second",
+        "third",
+    ]
+    assert rooms["third"].objects["key"].location is rooms["third"]
+    assert w2.dump() == data
+    assert StoryWorld.load(data, game).lazy is False
+
+
+def test_index(game: Game) -> None:
+    """Test that the world index is kept up to date."""
+    w: StoryWorld = StoryWorld(game)
+    first: WorldRoom = WorldRoom("first")
+    second: WorldRoom = WorldRoom("second", name="#first")
+    w.add_room(first)
+    w.add_room(second)
+    index: WorldIndex = w.index
+    assert index.name_shadows == {"first": [second]}
+    assert w.get_shadows("first") == ([second], [])
+    x: RoomExit = first.create_exit(second)
+    assert w.get_entrances("second") == [x]
+    assert w.get_entrances("first") == []
+    key: RoomObject = second.create_object(id="key")
+    assert index.objects == {"key": (key, second)}
+    assert w.get_object("key") is key
+    second.remove_object(key)
+    assert w.get_object("key") is None
+    assert list(w.all_objects()) == []
+    first.add_object(key)
+    assert key.location is first
+    assert index.objects == {"key": (key, first)}
+    second.description = "#first"
+    second.name = "Second Room"
+    index.add_shadows(second)
+    assert w.get_shadows("first") == ([], [second])
+    first.remove_exit(x)
+    assert w.get_entrances("second") == []
+    w.remove_room(second)
+    assert "second" not in w.rooms
+    assert w.get_shadows("first") == ([], [])
+    data: Dict[str, Any] = w.dump()
+    assert "index" not in data[StoryWorld.__value_key__]
+    first.create_exit(second)
+    w.add_room(second)
+    w2: StoryWorld = StoryWorld.load(w.dump(), game, lazy=True)
+    assert w2.rooms.loaded() == []  # type: ignore[attr-defined]
+    assert w2.get_object("key") is w2.rooms["first"].objects["key"]
+    assert [x.location.id for x in w2.get_entrances("second")] == ["first"]
+    assert w2.get_shadows("first") == ([], [w2.rooms["second"]])
+
+
+def test_prefetcher(game: Game) -> None:
+    """Test loading the sounds of nearby rooms."""
+    w: StoryWorld = StoryWorld(game)
+    first: WorldRoom = WorldRoom(
+        "first", ambiances=[WorldAmbiance("sound.wav")]
+    )
+    second: WorldRoom = WorldRoom("second")
+    third: WorldRoom = WorldRoom("third")
+    for room in (first, second, third):
+        w.add_room(room)
+    first.create_exit(second, action=WorldAction(sound="move.wav"))
+    second.create_object(
+        ambiances=[WorldAmbiance("move.wav")],
+        take_action=WorldAction(sound="./sound.wav"),
+    )
+    p: RoomPrefetcher = RoomPrefetcher(game.buffer_cache, game.thread_pool)
+    assert p.get_paths(first) == ["sound.wav", "move.wav"]
+    assert p.get_paths(second) == ["move.wav", "sound.wav"]
+    assert p.get_paths(third) == []
+    assert p.get_rooms(first) == [first, second]
+
+    def finish() -> None:
+        promise: ThreadedPromise
+        for promise in list(p.pending.values()):
+            assert promise.future is not None
+            promise.future.result(timeout=5.0)
+            promise.check(0.0)
+
+    p.max_pending = 1
+    p.update(first)
+    assert p.recent_room_ids == ["first"]
+    assert list(p.pending) == ["sound.wav"]
+    assert p.queue == ["move.wav"]
+    finish()
+    finish()
+    assert p.pending == {}
+    assert p.queue == []
+    uri: str = game.buffer_cache.get_uri("file", "move.wav")
+    assert game.buffer_cache.buffer_uris[0] == uri
+    assert p.size == game.buffer_cache.current_size
+    p.update(third)
+    assert p.recent_room_ids == ["third", "first"]
+    assert p.pending == {}
+    assert p.size == game.buffer_cache.current_size
+    # The current room is the most important.
+    assert game.buffer_cache.buffer_uris[0] == game.buffer_cache.get_uri(
+        "file", "sound.wav"
+    )
+    game.buffer_cache.destroy_all()
+    p.max_size = 1
+    p.update(second)
+    assert p.get_rooms(second) == [second, third, first]
+    assert list(p.pending) == ["move.wav"]
+    finish()
+    assert p.pending == {}
+    assert p.queue == ["sound.wav"]
+    p.clear()
+    assert p.queue == []
@@ -0,0 +1,91 @@
+"""Tests for the tracer."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from json import loads
+from pathlib import Path
+from threading import get_ident
+from typing import Any, Dict, List
+
+from pyglet.window import key
+from pytest import raises
+
+from earwax import Game, HeadlessRunner, Level, ThreadedPromise, Tracer
+
+
+def get_events(tracer: Tracer, category: str) -> List[Dict[str, Any]]:
+    """Return every event in the given category."""
+    return [e for e in tracer.events if e["cat"] == category]
+
+
+def test_ring_buffer() -> None:
+    """Test that old events are discarded."""
+    t: Tracer = Tracer(Game(), capacity=5)
+    for i in range(10):
+        t.instant("test", "test", number=i)
+    assert len(t.events) == 5
+    assert [e["args"]["number"] for e in t.events] == [5, 6, 7, 8, 9]
+    event: Dict[str, Any] = t.events[-1]
+    assert event["ph"] == "i"
+    assert event["tid"] == get_ident()
+    t.clear()
+    assert len(t.events) == 0
+
+
+def test_span() -> None:
+    """Test recording spans."""
+    t: Tracer = Tracer(Game())
+    with t.span("work", "test", size=5):
+        pass
+    event: Dict[str, Any] = t.events[0]
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["args"] == {"size": 5}
+    assert t.wrap(lambda: 5, "wrapped", "test")() == 5
+    assert t.events[-1]["name"] == "wrapped"
+
+
+def test_trace(tmp_path: Path) -> None:
+    """Test tracing a game."""
+    g: Game = Game()
+    level: Level = Level(g)
+
+    @level.action("Push", symbol=key.P)
+    def push() -> None:
+        g.push_level(Level(g))
+
+    path: Path = tmp_path / "trace.json"
+    t: Tracer = Tracer(g, path=path)
+    t.start()
+    assert t.running is True
+    assert g.tracer is t
+    with raises(RuntimeError):
+        Tracer(g).start()
+    with ThreadPoolExecutor() as pool:
+        promise: ThreadedPromise = ThreadedPromise(pool)
+        promise.register_func(get_ident)
+        with HeadlessRunner(g).started(initial_level=level) as r:
+            r.tap_key(key.P)
+            g.pop_level()
+            promise.run()
+            assert promise.future is not None
+            future: Future = promise.future
+            r.run_until(future.done, timeout=5.0)
+            r.step()
+    assert t.running is False
+    assert [e["name"] for e in get_events(t, "action")] == ["Action.run"]
+    levels: List[Dict[str, Any]] = get_events(t, "level")
+    assert [e["name"] for e in levels] == [
+        "Game.push_level",
+        "Game.push_level",
+        "Game.pop_level",
+        "Game.pop_level",
+    ]
+    promises: List[Dict[str, Any]] = get_events(t, "promise")
+    # The worker's span is added when it ends, which may be before the main
+    # thread records the start of the promise.
+    assert sorted(e["ph"] for e in promises) == ["X", "b", "e"]
+    worker: Dict[str, Any] = [e for e in promises if e["ph"] == "X"][0]
+    assert worker["tid"] == promise.future.result()
+    assert worker["tid"] != get_ident()
+    data: Dict[str, Any] = loads(path.read_text())
+    assert len(data["traceEvents"]) == len(t.events) + len(t.thread_names)
@@ -1,10 +1,12 @@
 """Tests functions from earwax.utils."""
 
 from datetime import timedelta
-from typing import List
+from pathlib import Path
+from typing import Dict, List
 
-from earwax.utils import (english_list, format_timedelta, nearest_square,
-                          pluralise)
+from earwax.utils import (english_list, format_timedelta, get_random,
+                          nearest_square, pluralise, random_file,
+                          random_stream_names, seed_random)
 
 
 def test_nearest_square() -> None:
@@ -48,3 +50,27 @@ def test_format_timedelta() -> None:
     assert format_timedelta(d, sep=" ", and_="+ ") == (
         "1 year 1 month 4 days 5 hours 10 minutes + 58 seconds"
     )
+
+
+def test_seed_random() -> None:
+    """Test the get_random and seed_random functions."""
+    seeds: Dict[str, int] = seed_random()
+    assert sorted(seeds) == sorted(random_stream_names)
+    numbers: List[int] = [get_random("die").randint(1, 100) for _ in range(10)]
+    assert seed_random(seeds) == seeds
+    assert [
+        get_random("die").randint(1, 100) for _ in range(10)
+    ] == numbers
+
+
+def test_random_file(tmp_path: Path) -> None:
+    """Test that random files can be chosen again with the same seeds."""
+    name: str
+    for name in ("c", "a", "d", "b"):
+        (tmp_path / f"{name}.wav").write_bytes(b"")
+    assert random_file(tmp_path / "a.wav") == tmp_path / "a.wav"
+    seeds: Dict[str, int] = seed_random()
+    paths: List[Path] = [random_file(tmp_path) for _ in range(10)]
+    assert all(p.parent == tmp_path for p in paths)
+    seed_random(seeds)
+    assert [random_file(tmp_path) for _ in range(10)] == paths